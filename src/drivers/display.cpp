@@ -230,15 +230,43 @@ void drawBitmapBg(int16_t x, int16_t y, const uint8_t* bitmap, int16_t w, int16_
     display->drawBitmap(x, y, bitmap, w, h, fgColor, bgColor);
 }
 
-void drawRGB565(int16_t x, int16_t y, const uint16_t* bitmap, int16_t w, int16_t h) {
+// True if the rectangle lies entirely on screen, so it can be sent as one address window
+static bool fitsScreen(int16_t x, int16_t y, int16_t w, int16_t h) {
+    return x >= 0 && y >= 0 && x + w <= display->width() && y + h <= display->height();
+}
+
+// Swap pixels between little-endian and panel (big-endian) byte order in place
+static void swapBytes(uint16_t* pixels, int count) {
+    for (int i = 0; i < count; i++) {
+        pixels[i] = __builtin_bswap16(pixels[i]);
+    }
+}
+
+// Push pixels already in panel byte order straight to SPI, no per-pixel transform
+// Caller must check fitsScreen() since an address window is not clipped
+static void pushBigEndian(int16_t x, int16_t y, const uint16_t* pixels, int16_t w, int16_t h) {
+    display->startWrite();
+    display->setAddrWindow(x, y, w, h);
+    display->writePixels((uint16_t*)pixels, (uint32_t)w * h, true, true);
+    display->endWrite();
+}
+
+void drawRGB565(int16_t x, int16_t y, const uint16_t* bitmap, int16_t w, int16_t h, bool bigEndian) {
     if (!displayInitialized || !display || !bitmap) return;
 
+    // Flash is memory-mapped on the ESP32, so panel-order data needs no copy
+    if (bigEndian && fitsScreen(x, y, w, h)) {
+        pushBigEndian(x, y, bitmap, w, h);
+        return;
+    }
+
     int pixels = w * h;
 
     if (pixels <= 144) {
         // Small image (emoji size) - use stack buffer for efficiency
         uint16_t buffer[144];
         memcpy_P(buffer, bitmap, pixels * sizeof(uint16_t));
+        if (bigEndian) swapBytes(buffer, pixels);
         display->drawRGBBitmap(x, y, buffer, w, h);
     } else {
         // Large image - draw row by row to avoid stack overflow
@@ -248,26 +276,140 @@ void drawRGB565(int16_t x, int16_t y, const uint16_t* bitmap, int16_t w, int16_t
 
         for (int row = 0; row < h; row++) {
             memcpy_P(rowBuffer, bitmap + (row * w), rowPixels * sizeof(uint16_t));
+            if (bigEndian) swapBytes(rowBuffer, rowPixels);
             display->drawRGBBitmap(x, y + row, rowBuffer, rowPixels, 1);
         }
     }
 }
 
+// Decode one RLE row into rowBuffer, advancing p, returns false on a corrupt stream
+static bool decodeRLERow(const uint16_t*& p, uint16_t* rowBuffer, int16_t w) {
+    int col = 0;
+    while (col < w) {
+        uint16_t header = *p++;
+        int count = header & 0x7FFF;
+        if (count == 0 || col + count > w) return false;
+
+        if (header & 0x8000) {
+            uint16_t color = *p++;
+            for (int i = 0; i < count; i++) {
+                rowBuffer[col++] = color;
+            }
+        } else {
+            memcpy_P(rowBuffer + col, p, count * sizeof(uint16_t));
+            p += count;
+            col += count;
+        }
+    }
+    return true;
+}
+
+void drawRGB565RLE(int16_t x, int16_t y, const uint16_t* data, int16_t w, int16_t h, bool bigEndian) {
+    if (!displayInitialized || !display || !data || w > 320) return;
+
+    // Panel-order data streams every row into a single address window
+    bool direct = bigEndian && fitsScreen(x, y, w, h);
+    if (direct) {
+        display->startWrite();
+        display->setAddrWindow(x, y, w, h);
+    }
+
+    // Packets never span rows, so each row decodes independently into one buffer
+    uint16_t rowBuffer[320];
+    const uint16_t* p = data;
+
+    for (int row = 0; row < h; row++) {
+        // Whole row is a single run (common for flat backgrounds) - skip the buffer
+        if (p[0] == (0x8000 | w)) {
+            uint16_t color = bigEndian ? __builtin_bswap16(p[1]) : p[1];
+            if (direct) {
+                display->writeColor(color, w);
+            } else {
+                display->drawFastHLine(x, y + row, w, color);
+            }
+            p += 2;
+            continue;
+        }
+
+        if (!decodeRLERow(p, rowBuffer, w)) break;  // Corrupt stream
+
+        if (direct) {
+            display->writePixels(rowBuffer, w, true, true);
+        } else {
+            if (bigEndian) swapBytes(rowBuffer, w);
+            display->drawRGBBitmap(x, y + row, rowBuffer, w, 1);
+        }
+    }
+
+    if (direct) {
+        display->endWrite();
+    }
+}
+
 // =============================================================================
 // EMOJI-AWARE TEXT RENDERING
 // =============================================================================
 
+bool drawEmoji(int16_t x, int16_t y, const EmojiEntry* entry, int16_t size) {
+    if (!displayInitialized || !display) return false;
+
+    // Extra sizes are plain RGB565 tables in PROGMEM
+    if (size != EMOJI_WIDTH) {
+        const uint16_t* bitmap = Emoji::getSizedBitmap(entry, size);
+        if (!bitmap) return false;
+        drawRGB565(x, y, bitmap, size, size, EMOJI_SWAP_BYTES);
+        return true;
+    }
+
+    uint16_t bitmap[EMOJI_PIXELS];
+    if (!Emoji::readBitmap(entry, bitmap)) return false;
+
+    // Alpha plane: copy only the opaque pixels, the background shows through
+    uint8_t mask[EMOJI_MASK_BYTES];
+    if (Emoji::readMask(entry, mask)) {
+        if (EMOJI_SWAP_BYTES) swapBytes(bitmap, EMOJI_PIXELS);
+        display->drawRGBBitmap(x, y, bitmap, mask, EMOJI_WIDTH, EMOJI_HEIGHT);
+        return true;
+    }
+
+    // Bitmap is already in RAM, push it directly
+    if (EMOJI_SWAP_BYTES && fitsScreen(x, y, EMOJI_WIDTH, EMOJI_HEIGHT)) {
+        pushBigEndian(x, y, bitmap, EMOJI_WIDTH, EMOJI_HEIGHT);
+    } else {
+        if (EMOJI_SWAP_BYTES) swapBytes(bitmap, EMOJI_PIXELS);
+        display->drawRGBBitmap(x, y, bitmap, EMOJI_WIDTH, EMOJI_HEIGHT);
+    }
+    return true;
+}
+
 void drawTextWithEmoji(int16_t x, int16_t y, const char* text, uint16_t color, uint8_t size) {
     if (!displayInitialized || !display || !text) return;
 
     int16_t cursorX = x;
     int16_t charWidth = 6 * size;
     int16_t charHeight = 8 * size;
+    int16_t emojiSize = Emoji::sizeForText(size);
     const char* p = text;
 
     while (*p) {
+        // Longest emoji or emoji sequence (ZWJ, keycap, flag) starting here
+        int bytes;
+        const EmojiEntry* emoji = Emoji::matchUTF8(p, &bytes);
+        if (emoji) {
+            // Center vertically relative to text
+            int16_t emojiY = y;
+            if (charHeight > emojiSize) {
+                emojiY += (charHeight - emojiSize) / 2;
+            }
+            if (drawEmoji(cursorX, emojiY, emoji, emojiSize)) {
+                cursorX += emojiSize;
+                p += bytes;
+                continue;
+            }
+        }
+
         uint32_t codepoint;
-        int bytes = Emoji::decodeUTF8(p, &codepoint);
+        bytes = Emoji::decodeUTF8(p, &codepoint);
 
         if (bytes == 0) {
             // Invalid byte, skip it
@@ -285,19 +427,8 @@ void drawTextWithEmoji(int16_t x, int16_t y, const char* text, uint16_t color, u
             cursorX += charWidth;
             p++;
         } else {
-            // Multi-byte UTF-8 character - check if it's an emoji
-            const EmojiEntry* emoji = Emoji::findByCodepoint(codepoint);
-            if (emoji && emoji->bitmap) {
-                // Draw emoji bitmap (12x12 RGB565)
-                // Center vertically relative to text
-                int16_t emojiY = y;
-                if (charHeight > EMOJI_HEIGHT) {
-                    emojiY += (charHeight - EMOJI_HEIGHT) / 2;
-                }
-                // Use our PROGMEM-safe function
-                drawRGB565(cursorX, emojiY, emoji->bitmap, EMOJI_WIDTH, EMOJI_HEIGHT);
-                cursorX += EMOJI_WIDTH;
-            } else {
+            // Joiners and modifiers left over from an unknown sequence take no space
+            if (!Emoji::isZeroWidth(codepoint)) {
                 // Unknown Unicode character - render placeholder [?]
                 display->setTextColor(color);
                 display->setTextSize(size);
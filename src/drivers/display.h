@@ -16,6 +16,8 @@
 #include <Arduino.h>
 #include "../config.h"
 
+struct EmojiEntry;
+
 // =============================================================================
 // DISPLAY DRIVER INTERFACE
 // =============================================================================
@@ -166,16 +168,44 @@ void drawBitmapBg(int16_t x, int16_t y, const uint8_t* bitmap, int16_t w, int16_
  * @param bitmap Pointer to RGB565 pixel data in PROGMEM
  * @param w Width in pixels
  * @param h Height in pixels
+ * @param bigEndian true if pixels are pre-swapped to panel byte order (--swap-bytes),
+ *                  these are pushed straight to SPI when fully on screen
+ */
+void drawRGB565(int16_t x, int16_t y, const uint16_t* bitmap, int16_t w, int16_t h, bool bigEndian = false);
+
+/**
+ * Draw an RLE-compressed RGB565 image from PROGMEM (see tools/convert_rgb565.py)
+ * Decodes one row at a time, no full-frame buffer is needed
+ * @param x X position
+ * @param y Y position
+ * @param data Pointer to the row-aligned RLE stream in PROGMEM
+ * @param w Width in pixels (max 320)
+ * @param h Height in pixels
+ * @param bigEndian true if pixels are pre-swapped to panel byte order (--swap-bytes)
  */
-void drawRGB565(int16_t x, int16_t y, const uint16_t* bitmap, int16_t w, int16_t h);
+void drawRGB565RLE(int16_t x, int16_t y, const uint16_t* data, int16_t w, int16_t h, bool bigEndian = false);
 
 // =============================================================================
 // EMOJI-AWARE TEXT RENDERING
 // =============================================================================
 
+/**
+ * Draw a single emoji bitmap
+ * Transparent pixels are skipped when EmojiData.h has an alpha plane;
+ * pre-composited variants follow Emoji::setBackground()
+ *
+ * @param x X position
+ * @param y Y position
+ * @param entry Emoji entry (may be nullptr)
+ * @param size Bitmap size in pixels, 12 or a size generated with --sizes
+ * @return true if a bitmap was drawn
+ */
+bool drawEmoji(int16_t x, int16_t y, const EmojiEntry* entry, int16_t size = 12);
+
 /**
  * Draw text with embedded emoji support
- * Parses UTF-8 text and renders emoji as bitmaps inline with text.
+ * Parses UTF-8 text and renders emoji (including ZWJ, keycap and flag
+ * sequences) as bitmaps inline with text.
  * Unknown Unicode characters are rendered as [?]
  *
  * @param x X position
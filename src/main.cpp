@@ -748,8 +748,8 @@ void showBootScreen() {
     int16_t logoY = 8;
 
     // Draw the MeshBerry grayscale logo (RGB565 format)
-    Display::drawRGB565(logoX, logoY, BootLogo::LOGO,
-                        BootLogo::WIDTH, BootLogo::HEIGHT);
+    Display::drawRGB565RLE(logoX, logoY, BootLogo::LOGO_RLE,
+                           BootLogo::WIDTH, BootLogo::HEIGHT, BootLogo::BYTE_SWAPPED);
 
     // Title centered below logo
     int16_t textY = logoY + BootLogo::HEIGHT + 10;
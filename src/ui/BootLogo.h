@@ -1,11 +1,12 @@
 /**
- * MeshBerry Boot Logo - Full Color Version
+ * MeshBerry BootLogo Image (Auto-Generated)
  *
  * SPDX-License-Identifier: GPL-3.0-or-later
  * Copyright (C) 2026 NodakMesh (nodakmesh.org)
  *
- * 120x103 RGB565 bitmap converted from Meshberry.jpg
- * Background replaced with Theme::BG_PRIMARY (black)
+ * Boot logo converted from Meshberry.jpg, background replaced with Theme::BG_PRIMARY (black)
+ * 120x103 RGB565 bitmap, RLE-compressed to 7192 bytes (raw 24720), draw with Display::drawRGB565RLE()
+ * Generated by tools/convert_rgb565.py from BootLogo.h
  */
 
 #ifndef MESHBERRY_BOOTLOGO_H
@@ -18,783 +19,241 @@ namespace BootLogo {
 constexpr int16_t WIDTH = 120;
 constexpr int16_t HEIGHT = 103;
 
-// RGB565 pixel data
-const uint16_t LOGO[] PROGMEM = {
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x5BE8, 0x6468, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x6CA8, 0x8627, 0x6C48, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x7548, 0x7DA7, 0x85E8, 0x6448, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x6C68, 0x7DA7, 0x7DA7, 0x7DA7, 0x7DA7, 0x7DA8, 0x6CA8, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x7DC8,
-    0x7DC7, 0x7DA7, 0x7DA7, 0x7DA7, 0x7DC7, 0x8608, 0x6C48, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x7D87, 0x7DA7, 0x7DC7, 0x75A7, 0x7DA7, 0x7DA7, 0x7D87, 0x7DA8, 0x5BE8,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x7528, 0x7DA7,
-    0x7DA7, 0x7DC7, 0x7DC7, 0x7587, 0x7D87, 0x7546, 0x7DA7, 0x7DE7, 0x7548, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x7DA8, 0x7DC7, 0x7DA7, 0x7567, 0x7DA7, 0x7566, 0x6D47, 0x7587, 0x7DC7, 0x7DA7,
-    0x8607, 0x5BA8, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x7D88, 0x7DC7,
-    0x7DC7, 0x7D87, 0x6D26, 0x6D06, 0x6D26, 0x7DC7, 0x7DC7, 0x7DA7, 0x7DE7, 0x7528, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x6428, 0x7DC7, 0x7DA7, 0x7DA7, 0x7DA7, 0x7DA7, 0x7587, 0x6D25, 0x7DC7, 0x7DA7, 0x7DA7,
-    0x7DA7, 0x7DC7, 0x6C88, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x6408, 0x0000, 0x0000, 0x6428, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x6C88, 0x85E7, 0x7D87,
-    0x7DA7, 0x7DA7, 0x7DC7, 0x7DE7, 0x6D46, 0x7547, 0x7DA7, 0x7587, 0x7DA7, 0x7DC7, 0x7DC7, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x5BE8, 0x6408, 0x0000, 0x5BA8, 0x5BA8, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x7508, 0x7DA8, 0x7548, 0x7548, 0x8607, 0x7DC8, 0x7D88, 0x7DC7, 0x7DC7, 0x7528, 0x7D88, 0x7D88,
-    0x5B88, 0x0000, 0x0000, 0x0000, 0x0000, 0x5B88, 0x7DC8, 0x7D87, 0x7DA7, 0x7D87, 0x7587, 0x7DA7, 0x7567, 0x6D26, 0x7DC7, 0x7587,
-    0x7DC7, 0x7D87, 0x7DC7, 0x5B68, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x6C88, 0x7DC7, 0x7507, 0x7D67, 0x7DE8,
-    0x7DC8, 0x7DC8, 0x8608, 0x7DA8, 0x7548, 0x7D68, 0x85C8, 0x5BA8, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x5B68, 0x85E8, 0x7DC7, 0x7DC7,
-    0x7DA7, 0x7DA7, 0x7DA7, 0x7D87, 0x7DC7, 0x7DC7, 0x7DC7, 0x7DA7, 0x7DC7, 0x6CA8, 0x6408, 0x0000, 0x0000, 0x0000, 0x7567, 0x7DC7,
-    0x7DC7, 0x7DC7, 0x7567, 0x6D26, 0x7567, 0x6D46, 0x6D46, 0x7DA7, 0x7DA7, 0x7DA7, 0x8607, 0x6408, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x5BC7, 0x7D28, 0x85E7, 0x7DC7, 0x85E7, 0x7DC7, 0x7D87, 0x7587, 0x7DA7, 0x7DA7, 0x7DA7, 0x7DC8, 0x85E7, 0x7528, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x7508, 0x7DC7, 0x7DA7, 0x7DA7, 0x7D87, 0x7DA7, 0x7567, 0x7DC7, 0x7DA7, 0x7DA7, 0x7DA7,
-    0x7DA7, 0x8607, 0x8627, 0x6C87, 0x0000, 0x0000, 0x7DC8, 0x7DA7, 0x7DA7, 0x7DA7, 0x7DA7, 0x7587, 0x7566, 0x64C5, 0x6D06, 0x7DA7,
-    0x7DA7, 0x7DC7, 0x8607, 0x6448, 0x0000, 0x0000, 0x0000, 0x0000, 0x85C8, 0x8608, 0x7DC7, 0x7D87, 0x7DA7, 0x7DA7, 0x7DC7, 0x7D87,
-    0x7567, 0x7DA8, 0x7D87, 0x7DA7, 0x7DA7, 0x85E8, 0x5B88, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x7DC8, 0x7DC7,
-    0x7DC7, 0x7567, 0x7587, 0x7586, 0x7587, 0x7DC7, 0x7DA7, 0x7DA7, 0x7DC7, 0x7DA7, 0x7D87, 0x7DE7, 0x6408, 0x0000, 0x7568, 0x7DE7,
-    0x7DA7, 0x7DA7, 0x7DA7, 0x7DA7, 0x7DC7, 0x7566, 0x6D26, 0x7DC7, 0x7DC7, 0x7587, 0x7DC7, 0x7548, 0x0000, 0x0000, 0x0000, 0x7527,
-    0x7DC7, 0x7DA7, 0x7DE7, 0x75A7, 0x7567, 0x7DA7, 0x7DC7, 0x7567, 0x7D87, 0x7567, 0x7D87, 0x7DC7, 0x7DE7, 0x6CC8, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x5B88, 0x85E8, 0x7DA7, 0x7D87, 0x7D87, 0x7D87, 0x6D06, 0x6506, 0x7DA7, 0x7DE7, 0x75A7,
-    0x7DA7, 0x7DA7, 0x7DA7, 0x7DC7, 0x8608, 0x6468, 0x0000, 0x7DA7, 0x7DA7, 0x7587, 0x7587, 0x7DA7, 0x7DA7, 0x7DC7, 0x6D46, 0x7DC7,
-    0x7587, 0x7546, 0x7DA7, 0x7588, 0x0000, 0x0000, 0x7528, 0x7DC7, 0x7D87, 0x7DA7, 0x7DC7, 0x7587, 0x7DC7, 0x7DC7, 0x7547, 0x64E5,
-    0x7586, 0x7DA7, 0x7D87, 0x7D87, 0x85E8, 0x7508, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x6CA8, 0x7DE7,
-    0x7567, 0x7567, 0x75A6, 0x7DA7, 0x7566, 0x6D05, 0x7587, 0x7587, 0x7567, 0x7DA7, 0x7DA7, 0x7DA7, 0x7DE7, 0x8608, 0x0000, 0x6447,
-    0x8608, 0x7D87, 0x7566, 0x7566, 0x7DA7, 0x7DC7, 0x6D26, 0x75A7, 0x7566, 0x7D87, 0x7DE8, 0x6CE8, 0x0000, 0x7547, 0x8627, 0x7DC7,
-    0x7DA7, 0x7DA7, 0x7D87, 0x7567, 0x7DC7, 0x6D26, 0x6D06, 0x7587, 0x7DA6, 0x7586, 0x7546, 0x7D87, 0x7DA8, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x7508, 0x7DE7, 0x7DC7, 0x7DC7, 0x7DA7, 0x7DC7, 0x7DA7, 0x6D26, 0x64A5,
-    0x6D26, 0x7DC7, 0x7DC7, 0x75A7, 0x7DA7, 0x7DC7, 0x7508, 0x5BE8, 0x7586, 0x7586, 0x7DC7, 0x7DA7, 0x6D46, 0x6D46, 0x6D06, 0x6D26,
-    0x75A7, 0x7DA7, 0x7DC6, 0x6427, 0x5B68, 0x7DC7, 0x7DA7, 0x7DA7, 0x7DA7, 0x7DC7, 0x7D87, 0x5CA5, 0x64E6, 0x7587, 0x7DC7, 0x7DC7,
-    0x7DC7, 0x7DC7, 0x85C7, 0x85A8, 0x5B88, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x6CA8,
-    0x8607, 0x7DA7, 0x7DA7, 0x7DA7, 0x7DA7, 0x7587, 0x7546, 0x64E6, 0x64E5, 0x7566, 0x85E7, 0x7587, 0x7D87, 0x7DA7, 0x7DC6, 0x5B88,
-    0xADF3, 0x964C, 0x6D65, 0x75A6, 0x7DA7, 0x7567, 0x64C5, 0x5CC5, 0x75A6, 0x7DC8, 0xB6F2, 0x740B, 0x64A6, 0x7DC7, 0x7DA8, 0x7567,
-    0x7DC7, 0x7DA7, 0x6D06, 0x64C5, 0x6D26, 0x7586, 0x75A7, 0x7DA7, 0x7DA7, 0x7DA7, 0x7DA7, 0x85C8, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x7D88, 0x7DC7, 0x7DA7, 0x7DA7, 0x7D87, 0x7DA7, 0x7586, 0x75A6,
-    0x7DC7, 0x6D06, 0x64E6, 0x6D46, 0x7565, 0x85C7, 0xA68E, 0xC6B7, 0xDEFD, 0xDF1A, 0xC714, 0x962B, 0x7586, 0x7DC7, 0x7586, 0x7D69,
-    0xB6D1, 0xCEF8, 0xE73E, 0xD6BA, 0xAE91, 0x85E8, 0x7565, 0x6D05, 0x6D46, 0x64E5, 0x7566, 0x7DA6, 0x7586, 0x7566, 0x7D87, 0x7DA7,
-    0x7DA7, 0x7DA7, 0x85E8, 0x6C48, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x7D68, 0x7DE7, 0x7D87, 0x7DA8, 0x7585, 0x9E4E, 0xAEB1, 0x8E09, 0x85E8, 0x6D46, 0x74E8, 0x960E, 0xCF17, 0xB596, 0x0000,
-    0x0000, 0x0000, 0x8C52, 0xBE37, 0xC6F7, 0xC6F6, 0xC6F6, 0xBE57, 0x94B3, 0x0000, 0x6B6D, 0x0000, 0x9CD4, 0xCEB8, 0xAE72, 0x854B,
-    0x7528, 0x962A, 0xA68D, 0xAEB0, 0xD779, 0x9E4D, 0x7565, 0x7DA8, 0x7DA7, 0x85E7, 0x63E8, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x5BC8, 0x85C8, 0x85E8, 0x7586, 0x9E4D, 0xD71A, 0xCE5A,
-    0xC677, 0xC6D7, 0xC6D6, 0xEF9D, 0xC639, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xA515, 0xFFDF, 0xAD56, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xA535, 0xF7BF, 0xDF3A, 0xB5F6, 0xB5B6, 0x9CF3, 0xAD77, 0xCEB9, 0x9E4D, 0x7586,
-    0x85E8, 0x7508, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x6C48, 0xC714, 0xAD96, 0x0000, 0x0000, 0x0000, 0x0000, 0x9CF4, 0xDF1C, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x7C10, 0x0000, 0x0000, 0x0000, 0x0000, 0xCE99, 0x0000, 0x0000, 0x0000, 0x0000, 0x8C51, 0x0000, 0x0000, 0x6B6D, 0x0000, 0xC639,
-    0xA534, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xB5D7, 0xBEB4, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x7BF0, 0xBDD8, 0x8C31, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0xBE18, 0x0000, 0x0000, 0x0000, 0xB5B6, 0xFFFF, 0x8C51, 0x0000, 0x0000, 0x0000, 0xCE79, 0x0000, 0x0000,
-    0x0000, 0x7BEF, 0xFFFF, 0xCE79, 0x0000, 0x0000, 0x0000, 0xAD75, 0x7C10, 0x0000, 0x0000, 0x0000, 0x738E, 0x0000, 0x0000, 0x9493,
-    0xBE18, 0x7BCF, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0xDF1C, 0xA514, 0x0000, 0x0000, 0xB5D7, 0xC638, 0x0000, 0x0000, 0x0000, 0xBDF7, 0x0000, 0x0000, 0x0000, 0x7BF0,
-    0xB5B6, 0x738E, 0x0000, 0x0000, 0x0000, 0xCE79, 0x0000, 0x0000, 0x0000, 0x6B4D, 0xAD55, 0x8430, 0x0000, 0x0000, 0x0000, 0x9CD3,
-    0x8C71, 0x0000, 0x0000, 0x8430, 0xF7BF, 0x94B2, 0x0000, 0x0000, 0xBE18, 0xBDF7, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xAD96, 0x0000, 0x0000, 0x0000, 0xBDF8, 0xB5D7,
-    0x0000, 0x0000, 0xB5B6, 0xAD76, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xA534, 0xEF9E, 0x73AE, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x9CF3, 0xEF5D, 0x738E, 0x0000, 0x73AE, 0xC618, 0x8430, 0x0000, 0x0000,
-    0x8C51, 0x9CF3, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0xE71C, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xCE7A, 0xFFFF, 0xE75D, 0x8C51, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0xAD75, 0xE73C, 0xE71C, 0xDEFB, 0x9CD3, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xBDD7, 0xE71C,
-    0xE73D, 0xD6BB, 0x0000, 0x0000, 0x0000, 0x0000, 0x6B6D, 0x0000, 0x7C10, 0xA534, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x6B6D, 0xC618, 0xDEDB, 0xC638, 0x9CD3, 0x0000, 0x0000, 0xAD75,
-    0xCE59, 0x94B2, 0x7BF0, 0x8C51, 0xCE59, 0xBE18, 0x73AE, 0x6B6D, 0x8C51, 0xB596, 0xD69A, 0x9CD3, 0x0000, 0x738E, 0x0000, 0xB596,
-    0xD6BA, 0xA535, 0x9CF3, 0x94B2, 0xB596, 0xD69A, 0x9CF3, 0x0000, 0x6B8E, 0x7C10, 0xCE79, 0xA534, 0x0000, 0x0000, 0x0000, 0x0000,
-    0xAD75, 0xEF7E, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xA535,
-    0xBDD7, 0x73AE, 0x0000, 0x0000, 0xBDF7, 0xD6DB, 0xC638, 0xAD75, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x8410, 0xDEFB, 0xF7BF,
-    0xE75C, 0x9492, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xB5B6, 0xFFFF, 0xFFFF, 0x9CD3, 0x0000, 0x0000, 0x0000,
-    0x6B6D, 0x0000, 0x0000, 0xAD55, 0xCE59, 0x8C71, 0xAD96, 0xCE9A, 0xB5B7, 0xBE18, 0xCE59, 0x6B6D, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xAD55, 0xD6BA, 0x8410, 0x0000, 0x0000, 0x0000, 0x0000, 0xAD75, 0xFFFF, 0x7BEF, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x8431, 0xEF7E, 0x94D2, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0xBE18, 0xBDD7, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x7C10, 0xFFFF, 0xDF1C, 0x0000,
-    0x0000, 0x0000, 0x6B8E, 0xBE18, 0x94B2, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xCE59, 0x9CF3, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0xAD76, 0xBDF7, 0x0000, 0x738E, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xD6BA,
-    0x0000, 0x0000, 0x738E, 0x0000, 0x6B8E, 0x8450, 0x0000, 0x738E, 0x0000, 0x0000, 0xA534, 0xA514, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x8430, 0x0000, 0x0000, 0x73AE, 0x0000, 0xAD76, 0xB5B7, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x9CF3, 0xC659, 0x8430, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xBDD7, 0x0000, 0x0000, 0x8C92, 0xC638, 0x738E, 0x0000, 0x94B3, 0xA514, 0x0000, 0x0000,
-    0x0000, 0xC659, 0xDEDB, 0x6B8E, 0x0000, 0x0000, 0x0000, 0xD6DB, 0x0000, 0x0000, 0x0000, 0x0000, 0xDEFB, 0xFFFF, 0x8C71, 0x0000,
-    0x0000, 0x0000, 0xA514, 0xA514, 0x0000, 0x0000, 0x0000, 0x94B3, 0xFFFF, 0xBE18, 0x0000, 0x0000, 0x0000, 0xA534, 0x9D14, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xC618, 0xD69A, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xB5B7, 0x0000, 0x0000,
-    0xAD96, 0xF7BF, 0x738E, 0x0000, 0xA514, 0x9CD3, 0x0000, 0x0000, 0x0000, 0xD69A, 0xEF5D, 0x73AE, 0x0000, 0x0000, 0x0000, 0xCE9A,
-    0x0000, 0x0000, 0x0000, 0x0000, 0xB596, 0xCE7A, 0x7BEF, 0x0000, 0x0000, 0x0000, 0xA514, 0xA514, 0x0000, 0x0000, 0x0000, 0x8C51,
-    0xD6DB, 0xA534, 0x0000, 0x0000, 0x0000, 0xA514, 0x94D3, 0x0000, 0x0000, 0x8C71, 0xC638, 0x73AF, 0x0000, 0x0000, 0xBDD7, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x7BEF, 0xAD55, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xB596, 0x8C71, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x6B6D, 0x0000, 0x6B8E, 0x0000, 0x7BCF, 0xD69A, 0x0000, 0x0000, 0x73AE, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x7BAE, 0x0000, 0xB596, 0xBDF7, 0x0000, 0x738E, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x6B8E, 0x0000, 0x9CD3, 0x94D3, 0x0000,
-    0x0000, 0x9492, 0xFFFF, 0x9492, 0x0000, 0x0000, 0xB5D7, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xBE18, 0xB5B7, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0xCE9A, 0x94D3, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xDEDB, 0xEF7E,
-    0x7BCF, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x8430, 0xF7BF, 0xFFFF, 0x8C51, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xAD76, 0xB5B6, 0x0000, 0x6B6D, 0x0000, 0x7BCF, 0x0000, 0x0000, 0x0000, 0xB5B6, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0xC638, 0xF79E, 0x73AE, 0x0000, 0x0000, 0x0000, 0x8431, 0x8451, 0xDEFB, 0xE73C, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xB5D7, 0xEF5D, 0xDF1C, 0xDEDB, 0x9492, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0xAD55, 0xD6DA, 0xC638, 0xC659, 0xD6BB, 0x94B2, 0x0000, 0x0000, 0x6B6D, 0x0000, 0x0000, 0x0000, 0x0000, 0xE73D, 0xFFFF, 0x8430,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xBDD7, 0x8410, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x6B8E, 0xB596, 0xB5D7, 0x9CF4, 0xD6DB, 0x9CD3,
-    0x0000, 0x9492, 0xF7DF, 0xEF7E, 0xC638, 0xA534, 0xC659, 0xA514, 0x0000, 0x0000, 0x738E, 0xAD55, 0xDF1C, 0x94B3, 0x0000, 0x0000,
-    0x73AE, 0xCE59, 0xDEDB, 0x9492, 0x7BEF, 0x8451, 0x9CF3, 0xE73C, 0xBDD7, 0x0000, 0x0000, 0x0000, 0x0000, 0xCE59, 0xDEFB, 0x7BEF,
-    0x738E, 0x0000, 0x6B6D, 0xBE18, 0xEF9E, 0xD6BB, 0xEF7D, 0xD69A, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xE73D, 0xC638,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0xDEFB, 0xC618, 0x73AF, 0x0000, 0x0000, 0x0000, 0xBE18, 0xEF7E, 0xBDF7, 0x8C92, 0x7C10, 0xAD96, 0xC639, 0xAD55, 0xC639,
-    0xDEDB, 0xAD96, 0xDEDB, 0xB5B6, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xC638, 0xF7DF, 0xF7DF, 0xBE18, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x7BEF, 0xCE79, 0xDF1C, 0xDF1C, 0xD6BA, 0xA534, 0x0000, 0x0000, 0x738E, 0x9CF4,
-    0xCE79, 0x0000, 0x0000, 0x0000, 0x0000, 0xCE79, 0xB5B6, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xDEDB, 0x0000, 0x0000, 0x0000, 0x6B6D, 0x8430, 0xD6BA,
-    0x9492, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xA555, 0xD6BB, 0xEF9E, 0xFFFF, 0x8430, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0xDEFB, 0xDF1C, 0x738E, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x73AE,
-    0xEF9E, 0xEF7E, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x8451, 0xE75D, 0xB5B6, 0xB596, 0xEF7D, 0xD6DB, 0xDF1C, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x7BEF, 0x9CF4, 0x0000, 0x0000, 0x7BCF, 0xF79E, 0xC659, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x94B2,
-    0xF7BE, 0xB5D7, 0x0000, 0x73AE, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x7BCF, 0x0000, 0xA534, 0xA555, 0x0000, 0x7BCF,
-    0x6B6D, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x7BEF, 0x0000, 0xAD96, 0xAD76, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x738E, 0xE75D, 0xFFDF, 0xCE7A, 0x94B2, 0xBDD7, 0xCE7A, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x9CF3, 0x8410, 0x0000, 0x8410, 0xDEFB, 0xF79E, 0x7BF0, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x738E, 0x0000, 0x0000, 0xE73C, 0xA535, 0x0000, 0x0000, 0x6B6D, 0x6B6D, 0xAD76, 0xA534,
-    0x0000, 0x0000, 0x0000, 0x0000, 0xA535, 0xA555, 0x0000, 0x0000, 0x0000, 0x738E, 0xB596, 0xBDF8, 0x73AE, 0x738D, 0x0000, 0x0000,
-    0xAD55, 0x9CF3, 0x0000, 0x73AE, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xA534, 0xF7DF, 0x0000, 0x0000, 0x0000, 0x73AE,
-    0xCE7A, 0x6B6D, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0xBDD7, 0x0000, 0x0000, 0xA555, 0xFFFF, 0xD6BB, 0x0000, 0x0000, 0x6B6D, 0x73AE, 0xBDD7, 0x8C51, 0x0000, 0x0000, 0x0000, 0x0000,
-    0xE73C, 0xA534, 0x0000, 0x0000, 0x0000, 0x738E, 0xFFFF, 0xFFFF, 0x738E, 0x0000, 0x0000, 0x0000, 0xAD55, 0xA555, 0x0000, 0x0000,
-    0x0000, 0x6B6D, 0xFFDF, 0xFFFF, 0x7BCF, 0x0000, 0x0000, 0x0000, 0xAD75, 0xA514, 0x0000, 0x0000, 0x0000, 0xBDF7, 0xA534, 0x0000,
-    0x6B6D, 0x0000, 0x7C10, 0xD69A, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xC618, 0x94B2, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x7BEF, 0xE71C, 0x0000, 0x0000, 0x0000, 0x7C10, 0xBE18, 0x0000, 0x0000,
-    0x0000, 0xA534, 0xFFFF, 0xCE59, 0x0000, 0x0000, 0x0000, 0x0000, 0xDF1C, 0xA534, 0x0000, 0x0000, 0x0000, 0x6B6E, 0xAD76, 0xA555,
-    0x6B6D, 0x0000, 0x0000, 0x0000, 0xAD55, 0xA534, 0x0000, 0x0000, 0x0000, 0x6B6D, 0x94B2, 0xA534, 0x6B8E, 0x0000, 0x0000, 0x0000,
-    0xAD96, 0x9CD3, 0x0000, 0x0000, 0x738E, 0xFFDF, 0xEF7E, 0x0000, 0x0000, 0x0000, 0x8410, 0xC659, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0xFFFF, 0x8C71, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0xDEFB, 0x6B8E, 0x0000, 0x0000, 0x0000, 0xC639, 0x0000, 0x0000, 0x0000, 0x73AE, 0xAD96, 0x8410, 0x6B8D, 0x0000, 0x0000, 0x0000,
-    0xDEFB, 0x94B3, 0x0000, 0x7BCE, 0x738E, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x7BEF, 0x0000, 0xAD96, 0xAD55, 0x0000, 0x7BCF,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x7BCF, 0x0000, 0xAD96, 0xAD75, 0x0000, 0x6B6D, 0x0000, 0x8C71, 0x8C71, 0x0000,
-    0x0000, 0x0000, 0x9CD3, 0x9D14, 0x0000, 0x0000, 0x73AE, 0x0000, 0x0000, 0x0000, 0xBDF7, 0x7BCF, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xCE9A, 0x0000, 0x0000, 0x0000, 0xC639, 0x0000, 0x6B6D,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x73AE, 0x0000, 0xE71C, 0xB5D7, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x7BCF, 0xEF7E, 0xEF7D, 0x7BCF, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x738E,
-    0xDF1C, 0xDEDB, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x738E, 0x0000, 0xAD96, 0x8C71, 0x0000, 0x0000, 0xEF7E, 0xCE7A,
-    0x0000, 0x0000, 0xAD96, 0x738E, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x8C92, 0xB5D7, 0x0000, 0x8430, 0xE71C, 0x6B8E, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xB596,
-    0xFFFF, 0xFFDF, 0x8451, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xCE9A, 0xEF9E, 0xEF9E, 0xC659, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xB5B6, 0xFFFF, 0xF7DF, 0x73AE, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0xC659, 0x738E, 0x0000, 0x6B6D, 0xC618, 0xB5B6, 0x0000, 0x0000, 0xAD55, 0x73AE, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xC638, 0xCE9A, 0xDEFC, 0xFFFF, 0xB5D7, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xA514, 0xD6DB, 0xBDF7, 0xAD75, 0xD6DB, 0xCE79, 0x73AE, 0x0000, 0x0000, 0x0000,
-    0x0000, 0xB5B6, 0xEF5D, 0x9492, 0x6B8E, 0x738E, 0x9492, 0xE75D, 0xB5D7, 0x0000, 0x0000, 0x0000, 0x0000, 0x9CF4, 0xE75D, 0xB5B6,
-    0x8C51, 0xA514, 0xDEDB, 0x9491, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x9D14, 0xFFFF, 0xA534, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0xAD55, 0x7BEF, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x9D14, 0xFFFF, 0xDEDB, 0x8451, 0xB5B7, 0xE73C, 0x9492, 0x0000, 0x0000, 0x0000, 0x0000, 0xD6BB, 0xC659, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x94D3, 0xE73C, 0xBDF8, 0xB5B6, 0xB5B7, 0xD6DB, 0xBDD7, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0xB5B6, 0xDEFB, 0xC638, 0xBDF7, 0xCE9A, 0xCE79, 0x6B6D, 0x0000, 0x0000, 0x0000, 0x0000, 0xD6BB, 0xCE9A, 0x0000, 0x0000, 0x94B2,
-    0xD6DB, 0xE73D, 0xF7DF, 0x8430, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xD6BA, 0x94B2, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xDEFC, 0xDEDB, 0x8430, 0x0000, 0x0000, 0x0000, 0x0000,
-    0xD69A, 0xCE7A, 0x9CF3, 0xAD55, 0xDF1C, 0x9CD3, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xB5B6, 0xFFFF, 0xFFFF,
-    0x8431, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x7BEF, 0xFFFF, 0xFFFF, 0x94D3, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0xA535, 0xD6DB, 0xE73C, 0xE73C, 0x8410, 0x0000, 0x8C51, 0xC659, 0x7BCF, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x8431, 0xF7BF, 0x94D3, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0xE75D, 0x9492, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x9492, 0xF7DF, 0xF7DF, 0x6B8E, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x738E, 0xDEFC, 0xC618, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0xBDF8, 0xDEDB, 0x738E, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xAD96, 0xFFFF, 0x8C72,
-    0x0000, 0x0000, 0x0000, 0x0000, 0xD69A, 0x9492, 0x0000, 0x0000, 0xA534, 0xC638, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xC639, 0x0000, 0x6B6D, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0xD6BB, 0xC638, 0x6B6D, 0x6B6D, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x7BEF, 0x0000, 0xB5B6, 0x94B2,
-    0x0000, 0x73AE, 0x738E, 0x0000, 0x0000, 0x0000, 0x0000, 0x738E, 0x73AE, 0x0000, 0x94B2, 0xB5B6, 0x0000, 0x7BEF, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x7BCF, 0x73AE, 0xDEFB, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xC638, 0xC659, 0xD6BA,
-    0xCE7A, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0xC638, 0x0000, 0x0000, 0x0000, 0x7BCF, 0x0000, 0x0000, 0x0000, 0x0000, 0xB596, 0xAD55, 0x0000, 0x0000, 0x73AE, 0x0000,
-    0x94B2, 0x7BEF, 0x6B6D, 0x0000, 0x0000, 0x0000, 0xBDD7, 0x9CD3, 0x0000, 0x0000, 0x0000, 0x73AE, 0xCE79, 0xCE9A, 0x7BEF, 0x0000,
-    0x0000, 0x0000, 0x9CF3, 0xB5D7, 0x0000, 0x0000, 0x0000, 0x73AE, 0xAD75, 0x94B2, 0x73AE, 0x0000, 0x0000, 0x0000, 0xDEFC, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x738E, 0xEFBE, 0xEF7E, 0xEF7E, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xBDD7, 0x0000, 0x0000, 0x0000, 0xFFFF, 0xC659, 0x0000,
-    0x0000, 0x0000, 0x9D14, 0xAD96, 0x0000, 0x0000, 0x0000, 0x9492, 0xFFFF, 0xE75D, 0x0000, 0x0000, 0x0000, 0x0000, 0xB5D7, 0x9CD3,
-    0x0000, 0x0000, 0x0000, 0x738E, 0xFFFF, 0xFFFF, 0x7BEF, 0x0000, 0x0000, 0x0000, 0x9D14, 0xB5B7, 0x0000, 0x0000, 0x0000, 0x8451,
-    0xFFFF, 0xEF9E, 0x0000, 0x0000, 0x0000, 0x0000, 0xCE9A, 0x0000, 0x0000, 0x0000, 0x6B6D, 0x0000, 0x738E, 0x0000, 0xBE18, 0x7C10,
-    0xB5D7, 0x94B2, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x73AE, 0xB596, 0x0000, 0x0000, 0x6B6E, 0xBDF8, 0xA534, 0x0000, 0x0000, 0x0000, 0x94D3, 0xAD96, 0x0000, 0x0000, 0x0000, 0x8410,
-    0xE73C, 0xC618, 0x6B6D, 0x0000, 0x0000, 0x0000, 0xB5B7, 0x9CD3, 0x0000, 0x0000, 0x6B6D, 0x738E, 0x94B3, 0x94D3, 0x6B6D, 0x6B8E,
-    0x0000, 0x0000, 0xA514, 0xB596, 0x0000, 0x0000, 0x0000, 0x7BEF, 0xC639, 0xB596, 0x0000, 0x0000, 0x0000, 0x6B6D, 0xCE79, 0x0000,
-    0x0000, 0xD6BA, 0xE75D, 0x6B6D, 0x0000, 0x0000, 0xBDF8, 0x738E, 0x0000, 0xC639, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xAD55, 0xE71C, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x94B3, 0xBDD7, 0x0000, 0x0000, 0x7BEF, 0x0000, 0x0000, 0x0000, 0x0000, 0x738E, 0x6B6D, 0x0000, 0xB5D7, 0x94B2,
-    0x0000, 0x7C0F, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x7BEF, 0x0000, 0xA555, 0xB5B6, 0x0000, 0x7BCF, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x73AE, 0x0000, 0x73AE, 0xC659, 0x0000, 0x0000, 0xBE18, 0xDEFB, 0x0000, 0x0000, 0x0000, 0xBDF7, 0x7C10,
-    0x0000, 0x8C71, 0xA555, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x8410, 0xE71C, 0x8C51, 0x0000, 0x0000, 0x6B6D, 0x0000, 0x0000, 0x0000, 0x0000, 0x94B3, 0xBDF8, 0x0000, 0x7BCF, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x7BEF, 0xE73D, 0xD6BB, 0x6B6D, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x6B6D, 0xDF1C, 0xEF5D, 0x8410, 0x0000, 0x0000, 0x0000, 0x6B6D, 0x0000, 0x0000, 0x0000, 0x0000, 0xA534, 0xE71C, 0x73AE,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xC659, 0x7BEF, 0x0000, 0x0000, 0xD6DB, 0x8C92, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xC659, 0x94B2, 0x0000, 0x6B6D, 0x0000, 0x0000,
-    0x0000, 0x736E, 0xE75D, 0xEF9E, 0x738E, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xA534, 0xFFFF, 0xFFFF,
-    0x94B3, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xA534, 0xF7FF, 0xFFFF, 0x8C71, 0x0000, 0x0000, 0x0000,
-    0x6B6D, 0x0000, 0x0000, 0x0000, 0x0000, 0xE73C, 0xF7DF, 0x6B4D, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x738E, 0xCE9A, 0x6B6D,
-    0x0000, 0x0000, 0xCE59, 0x8430, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0xCE7A, 0x9CD3, 0x0000, 0x0000, 0x0000, 0xB5B6, 0xCE9A, 0xD6DB, 0xEF7E, 0xDEFC, 0x7C10, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0xBDF8, 0xD6DB, 0xA555, 0x9D14, 0xD6BB, 0xD6BA, 0x6B6D, 0x0000, 0x0000, 0x0000, 0x0000, 0x7BCF,
-    0xE71C, 0xCE79, 0x94B2, 0xA534, 0xE73C, 0xAD75, 0x0000, 0x0000, 0x738E, 0x0000, 0x0000, 0x8C71, 0xE73C, 0xE75D, 0xEF7D, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xA514, 0xFFFF, 0xBDD7, 0x0000, 0x0000, 0xB5B7, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xC659, 0xD6BA, 0xCE79, 0xD6BB,
-    0x9CF3, 0x0000, 0x0000, 0x0000, 0xAD96, 0xFFFF, 0xC658, 0x6B6D, 0x0000, 0x0000, 0x73CF, 0xE75D, 0xB5D7, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x9CF3, 0xEF5D, 0xB596, 0x8410, 0x8430, 0xB5B6, 0xE73C, 0x8C71, 0x0000, 0x0000, 0x0000, 0x0000, 0xCE59, 0xDF1C, 0x73AE,
-    0x0000, 0x0000, 0xCE59, 0xD6BB, 0x7C10, 0x6B6D, 0x9492, 0xDEFC, 0x8C71, 0x0000, 0x0000, 0x0000, 0xB5B6, 0xDEFC, 0xE73D, 0xD6DB,
-    0x0000, 0x6B6D, 0xAD55, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x9CD3, 0xFFFF, 0x9CF3, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x8C71, 0xF7DF, 0xF7BE,
-    0xCE79, 0xD6BA, 0xDEFC, 0x8430, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xBE18, 0xF7BF, 0xFFFF, 0xBDF7, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x9492, 0xE73C, 0xD6DB, 0xDF1C, 0x9CF3, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0xD69A, 0xD69A, 0x9CD3, 0xDEFB, 0xC659, 0x0000, 0x6B8E, 0x73AE, 0x0000, 0x8C71, 0x8C51, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x7BF0, 0xCE7A, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xDF3C, 0xF7DF, 0xFFFF, 0x7C10, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x6B6D, 0xEF7D, 0xEF7D, 0x6B6D, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xA534,
-    0xFFFF, 0xAD75, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xA555, 0xFFFF, 0xB5D7, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0xBE18, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x8410, 0xAD96, 0x0000, 0x6B6D, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xAD55,
-    0xEF9E, 0xC639, 0x6B6E, 0x73AE, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x7BCF, 0x0000, 0xB596, 0xAD76, 0x0000, 0x73AE,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x73AE, 0x738E, 0xE73D, 0x8C71, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x7BCF, 0xD69A, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x8C72, 0xF7BF, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x8C92, 0xA555, 0x0000, 0x0000,
-    0x0000, 0x8C51, 0x9CD3, 0x0000, 0x738E, 0x0000, 0x0000, 0x94B3, 0xD69A, 0xBDF7, 0x0000, 0x0000, 0x73AE, 0x0000, 0x0000, 0x738E,
-    0x0000, 0x7BCF, 0x0000, 0x0000, 0xAD75, 0xA534, 0x0000, 0x0000, 0x73AE, 0x0000, 0x7BF0, 0x0000, 0x0000, 0x6B6D, 0x0000, 0x0000,
-    0xD6DB, 0x0000, 0x6B6D, 0x0000, 0x0000, 0x0000, 0x0000, 0x73AE, 0x0000, 0x0000, 0xCE9A, 0x0000, 0x0000, 0x0000, 0x0000, 0xA555,
-    0xB596, 0x6B6D, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x94B3, 0x9CD3, 0x0000, 0x0000, 0x0000, 0xDF1C, 0xFFFF, 0x738E, 0x0000, 0x0000, 0x0000, 0xAD96,
-    0xB5B6, 0xBDF8, 0x0000, 0x0000, 0x0000, 0x6B6D, 0xE71C, 0xE75D, 0x73AE, 0x0000, 0x0000, 0x0000, 0xAD96, 0x9D14, 0x0000, 0x0000,
-    0x0000, 0x9492, 0xFFDF, 0xCE59, 0x0000, 0x0000, 0x0000, 0x0000, 0xCE7A, 0x0000, 0x0000, 0x0000, 0xAD75, 0xDEFC, 0x7BF0, 0x0000,
-    0x0000, 0x0000, 0xF7BF, 0xE75D, 0x94B3, 0x94B3, 0xC638, 0x94B3, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xAD75, 0x9CF3, 0x0000, 0x7BAF,
-    0x0000, 0x8410, 0x9CF4, 0x0000, 0x0000, 0x0000, 0x0000, 0xBE18, 0x9CF3, 0xBDF8, 0x0000, 0x0000, 0x0000, 0x0000, 0xE73C, 0xEF9E,
-    0x7BEF, 0x0000, 0x0000, 0x0000, 0xB5B6, 0x9D14, 0x0000, 0x0000, 0x0000, 0x94B3, 0xF7BF, 0xC639, 0x0000, 0x0000, 0x0000, 0x6B8E,
-    0xC659, 0x0000, 0x0000, 0x0000, 0xC638, 0xFFFF, 0x8430, 0x0000, 0x0000, 0x6B6D, 0xDEFC, 0xDEFC, 0xF7DF, 0xEF7D, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0xDEFC, 0xEF7D, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xB5B7,
-    0x9CF3, 0xCE7A, 0x0000, 0x0000, 0x738E, 0x0000, 0x6B6D, 0x7BCF, 0x0000, 0x73AE, 0x0000, 0x0000, 0xB5B6, 0x9CD3, 0x0000, 0x6B6D,
-    0x6B6D, 0x0000, 0x8410, 0x0000, 0x0000, 0x6B6D, 0x0000, 0x7BEF, 0xC638, 0x0000, 0x0000, 0x6B6D, 0x0000, 0x73CE, 0x0000, 0x73AE,
-    0x0000, 0x7BF0, 0xAD96, 0x0000, 0xEF9E, 0x73CF, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xB596, 0xC618, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x9CF3, 0xDEFB, 0x9D14, 0xDEDB, 0x6B6D, 0x73AE, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x6B6E, 0xCE7A, 0xB5D7, 0x6B6D, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xA534,
-    0xCE9A, 0x6B8D, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xBE18, 0xDF1C, 0x0000, 0x8430, 0xBE38, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x8451, 0xDF1C, 0x73AE, 0x0000, 0x0000, 0x0000, 0x73AE, 0xAD75, 0xE71C, 0xE73D,
-    0xC659, 0xFFFF, 0xB5D7, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x8451, 0xFFFF, 0xF7DF, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x6B6D, 0x0000, 0x0000, 0x0000, 0x0000, 0xEF9E, 0xF7BF, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x9492, 0xEF7D, 0xBE18, 0x0000, 0x0000, 0xDEFB, 0xCE59, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0xCE59, 0xBDF7, 0xA555, 0xCE59, 0xC638, 0x94D3, 0x0000, 0x738E, 0x7BEF, 0xC638, 0xCE9A, 0xBDF8, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0xB596, 0xD6DB, 0xBE18, 0xC638, 0xDEFB, 0x8431, 0x0000, 0x0000, 0x6B6D, 0x0000, 0x0000, 0xA534, 0xDEFC, 0xC618,
-    0xDF1C, 0xB5B6, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xCE59, 0xB5D7, 0x6B8E, 0x0000, 0x0000, 0x0000, 0xBE18, 0x6B6E, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xFFDF, 0xD6BB, 0x8430, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x94D3, 0xEF5D, 0xA514, 0x0000, 0x6B6E, 0x8431, 0xE71C, 0xB596, 0x0000, 0x0000, 0x0000, 0x0000, 0xD69A,
-    0xCE59, 0x738E, 0x7BCF, 0x8430, 0xDEDB, 0xB5B6, 0x0000, 0x0000, 0x0000, 0xAD76, 0xEF5D, 0x9CF4, 0x8410, 0x94B3, 0xD69A, 0x8C92,
-    0xA535, 0xC659, 0x0000, 0x0000, 0x0000, 0xBDD7, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x9CF4, 0x9CF3, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xB5B7, 0xF7DF, 0xDEFB, 0xE77D,
-    0xCE9A, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x9CF3, 0xEF7D, 0xEF7E, 0xD69A, 0x6B8E, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0xEF7D, 0xFFFF, 0xE75D, 0x73AE, 0x0000, 0xC618, 0xD69A, 0x0000, 0x0000, 0xA514, 0x8431, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x94B3, 0xA514, 0x0000, 0x0000, 0x0000, 0x8430, 0x9492,
-    0x0000, 0x738E, 0x6B6D, 0x0000, 0x8C71, 0xA555, 0xBE18, 0xEF5D, 0x73AE, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0xBE18, 0xF7BE, 0x6B6E, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xAD55, 0xD6DB, 0x8410, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x738E, 0xC638, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x9CF3, 0x94B2, 0x0000, 0x0000, 0x0000, 0xDEFB, 0xFFFF, 0x73AE, 0x0000, 0x0000, 0x0000, 0xAD76, 0x9CD3, 0xBE18, 0x6B6D,
-    0x0000, 0x6B6D, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x6B6E, 0x0000, 0xA555, 0x9CF3, 0x0000, 0x6B6D, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x73AE, 0x0000, 0xA555, 0xA534, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xD6FB, 0xCE79, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xD6BB, 0xC659, 0x0000, 0x0000, 0x0000, 0x8410, 0x9CD3,
-    0x0000, 0x0000, 0x0000, 0x0000, 0xBE18, 0x9CF3, 0xCE79, 0x0000, 0x0000, 0x0000, 0x0000, 0xBDD7, 0xD6BA, 0x738E, 0x0000, 0x0000,
-    0x0000, 0xC638, 0x7BCF, 0x0000, 0x0000, 0x0000, 0xB596, 0xAD75, 0x0000, 0x0000, 0x0000, 0xC638, 0xD6DB, 0xAD76, 0x0000, 0x6B6D,
-    0x7BEF, 0xB5D7, 0xB596, 0x738E, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x8C51, 0xCE9A, 0x94B2, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xBDF8, 0x94D3, 0xD6BA, 0x0000,
-    0x0000, 0x0000, 0x0000, 0xD6BA, 0xEF9E, 0x6B6D, 0x0000, 0x0000, 0x0000, 0xD69A, 0x0000, 0x0000, 0x0000, 0x6B8E, 0xFFFF, 0xCE9A,
-    0x0000, 0x0000, 0x0000, 0xCE59, 0x0000, 0x94B2, 0xDF1C, 0xD6BB, 0xAD55, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xB5B6, 0xC638, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0xB596, 0xE75D, 0xA535, 0xCE7A, 0x0000, 0x6B6E, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x73AE, 0x0000,
-    0x0000, 0xCE79, 0x0000, 0x0000, 0x6B6E, 0x0000, 0x7C10, 0x0000, 0x0000, 0x0000, 0x6B6E, 0xBDF8, 0x0000, 0x0000, 0xC638, 0xB5B7,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x8C71, 0xC638, 0x9492, 0x73CF, 0x8430, 0xB5B6, 0xBE18, 0xCE79, 0xCE9A, 0xC659, 0xFFFF, 0x9CF4,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xA555, 0xD6DB, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0xCE59, 0xE75D, 0x0000, 0x0000, 0xA514, 0x8430, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x6B6D, 0xFFFF, 0xD6BB,
-    0xE73D, 0x9CF4, 0x6B6E, 0x0000, 0x0000, 0x6B4D, 0x8C51, 0xBDD7, 0xBDD7, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x6B6D, 0xAD75,
-    0xEF7D, 0xFFDF, 0xA535, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x73AE, 0xCE7A, 0xFFFF, 0xA535, 0x0000, 0x0000, 0xBDF7, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x738E, 0x0000, 0xAD76, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
+// Pixels are big-endian (panel byte order) when true, pass to the Display::drawRGB565* call
+constexpr bool BYTE_SWAPPED = false;
+
+// Row-aligned RLE stream: a header word with bit 15 set repeats the next
+// word (header & 0x7FFF) times, otherwise `header` literal pixels follow
+const uint16_t LOGO_RLE[] PROGMEM = {
+    0x8078, 0x0000, 0x8078, 0x0000, 0x8078, 0x0000, 0x8078, 0x0000, 0x8078, 0x0000, 0x8078, 0x0000, 0x8078, 0x0000, 0x8078, 0x0000,
+    0x8040, 0x0000, 0x0002, 0x5BE8, 0x6468, 0x8036, 0x0000, 0x8040, 0x0000, 0x0003, 0x6CA8, 0x8627, 0x6C48, 0x8035, 0x0000, 0x8040,
+    0x0000, 0x0004, 0x7548, 0x7DA7, 0x85E8, 0x6448, 0x8034, 0x0000, 0x803F, 0x0000, 0x0001, 0x6C68, 0x8004, 0x7DA7, 0x0002, 0x7DA8,
+    0x6CA8, 0x8032, 0x0000, 0x803F, 0x0000, 0x0002, 0x7DC8, 0x7DC7, 0x8003, 0x7DA7, 0x0003, 0x7DC7, 0x8608, 0x6C48, 0x8031, 0x0000,
+    0x803F, 0x0000, 0x0009, 0x7D87, 0x7DA7, 0x7DC7, 0x75A7, 0x7DA7, 0x7DA7, 0x7D87, 0x7DA8, 0x5BE8, 0x8030, 0x0000, 0x803E, 0x0000,
+    0x000B, 0x7528, 0x7DA7, 0x7DA7, 0x7DC7, 0x7DC7, 0x7587, 0x7D87, 0x7546, 0x7DA7, 0x7DE7, 0x7548, 0x802F, 0x0000, 0x803E, 0x0000,
+    0x000C, 0x7DA8, 0x7DC7, 0x7DA7, 0x7567, 0x7DA7, 0x7566, 0x6D47, 0x7587, 0x7DC7, 0x7DA7, 0x8607, 0x5BA8, 0x802E, 0x0000, 0x803E,
+    0x0000, 0x000C, 0x7D88, 0x7DC7, 0x7DC7, 0x7D87, 0x6D26, 0x6D06, 0x6D26, 0x7DC7, 0x7DC7, 0x7DA7, 0x7DE7, 0x7528, 0x802E, 0x0000,
+    0x803D, 0x0000, 0x0002, 0x6428, 0x7DC7, 0x8004, 0x7DA7, 0x0003, 0x7587, 0x6D25, 0x7DC7, 0x8003, 0x7DA7, 0x0002, 0x7DC7, 0x6C88,
+    0x802D, 0x0000, 0x8030, 0x0000, 0x0004, 0x6408, 0x0000, 0x0000, 0x6428, 0x8009, 0x0000, 0x000E, 0x6C88, 0x85E7, 0x7D87, 0x7DA7,
+    0x7DA7, 0x7DC7, 0x7DE7, 0x6D46, 0x7547, 0x7DA7, 0x7587, 0x7DA7, 0x7DC7, 0x7DC7, 0x800C, 0x0000, 0x0005, 0x5BE8, 0x6408, 0x0000,
+    0x5BA8, 0x5BA8, 0x801C, 0x0000, 0x802C, 0x0000, 0x000D, 0x7508, 0x7DA8, 0x7548, 0x7548, 0x8607, 0x7DC8, 0x7D88, 0x7DC7, 0x7DC7,
+    0x7528, 0x7D88, 0x7D88, 0x5B88, 0x8004, 0x0000, 0x000F, 0x5B88, 0x7DC8, 0x7D87, 0x7DA7, 0x7D87, 0x7587, 0x7DA7, 0x7567, 0x6D26,
+    0x7DC7, 0x7587, 0x7DC7, 0x7D87, 0x7DC7, 0x5B68, 0x8007, 0x0000, 0x000D, 0x6C88, 0x7DC7, 0x7507, 0x7D67, 0x7DE8, 0x7DC8, 0x7DC8,
+    0x8608, 0x7DA8, 0x7548, 0x7D68, 0x85C8, 0x5BA8, 0x8018, 0x0000, 0x802C, 0x0000, 0x0004, 0x5B68, 0x85E8, 0x7DC7, 0x7DC7, 0x8003,
+    0x7DA7, 0x0001, 0x7D87, 0x8003, 0x7DC7, 0x0004, 0x7DA7, 0x7DC7, 0x6CA8, 0x6408, 0x8003, 0x0000, 0x0001, 0x7567, 0x8003, 0x7DC7,
+    0x0005, 0x7567, 0x6D26, 0x7567, 0x6D46, 0x6D46, 0x8003, 0x7DA7, 0x0002, 0x8607, 0x6408, 0x8005, 0x0000, 0x0008, 0x5BC7, 0x7D28,
+    0x85E7, 0x7DC7, 0x85E7, 0x7DC7, 0x7D87, 0x7587, 0x8003, 0x7DA7, 0x0003, 0x7DC8, 0x85E7, 0x7528, 0x8019, 0x0000, 0x802D, 0x0000,
+    0x0008, 0x7508, 0x7DC7, 0x7DA7, 0x7DA7, 0x7D87, 0x7DA7, 0x7567, 0x7DC7, 0x8004, 0x7DA7, 0x0006, 0x8607, 0x8627, 0x6C87, 0x0000,
+    0x0000, 0x7DC8, 0x8004, 0x7DA7, 0x0009, 0x7587, 0x7566, 0x64C5, 0x6D06, 0x7DA7, 0x7DA7, 0x7DC7, 0x8607, 0x6448, 0x8004, 0x0000,
+    0x000F, 0x85C8, 0x8608, 0x7DC7, 0x7D87, 0x7DA7, 0x7DA7, 0x7DC7, 0x7D87, 0x7567, 0x7DA8, 0x7D87, 0x7DA7, 0x7DA7, 0x85E8, 0x5B88,
+    0x8019, 0x0000, 0x802E, 0x0000, 0x0012, 0x7DC8, 0x7DC7, 0x7DC7, 0x7567, 0x7587, 0x7586, 0x7587, 0x7DC7, 0x7DA7, 0x7DA7, 0x7DC7,
+    0x7DA7, 0x7D87, 0x7DE7, 0x6408, 0x0000, 0x7568, 0x7DE7, 0x8004, 0x7DA7, 0x0008, 0x7DC7, 0x7566, 0x6D26, 0x7DC7, 0x7DC7, 0x7587,
+    0x7DC7, 0x7548, 0x8003, 0x0000, 0x000F, 0x7527, 0x7DC7, 0x7DA7, 0x7DE7, 0x75A7, 0x7567, 0x7DA7, 0x7DC7, 0x7567, 0x7D87, 0x7567,
+    0x7D87, 0x7DC7, 0x7DE7, 0x6CC8, 0x801A, 0x0000, 0x802D, 0x0000, 0x0003, 0x5B88, 0x85E8, 0x7DA7, 0x8003, 0x7D87, 0x0005, 0x6D06,
+    0x6506, 0x7DA7, 0x7DE7, 0x75A7, 0x8003, 0x7DA7, 0x0023, 0x7DC7, 0x8608, 0x6468, 0x0000, 0x7DA7, 0x7DA7, 0x7587, 0x7587, 0x7DA7,
+    0x7DA7, 0x7DC7, 0x6D46, 0x7DC7, 0x7587, 0x7546, 0x7DA7, 0x7588, 0x0000, 0x0000, 0x7528, 0x7DC7, 0x7D87, 0x7DA7, 0x7DC7, 0x7587,
+    0x7DC7, 0x7DC7, 0x7547, 0x64E5, 0x7586, 0x7DA7, 0x7D87, 0x7D87, 0x85E8, 0x7508, 0x801A, 0x0000, 0x802E, 0x0000, 0x000B, 0x6CA8,
+    0x7DE7, 0x7567, 0x7567, 0x75A6, 0x7DA7, 0x7566, 0x6D05, 0x7587, 0x7587, 0x7567, 0x8003, 0x7DA7, 0x0021, 0x7DE7, 0x8608, 0x0000,
+    0x6447, 0x8608, 0x7D87, 0x7566, 0x7566, 0x7DA7, 0x7DC7, 0x6D26, 0x75A7, 0x7566, 0x7D87, 0x7DE8, 0x6CE8, 0x0000, 0x7547, 0x8627,
+    0x7DC7, 0x7DA7, 0x7DA7, 0x7D87, 0x7567, 0x7DC7, 0x6D26, 0x6D06, 0x7587, 0x7DA6, 0x7586, 0x7546, 0x7D87, 0x7DA8, 0x801B, 0x0000,
+    0x802F, 0x0000, 0x001F, 0x7508, 0x7DE7, 0x7DC7, 0x7DC7, 0x7DA7, 0x7DC7, 0x7DA7, 0x6D26, 0x64A5, 0x6D26, 0x7DC7, 0x7DC7, 0x75A7,
+    0x7DA7, 0x7DC7, 0x7508, 0x5BE8, 0x7586, 0x7586, 0x7DC7, 0x7DA7, 0x6D46, 0x6D46, 0x6D06, 0x6D26, 0x75A7, 0x7DA7, 0x7DC6, 0x6427,
+    0x5B68, 0x7DC7, 0x8003, 0x7DA7, 0x0005, 0x7DC7, 0x7D87, 0x5CA5, 0x64E6, 0x7587, 0x8004, 0x7DC7, 0x0003, 0x85C7, 0x85A8, 0x5B88,
+    0x801B, 0x0000, 0x802F, 0x0000, 0x0002, 0x6CA8, 0x8607, 0x8004, 0x7DA7, 0x0022, 0x7587, 0x7546, 0x64E6, 0x64E5, 0x7566, 0x85E7,
+    0x7587, 0x7D87, 0x7DA7, 0x7DC6, 0x5B88, 0xADF3, 0x964C, 0x6D65, 0x75A6, 0x7DA7, 0x7567, 0x64C5, 0x5CC5, 0x75A6, 0x7DC8, 0xB6F2,
+    0x740B, 0x64A6, 0x7DC7, 0x7DA8, 0x7567, 0x7DC7, 0x7DA7, 0x6D06, 0x64C5, 0x6D26, 0x7586, 0x75A7, 0x8004, 0x7DA7, 0x0001, 0x85C8,
+    0x801C, 0x0000, 0x8030, 0x0000, 0x0027, 0x7D88, 0x7DC7, 0x7DA7, 0x7DA7, 0x7D87, 0x7DA7, 0x7586, 0x75A6, 0x7DC7, 0x6D06, 0x64E6,
+    0x6D46, 0x7565, 0x85C7, 0xA68E, 0xC6B7, 0xDEFD, 0xDF1A, 0xC714, 0x962B, 0x7586, 0x7DC7, 0x7586, 0x7D69, 0xB6D1, 0xCEF8, 0xE73E,
+    0xD6BA, 0xAE91, 0x85E8, 0x7565, 0x6D05, 0x6D46, 0x64E5, 0x7566, 0x7DA6, 0x7586, 0x7566, 0x7D87, 0x8003, 0x7DA7, 0x0002, 0x85E8,
+    0x6C48, 0x801C, 0x0000, 0x8031, 0x0000, 0x000E, 0x7D68, 0x7DE7, 0x7D87, 0x7DA8, 0x7585, 0x9E4E, 0xAEB1, 0x8E09, 0x85E8, 0x6D46,
+    0x74E8, 0x960E, 0xCF17, 0xB596, 0x8003, 0x0000, 0x0019, 0x8C52, 0xBE37, 0xC6F7, 0xC6F6, 0xC6F6, 0xBE57, 0x94B3, 0x0000, 0x6B6D,
+    0x0000, 0x9CD4, 0xCEB8, 0xAE72, 0x854B, 0x7528, 0x962A, 0xA68D, 0xAEB0, 0xD779, 0x9E4D, 0x7565, 0x7DA8, 0x7DA7, 0x85E7, 0x63E8,
+    0x801D, 0x0000, 0x8031, 0x0000, 0x000C, 0x5BC8, 0x85C8, 0x85E8, 0x7586, 0x9E4D, 0xD71A, 0xCE5A, 0xC677, 0xC6D7, 0xC6D6, 0xEF9D,
+    0xC639, 0x8007, 0x0000, 0x0003, 0xA515, 0xFFDF, 0xAD56, 0x8007, 0x0000, 0x000C, 0xA535, 0xF7BF, 0xDF3A, 0xB5F6, 0xB5B6, 0x9CF3,
+    0xAD77, 0xCEB9, 0x9E4D, 0x7586, 0x85E8, 0x7508, 0x801E, 0x0000, 0x8033, 0x0000, 0x0003, 0x6C48, 0xC714, 0xAD96, 0x8004, 0x0000,
+    0x0002, 0x9CF4, 0xDF1C, 0x8004, 0x0000, 0x0001, 0x7C10, 0x8004, 0x0000, 0x0001, 0xCE99, 0x8004, 0x0000, 0x0007, 0x8C51, 0x0000,
+    0x0000, 0x6B6D, 0x0000, 0xC639, 0xA534, 0x8005, 0x0000, 0x0002, 0xB5D7, 0xBEB4, 0x8020, 0x0000, 0x8032, 0x0000, 0x0003, 0x7BF0,
+    0xBDD8, 0x8C31, 0x8006, 0x0000, 0x0001, 0xBE18, 0x8003, 0x0000, 0x0003, 0xB5B6, 0xFFFF, 0x8C51, 0x8003, 0x0000, 0x0001, 0xCE79,
+    0x8003, 0x0000, 0x0003, 0x7BEF, 0xFFFF, 0xCE79, 0x8003, 0x0000, 0x0002, 0xAD75, 0x7C10, 0x8003, 0x0000, 0x0006, 0x738E, 0x0000,
+    0x0000, 0x9493, 0xBE18, 0x7BCF, 0x801E, 0x0000, 0x8032, 0x0000, 0x0006, 0xDF1C, 0xA514, 0x0000, 0x0000, 0xB5D7, 0xC638, 0x8003,
+    0x0000, 0x0001, 0xBDF7, 0x8003, 0x0000, 0x0003, 0x7BF0, 0xB5B6, 0x738E, 0x8003, 0x0000, 0x0001, 0xCE79, 0x8003, 0x0000, 0x0003,
+    0x6B4D, 0xAD55, 0x8430, 0x8003, 0x0000, 0x000B, 0x9CD3, 0x8C71, 0x0000, 0x0000, 0x8430, 0xF7BF, 0x94B2, 0x0000, 0x0000, 0xBE18,
+    0xBDF7, 0x801E, 0x0000, 0x8032, 0x0000, 0x0001, 0xAD96, 0x8003, 0x0000, 0x0006, 0xBDF8, 0xB5D7, 0x0000, 0x0000, 0xB5B6, 0xAD76,
+    0x8008, 0x0000, 0x0003, 0xA534, 0xEF9E, 0x73AE, 0x8008, 0x0000, 0x000B, 0x9CF3, 0xEF5D, 0x738E, 0x0000, 0x73AE, 0xC618, 0x8430,
+    0x0000, 0x0000, 0x8C51, 0x9CF3, 0x801E, 0x0000, 0x8032, 0x0000, 0x0001, 0xE71C, 0x8006, 0x0000, 0x0004, 0xCE7A, 0xFFFF, 0xE75D,
+    0x8C51, 0x8006, 0x0000, 0x0005, 0xAD75, 0xE73C, 0xE71C, 0xDEFB, 0x9CD3, 0x8006, 0x0000, 0x0004, 0xBDD7, 0xE71C, 0xE73D, 0xD6BB,
+    0x8004, 0x0000, 0x0004, 0x6B6D, 0x0000, 0x7C10, 0xA534, 0x801E, 0x0000, 0x8030, 0x0000, 0x0024, 0x6B6D, 0xC618, 0xDEDB, 0xC638,
+    0x9CD3, 0x0000, 0x0000, 0xAD75, 0xCE59, 0x94B2, 0x7BF0, 0x8C51, 0xCE59, 0xBE18, 0x73AE, 0x6B6D, 0x8C51, 0xB596, 0xD69A, 0x9CD3,
+    0x0000, 0x738E, 0x0000, 0xB596, 0xD6BA, 0xA535, 0x9CF3, 0x94B2, 0xB596, 0xD69A, 0x9CF3, 0x0000, 0x6B8E, 0x7C10, 0xCE79, 0xA534,
+    0x8004, 0x0000, 0x0002, 0xAD75, 0xEF7E, 0x801E, 0x0000, 0x802F, 0x0000, 0x0009, 0xA535, 0xBDD7, 0x73AE, 0x0000, 0x0000, 0xBDF7,
+    0xD6DB, 0xC638, 0xAD75, 0x8005, 0x0000, 0x0005, 0x8410, 0xDEFB, 0xF7BF, 0xE75C, 0x9492, 0x8007, 0x0000, 0x0004, 0xB5B6, 0xFFFF,
+    0xFFFF, 0x9CD3, 0x8003, 0x0000, 0x000C, 0x6B6D, 0x0000, 0x0000, 0xAD55, 0xCE59, 0x8C71, 0xAD96, 0xCE9A, 0xB5B7, 0xBE18, 0xCE59,
+    0x6B6D, 0x801C, 0x0000, 0x802D, 0x0000, 0x0003, 0xAD55, 0xD6BA, 0x8410, 0x8004, 0x0000, 0x0003, 0xAD75, 0xFFFF, 0x7BEF, 0x8007,
+    0x0000, 0x0003, 0x8431, 0xEF7E, 0x94D2, 0x8009, 0x0000, 0x0002, 0xBE18, 0xBDD7, 0x8008, 0x0000, 0x0003, 0x7C10, 0xFFFF, 0xDF1C,
+    0x8003, 0x0000, 0x0003, 0x6B8E, 0xBE18, 0x94B2, 0x801B, 0x0000, 0x802D, 0x0000, 0x0002, 0xCE59, 0x9CF3, 0x8005, 0x0000, 0x0004,
+    0xAD76, 0xBDF7, 0x0000, 0x738E, 0x8007, 0x0000, 0x000D, 0xD6BA, 0x0000, 0x0000, 0x738E, 0x0000, 0x6B8E, 0x8450, 0x0000, 0x738E,
+    0x0000, 0x0000, 0xA534, 0xA514, 0x8004, 0x0000, 0x0007, 0x8430, 0x0000, 0x0000, 0x73AE, 0x0000, 0xAD76, 0xB5B7, 0x8005, 0x0000,
+    0x0003, 0x9CF3, 0xC659, 0x8430, 0x8019, 0x0000, 0x802D, 0x0000, 0x0009, 0xBDD7, 0x0000, 0x0000, 0x8C92, 0xC638, 0x738E, 0x0000,
+    0x94B3, 0xA514, 0x8003, 0x0000, 0x0003, 0xC659, 0xDEDB, 0x6B8E, 0x8003, 0x0000, 0x0001, 0xD6DB, 0x8004, 0x0000, 0x0003, 0xDEFB,
+    0xFFFF, 0x8C71, 0x8003, 0x0000, 0x0002, 0xA514, 0xA514, 0x8003, 0x0000, 0x0003, 0x94B3, 0xFFFF, 0xBE18, 0x8003, 0x0000, 0x0002,
+    0xA534, 0x9D14, 0x8006, 0x0000, 0x0002, 0xC618, 0xD69A, 0x8019, 0x0000, 0x802D, 0x0000, 0x0009, 0xB5B7, 0x0000, 0x0000, 0xAD96,
+    0xF7BF, 0x738E, 0x0000, 0xA514, 0x9CD3, 0x8003, 0x0000, 0x0003, 0xD69A, 0xEF5D, 0x73AE, 0x8003, 0x0000, 0x0001, 0xCE9A, 0x8004,
+    0x0000, 0x0003, 0xB596, 0xCE7A, 0x7BEF, 0x8003, 0x0000, 0x0002, 0xA514, 0xA514, 0x8003, 0x0000, 0x0003, 0x8C51, 0xD6DB, 0xA534,
+    0x8003, 0x0000, 0x000A, 0xA514, 0x94D3, 0x0000, 0x0000, 0x8C71, 0xC638, 0x73AF, 0x0000, 0x0000, 0xBDD7, 0x8019, 0x0000, 0x802C,
+    0x0000, 0x0002, 0x7BEF, 0xAD55, 0x8006, 0x0000, 0x0002, 0xB596, 0x8C71, 0x8004, 0x0000, 0x0009, 0x6B6D, 0x0000, 0x6B8E, 0x0000,
+    0x7BCF, 0xD69A, 0x0000, 0x0000, 0x73AE, 0x8005, 0x0000, 0x0006, 0x7BAE, 0x0000, 0xB596, 0xBDF7, 0x0000, 0x738E, 0x8005, 0x0000,
+    0x000C, 0x6B8E, 0x0000, 0x9CD3, 0x94D3, 0x0000, 0x0000, 0x9492, 0xFFFF, 0x9492, 0x0000, 0x0000, 0xB5D7, 0x8019, 0x0000, 0x802C,
+    0x0000, 0x0002, 0xBE18, 0xB5B7, 0x8006, 0x0000, 0x0002, 0xCE9A, 0x94D3, 0x8008, 0x0000, 0x0003, 0xDEDB, 0xEF7E, 0x7BCF, 0x8008,
+    0x0000, 0x0004, 0x8430, 0xF7BF, 0xFFFF, 0x8C51, 0x8008, 0x0000, 0x0006, 0xAD76, 0xB5B6, 0x0000, 0x6B6D, 0x0000, 0x7BCF, 0x8003,
+    0x0000, 0x0001, 0xB5B6, 0x8019, 0x0000, 0x802C, 0x0000, 0x0003, 0xC638, 0xF79E, 0x73AE, 0x8003, 0x0000, 0x0004, 0x8431, 0x8451,
+    0xDEFB, 0xE73C, 0x8007, 0x0000, 0x0005, 0xB5D7, 0xEF5D, 0xDF1C, 0xDEDB, 0x9492, 0x8006, 0x0000, 0x0009, 0xAD55, 0xD6DA, 0xC638,
+    0xC659, 0xD6BB, 0x94B2, 0x0000, 0x0000, 0x6B6D, 0x8004, 0x0000, 0x0003, 0xE73D, 0xFFFF, 0x8430, 0x8006, 0x0000, 0x0002, 0xBDD7,
+    0x8410, 0x8018, 0x0000, 0x802A, 0x0000, 0x001F, 0x6B8E, 0xB596, 0xB5D7, 0x9CF4, 0xD6DB, 0x9CD3, 0x0000, 0x9492, 0xF7DF, 0xEF7E,
+    0xC638, 0xA534, 0xC659, 0xA514, 0x0000, 0x0000, 0x738E, 0xAD55, 0xDF1C, 0x94B3, 0x0000, 0x0000, 0x73AE, 0xCE59, 0xDEDB, 0x9492,
+    0x7BEF, 0x8451, 0x9CF3, 0xE73C, 0xBDD7, 0x8004, 0x0000, 0x000B, 0xCE59, 0xDEFB, 0x7BEF, 0x738E, 0x0000, 0x6B6D, 0xBE18, 0xEF9E,
+    0xD6BB, 0xEF7D, 0xD69A, 0x8006, 0x0000, 0x0002, 0xE73D, 0xC638, 0x8018, 0x0000, 0x8029, 0x0000, 0x0003, 0xDEFB, 0xC618, 0x73AF,
+    0x8003, 0x0000, 0x000D, 0xBE18, 0xEF7E, 0xBDF7, 0x8C92, 0x7C10, 0xAD96, 0xC639, 0xAD55, 0xC639, 0xDEDB, 0xAD96, 0xDEDB, 0xB5B6,
+    0x8007, 0x0000, 0x0004, 0xC638, 0xF7DF, 0xF7DF, 0xBE18, 0x8007, 0x0000, 0x000B, 0x7BEF, 0xCE79, 0xDF1C, 0xDF1C, 0xD6BA, 0xA534,
+    0x0000, 0x0000, 0x738E, 0x9CF4, 0xCE79, 0x8004, 0x0000, 0x0002, 0xCE79, 0xB5B6, 0x8019, 0x0000, 0x8029, 0x0000, 0x0001, 0xDEDB,
+    0x8003, 0x0000, 0x0004, 0x6B6D, 0x8430, 0xD6BA, 0x9492, 0x8005, 0x0000, 0x0005, 0xA555, 0xD6BB, 0xEF9E, 0xFFFF, 0x8430, 0x8009,
+    0x0000, 0x0003, 0xDEFB, 0xDF1C, 0x738E, 0x8008, 0x0000, 0x0003, 0x73AE, 0xEF9E, 0xEF7E, 0x8006, 0x0000, 0x0007, 0x8451, 0xE75D,
+    0xB5B6, 0xB596, 0xEF7D, 0xD6DB, 0xDF1C, 0x8019, 0x0000, 0x8028, 0x0000, 0x0007, 0x7BEF, 0x9CF4, 0x0000, 0x0000, 0x7BCF, 0xF79E,
+    0xC659, 0x8008, 0x0000, 0x0005, 0x94B2, 0xF7BE, 0xB5D7, 0x0000, 0x73AE, 0x8006, 0x0000, 0x0007, 0x7BCF, 0x0000, 0xA534, 0xA555,
+    0x0000, 0x7BCF, 0x6B6D, 0x8005, 0x0000, 0x0004, 0x7BEF, 0x0000, 0xAD96, 0xAD76, 0x8007, 0x0000, 0x0007, 0x738E, 0xE75D, 0xFFDF,
+    0xCE7A, 0x94B2, 0xBDD7, 0xCE7A, 0x8018, 0x0000, 0x8028, 0x0000, 0x0007, 0x9CF3, 0x8410, 0x0000, 0x8410, 0xDEFB, 0xF79E, 0x7BF0,
+    0x8006, 0x0000, 0x000B, 0x738E, 0x0000, 0x0000, 0xE73C, 0xA535, 0x0000, 0x0000, 0x6B6D, 0x6B6D, 0xAD76, 0xA534, 0x8004, 0x0000,
+    0x0002, 0xA535, 0xA555, 0x8003, 0x0000, 0x000B, 0x738E, 0xB596, 0xBDF8, 0x73AE, 0x738D, 0x0000, 0x0000, 0xAD55, 0x9CF3, 0x0000,
+    0x73AE, 0x8006, 0x0000, 0x0002, 0xA534, 0xF7DF, 0x8003, 0x0000, 0x0003, 0x73AE, 0xCE7A, 0x6B6D, 0x8016, 0x0000, 0x8028, 0x0000,
+    0x000C, 0xBDD7, 0x0000, 0x0000, 0xA555, 0xFFFF, 0xD6BB, 0x0000, 0x0000, 0x6B6D, 0x73AE, 0xBDD7, 0x8C51, 0x8004, 0x0000, 0x0002,
+    0xE73C, 0xA534, 0x8003, 0x0000, 0x0004, 0x738E, 0xFFFF, 0xFFFF, 0x738E, 0x8003, 0x0000, 0x0002, 0xAD55, 0xA555, 0x8003, 0x0000,
+    0x0004, 0x6B6D, 0xFFDF, 0xFFFF, 0x7BCF, 0x8003, 0x0000, 0x0002, 0xAD75, 0xA514, 0x8003, 0x0000, 0x0007, 0xBDF7, 0xA534, 0x0000,
+    0x6B6D, 0x0000, 0x7C10, 0xD69A, 0x8005, 0x0000, 0x0002, 0xC618, 0x94B2, 0x8015, 0x0000, 0x8027, 0x0000, 0x0002, 0x7BEF, 0xE71C,
+    0x8003, 0x0000, 0x0002, 0x7C10, 0xBE18, 0x8003, 0x0000, 0x0003, 0xA534, 0xFFFF, 0xCE59, 0x8004, 0x0000, 0x0002, 0xDF1C, 0xA534,
+    0x8003, 0x0000, 0x0004, 0x6B6E, 0xAD76, 0xA555, 0x6B6D, 0x8003, 0x0000, 0x0002, 0xAD55, 0xA534, 0x8003, 0x0000, 0x0004, 0x6B6D,
+    0x94B2, 0xA534, 0x6B8E, 0x8003, 0x0000, 0x0007, 0xAD96, 0x9CD3, 0x0000, 0x0000, 0x738E, 0xFFDF, 0xEF7E, 0x8003, 0x0000, 0x0002,
+    0x8410, 0xC659, 0x8006, 0x0000, 0x0002, 0xFFFF, 0x8C71, 0x8014, 0x0000, 0x8028, 0x0000, 0x0002, 0xDEFB, 0x6B8E, 0x8003, 0x0000,
+    0x0001, 0xC639, 0x8003, 0x0000, 0x0004, 0x73AE, 0xAD96, 0x8410, 0x6B8D, 0x8003, 0x0000, 0x0005, 0xDEFB, 0x94B3, 0x0000, 0x7BCE,
+    0x738E, 0x8005, 0x0000, 0x0006, 0x7BEF, 0x0000, 0xAD96, 0xAD55, 0x0000, 0x7BCF, 0x8006, 0x0000, 0x0009, 0x7BCF, 0x0000, 0xAD96,
+    0xAD75, 0x0000, 0x6B6D, 0x0000, 0x8C71, 0x8C71, 0x8003, 0x0000, 0x0005, 0x9CD3, 0x9D14, 0x0000, 0x0000, 0x73AE, 0x8003, 0x0000,
+    0x0002, 0xBDF7, 0x7BCF, 0x8014, 0x0000, 0x8029, 0x0000, 0x0001, 0xCE9A, 0x8003, 0x0000, 0x0003, 0xC639, 0x0000, 0x6B6D, 0x8006,
+    0x0000, 0x0004, 0x73AE, 0x0000, 0xE71C, 0xB5D7, 0x8009, 0x0000, 0x0004, 0x7BCF, 0xEF7E, 0xEF7D, 0x7BCF, 0x8008, 0x0000, 0x0003,
+    0x738E, 0xDF1C, 0xDEDB, 0x8006, 0x0000, 0x000C, 0x738E, 0x0000, 0xAD96, 0x8C71, 0x0000, 0x0000, 0xEF7E, 0xCE7A, 0x0000, 0x0000,
+    0xAD96, 0x738E, 0x8014, 0x0000, 0x8029, 0x0000, 0x0006, 0x8C92, 0xB5D7, 0x0000, 0x8430, 0xE71C, 0x6B8E, 0x8008, 0x0000, 0x0004,
+    0xB596, 0xFFFF, 0xFFDF, 0x8451, 0x8008, 0x0000, 0x0004, 0xCE9A, 0xEF9E, 0xEF9E, 0xC659, 0x8008, 0x0000, 0x0004, 0xB5B6, 0xFFFF,
+    0xF7DF, 0x73AE, 0x8007, 0x0000, 0x000A, 0xC659, 0x738E, 0x0000, 0x6B6D, 0xC618, 0xB5B6, 0x0000, 0x0000, 0xAD55, 0x73AE, 0x8014,
+    0x0000, 0x802A, 0x0000, 0x0005, 0xC638, 0xCE9A, 0xDEFC, 0xFFFF, 0xB5D7, 0x8007, 0x0000, 0x0007, 0xA514, 0xD6DB, 0xBDF7, 0xAD75,
+    0xD6DB, 0xCE79, 0x73AE, 0x8004, 0x0000, 0x0008, 0xB5B6, 0xEF5D, 0x9492, 0x6B8E, 0x738E, 0x9492, 0xE75D, 0xB5D7, 0x8004, 0x0000,
+    0x0007, 0x9CF4, 0xE75D, 0xB5B6, 0x8C51, 0xA514, 0xDEDB, 0x9491, 0x8005, 0x0000, 0x0003, 0x9D14, 0xFFFF, 0xA534, 0x8006, 0x0000,
+    0x0002, 0xAD55, 0x7BEF, 0x8014, 0x0000, 0x802A, 0x0000, 0x0007, 0x9D14, 0xFFFF, 0xDEDB, 0x8451, 0xB5B7, 0xE73C, 0x9492, 0x8004,
+    0x0000, 0x0002, 0xD6BB, 0xC659, 0x8004, 0x0000, 0x0007, 0x94D3, 0xE73C, 0xBDF8, 0xB5B6, 0xB5B7, 0xD6DB, 0xBDD7, 0x8006, 0x0000,
+    0x0007, 0xB5B6, 0xDEFB, 0xC638, 0xBDF7, 0xCE9A, 0xCE79, 0x6B6D, 0x8004, 0x0000, 0x0009, 0xD6BB, 0xCE9A, 0x0000, 0x0000, 0x94B2,
+    0xD6DB, 0xE73D, 0xF7DF, 0x8430, 0x8006, 0x0000, 0x0002, 0xD6BA, 0x94B2, 0x8014, 0x0000, 0x8029, 0x0000, 0x0003, 0xDEFC, 0xDEDB,
+    0x8430, 0x8004, 0x0000, 0x0006, 0xD69A, 0xCE7A, 0x9CF3, 0xAD55, 0xDF1C, 0x9CD3, 0x8007, 0x0000, 0x0004, 0xB5B6, 0xFFFF, 0xFFFF,
+    0x8431, 0x8008, 0x0000, 0x0004, 0x7BEF, 0xFFFF, 0xFFFF, 0x94D3, 0x8007, 0x0000, 0x0009, 0xA535, 0xD6DB, 0xE73C, 0xE73C, 0x8410,
+    0x0000, 0x8C51, 0xC659, 0x7BCF, 0x8004, 0x0000, 0x0003, 0x8431, 0xF7BF, 0x94D3, 0x8014, 0x0000, 0x8029, 0x0000, 0x0002, 0xE75D,
+    0x9492, 0x8006, 0x0000, 0x0004, 0x9492, 0xF7DF, 0xF7DF, 0x6B8E, 0x8008, 0x0000, 0x0003, 0x738E, 0xDEFC, 0xC618, 0x800A, 0x0000,
+    0x0003, 0xBDF8, 0xDEDB, 0x738E, 0x8008, 0x0000, 0x0003, 0xAD96, 0xFFFF, 0x8C72, 0x8004, 0x0000, 0x0006, 0xD69A, 0x9492, 0x0000,
+    0x0000, 0xA534, 0xC638, 0x8016, 0x0000, 0x8029, 0x0000, 0x0003, 0xC639, 0x0000, 0x6B6D, 0x8006, 0x0000, 0x0004, 0xD6BB, 0xC638,
+    0x6B6D, 0x6B6D, 0x8006, 0x0000, 0x0007, 0x7BEF, 0x0000, 0xB5B6, 0x94B2, 0x0000, 0x73AE, 0x738E, 0x8004, 0x0000, 0x0007, 0x738E,
+    0x73AE, 0x0000, 0x94B2, 0xB5B6, 0x0000, 0x7BEF, 0x8006, 0x0000, 0x0003, 0x7BCF, 0x73AE, 0xDEFB, 0x8006, 0x0000, 0x0004, 0xC638,
+    0xC659, 0xD6BA, 0xCE7A, 0x8017, 0x0000, 0x8029, 0x0000, 0x0001, 0xC638, 0x8003, 0x0000, 0x0001, 0x7BCF, 0x8004, 0x0000, 0x0009,
+    0xB596, 0xAD55, 0x0000, 0x0000, 0x73AE, 0x0000, 0x94B2, 0x7BEF, 0x6B6D, 0x8003, 0x0000, 0x0002, 0xBDD7, 0x9CD3, 0x8003, 0x0000,
+    0x0004, 0x73AE, 0xCE79, 0xCE9A, 0x7BEF, 0x8003, 0x0000, 0x0002, 0x9CF3, 0xB5D7, 0x8003, 0x0000, 0x0004, 0x73AE, 0xAD75, 0x94B2,
+    0x73AE, 0x8003, 0x0000, 0x0001, 0xDEFC, 0x8006, 0x0000, 0x0004, 0x738E, 0xEFBE, 0xEF7E, 0xEF7E, 0x8017, 0x0000, 0x8029, 0x0000,
+    0x0001, 0xBDD7, 0x8003, 0x0000, 0x0002, 0xFFFF, 0xC659, 0x8003, 0x0000, 0x0002, 0x9D14, 0xAD96, 0x8003, 0x0000, 0x0003, 0x9492,
+    0xFFFF, 0xE75D, 0x8004, 0x0000, 0x0002, 0xB5D7, 0x9CD3, 0x8003, 0x0000, 0x0004, 0x738E, 0xFFFF, 0xFFFF, 0x7BEF, 0x8003, 0x0000,
+    0x0002, 0x9D14, 0xB5B7, 0x8003, 0x0000, 0x0003, 0x8451, 0xFFFF, 0xEF9E, 0x8004, 0x0000, 0x0001, 0xCE9A, 0x8003, 0x0000, 0x0008,
+    0x6B6D, 0x0000, 0x738E, 0x0000, 0xBE18, 0x7C10, 0xB5D7, 0x94B2, 0x8016, 0x0000, 0x8028, 0x0000, 0x0007, 0x73AE, 0xB596, 0x0000,
+    0x0000, 0x6B6E, 0xBDF8, 0xA534, 0x8003, 0x0000, 0x0002, 0x94D3, 0xAD96, 0x8003, 0x0000, 0x0004, 0x8410, 0xE73C, 0xC618, 0x6B6D,
+    0x8003, 0x0000, 0x000E, 0xB5B7, 0x9CD3, 0x0000, 0x0000, 0x6B6D, 0x738E, 0x94B3, 0x94D3, 0x6B6D, 0x6B8E, 0x0000, 0x0000, 0xA514,
+    0xB596, 0x8003, 0x0000, 0x0003, 0x7BEF, 0xC639, 0xB596, 0x8003, 0x0000, 0x000D, 0x6B6D, 0xCE79, 0x0000, 0x0000, 0xD6BA, 0xE75D,
+    0x6B6D, 0x0000, 0x0000, 0xBDF8, 0x738E, 0x0000, 0xC639, 0x8016, 0x0000, 0x8028, 0x0000, 0x0002, 0xAD55, 0xE71C, 0x8008, 0x0000,
+    0x0005, 0x94B3, 0xBDD7, 0x0000, 0x0000, 0x7BEF, 0x8004, 0x0000, 0x0007, 0x738E, 0x6B6D, 0x0000, 0xB5D7, 0x94B2, 0x0000, 0x7C0F,
+    0x8006, 0x0000, 0x0006, 0x7BEF, 0x0000, 0xA555, 0xB5B6, 0x0000, 0x7BCF, 0x8005, 0x0000, 0x0008, 0x73AE, 0x0000, 0x73AE, 0xC659,
+    0x0000, 0x0000, 0xBE18, 0xDEFB, 0x8003, 0x0000, 0x0005, 0xBDF7, 0x7C10, 0x0000, 0x8C71, 0xA555, 0x8015, 0x0000, 0x8028, 0x0000,
+    0x0006, 0x8410, 0xE71C, 0x8C51, 0x0000, 0x0000, 0x6B6D, 0x8004, 0x0000, 0x0004, 0x94B3, 0xBDF8, 0x0000, 0x7BCF, 0x8007, 0x0000,
+    0x0004, 0x7BEF, 0xE73D, 0xD6BB, 0x6B6D, 0x8008, 0x0000, 0x0004, 0x6B6D, 0xDF1C, 0xEF5D, 0x8410, 0x8003, 0x0000, 0x0001, 0x6B6D,
+    0x8004, 0x0000, 0x0003, 0xA534, 0xE71C, 0x73AE, 0x8006, 0x0000, 0x0006, 0xC659, 0x7BEF, 0x0000, 0x0000, 0xD6DB, 0x8C92, 0x8014,
+    0x0000, 0x802A, 0x0000, 0x0004, 0xC659, 0x94B2, 0x0000, 0x6B6D, 0x8003, 0x0000, 0x0004, 0x736E, 0xE75D, 0xEF9E, 0x738E, 0x8008,
+    0x0000, 0x0004, 0xA534, 0xFFFF, 0xFFFF, 0x94B3, 0x8008, 0x0000, 0x0004, 0xA534, 0xF7FF, 0xFFFF, 0x8C71, 0x8003, 0x0000, 0x0001,
+    0x6B6D, 0x8004, 0x0000, 0x0003, 0xE73C, 0xF7DF, 0x6B4D, 0x8005, 0x0000, 0x0007, 0x738E, 0xCE9A, 0x6B6D, 0x0000, 0x0000, 0xCE59,
+    0x8430, 0x8014, 0x0000, 0x802B, 0x0000, 0x0002, 0xCE7A, 0x9CD3, 0x8003, 0x0000, 0x0006, 0xB5B6, 0xCE9A, 0xD6DB, 0xEF7E, 0xDEFC,
+    0x7C10, 0x8006, 0x0000, 0x0007, 0xBDF8, 0xD6DB, 0xA555, 0x9D14, 0xD6BB, 0xD6BA, 0x6B6D, 0x8004, 0x0000, 0x0010, 0x7BCF, 0xE71C,
+    0xCE79, 0x94B2, 0xA534, 0xE73C, 0xAD75, 0x0000, 0x0000, 0x738E, 0x0000, 0x0000, 0x8C71, 0xE73C, 0xE75D, 0xEF7D, 0x8006, 0x0000,
+    0x0006, 0xA514, 0xFFFF, 0xBDD7, 0x0000, 0x0000, 0xB5B7, 0x8015, 0x0000, 0x802C, 0x0000, 0x0005, 0xC659, 0xD6BA, 0xCE79, 0xD6BB,
+    0x9CF3, 0x8003, 0x0000, 0x0009, 0xAD96, 0xFFFF, 0xC658, 0x6B6D, 0x0000, 0x0000, 0x73CF, 0xE75D, 0xB5D7, 0x8004, 0x0000, 0x0008,
+    0x9CF3, 0xEF5D, 0xB596, 0x8410, 0x8430, 0xB5B6, 0xE73C, 0x8C71, 0x8004, 0x0000, 0x000C, 0xCE59, 0xDF1C, 0x73AE, 0x0000, 0x0000,
+    0xCE59, 0xD6BB, 0x7C10, 0x6B6D, 0x9492, 0xDEFC, 0x8C71, 0x8003, 0x0000, 0x0007, 0xB5B6, 0xDEFC, 0xE73D, 0xD6DB, 0x0000, 0x6B6D,
+    0xAD55, 0x8015, 0x0000, 0x802C, 0x0000, 0x0003, 0x9CD3, 0xFFFF, 0x9CF3, 0x8006, 0x0000, 0x0007, 0x8C71, 0xF7DF, 0xF7BE, 0xCE79,
+    0xD6BA, 0xDEFC, 0x8430, 0x8007, 0x0000, 0x0004, 0xBE18, 0xF7BF, 0xFFFF, 0xBDF7, 0x8007, 0x0000, 0x0005, 0x9492, 0xE73C, 0xD6DB,
+    0xDF1C, 0x9CF3, 0x8005, 0x0000, 0x000B, 0xD69A, 0xD69A, 0x9CD3, 0xDEFB, 0xC659, 0x0000, 0x6B8E, 0x73AE, 0x0000, 0x8C71, 0x8C51,
+    0x8015, 0x0000, 0x802C, 0x0000, 0x0002, 0x7BF0, 0xCE7A, 0x8009, 0x0000, 0x0004, 0xDF3C, 0xF7DF, 0xFFFF, 0x7C10, 0x8008, 0x0000,
+    0x0004, 0x6B6D, 0xEF7D, 0xEF7D, 0x6B6D, 0x8008, 0x0000, 0x0003, 0xA534, 0xFFFF, 0xAD75, 0x8007, 0x0000, 0x0003, 0xA555, 0xFFFF,
+    0xB5D7, 0x8005, 0x0000, 0x0001, 0xBE18, 0x8016, 0x0000, 0x802C, 0x0000, 0x0004, 0x8410, 0xAD96, 0x0000, 0x6B6D, 0x8007, 0x0000,
+    0x0005, 0xAD55, 0xEF9E, 0xC639, 0x6B6E, 0x73AE, 0x8006, 0x0000, 0x0006, 0x7BCF, 0x0000, 0xB596, 0xAD76, 0x0000, 0x73AE, 0x8006,
+    0x0000, 0x0004, 0x73AE, 0x738E, 0xE73D, 0x8C71, 0x8007, 0x0000, 0x0002, 0x7BCF, 0xD69A, 0x8005, 0x0000, 0x0002, 0x8C72, 0xF7BF,
+    0x8016, 0x0000, 0x802C, 0x0000, 0x0002, 0x8C92, 0xA555, 0x8003, 0x0000, 0x0022, 0x8C51, 0x9CD3, 0x0000, 0x738E, 0x0000, 0x0000,
+    0x94B3, 0xD69A, 0xBDF7, 0x0000, 0x0000, 0x73AE, 0x0000, 0x0000, 0x738E, 0x0000, 0x7BCF, 0x0000, 0x0000, 0xAD75, 0xA534, 0x0000,
+    0x0000, 0x73AE, 0x0000, 0x7BF0, 0x0000, 0x0000, 0x6B6D, 0x0000, 0x0000, 0xD6DB, 0x0000, 0x6B6D, 0x8004, 0x0000, 0x0004, 0x73AE,
+    0x0000, 0x0000, 0xCE9A, 0x8004, 0x0000, 0x0003, 0xA555, 0xB596, 0x6B6D, 0x8016, 0x0000, 0x802C, 0x0000, 0x0002, 0x94B3, 0x9CD3,
+    0x8003, 0x0000, 0x0003, 0xDF1C, 0xFFFF, 0x738E, 0x8003, 0x0000, 0x0003, 0xAD96, 0xB5B6, 0xBDF8, 0x8003, 0x0000, 0x0004, 0x6B6D,
+    0xE71C, 0xE75D, 0x73AE, 0x8003, 0x0000, 0x0002, 0xAD96, 0x9D14, 0x8003, 0x0000, 0x0003, 0x9492, 0xFFDF, 0xCE59, 0x8004, 0x0000,
+    0x0001, 0xCE7A, 0x8003, 0x0000, 0x0003, 0xAD75, 0xDEFC, 0x7BF0, 0x8003, 0x0000, 0x0006, 0xF7BF, 0xE75D, 0x94B3, 0x94B3, 0xC638,
+    0x94B3, 0x8018, 0x0000, 0x802C, 0x0000, 0x0007, 0xAD75, 0x9CF3, 0x0000, 0x7BAF, 0x0000, 0x8410, 0x9CF4, 0x8004, 0x0000, 0x0003,
+    0xBE18, 0x9CF3, 0xBDF8, 0x8004, 0x0000, 0x0003, 0xE73C, 0xEF9E, 0x7BEF, 0x8003, 0x0000, 0x0002, 0xB5B6, 0x9D14, 0x8003, 0x0000,
+    0x0003, 0x94B3, 0xF7BF, 0xC639, 0x8003, 0x0000, 0x0002, 0x6B8E, 0xC659, 0x8003, 0x0000, 0x000A, 0xC638, 0xFFFF, 0x8430, 0x0000,
+    0x0000, 0x6B6D, 0xDEFC, 0xDEFC, 0xF7DF, 0xEF7D, 0x801A, 0x0000, 0x802C, 0x0000, 0x0002, 0xDEFC, 0xEF7D, 0x8009, 0x0000, 0x0027,
+    0xB5B7, 0x9CF3, 0xCE7A, 0x0000, 0x0000, 0x738E, 0x0000, 0x6B6D, 0x7BCF, 0x0000, 0x73AE, 0x0000, 0x0000, 0xB5B6, 0x9CD3, 0x0000,
+    0x6B6D, 0x6B6D, 0x0000, 0x8410, 0x0000, 0x0000, 0x6B6D, 0x0000, 0x7BEF, 0xC638, 0x0000, 0x0000, 0x6B6D, 0x0000, 0x73CE, 0x0000,
+    0x73AE, 0x0000, 0x7BF0, 0xAD96, 0x0000, 0xEF9E, 0x73CF, 0x801A, 0x0000, 0x802D, 0x0000, 0x0002, 0xB596, 0xC618, 0x8007, 0x0000,
+    0x0006, 0x9CF3, 0xDEFB, 0x9D14, 0xDEDB, 0x6B6D, 0x73AE, 0x8007, 0x0000, 0x0004, 0x6B6E, 0xCE7A, 0xB5D7, 0x6B6D, 0x8008, 0x0000,
+    0x0003, 0xA534, 0xCE9A, 0x6B8D, 0x8007, 0x0000, 0x0005, 0xBE18, 0xDF1C, 0x0000, 0x8430, 0xBE38, 0x801A, 0x0000, 0x802E, 0x0000,
+    0x0003, 0x8451, 0xDF1C, 0x73AE, 0x8003, 0x0000, 0x0007, 0x73AE, 0xAD75, 0xE71C, 0xE73D, 0xC659, 0xFFFF, 0xB5D7, 0x8008, 0x0000,
+    0x0003, 0x8451, 0xFFFF, 0xF7DF, 0x8004, 0x0000, 0x0001, 0x6B6D, 0x8004, 0x0000, 0x0002, 0xEF9E, 0xF7BF, 0x8007, 0x0000, 0x0007,
+    0x9492, 0xEF7D, 0xBE18, 0x0000, 0x0000, 0xDEFB, 0xCE59, 0x8019, 0x0000, 0x8030, 0x0000, 0x000C, 0xCE59, 0xBDF7, 0xA555, 0xCE59,
+    0xC638, 0x94D3, 0x0000, 0x738E, 0x7BEF, 0xC638, 0xCE9A, 0xBDF8, 0x8006, 0x0000, 0x0010, 0xB596, 0xD6DB, 0xBE18, 0xC638, 0xDEFB,
+    0x8431, 0x0000, 0x0000, 0x6B6D, 0x0000, 0x0000, 0xA534, 0xDEFC, 0xC618, 0xDF1C, 0xB5B6, 0x8005, 0x0000, 0x0003, 0xCE59, 0xB5D7,
+    0x6B8E, 0x8003, 0x0000, 0x0002, 0xBE18, 0x6B6E, 0x8019, 0x0000, 0x8031, 0x0000, 0x0003, 0xFFDF, 0xD6BB, 0x8430, 0x8007, 0x0000,
+    0x0008, 0x94D3, 0xEF5D, 0xA514, 0x0000, 0x6B6E, 0x8431, 0xE71C, 0xB596, 0x8004, 0x0000, 0x0007, 0xD69A, 0xCE59, 0x738E, 0x7BCF,
+    0x8430, 0xDEDB, 0xB5B6, 0x8003, 0x0000, 0x0009, 0xAD76, 0xEF5D, 0x9CF4, 0x8410, 0x94B3, 0xD69A, 0x8C92, 0xA535, 0xC659, 0x8003,
+    0x0000, 0x0001, 0xBDD7, 0x801A, 0x0000, 0x8031, 0x0000, 0x0002, 0x9CF4, 0x9CF3, 0x8009, 0x0000, 0x0005, 0xB5B7, 0xF7DF, 0xDEFB,
+    0xE77D, 0xCE9A, 0x8007, 0x0000, 0x0005, 0x9CF3, 0xEF7D, 0xEF7E, 0xD69A, 0x6B8E, 0x8006, 0x0000, 0x000B, 0xEF7D, 0xFFFF, 0xE75D,
+    0x73AE, 0x0000, 0xC618, 0xD69A, 0x0000, 0x0000, 0xA514, 0x8431, 0x801A, 0x0000, 0x8031, 0x0000, 0x0002, 0x94B3, 0xA514, 0x8003,
+    0x0000, 0x000B, 0x8430, 0x9492, 0x0000, 0x738E, 0x6B6D, 0x0000, 0x8C71, 0xA555, 0xBE18, 0xEF5D, 0x73AE, 0x8008, 0x0000, 0x0003,
+    0xBE18, 0xF7BE, 0x6B6E, 0x8007, 0x0000, 0x0003, 0xAD55, 0xD6DB, 0x8410, 0x8005, 0x0000, 0x0002, 0x738E, 0xC638, 0x801B, 0x0000,
+    0x8031, 0x0000, 0x0002, 0x9CF3, 0x94B2, 0x8003, 0x0000, 0x0003, 0xDEFB, 0xFFFF, 0x73AE, 0x8003, 0x0000, 0x0006, 0xAD76, 0x9CD3,
+    0xBE18, 0x6B6D, 0x0000, 0x6B6D, 0x8005, 0x0000, 0x0006, 0x6B6E, 0x0000, 0xA555, 0x9CF3, 0x0000, 0x6B6D, 0x8004, 0x0000, 0x0004,
+    0x73AE, 0x0000, 0xA555, 0xA534, 0x8006, 0x0000, 0x0002, 0xD6FB, 0xCE79, 0x801B, 0x0000, 0x8031, 0x0000, 0x0002, 0xD6BB, 0xC659,
+    0x8003, 0x0000, 0x0002, 0x8410, 0x9CD3, 0x8004, 0x0000, 0x0003, 0xBE18, 0x9CF3, 0xCE79, 0x8004, 0x0000, 0x0003, 0xBDD7, 0xD6BA,
+    0x738E, 0x8003, 0x0000, 0x0002, 0xC638, 0x7BCF, 0x8003, 0x0000, 0x0002, 0xB596, 0xAD75, 0x8003, 0x0000, 0x0009, 0xC638, 0xD6DB,
+    0xAD76, 0x0000, 0x6B6D, 0x7BEF, 0xB5D7, 0xB596, 0x738E, 0x801C, 0x0000, 0x8031, 0x0000, 0x0003, 0x8C51, 0xCE9A, 0x94B2, 0x8008,
+    0x0000, 0x0003, 0xBDF8, 0x94D3, 0xD6BA, 0x8004, 0x0000, 0x0003, 0xD6BA, 0xEF9E, 0x6B6D, 0x8003, 0x0000, 0x0001, 0xD69A, 0x8003,
+    0x0000, 0x0003, 0x6B8E, 0xFFFF, 0xCE9A, 0x8003, 0x0000, 0x0006, 0xCE59, 0x0000, 0x94B2, 0xDF1C, 0xD6BB, 0xAD55, 0x801F, 0x0000,
+    0x8033, 0x0000, 0x0002, 0xB5B6, 0xC638, 0x8006, 0x0000, 0x0006, 0xB596, 0xE75D, 0xA535, 0xCE7A, 0x0000, 0x6B6E, 0x8005, 0x0000,
+    0x0009, 0x73AE, 0x0000, 0x0000, 0xCE79, 0x0000, 0x0000, 0x6B6E, 0x0000, 0x7C10, 0x8003, 0x0000, 0x0006, 0x6B6E, 0xBDF8, 0x0000,
+    0x0000, 0xC638, 0xB5B7, 0x8020, 0x0000, 0x8034, 0x0000, 0x000C, 0x8C71, 0xC638, 0x9492, 0x73CF, 0x8430, 0xB5B6, 0xBE18, 0xCE79,
+    0xCE9A, 0xC659, 0xFFFF, 0x9CF4, 0x8008, 0x0000, 0x0002, 0xA555, 0xD6DB, 0x8008, 0x0000, 0x0006, 0xCE59, 0xE75D, 0x0000, 0x0000,
+    0xA514, 0x8430, 0x8020, 0x0000, 0x8035, 0x0000, 0x000C, 0x6B6D, 0xFFFF, 0xD6BB, 0xE73D, 0x9CF4, 0x6B6E, 0x0000, 0x0000, 0x6B4D,
+    0x8C51, 0xBDD7, 0xBDD7, 0x8005, 0x0000, 0x0005, 0x6B6D, 0xAD75, 0xEF7D, 0xFFDF, 0xA535, 0x8005, 0x0000, 0x0007, 0x73AE, 0xCE7A,
+    0xFFFF, 0xA535, 0x0000, 0x0000, 0xBDF7, 0x8021, 0x0000, 0x8036, 0x0000, 0x0003, 0x738E, 0x0000, 0xAD76, 0x8007, 0x0000, 0x0017,
     0xAD55, 0xD6BB, 0x9CF3, 0x8430, 0x8C71, 0xC638, 0xC638, 0x8430, 0x7BEF, 0x73AE, 0xA534, 0xD69A, 0x9CD3, 0x0000, 0x7BCF, 0xBDF7,
-    0xCE7A, 0xCE7A, 0xE73D, 0x73AE, 0x0000, 0x6B6D, 0xBDD7, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x94B3, 0x8C51, 0x0000, 0x0000, 0x0000, 0xE75D, 0xC659, 0x0000, 0x0000, 0x0000, 0xCE7A, 0xFFFF, 0xBDF7, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x8410, 0xB596, 0xEF7D, 0xEF7D, 0xB596, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xDEFB, 0xC638, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x94D3, 0xC618, 0x0000, 0x0000, 0x0000, 0xA555, 0x9D14, 0x0000,
-    0x0000, 0x0000, 0x738E, 0xDEDB, 0x0000, 0x0000, 0x0000, 0x0000, 0x6B8D, 0x0000, 0x0000, 0x0000, 0x0000, 0xB5B7, 0xB596, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x7C10, 0xB5D7, 0x94B2, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x8C51, 0xE73C, 0xAD96, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x9CF4, 0xDEDB, 0x0000, 0x0000, 0x0000, 0x6B6D,
-    0xEF9E, 0xCE9A, 0x0000, 0x0000, 0x0000, 0x7BF0, 0xCE9A, 0x7BEF, 0x0000, 0x8C71, 0xB5B6, 0xA534, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x8430, 0xBDF8, 0x9CD3, 0x0000, 0x0000, 0x0000,
-    0x8C71, 0xB5B7, 0xCE7A, 0xDF1C, 0x0000, 0x0000, 0x0000, 0x0000, 0xB5B7, 0x9492, 0x0000, 0x6B6D, 0x0000, 0xB596, 0xD6DB, 0x9492,
-    0xD6BB, 0xE75D, 0x6B6D, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x8C51, 0xDEDB, 0xE73C, 0xB5B7, 0x94B2, 0x0000, 0x0000, 0xBDF7, 0x7BCF, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x94B2, 0xE73D, 0x9CD3, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x8431, 0x0000,
-    0x0000, 0x0000, 0x0000, 0xCE7A, 0xEF5D, 0x8431, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xBDD7, 0xAD95, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x73AE, 0x8C71, 0xA534, 0xBDF8, 0xB596,
-    0x9CF4, 0xB5B6, 0xC618, 0x7BEF, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xBDD7, 0xDF1C, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
+    0xCE7A, 0xCE7A, 0xE73D, 0x73AE, 0x0000, 0x6B6D, 0xBDD7, 0x8021, 0x0000, 0x8038, 0x0000, 0x0002, 0x94B3, 0x8C51, 0x8003, 0x0000,
+    0x0002, 0xE75D, 0xC659, 0x8003, 0x0000, 0x0003, 0xCE7A, 0xFFFF, 0xBDF7, 0x8006, 0x0000, 0x0005, 0x8410, 0xB596, 0xEF7D, 0xEF7D,
+    0xB596, 0x8005, 0x0000, 0x0002, 0xDEFB, 0xC638, 0x8021, 0x0000, 0x8038, 0x0000, 0x0002, 0x94D3, 0xC618, 0x8003, 0x0000, 0x0002,
+    0xA555, 0x9D14, 0x8003, 0x0000, 0x0002, 0x738E, 0xDEDB, 0x8004, 0x0000, 0x0001, 0x6B8D, 0x8004, 0x0000, 0x0002, 0xB5B7, 0xB596,
+    0x8004, 0x0000, 0x0003, 0x7C10, 0xB5D7, 0x94B2, 0x8022, 0x0000, 0x8038, 0x0000, 0x0003, 0x8C51, 0xE73C, 0xAD96, 0x8007, 0x0000,
+    0x0002, 0x9CF4, 0xDEDB, 0x8003, 0x0000, 0x0003, 0x6B6D, 0xEF9E, 0xCE9A, 0x8003, 0x0000, 0x0007, 0x7BF0, 0xCE9A, 0x7BEF, 0x0000,
+    0x8C71, 0xB5B6, 0xA534, 0x8024, 0x0000, 0x803A, 0x0000, 0x0003, 0x8430, 0xBDF8, 0x9CD3, 0x8003, 0x0000, 0x0004, 0x8C71, 0xB5B7,
+    0xCE7A, 0xDF1C, 0x8004, 0x0000, 0x000B, 0xB5B7, 0x9492, 0x0000, 0x6B6D, 0x0000, 0xB596, 0xD6DB, 0x9492, 0xD6BB, 0xE75D, 0x6B6D,
+    0x8025, 0x0000, 0x803C, 0x0000, 0x0009, 0x8C51, 0xDEDB, 0xE73C, 0xB5B7, 0x94B2, 0x0000, 0x0000, 0xBDF7, 0x7BCF, 0x8007, 0x0000,
+    0x0003, 0x94B2, 0xE73D, 0x9CD3, 0x8029, 0x0000, 0x803E, 0x0000, 0x0001, 0x8431, 0x8004, 0x0000, 0x0003, 0xCE7A, 0xEF5D, 0x8431,
+    0x8005, 0x0000, 0x0002, 0xBDD7, 0xAD95, 0x802B, 0x0000, 0x8043, 0x0000, 0x0009, 0x73AE, 0x8C71, 0xA534, 0xBDF8, 0xB596, 0x9CF4,
+    0xB5B6, 0xC618, 0x7BEF, 0x802C, 0x0000, 0x8048, 0x0000, 0x0002, 0xBDD7, 0xDF1C, 0x802E, 0x0000, 0x8078, 0x0000, 0x8078, 0x0000,
+    0x8078, 0x0000, 0x8078, 0x0000, 0x8078, 0x0000, 0x8078, 0x0000, 0x8078, 0x0000, 0x8078, 0x0000,
 };
 
+constexpr bool HAS_IMAGE = (sizeof(LOGO_RLE) / sizeof(LOGO_RLE[0])) > 100;
+
 } // namespace BootLogo
 
 #endif // MESHBERRY_BOOTLOGO_H
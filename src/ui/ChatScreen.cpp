@@ -206,6 +206,7 @@ void ChatScreen::drawMessages(bool fullRedraw) {
         // Draw message text inside bubble
         int16_t textX = bubbleX + bubblePadding;
         int16_t textY = y + bubblePadding - 2;
+        Emoji::setBackground(bubbleColor);
         for (int ln = 0; ln < lineCount; ln++) {
             Display::drawTextWithEmoji(textX, textY, wrappedLines[ln], textColor, 1);
             textY += 10;
@@ -270,6 +271,7 @@ void ChatScreen::drawInputBar() {
             displayText = _inputBuffer + (_inputPos - maxChars);
         }
         // Use drawTextWithEmoji to properly render emoji glyphs
+        Emoji::setBackground(bgColor);
         Display::drawTextWithEmoji(fieldX + 6, fieldY + 6, displayText, Theme::TEXT_PRIMARY, 1);
 
         // Cursor (blinking)
@@ -214,6 +214,7 @@ void DMChatScreen::drawMessages(bool fullRedraw) {
 
         // Draw message text inside bubble
         int16_t textY = y + bubblePadding;
+        Emoji::setBackground(bubbleColor);
         for (int ln = 0; ln < lineCount; ln++) {
             Display::drawTextWithEmoji(bubbleX + bubblePadding, textY, wrappedLines[ln], textColor, 1);
             textY += lineHeight;
@@ -276,6 +277,7 @@ void DMChatScreen::drawInputBar() {
             displayText = _inputBuffer + (_inputPos - maxChars);
         }
         // Use drawTextWithEmoji to properly render emoji glyphs
+        Emoji::setBackground(bgColor);
         Display::drawTextWithEmoji(fieldX + 4, fieldY + 6, displayText, Theme::TEXT_PRIMARY, 1);
 
         // Cursor (blinking)
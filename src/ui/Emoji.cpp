@@ -11,6 +11,18 @@
 // Include the generated emoji bitmap data (353 emoji)
 #include "EmojiData.h"
 
+static_assert(EMOJI_BYTE_SWAPPED == EMOJI_SWAP_BYTES,
+              "EmojiData.h pixel byte order does not match -DEMOJI_SWAP_BYTES, regenerate it or fix the flag");
+
+#if defined(EMOJI_ALPHA_BITS)
+static_assert(EMOJI_ALPHA_BITS == 1, "EmojiData.h alpha plane must be a 1-bit mask, regenerate it with --alpha-bits 1");
+#endif
+
+#if defined(EMOJI_VARIANT_COUNT)
+// Pre-composited bitmap variant selected by setBackground()
+static uint8_t currentVariant = 0;
+#endif
+
 // Category names
 static const char* CATEGORY_NAMES[] = {
     "Faces",
@@ -131,22 +143,152 @@ int utf8Length(const char* str) {
 // =========================================================================
 
 const EmojiEntry* findByCodepoint(uint32_t codepoint) {
-    for (int i = 0; i < EMOJI_COUNT; i++) {
-        if (EMOJI_TABLE[i].codepoint == codepoint) {
-            return &EMOJI_TABLE[i];
+    // Lower-bound binary search over the codepoint-sorted index, so duplicate
+    // codepoints resolve to their first table entry. Sequences are not indexed,
+    // their first codepoint alone is not the emoji
+    int lo = 0;
+    int hi = EMOJI_CODEPOINT_INDEX_COUNT;
+    while (lo < hi) {
+        int mid = (lo + hi) / 2;
+        if (EMOJI_TABLE[EMOJI_CODEPOINT_INDEX[mid]].codepoint < codepoint) {
+            lo = mid + 1;
+        } else {
+            hi = mid;
+        }
+    }
+
+    if (lo < EMOJI_CODEPOINT_INDEX_COUNT) {
+        const EmojiEntry* entry = &EMOJI_TABLE[EMOJI_CODEPOINT_INDEX[lo]];
+        if (entry->codepoint == codepoint) {
+            return entry;
+        }
+    }
+    return nullptr;
+}
+
+#if defined(EMOJI_SEQUENCE_COUNT)
+// Binary search a trie node's (sorted, contiguous) children
+static const EmojiSequenceNode* findSequenceChild(const EmojiSequenceNode* node, uint32_t codepoint) {
+    int lo = node->firstChild;
+    int hi = node->firstChild + node->childCount;
+    while (lo < hi) {
+        int mid = (lo + hi) / 2;
+        if (EMOJI_SEQUENCE_NODES[mid].codepoint < codepoint) {
+            lo = mid + 1;
+        } else {
+            hi = mid;
+        }
+    }
+    if (lo < node->firstChild + node->childCount && EMOJI_SEQUENCE_NODES[lo].codepoint == codepoint) {
+        return &EMOJI_SEQUENCE_NODES[lo];
+    }
+    return nullptr;
+}
+
+// Codepoints of a sequence entry, nullptr for single-codepoint entries
+static const EmojiSequence* findSequence(const EmojiEntry* entry) {
+    int index = entry - EMOJI_TABLE;
+    int lo = 0;
+    int hi = EMOJI_SEQUENCE_COUNT;
+    while (lo < hi) {
+        int mid = (lo + hi) / 2;
+        if (EMOJI_SEQUENCES[mid].entry < index) {
+            lo = mid + 1;
+        } else {
+            hi = mid;
         }
     }
+    if (lo < EMOJI_SEQUENCE_COUNT && EMOJI_SEQUENCES[lo].entry == index) {
+        return &EMOJI_SEQUENCES[lo];
+    }
     return nullptr;
 }
+#endif
+
+const EmojiEntry* matchUTF8(const char* str, int* bytes) {
+    uint32_t codepoint;
+    int len = decodeUTF8(str, &codepoint);
+    if (bytes) *bytes = len;
+    if (len == 0) return nullptr;
+
+    // ASCII only starts an emoji when a combining mark follows (keycaps)
+    if (len == 1 && (uint8_t)str[1] < 0x80) return nullptr;
+
+    const EmojiEntry* match = nullptr;
+    int matchLen = 0;
+
+#if defined(EMOJI_SEQUENCE_COUNT)
+    // Walk the trie along the text, remembering the longest complete
+    // sequence; every codepoint is decoded once
+    const EmojiSequenceNode* node = findSequenceChild(&EMOJI_SEQUENCE_NODES[0], codepoint);
+    int pos = len;
+    while (node) {
+        if (node->entry != EMOJI_SEQUENCE_NONE) {
+            match = &EMOJI_TABLE[node->entry];
+            matchLen = pos;
+        }
+        if (node->childCount == 0) break;
+
+        uint32_t next;
+        int n = decodeUTF8(str + pos, &next);
+        if (n == 0) break;
+        node = findSequenceChild(node, next);
+        pos += n;
+    }
+#endif
+
+    if (!match) {
+        match = findByCodepoint(codepoint);
+        matchLen = len;
+        if (!match) return nullptr;
+    }
+
+    // An emoji presentation selector after the match belongs to it
+    uint32_t next;
+    int n = decodeUTF8(str + matchLen, &next);
+    if (n && next == 0xFE0F) {
+        matchLen += n;
+    }
+
+    if (bytes) *bytes = matchLen;
+    return match;
+}
+
+// 32-bit FNV-1a with the seed folded into the offset basis
+// (must match fnv1a_32() in tools/generate_emoji.py)
+static uint32_t hashShortcode(const char* str, uint32_t seed) {
+    uint32_t h = 0x811C9DC5u ^ seed;
+    while (*str) {
+        h = (h ^ (uint8_t)*str++) * 0x01000193u;
+    }
+    return h;
+}
 
 const EmojiEntry* findByShortcode(const char* shortcode) {
     if (!shortcode) return nullptr;
 
-    for (int i = 0; i < EMOJI_COUNT; i++) {
-        if (strcmp(EMOJI_TABLE[i].shortcode, shortcode) == 0) {
-            return &EMOJI_TABLE[i];
+    // Minimal perfect hash: every shortcode maps to a unique slot, so one
+    // strcmp confirms (or rejects) the candidate
+    uint32_t bucket = hashShortcode(shortcode, EMOJI_SHORTCODE_BUCKET_SEED) % EMOJI_SHORTCODE_BUCKETS;
+    uint32_t h = hashShortcode(shortcode, EMOJI_SHORTCODE_SLOT_SEED);
+    uint32_t d = EMOJI_SHORTCODE_DISPLACE[bucket];
+    uint32_t f1 = (h & 0xFFFF) % EMOJI_COUNT;
+    uint32_t f2 = (h >> 16) % EMOJI_COUNT;
+    uint32_t slot = (f1 + ((d >> 16) * f2) % EMOJI_COUNT + (d & 0xFFFF)) % EMOJI_COUNT;
+
+    const EmojiEntry* entry = &EMOJI_TABLE[EMOJI_SHORTCODE_SLOTS[slot]];
+    if (strcmp(entry->shortcode, shortcode) == 0) {
+        return entry;
+    }
+
+#if defined(EMOJI_ALIAS_COUNT)
+    // Aliases are few, so they are scanned only after the hash misses
+    for (int i = 0; i < EMOJI_ALIAS_COUNT; i++) {
+        if (strcmp(EMOJI_ALIASES[i].shortcode, shortcode) == 0) {
+            return &EMOJI_TABLE[EMOJI_ALIASES[i].entry];
         }
     }
+#endif
     return nullptr;
 }
 
@@ -155,27 +297,125 @@ const EmojiEntry* getByIndex(int index) {
     return &EMOJI_TABLE[index];
 }
 
-int getCount() {
-    return EMOJI_COUNT;
+const uint16_t* getBitmap(const EmojiEntry* entry) {
+    if (!entry) return nullptr;
+#if defined(EMOJI_PALETTE_BITS)
+    return nullptr;  // Palette-indexed, must be decoded with readBitmap()
+#elif defined(EMOJI_VARIANT_COUNT)
+    // Variants follow one another in the atlas, one full set per background
+    return EMOJI_ATLAS + ((uint32_t)currentVariant * EMOJI_VARIANT_STRIDE + entry->bitmapIndex) * EMOJI_PIXELS;
+#elif EMOJI_USE_ATLAS
+    return EMOJI_ATLAS + (uint32_t)entry->bitmapIndex * EMOJI_PIXELS;
+#else
+    return entry->bitmap;
+#endif
 }
 
-int getCategoryStart(EmojiCategory category) {
-    for (int i = 0; i < EMOJI_COUNT; i++) {
-        if (EMOJI_TABLE[i].category == category) {
-            return i;
+bool readBitmap(const EmojiEntry* entry, uint16_t* out) {
+    if (!entry || !out) return false;
+
+#if defined(EMOJI_PALETTE_BITS)
+    const uint8_t* indices = EMOJI_PALETTE_INDICES + (uint32_t)entry->bitmapIndex * EMOJI_INDEX_BYTES;
+#if EMOJI_PALETTE_SHARED
+    const uint16_t* palette = EMOJI_PALETTE;
+#else
+    const uint16_t* palette = EMOJI_PALETTES + (uint32_t)entry->bitmapIndex * EMOJI_PALETTE_SIZE;
+#endif
+
+    for (int i = 0; i < EMOJI_PIXELS; i++) {
+#if EMOJI_PALETTE_BITS == 4
+        // Two pixels per byte, high nibble first
+        uint8_t idx = (i & 1) ? (indices[i >> 1] & 0x0F) : (indices[i >> 1] >> 4);
+#else
+        uint8_t idx = indices[i];
+#endif
+        out[i] = palette[idx];
+    }
+    return true;
+#else
+    const uint16_t* bitmap = getBitmap(entry);
+    if (!bitmap) return false;
+    memcpy_P(out, bitmap, EMOJI_PIXELS * sizeof(uint16_t));
+    return true;
+#endif
+}
+
+const uint16_t* getSizedBitmap(const EmojiEntry* entry, int size) {
+    if (!entry) return nullptr;
+    if (size == EMOJI_WIDTH) return getBitmap(entry);
+
+#if defined(EMOJI_SIZE_COUNT)
+    for (int i = 0; i < EMOJI_SIZE_COUNT; i++) {
+        if (EMOJI_SIZE_TABLES[i].size == size) {
+            return EMOJI_SIZE_TABLES[i].bitmaps + (uint32_t)(entry - EMOJI_TABLE) * size * size;
         }
     }
-    return -1;
+#endif
+    return nullptr;
 }
 
-int getCategoryCount(EmojiCategory category) {
-    int count = 0;
-    for (int i = 0; i < EMOJI_COUNT; i++) {
-        if (EMOJI_TABLE[i].category == category) {
-            count++;
+int sizeForText(uint8_t textSize) {
+    int size = EMOJI_WIDTH;
+#if defined(EMOJI_SIZE_COUNT)
+    // Size tables are sorted ascending
+    for (int i = 0; i < EMOJI_SIZE_COUNT; i++) {
+        if (EMOJI_SIZE_TABLES[i].size <= 8 * textSize) {
+            size = EMOJI_SIZE_TABLES[i].size;
         }
     }
-    return count;
+#else
+    (void)textSize;
+#endif
+    return size;
+}
+
+bool readMask(const EmojiEntry* entry, uint8_t* out) {
+#if defined(EMOJI_ALPHA_BITS)
+    if (!entry || !out) return false;
+
+    // The alpha plane is indexed by table position in every storage mode
+    const uint8_t* alpha = EMOJI_ALPHA + (uint32_t)(entry - EMOJI_TABLE) * EMOJI_ALPHA_BYTES;
+    memcpy_P(out, alpha, EMOJI_MASK_BYTES);
+    return true;
+#else
+    (void)entry;
+    (void)out;
+    return false;
+#endif
+}
+
+bool setBackground(uint16_t color) {
+#if defined(EMOJI_VARIANT_COUNT)
+    for (int v = 0; v < EMOJI_VARIANT_COUNT; v++) {
+        if (EMOJI_VARIANT_BG[v] == color) {
+            currentVariant = v;
+            return true;
+        }
+    }
+    currentVariant = 0;
+#else
+    (void)color;
+#endif
+    return false;
+}
+
+int getCount() {
+    return EMOJI_COUNT;
+}
+
+int getCategoryStart(EmojiCategory category) {
+    int idx = (int)category;
+    if (idx < 0 || idx >= (int)EmojiCategory::CATEGORY_COUNT) return -1;
+
+    // Categories are contiguous in EMOJI_TABLE (validated by the generator)
+    if (EMOJI_CATEGORY_OFFSETS[idx + 1] == EMOJI_CATEGORY_OFFSETS[idx]) return -1;
+    return EMOJI_CATEGORY_OFFSETS[idx];
+}
+
+int getCategoryCount(EmojiCategory category) {
+    int idx = (int)category;
+    if (idx < 0 || idx >= (int)EmojiCategory::CATEGORY_COUNT) return 0;
+    return EMOJI_CATEGORY_OFFSETS[idx + 1] - EMOJI_CATEGORY_OFFSETS[idx];
 }
 
 const char* getCategoryName(EmojiCategory category) {
@@ -195,11 +435,20 @@ int16_t textWidth(const char* text, uint8_t textSize) {
 
     int16_t width = 0;
     int16_t charWidth = 6 * textSize;  // Default font width
+    int16_t emojiWidth = sizeForText(textSize);
     const char* p = text;
 
     while (*p) {
+        int bytes;
+        if (matchUTF8(p, &bytes)) {
+            // Known emoji or emoji sequence
+            width += emojiWidth;
+            p += bytes;
+            continue;
+        }
+
         uint32_t cp;
-        int bytes = decodeUTF8(p, &cp);
+        bytes = decodeUTF8(p, &cp);
 
         if (bytes == 0) {
             // Invalid byte, skip
@@ -211,10 +460,7 @@ int16_t textWidth(const char* text, uint8_t textSize) {
             p++;
         } else {
             // Multi-byte character
-            if (findByCodepoint(cp)) {
-                // Known emoji
-                width += EMOJI_WIDTH;
-            } else {
+            if (!isZeroWidth(cp)) {
                 // Unknown Unicode, render as [?]
                 width += 3 * charWidth;
             }
@@ -225,6 +471,34 @@ int16_t textWidth(const char* text, uint8_t textSize) {
     return width;
 }
 
+int encodeEmoji(const EmojiEntry* entry, char* buf, size_t bufSize) {
+    if (!entry || !buf || bufSize == 0) return 0;
+
+    const uint32_t* codepoints = &entry->codepoint;
+    int count = 1;
+#if defined(EMOJI_SEQUENCE_COUNT)
+    const EmojiSequence* sequence = findSequence(entry);
+    if (sequence) {
+        codepoints = EMOJI_SEQUENCE_CODEPOINTS + sequence->offset;
+        count = sequence->length;
+    }
+#endif
+
+    size_t pos = 0;
+    for (int i = 0; i < count; i++) {
+        char utf8[5];
+        int bytes = encodeUTF8(codepoints[i], utf8);
+        if (bytes == 0 || pos + bytes >= bufSize) {
+            buf[0] = '\0';
+            return 0;
+        }
+        memcpy(buf + pos, utf8, bytes);
+        pos += bytes;
+    }
+    buf[pos] = '\0';
+    return (int)pos;
+}
+
 void convertShortcodes(char* text, size_t maxLen) {
     if (!text || maxLen < 2) return;
 
@@ -246,9 +520,9 @@ void convertShortcodes(char* text, size_t maxLen) {
                 // Look up emoji
                 const EmojiEntry* emoji = findByShortcode(shortcode);
                 if (emoji) {
-                    // Encode codepoint as UTF-8
-                    char utf8[5];
-                    int bytes = encodeUTF8(emoji->codepoint, utf8);
+                    // Encode codepoint (or whole sequence) as UTF-8
+                    char utf8[32];
+                    int bytes = encodeEmoji(emoji, utf8, sizeof(utf8));
                     if (bytes > 0 && resultPos + bytes < sizeof(result) - 1) {
                         memcpy(result + resultPos, utf8, bytes);
                         resultPos += bytes;
@@ -274,8 +548,23 @@ bool isEmoji(uint32_t codepoint) {
     return findByCodepoint(codepoint) != nullptr;
 }
 
+bool isZeroWidth(uint32_t codepoint) {
+    return codepoint == 0x200D ||                           // Zero width joiner
+           codepoint == 0xFE0E || codepoint == 0xFE0F ||    // Text / emoji presentation selectors
+           codepoint == 0x20E3 ||                           // Combining enclosing keycap
+           (codepoint >= 0x1F3FB && codepoint <= 0x1F3FF) ||  // Skin tone modifiers
+           (codepoint >= 0xE0020 && codepoint <= 0xE007F);    // Tags (subdivision flags)
+}
+
 void init() {
-    // Nothing to initialize currently
+#ifdef EMOJI_BLOB_SIZE
+    // Bitmaps are linked from EmojiData.bin, make sure it matches the tables
+    size_t blobSize = EMOJI_BLOB_END - EMOJI_BLOB_START;
+    if (blobSize != EMOJI_BLOB_SIZE) {
+        Serial.printf("[EMOJI] Bitmap blob is %u bytes, expected %u - regenerate EmojiData.bin\n",
+                      (unsigned)blobSize, (unsigned)EMOJI_BLOB_SIZE);
+    }
+#endif
     Serial.printf("[EMOJI] Initialized with %d emoji\n", EMOJI_COUNT);
 }
 
@@ -18,6 +18,22 @@
 #define EMOJI_HEIGHT 12
 #define EMOJI_PIXELS (EMOJI_WIDTH * EMOJI_HEIGHT)  // 144 pixels
 
+// 1-bit transparency mask (Adafruit_GFX layout: rows padded to bytes, MSB first)
+#define EMOJI_MASK_STRIDE ((EMOJI_WIDTH + 7) / 8)
+#define EMOJI_MASK_BYTES (EMOJI_MASK_STRIDE * EMOJI_HEIGHT)  // 24 bytes
+
+// Set to 1 (-DEMOJI_USE_ATLAS=1) when EmojiData.h is generated with --atlas, --palette,
+// --blob or --backgrounds
+#ifndef EMOJI_USE_ATLAS
+#define EMOJI_USE_ATLAS 0
+#endif
+
+// Set to 1 (-DEMOJI_SWAP_BYTES=1) when EmojiData.h is generated with --swap-bytes
+// (bitmaps stored big-endian, pushed to the panel without a per-pixel swap)
+#ifndef EMOJI_SWAP_BYTES
+#define EMOJI_SWAP_BYTES 0
+#endif
+
 // Category IDs for emoji picker
 enum class EmojiCategory : uint8_t {
     FACES = 0,
@@ -40,10 +56,49 @@ enum class EmojiCategory : uint8_t {
 struct EmojiEntry {
     uint32_t codepoint;           // Unicode codepoint (e.g., 0x1F600 for grinning face)
     const char* shortcode;        // Shortcode without colons (e.g., "smile")
-    const uint16_t* bitmap;       // 12x12 RGB565 bitmap in PROGMEM
+#if EMOJI_USE_ATLAS
+    uint16_t bitmapIndex;         // Bitmap slot in EMOJI_ATLAS (use Emoji::getBitmap)
+#else
+    const uint16_t* bitmap;       // 12x12 RGB565 bitmap in PROGMEM (use Emoji::getBitmap)
+#endif
     EmojiCategory category;       // Category for picker organization
 };
 
+/**
+ * Extra bitmap size (generate_emoji.py --sizes), addressed by EMOJI_TABLE index
+ */
+struct EmojiSizeTable {
+    uint8_t size;                 // Bitmap width and height in pixels
+    const uint16_t* bitmaps;      // size * size RGB565 pixels per entry, in table order
+};
+
+/**
+ * Sequence trie node (generate_emoji.py), node 0 in EMOJI_SEQUENCE_NODES is the root
+ */
+struct EmojiSequenceNode {
+    uint32_t codepoint;           // Codepoint on the edge into this node
+    uint16_t firstChild;          // Index of the first child, children are contiguous and sorted
+    uint8_t childCount;           // Number of children (0 = leaf)
+    uint16_t entry;               // EMOJI_TABLE index of the sequence ending here, or EMOJI_SEQUENCE_NONE
+};
+
+/**
+ * Codepoints of a multi-codepoint table entry (ZWJ, keycap or flag sequence)
+ */
+struct EmojiSequence {
+    uint16_t entry;               // EMOJI_TABLE index
+    uint16_t offset;              // First codepoint in EMOJI_SEQUENCE_CODEPOINTS
+    uint8_t length;               // Number of codepoints
+};
+
+/**
+ * Other shortcode of a table entry (manifest "aliases"), see Emoji::findByShortcode()
+ */
+struct EmojiAlias {
+    const char* shortcode;        // Alias without colons (e.g., "moai")
+    uint16_t entry;               // EMOJI_TABLE index
+};
+
 namespace Emoji {
 
 // =========================================================================
@@ -84,6 +139,17 @@ int utf8Length(const char* str);
  */
 const EmojiEntry* findByCodepoint(uint32_t codepoint);
 
+/**
+ * Match the longest emoji at the start of a UTF-8 string, including
+ * multi-codepoint sequences (ZWJ, keycap, flag) and a trailing U+FE0F.
+ * Walks the text forward once and allocates nothing.
+ * @param str UTF-8 string
+ * @param bytes Output number of bytes matched, or of the first character
+ *              when nothing matches (0 if the string is empty or invalid)
+ * @return Pointer to EmojiEntry, or nullptr if no emoji starts here
+ */
+const EmojiEntry* matchUTF8(const char* str, int* bytes);
+
 /**
  * Find emoji by shortcode (without colons)
  * @param shortcode Shortcode string (e.g., "smile")
@@ -98,6 +164,57 @@ const EmojiEntry* findByShortcode(const char* shortcode);
  */
 const EmojiEntry* getByIndex(int index);
 
+/**
+ * Get the bitmap for an emoji entry
+ * @param entry Emoji entry
+ * @return 12x12 RGB565 bitmap in PROGMEM, or nullptr if missing or
+ *         stored encoded (palette-indexed), see readBitmap()
+ */
+const uint16_t* getBitmap(const EmojiEntry* entry);
+
+/**
+ * Copy (decoding if needed) the bitmap for an emoji entry
+ * @param entry Emoji entry
+ * @param out Output buffer of EMOJI_PIXELS RGB565 values
+ * @return true if the bitmap was written
+ */
+bool readBitmap(const EmojiEntry* entry, uint16_t* out);
+
+/**
+ * Get the bitmap for an emoji entry at another generated size
+ * @param entry Emoji entry
+ * @param size Bitmap width/height in pixels (EMOJI_WIDTH or a --sizes value)
+ * @return size * size RGB565 bitmap in PROGMEM, or nullptr if that size
+ *         was not generated
+ */
+const uint16_t* getSizedBitmap(const EmojiEntry* entry, int size);
+
+/**
+ * Pick the emoji size to draw beside text
+ * @param textSize Font size multiplier (line height 8 * textSize)
+ * @return Largest generated size that fits the line height, at least EMOJI_WIDTH
+ */
+int sizeForText(uint8_t textSize);
+
+/**
+ * Read the transparency mask for an emoji entry (EmojiData.h generated
+ * with --alpha-bits). Set bits are opaque pixels to copy, clear bits keep
+ * whatever background is already on screen.
+ * @param entry Emoji entry
+ * @param out Output buffer of EMOJI_MASK_BYTES
+ * @return true if the mask was written, false if there is no alpha plane
+ */
+bool readMask(const EmojiEntry* entry, uint8_t* out);
+
+/**
+ * Select the background the next bitmaps are drawn on (EmojiData.h
+ * generated with --backgrounds holds one pre-composited variant per colour)
+ * @param color RGB565 background colour
+ * @return true if a variant for this colour exists, otherwise the first
+ *         variant is used
+ */
+bool setBackground(uint16_t color);
+
 /**
  * Get total number of emoji
  */
@@ -128,6 +245,15 @@ const char* getCategoryName(EmojiCategory category);
 // TEXT PROCESSING
 // =========================================================================
 
+/**
+ * Encode an emoji entry as UTF-8, every codepoint of a sequence included
+ * @param entry Emoji entry
+ * @param buf Output buffer, NUL-terminated
+ * @param bufSize Buffer size in bytes
+ * @return Number of bytes written (excluding NUL), 0 if it does not fit
+ */
+int encodeEmoji(const EmojiEntry* entry, char* buf, size_t bufSize);
+
 /**
  * Calculate pixel width of text with emoji
  * @param text UTF-8 text string
@@ -151,6 +277,15 @@ void convertShortcodes(char* text, size_t maxLen);
  */
 bool isEmoji(uint32_t codepoint);
 
+/**
+ * Check if a codepoint only modifies the character before it (joiner,
+ * variation selector, skin tone, tag). Left over from a sequence that did
+ * not match, these are drawn with no width.
+ * @param codepoint Unicode codepoint
+ * @return true if the codepoint has no glyph of its own
+ */
+bool isZeroWidth(uint32_t codepoint);
+
 // =========================================================================
 // INITIALIZATION
 // =========================================================================
@@ -7,7 +7,7 @@
  * Twemoji graphics licensed under CC-BY 4.0
  * https://github.com/twitter/twemoji
  * 
- * Total: 1013 emoji as 12x12 RGB565 bitmaps
+ * Total: 1015 emoji as 12x12 RGB565 bitmaps
  */
 
 #ifndef MESHBERRY_EMOJI_DATA_H
@@ -16,6 +16,13 @@
 #include <Arduino.h>
 #include "Emoji.h"
 
+#if EMOJI_USE_ATLAS
+#error "EmojiData.h was generated without --atlas, regenerate it or drop -DEMOJI_USE_ATLAS"
+#endif
+
+// RGB565 byte order: 1 = big-endian (panel order, --swap-bytes), 0 = little-endian
+#define EMOJI_BYTE_SWAPPED 0
+
 // ============ FACES (113 emoji) ============
 
 static const uint16_t EMOJI_BMP_GRIN[144] PROGMEM = {
@@ -6268,7 +6275,7 @@ static const uint16_t EMOJI_BMP_ICE[144] PROGMEM = {
     0x0000, 0x0000, 0x0000, 0x0000, 0x0021, 0x2166, 0x2145, 0x0041, 0x0000, 0x0000, 0x0000, 0x0000
 };
 
-// ============ ACTIVITIES (75 emoji) ============
+// ============ ACTIVITIES (74 emoji) ============
 
 static const uint16_t EMOJI_BMP_SOCCER[144] PROGMEM = {
     0x0000, 0x0000, 0x0861, 0x3A08, 0x1905, 0x2145, 0x2145, 0x2166, 0x632D, 0x0861, 0x0000, 0x0000,
@@ -6945,21 +6952,6 @@ static const uint16_t EMOJI_BMP_SPADES[144] PROGMEM = {
     0x0000, 0x0000, 0x2966, 0x31E8, 0x31C7, 0x31A7, 0x31A7, 0x31C7, 0x31E8, 0x2966, 0x0000, 0x0000
 };
 
-static const uint16_t EMOJI_BMP_HEARTS[144] PROGMEM = {
-    0x0000, 0x0000, 0x0000, 0x0800, 0x0000, 0x0000, 0x0000, 0x0000, 0x0800, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x2821, 0x98A5, 0xA8A5, 0x8084, 0x0800, 0x0800, 0x8084, 0xA8A5, 0x98A5, 0x2821, 0x0000,
-    0x1000, 0xB0C5, 0xC8C6, 0xC0C6, 0xD0E6, 0x7884, 0x7884, 0xD0E6, 0xC0C6, 0xC8C6, 0xB0C5, 0x1000,
-    0x4042, 0xC0C6, 0xB8C5, 0xB8C6, 0xB8C5, 0xC0C6, 0xC0C6, 0xB8C5, 0xB8C6, 0xB8C5, 0xC0C6, 0x4042,
-    0x3021, 0xC0C6, 0xB8C6, 0xB8C6, 0xB8C6, 0xB8C6, 0xB8C6, 0xB8C6, 0xB8C6, 0xB8C6, 0xC0C6, 0x3021,
-    0x0000, 0xA0A5, 0xC0C6, 0xB8C6, 0xB8C6, 0xB8C6, 0xB8C6, 0xB8C6, 0xB8C6, 0xC0C6, 0xA0A5, 0x0000,
-    0x0000, 0x4042, 0xC8C6, 0xB8C5, 0xB8C6, 0xB8C6, 0xB8C6, 0xB8C6, 0xB8C5, 0xC8C6, 0x4042, 0x0000,
-    0x0000, 0x0000, 0x7063, 0xC8C6, 0xB8C5, 0xB8C6, 0xB8C6, 0xB8C5, 0xC8C6, 0x7063, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x8884, 0xC8C6, 0xB8C5, 0xB8C5, 0xC8C6, 0x8884, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x8884, 0xC8C6, 0xC8C6, 0x8884, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x7883, 0x7883, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000
-};
-
 static const uint16_t EMOJI_BMP_DIAMONDS[144] PROGMEM = {
     0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x6863, 0x6863, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
     0x0000, 0x0000, 0x0000, 0x0000, 0x2821, 0xC0C6, 0xC0C6, 0x2821, 0x0000, 0x0000, 0x0000, 0x0000,
@@ -8897,7 +8889,7 @@ static const uint16_t EMOJI_BMP_CITYSCAPE[144] PROGMEM = {
     0x1904, 0x2986, 0x2146, 0x2166, 0x638F, 0x638F, 0x2987, 0x2166, 0x2145, 0x530D, 0x424A, 0x18E3
 };
 
-// ============ OBJECTS (174 emoji) ============
+// ============ OBJECTS (172 emoji) ============
 
 static const uint16_t EMOJI_BMP_WATCH[144] PROGMEM = {
     0x0000, 0x0000, 0x0000, 0x0841, 0x29A7, 0x29A7, 0x29A7, 0x29A7, 0x0841, 0x0000, 0x0000, 0x0000,
@@ -10609,21 +10601,6 @@ static const uint16_t EMOJI_BMP_BOOMERANG[144] PROGMEM = {
     0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x2061, 0x30C2, 0x0000
 };
 
-static const uint16_t EMOJI_BMP_BOW2[144] PROGMEM = {
-    0x7431, 0x530D, 0x18E4, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x1040,
-    0x5B2D, 0xCEFD, 0x4229, 0x0000, 0x4944, 0x71E5, 0x7206, 0x69E5, 0x69C5, 0x8A88, 0xA309, 0x5984,
-    0x18E4, 0x4249, 0x8CB3, 0xA36B, 0xCB49, 0x8A67, 0x4923, 0x28C2, 0x1861, 0x51C5, 0x4164, 0x0000,
-    0x0000, 0x0000, 0xA36B, 0xE699, 0x41A6, 0x0000, 0x0000, 0x0000, 0x0000, 0x3123, 0x20C2, 0x0000,
-    0x0000, 0x4944, 0xCB49, 0x49E7, 0x9535, 0x2945, 0x0000, 0x0020, 0x0000, 0x3944, 0x28E3, 0x0000,
-    0x0000, 0x71E5, 0x8A67, 0x0000, 0x2945, 0xA556, 0x2145, 0x0000, 0x0000, 0x3944, 0x28E3, 0x0000,
-    0x0000, 0x7A06, 0x4123, 0x0000, 0x0000, 0x2145, 0xA556, 0x2945, 0x0000, 0x2924, 0x28E3, 0x0000,
-    0x0000, 0x69E5, 0x28A2, 0x0000, 0x0020, 0x0000, 0x2945, 0x9D56, 0x51A6, 0x71E2, 0x2102, 0x0000,
-    0x0000, 0x69C5, 0x1040, 0x0000, 0x0000, 0x0000, 0x0000, 0x4165, 0xEE97, 0xD2C7, 0x90E2, 0x1020,
-    0x0000, 0x8A88, 0x51A5, 0x3144, 0x3944, 0x3944, 0x3944, 0x71E2, 0xD2E7, 0xC518, 0xC9CA, 0x68A3,
-    0x0000, 0xA309, 0x4164, 0x28E3, 0x28E3, 0x28E3, 0x28E3, 0x2902, 0x90C2, 0xC9EA, 0x0041, 0x0000,
-    0x1040, 0x5984, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x1001, 0x6883, 0x0000, 0x0000
-};
-
 static const uint16_t EMOJI_BMP_SHIELD[144] PROGMEM = {
     0x0000, 0x31A6, 0x7BF0, 0x9536, 0x9DFA, 0x9E3C, 0x8D78, 0x9557, 0x8CF5, 0x7C10, 0x39C7, 0x0000,
     0x2104, 0xA63B, 0x761F, 0x65BE, 0x557E, 0x4D3D, 0x1B33, 0x2333, 0x3394, 0x4C36, 0x9D98, 0x2124,
@@ -11464,21 +11441,6 @@ static const uint16_t EMOJI_BMP_URN[144] PROGMEM = {
     0x0000, 0x0000, 0x0000, 0x3124, 0xABCC, 0xBC0D, 0xBC0D, 0x6247, 0x0000, 0x0000, 0x0000, 0x0000
 };
 
-static const uint16_t EMOJI_BMP_MOAI[144] PROGMEM = {
-    0x0000, 0x0000, 0x10A3, 0x94D3, 0xCE9B, 0xD6FC, 0xD6FC, 0xCE9B, 0x94D3, 0x10A3, 0x0000, 0x0000,
-    0x0020, 0x0000, 0x5B0C, 0xD6DC, 0x9515, 0x8493, 0x8493, 0x9515, 0xCEDC, 0x5AEC, 0x0000, 0x0020,
-    0x0000, 0x0000, 0x8452, 0x7411, 0x532D, 0x7431, 0x7431, 0x532D, 0x7411, 0x7C31, 0x0000, 0x0000,
-    0x0000, 0x0861, 0xADB7, 0xCE9B, 0xA576, 0xC67A, 0xC67A, 0xA576, 0xCE9B, 0xA597, 0x0861, 0x0000,
-    0x0000, 0x10C3, 0xADD8, 0xD71C, 0xBE5A, 0xC67A, 0xC67A, 0xBE5A, 0xD71C, 0xADD8, 0x10C3, 0x0000,
-    0x0000, 0x2125, 0xB5F8, 0xD6DC, 0xC67A, 0xADB7, 0xADB7, 0xC67A, 0xD6DC, 0xB5F8, 0x2125, 0x0000,
-    0x0000, 0x2966, 0xB5F8, 0xD6FC, 0xBE19, 0x6BD0, 0x6BD0, 0xB619, 0xD6FC, 0xB5F8, 0x2966, 0x0000,
-    0x0000, 0x2166, 0xB619, 0xD6FC, 0xB618, 0x9D35, 0x9D35, 0xB618, 0xD6DC, 0xB619, 0x2166, 0x0000,
-    0x0000, 0x0841, 0x94F4, 0xD6FC, 0x8493, 0x7411, 0x7411, 0x8493, 0xD6FC, 0x8CB3, 0x0841, 0x0000,
-    0x0020, 0x0000, 0x73CF, 0xDF5E, 0xC67A, 0xC69A, 0xC69A, 0xC67A, 0xDF5E, 0x6B8E, 0x0000, 0x0020,
-    0x0000, 0x0020, 0x7411, 0xBE39, 0xC67A, 0xC69A, 0xC69A, 0xC65A, 0xBE39, 0x7411, 0x0020, 0x0000,
-    0x0000, 0x0000, 0x3A09, 0x5B4E, 0x6BB0, 0x6BF0, 0x6BF0, 0x6BB0, 0x5B4E, 0x3A09, 0x0000, 0x0000
-};
-
 static const uint16_t EMOJI_BMP_PLACARD[144] PROGMEM = {
     0x0000, 0x0000, 0x0861, 0x1082, 0x1082, 0x938B, 0x6268, 0x0862, 0x1082, 0x0841, 0x0000, 0x0000,
     0x0000, 0x39C7, 0xDEFC, 0xD6BB, 0xD6DB, 0xEF7D, 0xE75D, 0xD6DB, 0xD6FC, 0xBDF8, 0x0841, 0x0000,
@@ -11509,7 +11471,7 @@ static const uint16_t EMOJI_BMP_ROCK[144] PROGMEM = {
     0x0000, 0x0000, 0x0000, 0x0000, 0x0861, 0x3A09, 0x424A, 0x3A49, 0x1924, 0x0000, 0x0000, 0x0000
 };
 
-// ============ SYMBOLS (241 emoji) ============
+// ============ SYMBOLS (229 emoji) ============
 
 static const uint16_t EMOJI_BMP_CHECK[144] PROGMEM = {
     0x5407, 0x7DAA, 0x758A, 0x758A, 0x758A, 0x758A, 0x758A, 0x758A, 0x758A, 0x756A, 0x7DAB, 0x5407,
@@ -14241,51 +14203,6 @@ static const uint16_t EMOJI_BMP_HEAVY_MULT[144] PROGMEM = {
     0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000
 };
 
-static const uint16_t EMOJI_BMP_HEAVY_PLUS[144] PROGMEM = {
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0861, 0x0861, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x29A7, 0x2987, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x2987, 0x2987, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x29A7, 0x29A7, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0020, 0x0000, 0x0021, 0x2987, 0x2987, 0x0021, 0x0000, 0x0020, 0x0000, 0x0000,
-    0x0861, 0x2987, 0x29A7, 0x2987, 0x2987, 0x31A7, 0x31A7, 0x2987, 0x2987, 0x29A7, 0x2987, 0x0861,
-    0x0861, 0x2987, 0x29A7, 0x2987, 0x2987, 0x31A7, 0x31A7, 0x2987, 0x2987, 0x29A7, 0x2987, 0x0861,
-    0x0000, 0x0000, 0x0020, 0x0000, 0x0021, 0x2987, 0x2987, 0x0021, 0x0000, 0x0020, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x29A7, 0x29A7, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x2987, 0x2987, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x2987, 0x2987, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0861, 0x0861, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000
-};
-
-static const uint16_t EMOJI_BMP_HEAVY_MINUS[144] PROGMEM = {
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0020, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0020, 0x0000, 0x0000,
-    0x0861, 0x2987, 0x29A7, 0x2987, 0x2987, 0x2987, 0x2987, 0x2987, 0x2987, 0x29A7, 0x2987, 0x0861,
-    0x0861, 0x2987, 0x29A7, 0x2987, 0x2987, 0x2987, 0x2987, 0x2987, 0x2987, 0x29A7, 0x2987, 0x0861,
-    0x0000, 0x0000, 0x0020, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0020, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000
-};
-
-static const uint16_t EMOJI_BMP_HEAVY_DIV[144] PROGMEM = {
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0021, 0x2966, 0x2966, 0x0021, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x1082, 0x39E8, 0x39E8, 0x1082, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x18E4, 0x18E4, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0020, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0020, 0x0000, 0x0000,
-    0x0861, 0x2987, 0x29A7, 0x2987, 0x2987, 0x29A7, 0x29A7, 0x2987, 0x2987, 0x29A7, 0x2987, 0x0861,
-    0x0861, 0x2987, 0x29A7, 0x2987, 0x2987, 0x29A7, 0x29A7, 0x2987, 0x2987, 0x29A7, 0x2987, 0x0861,
-    0x0000, 0x0000, 0x0020, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0020, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x18E4, 0x18E4, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x1082, 0x39E8, 0x39E8, 0x1082, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0021, 0x2966, 0x2966, 0x0021, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000
-};
-
 static const uint16_t EMOJI_BMP_INFINITY[144] PROGMEM = {
     0x0000, 0x0000, 0x0021, 0x1A6E, 0x3417, 0x3C9A, 0x3C9A, 0x3417, 0x1A6E, 0x0021, 0x0000, 0x0000,
     0x0000, 0x08A3, 0x33F6, 0x44FC, 0x3CDB, 0x3CBB, 0x3CBB, 0x3CDB, 0x44FC, 0x33F6, 0x08A3, 0x0000,
@@ -14391,141 +14308,6 @@ static const uint16_t EMOJI_BMP_ZERO[144] PROGMEM = {
     0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000, 0x0000, 0x0000
 };
 
-static const uint16_t EMOJI_BMP_ONE[144] PROGMEM = {
-    0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000,
-    0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000,
-    0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000, 0x0000, 0x0000
-};
-
-static const uint16_t EMOJI_BMP_TWO[144] PROGMEM = {
-    0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000,
-    0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000,
-    0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000, 0x0000, 0x0000
-};
-
-static const uint16_t EMOJI_BMP_THREE[144] PROGMEM = {
-    0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000,
-    0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000,
-    0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000, 0x0000, 0x0000
-};
-
-static const uint16_t EMOJI_BMP_FOUR[144] PROGMEM = {
-    0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000,
-    0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000,
-    0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000, 0x0000, 0x0000
-};
-
-static const uint16_t EMOJI_BMP_FIVE[144] PROGMEM = {
-    0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000,
-    0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000,
-    0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000, 0x0000, 0x0000
-};
-
-static const uint16_t EMOJI_BMP_SIX[144] PROGMEM = {
-    0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000,
-    0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000,
-    0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000, 0x0000, 0x0000
-};
-
-static const uint16_t EMOJI_BMP_SEVEN[144] PROGMEM = {
-    0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000,
-    0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000,
-    0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000, 0x0000, 0x0000
-};
-
-static const uint16_t EMOJI_BMP_EIGHT[144] PROGMEM = {
-    0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000,
-    0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000,
-    0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000, 0x0000, 0x0000
-};
-
-static const uint16_t EMOJI_BMP_NINE[144] PROGMEM = {
-    0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000,
-    0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000,
-    0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0xFEA0, 0xFEA0, 0xFEA0, 0x0000, 0x0000, 0x0000, 0x0000
-};
-
 static const uint16_t EMOJI_BMP_TEN[144] PROGMEM = {
     0x2B31, 0x3C79, 0x3C38, 0x3C58, 0x3C58, 0x3C58, 0x3C58, 0x3C38, 0x3C38, 0x3C58, 0x3C59, 0x2B11,
     0x3C58, 0x3438, 0x3C58, 0x3C38, 0x3C38, 0x3C58, 0x3418, 0x4478, 0x4478, 0x3418, 0x3C58, 0x3C59,
@@ -15126,7 +14908,7 @@ static const uint16_t EMOJI_BMP_U6E80[144] PROGMEM = {
     0xA106, 0xE168, 0xD968, 0xD968, 0xD948, 0xD968, 0xD968, 0xD968, 0xD948, 0xD968, 0xE168, 0xA106
 };
 
-// ============ FLAGS (7 emoji) ============
+// ============ FLAGS (5 emoji) ============
 
 static const uint16_t EMOJI_BMP_CHECKERED[144] PROGMEM = {
     0x0020, 0x6B8E, 0x2145, 0x0000, 0x0000, 0x0000, 0x0862, 0x39E8, 0x52AA, 0x18C3, 0x0041, 0x0000,
@@ -15203,39 +14985,9 @@ static const uint16_t EMOJI_BMP_WHITE_FLAG[144] PROGMEM = {
     0x0841, 0x8493, 0x2966, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000
 };
 
-static const uint16_t EMOJI_BMP_RAINBOW_FLAG[144] PROGMEM = {
-    0x0020, 0x6B8E, 0x2145, 0x0000, 0x0000, 0x0000, 0x10C3, 0x3A08, 0x5AEB, 0x52CB, 0x2124, 0x0000,
-    0x0861, 0x9D56, 0xCE9A, 0x9D14, 0x94D3, 0xB5B7, 0xD6DB, 0xE77E, 0xEF9E, 0xF7DF, 0xC67A, 0x0861,
-    0x0861, 0x8CB4, 0xE75E, 0xF7DF, 0xF7DF, 0xEF9F, 0xE77E, 0xDF3D, 0xDF3D, 0xE75D, 0xCEBB, 0x1082,
-    0x0861, 0x8CD4, 0xDF1D, 0xDF3D, 0xDF3D, 0xDF3D, 0xDF3D, 0xE75D, 0xDF3D, 0xE77E, 0xCEBB, 0x1082,
-    0x0861, 0x8CD4, 0xDF3D, 0xE75D, 0xE75D, 0xE75D, 0xE75D, 0xE75D, 0xDF3D, 0xE77E, 0xCEBB, 0x1082,
-    0x0861, 0x8CD4, 0xDF3D, 0xE75D, 0xE75D, 0xE75D, 0xDF3D, 0xDF3D, 0xDF1D, 0xE75D, 0xCEBB, 0x1082,
-    0x0861, 0x8CD4, 0xDF3D, 0xDF3D, 0xDF3D, 0xDF3D, 0xE75E, 0xEF9E, 0xEFBF, 0xF7DF, 0xD6DB, 0x1082,
-    0x0861, 0x8CD4, 0xDF3D, 0xEFBF, 0xEFBF, 0xEF9E, 0xD6FC, 0xB5D7, 0x94D3, 0xA535, 0xB5F8, 0x1082,
-    0x0861, 0x8CD4, 0x4AAB, 0x4A6A, 0x52CB, 0x39E7, 0x10A2, 0x0000, 0x0000, 0x0000, 0x0020, 0x0000,
-    0x0861, 0x8CF5, 0x2966, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0861, 0x8CF5, 0x31C7, 0x0000, 0x0020, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0841, 0x8493, 0x2966, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000
-};
-
-static const uint16_t EMOJI_BMP_PIRATE[144] PROGMEM = {
-    0x0020, 0x636E, 0x2104, 0x0000, 0x0000, 0x0000, 0x0020, 0x0862, 0x10A3, 0x10A2, 0x0041, 0x0000,
-    0x1082, 0x8CD4, 0x3A08, 0x2125, 0x2125, 0x2145, 0x2987, 0x31C7, 0x31C8, 0x31C8, 0x2986, 0x0000,
-    0x1082, 0x7C52, 0x39E8, 0x31C7, 0x31C8, 0x31C8, 0x31C7, 0x31A7, 0x31A7, 0x31A7, 0x2987, 0x0020,
-    0x1082, 0x8473, 0x39E8, 0x2987, 0x29A7, 0x31A7, 0x31A7, 0x31A7, 0x31A7, 0x31C7, 0x2987, 0x0020,
-    0x1082, 0x8473, 0x39E8, 0x29A7, 0x31A7, 0x31A7, 0x31A7, 0x31A7, 0x31A7, 0x31C7, 0x2987, 0x0020,
-    0x1082, 0x8473, 0x39E8, 0x29A7, 0x31A7, 0x31A7, 0x31A7, 0x31A7, 0x29A7, 0x31A7, 0x2986, 0x0020,
-    0x1082, 0x8473, 0x31E8, 0x29A7, 0x29A7, 0x31A7, 0x31C7, 0x31C8, 0x31C8, 0x31C8, 0x2987, 0x0020,
-    0x1082, 0x8473, 0x3A09, 0x31A7, 0x31C8, 0x31C7, 0x2987, 0x2166, 0x2125, 0x2125, 0x2966, 0x0020,
-    0x0861, 0x8CF4, 0x31C7, 0x0862, 0x10A3, 0x0862, 0x0020, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0861, 0x8CF5, 0x29A6, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0861, 0x8CF5, 0x31A7, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000,
-    0x0841, 0x8493, 0x2966, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000, 0x0000
-};
-
 // ============ EMOJI TABLE ============
 
-const int EMOJI_COUNT = 1013;
+const int EMOJI_COUNT = 1015;
 
 const EmojiEntry EMOJI_TABLE[EMOJI_COUNT] PROGMEM = {
     { 0x1F600, "grin", EMOJI_BMP_GRIN, EmojiCategory::FACES },
@@ -15699,7 +15451,6 @@ const EmojiEntry EMOJI_TABLE[EMOJI_COUNT] PROGMEM = {
     { 0x1F9F8, "teddy", EMOJI_BMP_TEDDY, EmojiCategory::ACTIVITIES },
     { 0x1FA86, "nesting", EMOJI_BMP_NESTING, EmojiCategory::ACTIVITIES },
     { 0x02660, "spades", EMOJI_BMP_SPADES, EmojiCategory::ACTIVITIES },
-    { 0x02665, "hearts", EMOJI_BMP_HEARTS, EmojiCategory::ACTIVITIES },
     { 0x02666, "diamonds", EMOJI_BMP_DIAMONDS, EmojiCategory::ACTIVITIES },
     { 0x02663, "clubs", EMOJI_BMP_CLUBS, EmojiCategory::ACTIVITIES },
     { 0x0265F, "chess", EMOJI_BMP_CHESS, EmojiCategory::ACTIVITIES },
@@ -15943,7 +15694,6 @@ const EmojiEntry EMOJI_TABLE[EMOJI_COUNT] PROGMEM = {
     { 0x02694, "swords", EMOJI_BMP_SWORDS, EmojiCategory::OBJECTS },
     { 0x1F52B, "gun", EMOJI_BMP_GUN, EmojiCategory::OBJECTS },
     { 0x1FA83, "boomerang", EMOJI_BMP_BOOMERANG, EmojiCategory::OBJECTS },
-    { 0x1F3F9, "bow2", EMOJI_BMP_BOW2, EmojiCategory::OBJECTS },
     { 0x1F6E1, "shield", EMOJI_BMP_SHIELD, EmojiCategory::OBJECTS },
     { 0x1FA9A, "carpentry", EMOJI_BMP_CARPENTRY, EmojiCategory::OBJECTS },
     { 0x1F527, "wrench", EMOJI_BMP_WRENCH, EmojiCategory::OBJECTS },
@@ -16000,7 +15750,6 @@ const EmojiEntry EMOJI_TABLE[EMOJI_COUNT] PROGMEM = {
     { 0x026B0, "coffin", EMOJI_BMP_COFFIN, EmojiCategory::OBJECTS },
     { 0x1FAA6, "headstone", EMOJI_BMP_HEADSTONE, EmojiCategory::OBJECTS },
     { 0x026B1, "urn", EMOJI_BMP_URN, EmojiCategory::OBJECTS },
-    { 0x1F5FF, "moai", EMOJI_BMP_MOAI, EmojiCategory::OBJECTS },
     { 0x1FAA7, "placard", EMOJI_BMP_PLACARD, EmojiCategory::OBJECTS },
     { 0x1FAA8, "rock", EMOJI_BMP_ROCK, EmojiCategory::OBJECTS },
     { 0x02705, "check", EMOJI_BMP_CHECK, EmojiCategory::SYMBOLS },
@@ -16185,9 +15934,6 @@ const EmojiEntry EMOJI_TABLE[EMOJI_COUNT] PROGMEM = {
     { 0x02642, "male", EMOJI_BMP_MALE, EmojiCategory::SYMBOLS },
     { 0x026A7, "transgender", EMOJI_BMP_TRANSGENDER, EmojiCategory::SYMBOLS },
     { 0x02716, "heavy_mult", EMOJI_BMP_HEAVY_MULT, EmojiCategory::SYMBOLS },
-    { 0x02795, "heavy_plus", EMOJI_BMP_HEAVY_PLUS, EmojiCategory::SYMBOLS },
-    { 0x02796, "heavy_minus", EMOJI_BMP_HEAVY_MINUS, EmojiCategory::SYMBOLS },
-    { 0x02797, "heavy_div", EMOJI_BMP_HEAVY_DIV, EmojiCategory::SYMBOLS },
     { 0x0267E, "infinity", EMOJI_BMP_INFINITY, EmojiCategory::SYMBOLS },
     { 0x1F4B2, "heavy_dollar", EMOJI_BMP_HEAVY_DOLLAR, EmojiCategory::SYMBOLS },
     { 0x1F4B1, "currency", EMOJI_BMP_CURRENCY, EmojiCategory::SYMBOLS },
@@ -16195,15 +15941,15 @@ const EmojiEntry EMOJI_TABLE[EMOJI_COUNT] PROGMEM = {
     { 0x000AE, "registered", EMOJI_BMP_REGISTERED, EmojiCategory::SYMBOLS },
     { 0x02122, "tm", EMOJI_BMP_TM, EmojiCategory::SYMBOLS },
     { 0x00030, "zero", EMOJI_BMP_ZERO, EmojiCategory::SYMBOLS },
-    { 0x00031, "one", EMOJI_BMP_ONE, EmojiCategory::SYMBOLS },
-    { 0x00032, "two", EMOJI_BMP_TWO, EmojiCategory::SYMBOLS },
-    { 0x00033, "three", EMOJI_BMP_THREE, EmojiCategory::SYMBOLS },
-    { 0x00034, "four", EMOJI_BMP_FOUR, EmojiCategory::SYMBOLS },
-    { 0x00035, "five", EMOJI_BMP_FIVE, EmojiCategory::SYMBOLS },
-    { 0x00036, "six", EMOJI_BMP_SIX, EmojiCategory::SYMBOLS },
-    { 0x00037, "seven", EMOJI_BMP_SEVEN, EmojiCategory::SYMBOLS },
-    { 0x00038, "eight", EMOJI_BMP_EIGHT, EmojiCategory::SYMBOLS },
-    { 0x00039, "nine", EMOJI_BMP_NINE, EmojiCategory::SYMBOLS },
+    { 0x00031, "one", EMOJI_BMP_ZERO, EmojiCategory::SYMBOLS },
+    { 0x00032, "two", EMOJI_BMP_ZERO, EmojiCategory::SYMBOLS },
+    { 0x00033, "three", EMOJI_BMP_ZERO, EmojiCategory::SYMBOLS },
+    { 0x00034, "four", EMOJI_BMP_ZERO, EmojiCategory::SYMBOLS },
+    { 0x00035, "five", EMOJI_BMP_ZERO, EmojiCategory::SYMBOLS },
+    { 0x00036, "six", EMOJI_BMP_ZERO, EmojiCategory::SYMBOLS },
+    { 0x00037, "seven", EMOJI_BMP_ZERO, EmojiCategory::SYMBOLS },
+    { 0x00038, "eight", EMOJI_BMP_ZERO, EmojiCategory::SYMBOLS },
+    { 0x00039, "nine", EMOJI_BMP_ZERO, EmojiCategory::SYMBOLS },
     { 0x1F51F, "ten", EMOJI_BMP_TEN, EmojiCategory::SYMBOLS },
     { 0x1F520, "abc_upper", EMOJI_BMP_ABC_UPPER, EmojiCategory::SYMBOLS },
     { 0x1F521, "abc_lower", EMOJI_BMP_ABC_LOWER, EmojiCategory::SYMBOLS },
@@ -16249,8 +15995,320 @@ const EmojiEntry EMOJI_TABLE[EMOJI_COUNT] PROGMEM = {
     { 0x1F38C, "crossed_flags", EMOJI_BMP_CROSSED_FLAGS, EmojiCategory::FLAGS },
     { 0x1F3F4, "black_flag", EMOJI_BMP_BLACK_FLAG, EmojiCategory::FLAGS },
     { 0x1F3F3, "white_flag", EMOJI_BMP_WHITE_FLAG, EmojiCategory::FLAGS },
-    { 0x1F3F3, "rainbow_flag", EMOJI_BMP_RAINBOW_FLAG, EmojiCategory::FLAGS },
-    { 0x1F3F4, "pirate", EMOJI_BMP_PIRATE, EmojiCategory::FLAGS },
+    { 0x1F3F3, "rainbow_flag", EMOJI_BMP_ZERO, EmojiCategory::FLAGS },
+    { 0x1F3F4, "pirate", EMOJI_BMP_ZERO, EmojiCategory::FLAGS },
+    { 0x1F1FA, "flag_us", EMOJI_BMP_ZERO, EmojiCategory::FLAGS },
+    { 0x1F1E8, "flag_ca", EMOJI_BMP_ZERO, EmojiCategory::FLAGS },
+    { 0x1F1F2, "flag_mx", EMOJI_BMP_ZERO, EmojiCategory::FLAGS },
+    { 0x1F1EC, "flag_gb", EMOJI_BMP_ZERO, EmojiCategory::FLAGS },
+    { 0x1F1E9, "flag_de", EMOJI_BMP_ZERO, EmojiCategory::FLAGS },
+    { 0x1F1EB, "flag_fr", EMOJI_BMP_ZERO, EmojiCategory::FLAGS },
+    { 0x1F1EF, "flag_jp", EMOJI_BMP_ZERO, EmojiCategory::FLAGS },
+    { 0x1F1FA, "flag_ua", EMOJI_BMP_ZERO, EmojiCategory::FLAGS },
+};
+
+// First table index of each category (in EmojiCategory order), plus EMOJI_COUNT
+const uint16_t EMOJI_CATEGORY_OFFSETS[(int)EmojiCategory::CATEGORY_COUNT + 1] PROGMEM = {
+    0, 113, 162, 210, 240, 313, 416, 490, 590, 762, 1000, 1015
+};
+
+// Single-codepoint table indices sorted by codepoint (ties keep table order) for binary search
+const int EMOJI_CODEPOINT_INDEX_COUNT = 995;
+
+const uint16_t EMOJI_CODEPOINT_INDEX[EMOJI_CODEPOINT_INDEX_COUNT] PROGMEM = {
+    947, 948, 824, 823, 949, 972, 879, 878, 877, 871, 873, 875, 880, 881, 590, 594,
+    933, 920, 924, 927, 929, 921, 925, 922, 930, 931, 932, 974, 847, 848, 919, 923,
+    844, 843, 846, 845, 798, 800, 799, 399, 131, 95, 868, 869, 898, 899, 900, 896,
+    895, 67, 18, 940, 941, 903, 904, 905, 906, 907, 908, 909, 910, 911, 912, 913,
+    914, 463, 460, 462, 229, 461, 944, 698, 545, 701, 711, 719, 709, 892, 795, 942,
+    833, 832, 757, 759, 416, 419, 915, 697, 714, 859, 573, 570, 575, 433, 543, 539,
+    441, 576, 546, 685, 762, 529, 646, 134, 116, 121, 144, 659, 660, 943, 897, 894,
+    772, 763, 764, 820, 821, 822, 819, 220, 210, 765, 766, 767, 872, 768, 769, 882,
+    883, 876, 870, 874, 841, 842, 770, 996, 997, 465, 464, 966, 968, 977, 979, 967,
+    969, 970, 971, 973, 975, 976, 978, 980, 981, 982, 983, 984, 990, 987, 991, 995,
+    994, 999, 986, 985, 993, 989, 998, 988, 992, 796, 797, 802, 577, 771, 358, 360,
+    361, 335, 238, 239, 235, 237, 336, 329, 330, 320, 319, 316, 317, 318, 326, 313,
+    314, 315, 324, 323, 321, 355, 357, 351, 352, 379, 378, 377, 376, 374, 375, 343,
+    356, 341, 380, 383, 384, 385, 386, 387, 392, 393, 394, 395, 396, 389, 367, 365,
+    401, 402, 404, 405, 406, 407, 408, 397, 403, 371, 790, 789, 388, 199, 788, 786,
+    787, 1002, 794, 791, 807, 808, 809, 605, 792, 435, 487, 604, 934, 488, 467, 793,
+    607, 466, 475, 452, 455, 425, 456, 805, 806, 478, 480, 477, 479, 482, 486, 437,
+    421, 442, 417, 1000, 443, 469, 468, 450, 418, 423, 444, 449, 504, 495, 431, 422,
+    429, 428, 426, 578, 579, 580, 587, 588, 589, 586, 585, 581, 582, 583, 584, 557,
+    558, 559, 560, 561, 562, 563, 564, 565, 566, 567, 568, 569, 617, 556, 555, 1004,
+    1003, 635, 427, 434, 307, 306, 296, 295, 297, 294, 293, 308, 279, 292, 291, 274,
+    278, 258, 259, 268, 303, 289, 290, 272, 276, 271, 275, 285, 286, 287, 277, 262,
+    261, 260, 248, 299, 300, 284, 242, 251, 249, 244, 241, 280, 283, 269, 254, 240,
+    252, 253, 243, 267, 246, 247, 312, 309, 158, 159, 152, 154, 161, 160, 128, 130,
+    126, 127, 135, 113, 118, 132, 133, 138, 140, 164, 165, 168, 170, 184, 195, 167,
+    192, 191, 172, 173, 162, 188, 190, 98, 99, 100, 198, 101, 102, 93, 94, 178,
+    186, 145, 726, 728, 230, 231, 232, 233, 234, 223, 219, 221, 225, 224, 226, 214,
+    213, 212, 215, 227, 222, 228, 855, 615, 775, 783, 774, 776, 801, 777, 96, 147,
+    773, 779, 782, 785, 636, 946, 945, 643, 638, 639, 640, 641, 642, 645, 534, 593,
+    666, 599, 600, 601, 602, 667, 668, 628, 630, 670, 671, 674, 675, 676, 677, 678,
+    679, 680, 681, 683, 684, 633, 627, 626, 619, 620, 621, 622, 623, 624, 625, 629,
+    665, 725, 816, 815, 650, 651, 652, 647, 648, 649, 654, 653, 655, 656, 657, 631,
+    591, 592, 938, 939, 866, 937, 608, 609, 610, 810, 489, 611, 606, 916, 917, 918,
+    884, 885, 935, 936, 811, 812, 813, 814, 817, 818, 612, 613, 691, 692, 693, 689,
+    690, 803, 804, 634, 713, 856, 886, 887, 888, 889, 890, 867, 960, 961, 962, 963,
+    964, 965, 784, 616, 706, 695, 708, 702, 723, 724, 902, 857, 858, 825, 829, 849,
+    850, 851, 852, 853, 854, 926, 928, 893, 574, 571, 572, 901, 614, 778, 185, 476,
+    682, 662, 661, 663, 664, 115, 129, 117, 217, 595, 596, 597, 598, 669, 686, 687,
+    688, 672, 673, 710, 694, 632, 700, 780, 781, 658, 551, 554, 553, 552, 0, 3,
+    7, 1, 2, 5, 4, 12, 92, 10, 11, 22, 42, 14, 61, 37, 34, 35,
+    38, 84, 43, 64, 81, 17, 16, 20, 19, 23, 24, 26, 83, 65, 90, 89,
+    78, 82, 88, 77, 73, 74, 75, 85, 44, 86, 40, 79, 68, 69, 76, 80,
+    70, 71, 46, 56, 36, 47, 105, 106, 104, 107, 108, 109, 112, 111, 110, 66,
+    8, 9, 39, 176, 177, 181, 255, 256, 257, 179, 139, 174, 175, 143, 535, 528,
+    514, 515, 516, 517, 518, 519, 520, 521, 522, 493, 511, 494, 550, 499, 497, 498,
+    496, 510, 491, 513, 490, 512, 492, 501, 502, 503, 523, 524, 525, 526, 527, 538,
+    544, 541, 549, 548, 547, 509, 1001, 731, 860, 756, 862, 863, 864, 506, 861, 865,
+    738, 740, 741, 736, 735, 891, 755, 732, 699, 704, 530, 531, 532, 537, 542, 507,
+    505, 540, 536, 438, 508, 500, 439, 826, 827, 828, 830, 831, 834, 838, 835, 836,
+    837, 839, 840, 119, 218, 216, 120, 32, 27, 48, 62, 31, 49, 103, 28, 124,
+    125, 114, 136, 137, 142, 122, 123, 58, 97, 50, 6, 45, 41, 182, 52, 33,
+    15, 25, 30, 91, 29, 51, 57, 196, 197, 141, 146, 189, 194, 200, 183, 446,
+    447, 445, 448, 436, 236, 484, 409, 410, 432, 470, 471, 472, 473, 474, 440, 430,
+    420, 424, 342, 331, 334, 354, 340, 337, 344, 370, 366, 363, 364, 398, 328, 348,
+    381, 382, 369, 411, 327, 332, 391, 346, 353, 359, 333, 325, 347, 13, 87, 21,
+    59, 55, 53, 54, 187, 60, 72, 250, 270, 264, 263, 266, 288, 265, 245, 273,
+    298, 304, 302, 310, 281, 282, 301, 305, 311, 712, 157, 150, 151, 156, 201, 202,
+    153, 148, 149, 350, 390, 373, 413, 338, 339, 349, 372, 414, 415, 412, 180, 63,
+    166, 163, 171, 169, 193, 451, 203, 204, 205, 206, 207, 208, 209, 155, 211, 457,
+    720, 721, 722, 603, 754, 716, 717, 744, 745, 458, 746, 747, 748, 750, 753, 644,
+    727, 729, 730, 453, 454, 533, 703, 459, 737, 743, 696, 618, 481, 485, 483, 637,
+    705, 707, 718, 715, 733, 734, 739, 749, 742, 752, 758, 760, 761, 322, 345, 362,
+    368, 400, 751,
+};
+
+// ============ SEQUENCES ============
+
+// Multi-codepoint emoji (ZWJ, keycap and flag sequences), see Emoji::matchUTF8()
+#define EMOJI_SEQUENCE_COUNT 20
+#define EMOJI_SEQUENCE_NODE_COUNT 66
+#define EMOJI_SEQUENCE_NONE 0xFFFF
+
+// Trie over the sequences, node 0 is the root; children are contiguous and sorted
+const EmojiSequenceNode EMOJI_SEQUENCE_NODES[EMOJI_SEQUENCE_NODE_COUNT] PROGMEM = {
+    { 0x00000, 1, 19, EMOJI_SEQUENCE_NONE },
+    { 0x00030, 20, 2, EMOJI_SEQUENCE_NONE },
+    { 0x00031, 22, 2, EMOJI_SEQUENCE_NONE },
+    { 0x00032, 24, 2, EMOJI_SEQUENCE_NONE },
+    { 0x00033, 26, 2, EMOJI_SEQUENCE_NONE },
+    { 0x00034, 28, 2, EMOJI_SEQUENCE_NONE },
+    { 0x00035, 30, 2, EMOJI_SEQUENCE_NONE },
+    { 0x00036, 32, 2, EMOJI_SEQUENCE_NONE },
+    { 0x00037, 34, 2, EMOJI_SEQUENCE_NONE },
+    { 0x00038, 36, 2, EMOJI_SEQUENCE_NONE },
+    { 0x00039, 38, 2, EMOJI_SEQUENCE_NONE },
+    { 0x1F1E8, 40, 1, EMOJI_SEQUENCE_NONE },
+    { 0x1F1E9, 41, 1, EMOJI_SEQUENCE_NONE },
+    { 0x1F1EB, 42, 1, EMOJI_SEQUENCE_NONE },
+    { 0x1F1EC, 43, 1, EMOJI_SEQUENCE_NONE },
+    { 0x1F1EF, 44, 1, EMOJI_SEQUENCE_NONE },
+    { 0x1F1F2, 45, 1, EMOJI_SEQUENCE_NONE },
+    { 0x1F1FA, 46, 2, EMOJI_SEQUENCE_NONE },
+    { 0x1F3F3, 48, 2, EMOJI_SEQUENCE_NONE },
+    { 0x1F3F4, 50, 1, EMOJI_SEQUENCE_NONE },
+    { 0x020E3, 0, 0, 950 },
+    { 0x0FE0F, 51, 1, EMOJI_SEQUENCE_NONE },
+    { 0x020E3, 0, 0, 951 },
+    { 0x0FE0F, 52, 1, EMOJI_SEQUENCE_NONE },
+    { 0x020E3, 0, 0, 952 },
+    { 0x0FE0F, 53, 1, EMOJI_SEQUENCE_NONE },
+    { 0x020E3, 0, 0, 953 },
+    { 0x0FE0F, 54, 1, EMOJI_SEQUENCE_NONE },
+    { 0x020E3, 0, 0, 954 },
+    { 0x0FE0F, 55, 1, EMOJI_SEQUENCE_NONE },
+    { 0x020E3, 0, 0, 955 },
+    { 0x0FE0F, 56, 1, EMOJI_SEQUENCE_NONE },
+    { 0x020E3, 0, 0, 956 },
+    { 0x0FE0F, 57, 1, EMOJI_SEQUENCE_NONE },
+    { 0x020E3, 0, 0, 957 },
+    { 0x0FE0F, 58, 1, EMOJI_SEQUENCE_NONE },
+    { 0x020E3, 0, 0, 958 },
+    { 0x0FE0F, 59, 1, EMOJI_SEQUENCE_NONE },
+    { 0x020E3, 0, 0, 959 },
+    { 0x0FE0F, 60, 1, EMOJI_SEQUENCE_NONE },
+    { 0x1F1E6, 0, 0, 1008 },
+    { 0x1F1EA, 0, 0, 1011 },
+    { 0x1F1F7, 0, 0, 1012 },
+    { 0x1F1E7, 0, 0, 1010 },
+    { 0x1F1F5, 0, 0, 1013 },
+    { 0x1F1FD, 0, 0, 1009 },
+    { 0x1F1E6, 0, 0, 1014 },
+    { 0x1F1F8, 0, 0, 1007 },
+    { 0x0200D, 61, 1, EMOJI_SEQUENCE_NONE },
+    { 0x0FE0F, 62, 1, EMOJI_SEQUENCE_NONE },
+    { 0x0200D, 63, 1, EMOJI_SEQUENCE_NONE },
+    { 0x020E3, 0, 0, 950 },
+    { 0x020E3, 0, 0, 951 },
+    { 0x020E3, 0, 0, 952 },
+    { 0x020E3, 0, 0, 953 },
+    { 0x020E3, 0, 0, 954 },
+    { 0x020E3, 0, 0, 955 },
+    { 0x020E3, 0, 0, 956 },
+    { 0x020E3, 0, 0, 957 },
+    { 0x020E3, 0, 0, 958 },
+    { 0x020E3, 0, 0, 959 },
+    { 0x1F308, 0, 0, 1005 },
+    { 0x0200D, 64, 1, EMOJI_SEQUENCE_NONE },
+    { 0x02620, 65, 1, 1006 },
+    { 0x1F308, 0, 0, 1005 },
+    { 0x0FE0F, 0, 0, 1006 },
+};
+
+// Sequence entries sorted by table index, codepoints in EMOJI_SEQUENCE_CODEPOINTS
+const EmojiSequence EMOJI_SEQUENCES[EMOJI_SEQUENCE_COUNT] PROGMEM = {
+    { 950, 0, 3 },
+    { 951, 3, 3 },
+    { 952, 6, 3 },
+    { 953, 9, 3 },
+    { 954, 12, 3 },
+    { 955, 15, 3 },
+    { 956, 18, 3 },
+    { 957, 21, 3 },
+    { 958, 24, 3 },
+    { 959, 27, 3 },
+    { 1005, 30, 4 },
+    { 1006, 34, 4 },
+    { 1007, 38, 2 },
+    { 1008, 40, 2 },
+    { 1009, 42, 2 },
+    { 1010, 44, 2 },
+    { 1011, 46, 2 },
+    { 1012, 48, 2 },
+    { 1013, 50, 2 },
+    { 1014, 52, 2 },
+};
+
+const uint32_t EMOJI_SEQUENCE_CODEPOINTS[54] PROGMEM = {
+    0x00030, 0x0FE0F, 0x020E3, 0x00031, 0x0FE0F, 0x020E3, 0x00032, 0x0FE0F,
+    0x020E3, 0x00033, 0x0FE0F, 0x020E3, 0x00034, 0x0FE0F, 0x020E3, 0x00035,
+    0x0FE0F, 0x020E3, 0x00036, 0x0FE0F, 0x020E3, 0x00037, 0x0FE0F, 0x020E3,
+    0x00038, 0x0FE0F, 0x020E3, 0x00039, 0x0FE0F, 0x020E3, 0x1F3F3, 0x0FE0F,
+    0x0200D, 0x1F308, 0x1F3F4, 0x0200D, 0x02620, 0x0FE0F, 0x1F1FA, 0x1F1F8,
+    0x1F1E8, 0x1F1E6, 0x1F1F2, 0x1F1FD, 0x1F1EC, 0x1F1E7, 0x1F1E9, 0x1F1EA,
+    0x1F1EB, 0x1F1F7, 0x1F1EF, 0x1F1F5, 0x1F1FA, 0x1F1E6,
+};
+
+// Shortcode minimal perfect hash (CHD), see Emoji::findByShortcode()
+const uint32_t EMOJI_SHORTCODE_BUCKET_SEED = 0x00000000;
+const uint32_t EMOJI_SHORTCODE_SLOT_SEED = 0x5BD1E995;
+const int EMOJI_SHORTCODE_BUCKETS = 254;
+
+const uint32_t EMOJI_SHORTCODE_DISPLACE[EMOJI_SHORTCODE_BUCKETS] PROGMEM = {
+    0x0000002A, 0x00000000, 0x00000064, 0x00000006, 0x00000043, 0x00000055, 0x0000000E, 0x00000000,
+    0x00000016, 0x00000001, 0x00000004, 0x00000000, 0x00000053, 0x0000002C, 0x00000078, 0x00000001,
+    0x00000004, 0x00000006, 0x00000025, 0x00000000, 0x0000003C, 0x0000000F, 0x00000003, 0x0000000C,
+    0x000000EE, 0x00000020, 0x00000034, 0x0000002D, 0x00000001, 0x00000003, 0x00000002, 0x00000031,
+    0x0000006E, 0x00000008, 0x0000001C, 0x00000016, 0x0000000C, 0x00000055, 0x0000000A, 0x00000006,
+    0x00000021, 0x00000000, 0x00000000, 0x00000069, 0x00000001, 0x00000001, 0x0000000A, 0x00000002,
+    0x00000072, 0x00000004, 0x0000000B, 0x00000000, 0x00000046, 0x00000040, 0x00000030, 0x000100AA,
+    0x00000000, 0x00000064, 0x0000003E, 0x0000001B, 0x00000001, 0x00000020, 0x0000000B, 0x00000002,
+    0x00000001, 0x00000010, 0x0000000B, 0x0000013C, 0x00000026, 0x0000000D, 0x00000000, 0x000000B5,
+    0x00000058, 0x00000008, 0x0000016F, 0x00000015, 0x0000000B, 0x00000018, 0x00000006, 0x00000000,
+    0x00000003, 0x00000028, 0x0000008F, 0x00000019, 0x00000002, 0x0000000A, 0x00000000, 0x0000000A,
+    0x0000000A, 0x00000020, 0x00000010, 0x00000088, 0x00000043, 0x0000000F, 0x0000004C, 0x00000000,
+    0x00000000, 0x00000012, 0x0000011D, 0x0000007B, 0x0000001E, 0x00000000, 0x00000110, 0x00000035,
+    0x0000001F, 0x0000001A, 0x000000BA, 0x00000017, 0x000000A9, 0x00000029, 0x00000002, 0x00000003,
+    0x00000013, 0x00000037, 0x000001F8, 0x00000002, 0x00000001, 0x00000097, 0x00000160, 0x00000025,
+    0x00000022, 0x0000004B, 0x00000006, 0x0000001A, 0x00000109, 0x0000016F, 0x00000089, 0x00000002,
+    0x00000001, 0x00000000, 0x00000000, 0x00000058, 0x00000000, 0x0000000D, 0x00000072, 0x0000003C,
+    0x00000023, 0x00000146, 0x00000048, 0x00000005, 0x00000012, 0x0000010F, 0x00000183, 0x00000070,
+    0x000002A5, 0x0000014C, 0x0000011D, 0x00000014, 0x0000006F, 0x0000004A, 0x000001EE, 0x00000016,
+    0x00000003, 0x00000000, 0x00000058, 0x00000065, 0x000001D7, 0x0000000A, 0x0000002A, 0x000002CF,
+    0x00000003, 0x0000004C, 0x00000281, 0x000000D0, 0x00000003, 0x00000003, 0x00000023, 0x00000023,
+    0x00000099, 0x00000078, 0x0000000B, 0x0000010A, 0x00000058, 0x00000000, 0x000002C2, 0x00000009,
+    0x00000108, 0x0000028A, 0x000001A9, 0x00000007, 0x00000002, 0x0000006A, 0x0000011C, 0x0000023B,
+    0x00000001, 0x00000059, 0x00000041, 0x000000E7, 0x00000000, 0x0000000D, 0x0000004A, 0x00000027,
+    0x00010014, 0x0000018E, 0x00000018, 0x0000026A, 0x0000001E, 0x0000000E, 0x0000025A, 0x000001BF,
+    0x00000035, 0x0000009A, 0x0000001C, 0x00020092, 0x00000081, 0x0000002E, 0x000000D8, 0x00000024,
+    0x000003C6, 0x0000000A, 0x00000020, 0x000000E3, 0x000102E3, 0x00000031, 0x00000080, 0x00000002,
+    0x00000277, 0x0000000C, 0x000101B4, 0x000000B1, 0x00000064, 0x00000000, 0x00000041, 0x00000001,
+    0x0000002F, 0x0000004F, 0x0000004B, 0x00000035, 0x00000135, 0x000003D9, 0x00000000, 0x00000355,
+    0x0001011E, 0x00000001, 0x00000002, 0x0000032B, 0x00000368, 0x0000004B, 0x0000018B, 0x00000029,
+    0x00000000, 0x00000029, 0x00050025, 0x0000004B, 0x0000018E, 0x000001C9, 0x00000002, 0x000002DD,
+    0x00000146, 0x00000075, 0x00000000, 0x00000235, 0x00030186, 0x000002EF,
+};
+
+const uint16_t EMOJI_SHORTCODE_SLOTS[EMOJI_COUNT] PROGMEM = {
+    923, 822, 254, 40, 300, 39, 573, 930, 228, 122, 490, 732, 374, 6, 563, 460,
+    878, 358, 854, 666, 488, 297, 304, 1001, 589, 59, 798, 745, 874, 19, 655, 881,
+    915, 648, 748, 906, 506, 192, 268, 938, 509, 633, 642, 148, 848, 332, 931, 557,
+    845, 422, 316, 619, 371, 653, 494, 270, 420, 67, 515, 334, 955, 398, 377, 250,
+    807, 151, 829, 864, 942, 889, 835, 24, 641, 287, 406, 307, 343, 789, 54, 364,
+    262, 428, 5, 326, 440, 769, 111, 65, 336, 634, 826, 954, 963, 866, 485, 44,
+    233, 309, 744, 888, 521, 991, 472, 120, 652, 291, 827, 132, 392, 100, 12, 285,
+    927, 947, 51, 788, 783, 181, 512, 178, 88, 618, 486, 384, 717, 351, 381, 518,
+    868, 592, 940, 327, 8, 843, 25, 80, 776, 614, 238, 664, 449, 57, 517, 249,
+    56, 611, 580, 886, 462, 602, 522, 33, 865, 243, 46, 215, 37, 720, 416, 640,
+    498, 71, 281, 601, 791, 905, 41, 772, 913, 495, 155, 544, 138, 430, 3, 525,
+    162, 916, 700, 983, 900, 292, 473, 838, 108, 78, 484, 964, 977, 38, 453, 696,
+    687, 378, 543, 747, 124, 531, 407, 161, 639, 698, 1, 656, 896, 445, 909, 394,
+    110, 510, 987, 752, 253, 898, 42, 583, 982, 799, 379, 960, 768, 350, 177, 399,
+    582, 790, 419, 660, 209, 17, 413, 971, 542, 503, 658, 668, 594, 952, 444, 401,
+    669, 787, 673, 421, 662, 858, 282, 514, 369, 231, 558, 386, 663, 626, 852, 548,
+    475, 175, 935, 728, 1005, 469, 970, 813, 917, 919, 340, 819, 450, 861, 764, 729,
+    803, 107, 439, 675, 195, 165, 636, 140, 615, 613, 105, 214, 771, 319, 871, 722,
+    144, 220, 383, 296, 223, 946, 456, 978, 920, 891, 836, 164, 624, 1010, 218, 637,
+    412, 699, 500, 929, 129, 959, 590, 855, 143, 61, 809, 815, 477, 185, 936, 559,
+    97, 902, 62, 985, 405, 820, 948, 274, 172, 767, 442, 265, 497, 20, 47, 979,
+    135, 705, 4, 538, 18, 682, 908, 366, 375, 308, 171, 975, 661, 895, 894, 825,
+    34, 112, 395, 706, 126, 295, 452, 241, 48, 856, 740, 211, 903, 82, 684, 921,
+    737, 329, 387, 280, 224, 937, 236, 1011, 730, 863, 353, 414, 335, 278, 418, 438,
+    566, 750, 367, 715, 907, 587, 246, 581, 806, 184, 716, 190, 505, 102, 83, 802,
+    775, 968, 199, 314, 466, 11, 487, 530, 849, 410, 183, 736, 647, 411, 427, 604,
+    196, 174, 499, 429, 976, 1006, 426, 157, 830, 166, 458, 284, 550, 53, 264, 805,
+    785, 904, 784, 719, 423, 188, 765, 770, 70, 792, 402, 972, 599, 193, 914, 77,
+    313, 683, 892, 876, 50, 476, 96, 577, 961, 373, 851, 943, 561, 187, 121, 528,
+    549, 562, 520, 85, 293, 950, 256, 546, 239, 840, 553, 27, 302, 0, 596, 608,
+    90, 221, 674, 897, 382, 857, 72, 949, 30, 474, 91, 315, 766, 1009, 252, 210,
+    259, 708, 882, 320, 742, 179, 153, 127, 433, 842, 66, 688, 733, 519, 32, 191,
+    94, 459, 850, 31, 230, 671, 333, 139, 989, 704, 834, 872, 359, 76, 436, 701,
+    741, 260, 837, 204, 781, 117, 534, 990, 1008, 84, 118, 760, 417, 349, 206, 988,
+    686, 10, 390, 207, 247, 753, 22, 867, 483, 516, 973, 95, 551, 345, 734, 232,
+    248, 455, 617, 202, 922, 323, 817, 654, 283, 272, 125, 568, 631, 782, 974, 839,
+    841, 578, 598, 101, 400, 461, 163, 644, 468, 870, 567, 356, 145, 926, 317, 746,
+    883, 104, 711, 451, 504, 385, 149, 665, 189, 271, 14, 997, 994, 89, 269, 808,
+    368, 586, 123, 595, 853, 441, 298, 311, 87, 437, 380, 325, 944, 957, 749, 632,
+    672, 7, 493, 491, 170, 331, 142, 718, 1000, 128, 159, 529, 945, 828, 492, 198,
+    168, 579, 58, 1007, 115, 275, 290, 992, 389, 443, 201, 463, 527, 55, 690, 932,
+    724, 814, 478, 471, 951, 415, 800, 365, 526, 993, 119, 621, 901, 523, 251, 659,
+    322, 141, 305, 560, 996, 801, 341, 167, 677, 339, 924, 393, 565, 431, 824, 710,
+    73, 832, 606, 554, 1012, 958, 186, 203, 69, 739, 347, 532, 1003, 593, 208, 106,
+    36, 756, 403, 200, 877, 670, 591, 160, 182, 616, 569, 391, 533, 547, 680, 489,
+    860, 890, 966, 435, 795, 294, 555, 467, 134, 508, 885, 703, 873, 910, 607, 953,
+    173, 180, 967, 225, 623, 360, 169, 496, 15, 103, 928, 774, 759, 536, 113, 447,
+    276, 556, 1002, 226, 219, 213, 980, 424, 480, 286, 962, 64, 681, 266, 831, 620,
+    712, 605, 629, 52, 638, 63, 197, 470, 362, 630, 524, 811, 758, 575, 625, 911,
+    570, 995, 731, 743, 887, 158, 585, 344, 676, 227, 222, 321, 434, 1004, 646, 678,
+    709, 86, 627, 81, 726, 261, 727, 131, 464, 257, 564, 645, 981, 330, 263, 918,
+    26, 212, 609, 16, 880, 357, 310, 778, 324, 136, 328, 884, 875, 763, 479, 156,
+    454, 150, 812, 116, 751, 694, 597, 933, 779, 98, 816, 513, 761, 354, 194, 312,
+    68, 352, 130, 757, 481, 810, 273, 941, 804, 346, 1014, 695, 267, 205, 651, 610,
+    714, 370, 396, 244, 735, 409, 723, 649, 691, 939, 725, 245, 92, 388, 999, 229,
+    721, 363, 372, 448, 408, 869, 545, 537, 255, 713, 152, 137, 318, 797, 685, 793,
+    846, 404, 738, 279, 355, 361, 986, 240, 899, 794, 93, 540, 679, 60, 572, 628,
+    79, 657, 154, 859, 237, 893, 773, 755, 99, 603, 288, 432, 28, 74, 796, 754,
+    541, 844, 571, 21, 777, 277, 650, 965, 862, 998, 397, 23, 338, 303, 643, 301,
+    511, 306, 502, 818, 242, 348, 114, 45, 425, 847, 689, 289, 49, 43, 299, 667,
+    216, 635, 600, 2, 823, 821, 535, 934, 29, 234, 147, 109, 1013, 552, 75, 622,
+    457, 707, 133, 693, 465, 574, 539, 337, 482, 13, 376, 702, 235, 762, 501, 925,
+    956, 692, 35, 9, 446, 833, 879, 342, 584, 786, 217, 697, 984, 780, 146, 612,
+    588, 969, 912, 176, 507, 258, 576,
+};
+
+// Other shortcodes of table entries, scanned by Emoji::findByShortcode() after the hash
+#define EMOJI_ALIAS_COUNT 6
+
+const EmojiAlias EMOJI_ALIASES[EMOJI_ALIAS_COUNT] PROGMEM = {
+    { "hearts", 229 },
+    { "bow2", 434 },
+    { "moai", 552 },
+    { "heavy_plus", 765 },
+    { "heavy_minus", 766 },
+    { "heavy_div", 767 },
 };
 
 #endif // MESHBERRY_EMOJI_DATA_H
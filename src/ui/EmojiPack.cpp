@@ -0,0 +1,121 @@
+/**
+ * MeshBerry Emoji Pack Implementation
+ *
+ * SPDX-License-Identifier: GPL-3.0-or-later
+ * Copyright (C) 2026 NodakMesh (nodakmesh.org)
+ */
+
+#include "EmojiPack.h"
+#include <esp_partition.h>
+#include <esp_crc.h>
+
+static const uint8_t* packBase = nullptr;
+static spi_flash_mmap_handle_t packHandle;
+
+// Convenience accessor for a section at a header offset
+template <typename T>
+static const T* section(uint32_t offset) {
+    return (const T*)(packBase + offset);
+}
+
+namespace EmojiPack {
+
+bool mount(const char* label) {
+    if (packBase) return true;
+
+    const esp_partition_t* part = esp_partition_find_first(
+        ESP_PARTITION_TYPE_DATA, ESP_PARTITION_SUBTYPE_ANY, label);
+    if (!part) {
+        Serial.printf("[EMOJI] No '%s' partition\n", label);
+        return false;
+    }
+
+    const void* ptr = nullptr;
+    if (esp_partition_mmap(part, 0, part->size, SPI_FLASH_MMAP_DATA, &ptr, &packHandle) != ESP_OK) {
+        Serial.println("[EMOJI] Failed to map pack partition");
+        return false;
+    }
+
+    const EmojiPackHeader* hdr = (const EmojiPackHeader*)ptr;
+    bool valid = hdr->magic == EMOJI_PACK_MAGIC &&
+                 hdr->version == EMOJI_PACK_VERSION &&
+                 hdr->headerSize == sizeof(EmojiPackHeader) &&
+                 hdr->pixelFormat <= EMOJI_PACK_FORMAT_RGB565_BE &&
+                 hdr->totalSize >= sizeof(EmojiPackHeader) &&
+                 hdr->totalSize <= part->size;
+    if (valid) {
+        const uint8_t* body = (const uint8_t*)ptr + hdr->headerSize;
+        valid = esp_crc32_le(0, body, hdr->totalSize - hdr->headerSize) == hdr->crc32;
+    }
+
+    if (!valid) {
+        Serial.println("[EMOJI] Pack partition is empty or corrupt");
+        spi_flash_munmap(packHandle);
+        return false;
+    }
+
+    packBase = (const uint8_t*)ptr;
+    Serial.printf("[EMOJI] Mapped pack with %u emoji\n", hdr->count);
+    return true;
+}
+
+void unmount() {
+    if (!packBase) return;
+    spi_flash_munmap(packHandle);
+    packBase = nullptr;
+}
+
+bool isMounted() {
+    return packBase != nullptr;
+}
+
+const EmojiPackHeader* getHeader() {
+    return packBase ? section<EmojiPackHeader>(0) : nullptr;
+}
+
+int getCount() {
+    return packBase ? getHeader()->count : 0;
+}
+
+const EmojiPackEntry* getByIndex(int index) {
+    if (index < 0 || index >= getCount()) return nullptr;
+    return section<EmojiPackEntry>(getHeader()->entriesOffset) + index;
+}
+
+const EmojiPackEntry* findByCodepoint(uint32_t codepoint) {
+    if (!packBase) return nullptr;
+
+    const EmojiPackEntry* entries = section<EmojiPackEntry>(getHeader()->entriesOffset);
+    const uint16_t* index = section<uint16_t>(getHeader()->indexOffset);
+
+    // Lower-bound search so duplicate codepoints resolve to their first entry
+    int lo = 0;
+    int hi = getCount();
+    while (lo < hi) {
+        int mid = (lo + hi) / 2;
+        if (entries[index[mid]].codepoint < codepoint) {
+            lo = mid + 1;
+        } else {
+            hi = mid;
+        }
+    }
+
+    if (lo < getCount() && entries[index[lo]].codepoint == codepoint) {
+        return &entries[index[lo]];
+    }
+    return nullptr;
+}
+
+const char* getShortcode(const EmojiPackEntry* entry) {
+    if (!packBase || !entry) return nullptr;
+    return section<char>(entry->shortcodeOffset);
+}
+
+const uint16_t* getBitmap(const EmojiPackEntry* entry) {
+    if (!packBase || !entry) return nullptr;
+    const EmojiPackHeader* hdr = getHeader();
+    uint32_t pixels = (uint32_t)hdr->width * hdr->height;
+    return section<uint16_t>(hdr->bitmapsOffset) + entry->bitmapIndex * pixels;
+}
+
+} // namespace EmojiPack
@@ -0,0 +1,121 @@
+/**
+ * MeshBerry Emoji Pack
+ *
+ * SPDX-License-Identifier: GPL-3.0-or-later
+ * Copyright (C) 2026 NodakMesh (nodakmesh.org)
+ *
+ * Memory-mapped emoji data partition. A pack holds the emoji tables and
+ * bitmaps outside the application image, so emoji can be updated without
+ * re-flashing the firmware. Build packs with
+ * `tools/generate_emoji.py --pack emoji.pack`, check them with
+ * `tools/emoji_pack.py validate`, and write them to a data partition
+ * labelled "emoji" (e.g. `parttool.py write_partition --partition-name emoji`).
+ */
+
+#ifndef MESHBERRY_EMOJI_PACK_H
+#define MESHBERRY_EMOJI_PACK_H
+
+#include <Arduino.h>
+
+// Pack constants (must match tools/emoji_pack.py)
+#define EMOJI_PACK_MAGIC        0x4D424550  // "MBEP" - MeshBerry Emoji Pack
+#define EMOJI_PACK_VERSION      1
+#define EMOJI_PACK_FORMAT_RGB565 0          // Little-endian RGB565
+#define EMOJI_PACK_FORMAT_RGB565_BE 1       // Big-endian (panel byte order) RGB565
+#define EMOJI_PACK_PARTITION    "emoji"
+
+/**
+ * Pack image header, at offset 0
+ * All offsets are from the start of the image and 4-byte aligned
+ */
+struct EmojiPackHeader {
+    uint32_t magic;             // EMOJI_PACK_MAGIC
+    uint16_t version;           // EMOJI_PACK_VERSION
+    uint16_t headerSize;        // sizeof(EmojiPackHeader)
+    uint16_t count;             // Number of emoji
+    uint8_t width;              // Bitmap width in pixels
+    uint8_t height;             // Bitmap height in pixels
+    uint8_t pixelFormat;        // EMOJI_PACK_FORMAT_*
+    uint8_t categoryCount;      // Categories (offset table has one more entry)
+    uint16_t reserved0;
+    uint32_t categoriesOffset;  // uint16_t[categoryCount + 1], first entry of each category
+    uint32_t entriesOffset;     // EmojiPackEntry[count], in table (category) order
+    uint32_t indexOffset;       // uint16_t[count], entry numbers sorted by codepoint
+    uint32_t stringsOffset;     // NUL-terminated shortcodes
+    uint32_t bitmapsOffset;     // count * width * height RGB565 pixels
+    uint32_t totalSize;         // Image size in bytes
+    uint32_t crc32;             // CRC-32 of bytes [headerSize, totalSize)
+    uint32_t reserved1;
+};
+
+// Size: 48 bytes
+
+/**
+ * Pack entry
+ */
+struct EmojiPackEntry {
+    uint32_t codepoint;         // Unicode codepoint
+    uint32_t shortcodeOffset;   // Offset of the NUL-terminated shortcode
+    uint16_t bitmapIndex;       // Bitmap slot in the bitmap section
+    uint8_t category;           // EmojiCategory value
+    uint8_t reserved;
+};
+
+// Size: 12 bytes
+
+namespace EmojiPack {
+
+/**
+ * Map the emoji pack partition and validate it
+ * @param label Partition label
+ * @return true if a valid pack is mapped
+ */
+bool mount(const char* label = EMOJI_PACK_PARTITION);
+
+/**
+ * Unmap the pack partition
+ */
+void unmount();
+
+/**
+ * Check if a pack is mapped
+ */
+bool isMounted();
+
+/**
+ * Get the mapped pack header
+ * @return Header, or nullptr if not mounted
+ */
+const EmojiPackHeader* getHeader();
+
+/**
+ * Get number of emoji in the pack (0 if not mounted)
+ */
+int getCount();
+
+/**
+ * Get entry by table index
+ * @return Entry, or nullptr if out of range or not mounted
+ */
+const EmojiPackEntry* getByIndex(int index);
+
+/**
+ * Find entry by codepoint (binary search over the codepoint index)
+ * @return Entry, or nullptr if not found
+ */
+const EmojiPackEntry* findByCodepoint(uint32_t codepoint);
+
+/**
+ * Get an entry's shortcode
+ */
+const char* getShortcode(const EmojiPackEntry* entry);
+
+/**
+ * Get an entry's bitmap, pointing straight into mapped flash (no copy)
+ * @return width * height RGB565 pixels, or nullptr
+ */
+const uint16_t* getBitmap(const EmojiPackEntry* entry);
+
+} // namespace EmojiPack
+
+#endif // MESHBERRY_EMOJI_PACK_H
@@ -138,14 +138,12 @@ void EmojiPickerScreen::drawCell(int col, int row, bool selected) {
     // Get emoji at this position
     int catStart = Emoji::getCategoryStart(_currentCategory);
     int emojiIdx = catStart + (_scrollOffset + row) * COLS + col;
-    const EmojiEntry* emoji = Emoji::getByIndex(emojiIdx);
 
-    if (emoji && emoji->bitmap) {
-        // Center emoji in cell (12x12 in 16x16 cell)
-        int16_t emojiX = cellX + (CELL_SIZE - EMOJI_WIDTH) / 2;
-        int16_t emojiY = cellY + (CELL_SIZE - EMOJI_HEIGHT) / 2;
-        Display::drawRGB565(emojiX, emojiY, emoji->bitmap, EMOJI_WIDTH, EMOJI_HEIGHT);
-    }
+    // Center emoji in cell (12x12 in 16x16 cell)
+    int16_t emojiX = cellX + (CELL_SIZE - EMOJI_WIDTH) / 2;
+    int16_t emojiY = cellY + (CELL_SIZE - EMOJI_HEIGHT) / 2;
+    Emoji::setBackground(bgColor);
+    Display::drawEmoji(emojiX, emojiY, Emoji::getByIndex(emojiIdx));
 }
 
 bool EmojiPickerScreen::handleInput(const InputData& input) {
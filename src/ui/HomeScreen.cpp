@@ -64,8 +64,9 @@ void HomeScreen::draw(bool fullRedraw) {
 void HomeScreen::drawBackground() {
     // Check if we have a real background image
     if (HomeBg::HAS_IMAGE) {
-        // Draw the RGB565 background image
-        Display::drawRGB565(0, BG_START_Y, HomeBg::IMAGE, HomeBg::WIDTH, HomeBg::HEIGHT);
+        // Draw the RLE-compressed RGB565 background image
+        Display::drawRGB565RLE(0, BG_START_Y, HomeBg::IMAGE_RLE, HomeBg::WIDTH, HomeBg::HEIGHT,
+                               HomeBg::BYTE_SWAPPED);
     } else {
         // Fallback: solid dark background with MeshBerry branding
         Display::fillRect(0, BG_START_Y, Theme::SCREEN_WIDTH, BG_HEIGHT, Theme::BG_PRIMARY);
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark for RGB565 packing in generate_emoji.py
+Compares the per-pixel Python loop with the NumPy vectorized path
+
+Usage: python3 bench_rgb565.py [--repeat N]
+
+Requires: pip install Pillow numpy
+"""
+
+import argparse
+import os
+import sys
+import timeit
+
+from PIL import Image
+
+import generate_emoji as gen
+
+# Emoji sizes plus the HomeBg.h background
+SIZES = [(12, 12), (24, 24), (320, 190)]
+
+
+def loop_rgb565(img):
+    """Reference conversion: per-pixel loop as originally used by the generator"""
+    pixels = list(img.getdata())
+    rgb565_data = []
+    for r, g, b in pixels:
+        rgb565_data.append(gen.rgb_to_rgb565(r, g, b))
+    return rgb565_data
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark RGB565 packing")
+    parser.add_argument("--repeat", type=int, default=5, help="timing repeats (default: 5)")
+    args = parser.parse_args()
+
+    if gen.np is None:
+        print("NumPy is not installed, nothing to compare", file=sys.stderr)
+        return 1
+
+    print(f"{'size':>9}  {'loop':>10}  {'numpy':>10}  {'speedup':>8}")
+    for w, h in SIZES:
+        img = Image.frombytes('RGB', (w, h), os.urandom(w * h * 3))
+
+        # Both paths must agree before timing means anything
+        assert gen.image_to_rgb565(img) == loop_rgb565(img), f"mismatch at {w}x{h}"
+
+        number = max(1, 200000 // (w * h))
+        loop_t = min(timeit.repeat(lambda: loop_rgb565(img), number=number, repeat=args.repeat)) / number
+        vec_t = min(timeit.repeat(lambda: gen.image_to_rgb565(img), number=number, repeat=args.repeat)) / number
+        print(f"{w:>4}x{h:<4}  {loop_t * 1e6:>8.1f}us  {vec_t * 1e6:>8.1f}us  {loop_t / vec_t:>7.1f}x")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Convert images to RGB565 C headers for MeshBerry (HomeBg.h, BootLogo.h)
+Optionally RLE-compresses the pixels so the firmware can decode them row by
+row (Display::drawRGB565RLE) instead of storing the raw bitmap in flash
+
+Usage: python3 convert_rgb565.py INPUT --namespace HomeBg --array IMAGE [--rle] [--swap-bytes] > ../src/ui/HomeBg.h
+
+INPUT may be an image file (PNG/JPG/...) or an existing RGB565 header,
+raw or RLE, so committed assets can be re-encoded without the original.
+
+RLE stream format (uint16_t words, rows never share a packet):
+  header & 0x8000   run: repeat the next word (header & 0x7FFF) times
+  otherwise         literal: the next `header` words are pixels
+
+--swap-bytes stores pixels big-endian (the ST7789's byte order) so the
+firmware can push them to SPI without a per-pixel swap. RLE packet headers
+stay native; the header records the order in BYTE_SWAPPED.
+
+Requires: pip install Pillow
+"""
+
+import argparse
+import os
+import re
+import sys
+
+# Longest packet the 15-bit count can describe
+RLE_MAX_COUNT = 0x7FFF
+
+# Runs shorter than this are cheaper inside a literal packet
+RLE_MIN_RUN = 3
+
+
+def rgb_to_rgb565(r, g, b):
+    """Convert RGB888 to RGB565"""
+    return ((r & 0xF8) << 8) | ((g & 0xFC) << 3) | (b >> 3)
+
+
+def swap_bytes(pixels):
+    """Swap the two bytes of every RGB565 value (little-endian <-> big-endian)"""
+    return [((v & 0xFF) << 8) | (v >> 8) for v in pixels]
+
+
+def rle_encode(pixels, width, height):
+    """RLE-encode RGB565 pixels row by row, returns a list of uint16 words"""
+    words = []
+    for y in range(height):
+        row = pixels[y * width:(y + 1) * width]
+        literal = []
+        x = 0
+        while x < width:
+            run = 1
+            while x + run < width and row[x + run] == row[x] and run < RLE_MAX_COUNT:
+                run += 1
+
+            if run >= RLE_MIN_RUN:
+                if literal:
+                    words.append(len(literal))
+                    words.extend(literal)
+                    literal = []
+                words.append(0x8000 | run)
+                words.append(row[x])
+                x += run
+            else:
+                literal.extend(row[x:x + run])
+                x += run
+                if len(literal) > RLE_MAX_COUNT - RLE_MIN_RUN:
+                    words.append(len(literal))
+                    words.extend(literal)
+                    literal = []
+
+        if literal:
+            words.append(len(literal))
+            words.extend(literal)
+    return words
+
+
+def rle_decode_rows(words, width, height):
+    """Reference decoder, yields one row of pixels at a time like the firmware"""
+    pos = 0
+    for y in range(height):
+        row = []
+        while len(row) < width:
+            if pos >= len(words):
+                raise ValueError(f"RLE stream ends in row {y}")
+            header = words[pos]
+            count = header & 0x7FFF
+            if count == 0:
+                raise ValueError(f"zero-length packet at word {pos}")
+            if header & 0x8000:
+                row.extend([words[pos + 1]] * count)
+                pos += 2
+            else:
+                row.extend(words[pos + 1:pos + 1 + count])
+                pos += 1 + count
+        if len(row) != width:
+            raise ValueError(f"row {y} decodes to {len(row)} pixels, expected {width}")
+        yield row
+
+    if pos != len(words):
+        raise ValueError(f"{len(words) - pos} trailing words after last row")
+
+
+def rle_decode(words, width, height):
+    """Decode a whole RLE stream to a flat pixel list"""
+    return [v for row in rle_decode_rows(words, width, height) for v in row]
+
+
+def load_header(path):
+    """Read pixels from an RGB565 header in native byte order, returns (pixels, width, height)"""
+    with open(path) as f:
+        text = f.read()
+
+    width = re.search(r"WIDTH\s*=\s*(\d+)", text)
+    height = re.search(r"HEIGHT\s*=\s*(\d+)", text)
+    array = re.search(r"(\w+)\[\]\s*PROGMEM\s*=\s*\{(.*?)\};", text, re.S)
+    if not (width and height and array):
+        sys.exit(f"Error: {path} has no WIDTH/HEIGHT constants or PROGMEM array")
+
+    width, height = int(width.group(1)), int(height.group(1))
+    body = re.sub(r"//[^\n]*", "", array.group(2))
+    words = [int(v, 16) for v in re.findall(r"0x[0-9A-Fa-f]+", body)]
+    pixels = rle_decode(words, width, height) if array.group(1).endswith("_RLE") else words
+    if re.search(r"BYTE_SWAPPED\s*=\s*true", text):
+        pixels = swap_bytes(pixels)
+    return pixels, width, height
+
+
+def load_image(path, size=None):
+    """Read pixels from an image file, optionally resized, returns (pixels, width, height)"""
+    from PIL import Image
+
+    img = Image.open(path).convert('RGB')
+    if size:
+        img = img.resize(size, Image.Resampling.LANCZOS)
+    pixels = [rgb_to_rgb565(r, g, b) for r, g, b in img.getdata()]
+    return pixels, img.width, img.height
+
+
+def write_header(out, namespace, array, pixels, width, height, words, source, description, swapped=False):
+    """Write the C header, raw when words is None, otherwise RLE-compressed
+
+    pixels and words must already be in the output byte order.
+    """
+    raw_bytes = width * height * 2
+    order = "big-endian " if swapped else ""
+    guard = f"MESHBERRY_{namespace.upper()}_H"
+
+    out.write("/**\n")
+    out.write(f" * MeshBerry {namespace} Image (Auto-Generated)\n")
+    out.write(" *\n")
+    out.write(" * SPDX-License-Identifier: GPL-3.0-or-later\n")
+    out.write(" * Copyright (C) 2026 NodakMesh (nodakmesh.org)\n")
+    out.write(" *\n")
+    if description:
+        out.write(f" * {description}\n")
+    if words is None:
+        out.write(f" * {width}x{height} {order}RGB565 bitmap\n")
+    else:
+        out.write(f" * {width}x{height} {order}RGB565 bitmap, RLE-compressed to {len(words) * 2} bytes "
+                  f"(raw {raw_bytes}), draw with Display::drawRGB565RLE()\n")
+    out.write(f" * Generated by tools/convert_rgb565.py from {source}\n")
+    out.write(" */\n\n")
+    out.write(f"#ifndef {guard}\n#define {guard}\n\n")
+    out.write("#include <Arduino.h>\n\n")
+    out.write(f"namespace {namespace} {{\n\n")
+    out.write(f"constexpr int16_t WIDTH = {width};\n")
+    out.write(f"constexpr int16_t HEIGHT = {height};\n\n")
+    out.write("// Pixels are big-endian (panel byte order) when true, pass to the Display::drawRGB565* call\n")
+    out.write(f"constexpr bool BYTE_SWAPPED = {'true' if swapped else 'false'};\n\n")
+
+    if words is None:
+        name, data = array, pixels
+        out.write(f"// RGB565 pixel data ({width} * {height} * 2 = {raw_bytes:,} bytes)\n")
+    else:
+        name, data = f"{array}_RLE", words
+        out.write("// Row-aligned RLE stream: a header word with bit 15 set repeats the next\n")
+        out.write("// word (header & 0x7FFF) times, otherwise `header` literal pixels follow\n")
+
+    out.write(f"const uint16_t {name}[] PROGMEM = {{\n")
+    for i in range(0, len(data), 16):
+        out.write("    " + ", ".join(f"0x{v:04X}" for v in data[i:i + 16]) + ",\n")
+    out.write("};\n\n")
+    out.write(f"constexpr bool HAS_IMAGE = (sizeof({name}) / sizeof({name}[0])) > 100;\n\n")
+    out.write(f"}} // namespace {namespace}\n\n")
+    out.write(f"#endif // {guard}\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert an image to a MeshBerry RGB565 header")
+    parser.add_argument("input", help="image file or existing RGB565 header")
+    parser.add_argument("--namespace", required=True, help="C++ namespace, e.g. HomeBg")
+    parser.add_argument("--array", default="IMAGE", help="pixel array name (default: IMAGE)")
+    parser.add_argument("--size", help="resize image input to WxH")
+    parser.add_argument("--rle", action="store_true", help="emit RLE-compressed pixels")
+    parser.add_argument("--swap-bytes", action="store_true",
+                        help="store pixels big-endian (panel byte order) for direct SPI push")
+    parser.add_argument("--description", help="extra line for the header comment")
+    args = parser.parse_args()
+
+    if args.input.endswith(".h"):
+        pixels, width, height = load_header(args.input)
+    else:
+        size = tuple(int(v) for v in args.size.lower().split("x")) if args.size else None
+        pixels, width, height = load_image(args.input, size)
+
+    if len(pixels) != width * height:
+        sys.exit(f"Error: {len(pixels)} pixels for a {width}x{height} image")
+    if width > 320:
+        sys.exit(f"Error: {width} px rows do not fit the 320-pixel display row buffer")
+
+    if args.swap_bytes:
+        pixels = swap_bytes(pixels)
+
+    words = None
+    if args.rle:
+        words = rle_encode(pixels, width, height)
+        # Every stream is round-tripped through the reference decoder before it is written
+        if rle_decode(words, width, height) != pixels:
+            sys.exit("Error: RLE round trip mismatch")
+        print(f"{args.namespace}: {width}x{height}, {len(words) * 2} bytes RLE vs "
+              f"{width * height * 2} raw ({100 - len(words) * 200 // (width * height * 2)}% smaller)",
+              file=sys.stderr)
+
+    write_header(sys.stdout, args.namespace, args.array, pixels, width, height, words,
+                 os.path.basename(args.input), args.description, args.swap_bytes)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,372 @@
+#!/usr/bin/env python3
+"""
+MeshBerry emoji manifest: load, validate and convert
+
+The emoji set built by generate_emoji.py lives in emoji_manifest.json rather
+than in code. Rows are listed in table order, which must keep each category
+contiguous and in EmojiCategory enum order (src/ui/Emoji.h).
+
+JSON schema (version 1):
+  {
+    "version": 1,
+    "profiles": {                            optional named subsets
+      "NAME": {
+        "description": "...",
+        "categories": ["FACES", ...],        optional, default: every category
+        "include": ["shortcode", ...],       optional, added to the categories
+        "exclude": ["shortcode", ...]        optional, removed afterwards
+      }
+    },
+    "emoji": [
+      {"codepoint": "1F600", "shortcode": "grin", "category": "FACES"},
+      {"codepoint": "1F5FF", "shortcode": "moyai", "category": "TRAVEL",
+       "aliases": ["moai"]},                 optional other shortcodes
+      {"codepoint": "0023 FE0F 20E3", "shortcode": "hash", "category": "SYMBOLS"}
+    ]
+  }
+
+A CSV manifest has the columns codepoint,shortcode,category, optionally
+followed by aliases (space separated), and no profiles. Codepoints are hex;
+a multi-codepoint sequence (ZWJ, keycap, flag) lists its codepoints
+separated by spaces in fully-qualified form, including any U+FE0F.
+
+Every row is checked in a single pass and all problems are reported together:
+codepoint syntax and range, shortcode syntax (it becomes the C identifier
+EMOJI_BMP_<SHORTCODE> and must fit the firmware's :shortcode: buffer),
+duplicate shortcodes or aliases, unknown or out-of-order categories and
+table limits. A codepoint listed more than once is only a warning, lookups
+by codepoint find the first entry (generate_emoji.py --strict rejects it);
+list the other names as aliases of one entry instead.
+
+Usage: python3 emoji_manifest.py [MANIFEST] [--profile NAME]
+       python3 emoji_manifest.py emoji_manifest.json --csv emoji.csv
+"""
+
+import argparse
+import csv
+import json
+import os
+import re
+import sys
+
+MANIFEST_VERSION = 1
+
+# Default manifest, beside this script
+DEFAULT_MANIFEST = os.path.join(os.path.dirname(os.path.abspath(__file__)), "emoji_manifest.json")
+
+# Firmware header holding the EmojiCategory enum
+EMOJI_HEADER = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src", "ui", "Emoji.h")
+
+# Category names in EmojiCategory enum order (src/ui/Emoji.h)
+CATEGORIES = [
+    "FACES", "GESTURES", "PEOPLE", "HEARTS", "ANIMALS", "FOOD",
+    "ACTIVITIES", "TRAVEL", "OBJECTS", "SYMBOLS", "FLAGS",
+]
+
+CSV_COLUMNS = ["codepoint", "shortcode", "category"]
+# Optional trailing CSV column, space separated
+CSV_ALIASES_COLUMN = "aliases"
+
+# Emoji::convertShortcodes() copies :shortcode: into a 32-byte buffer and only
+# accepts up to 30 characters between the colons
+SHORTCODE_MAX_LENGTH = 30
+# Lower case so EMOJI_BMP_<shortcode.upper()> is a valid, collision-free C identifier
+SHORTCODE_PATTERN = re.compile(r"[a-z0-9_]+")
+
+# EmojiEntry and EmojiSequence use 16-bit table indices (0xFFFF = EMOJI_SEQUENCE_NONE)
+# and an 8-bit sequence length
+MAX_ENTRIES = 0xFFFF
+MAX_SEQUENCE_LENGTH = 255
+MAX_CODEPOINT = 0x10FFFF
+
+
+class ManifestError(ValueError):
+    """Invalid manifest, errors lists every problem found"""
+
+    def __init__(self, path, errors):
+        self.path = path
+        self.errors = errors
+        super().__init__(f"{path}: {len(errors)} error{'s' if len(errors) != 1 else ''}:\n  "
+                         + "\n  ".join(errors))
+
+
+class Manifest:
+    """Validated emoji manifest
+
+    entries are (codepoint, shortcode, category) rows in table order, where a
+    codepoint is an int or a tuple of ints for a sequence. aliases maps other
+    shortcodes to the shortcode of their entry, profiles maps profile names to
+    their definitions and warnings lists non-fatal problems.
+    """
+
+    def __init__(self, path, entries, profiles, warnings, aliases=None):
+        self.path = path
+        self.entries = entries
+        self.profiles = profiles
+        self.warnings = warnings
+        self.aliases = aliases or {}
+
+    def subset(self, profile):
+        """Entries of a named profile, in table order"""
+        if profile not in self.profiles:
+            known = ", ".join(sorted(self.profiles)) or "none defined"
+            raise ManifestError(self.path, [f"unknown profile {profile!r} (profiles: {known})"])
+        definition = self.profiles[profile]
+        categories = set(definition.get("categories", CATEGORIES))
+        include = set(definition.get("include", ()))
+        exclude = set(definition.get("exclude", ()))
+        return [(cp, sc, cat) for cp, sc, cat in self.entries
+                if (cat in categories or sc in include) and sc not in exclude]
+
+
+def parse_codepoint(text):
+    """Parse "1F600" or "0023 FE0F 20E3" into an int or a tuple of ints"""
+    parts = text.split()
+    if not parts or not all(re.fullmatch(r"[0-9A-Fa-f]{1,6}", part) for part in parts):
+        raise ValueError(f"invalid codepoint {text!r}, expected hex such as 1F600 or 0023 FE0F 20E3")
+    values = tuple(int(part, 16) for part in parts)
+    for value in values:
+        if value > MAX_CODEPOINT or 0xD800 <= value <= 0xDFFF:
+            raise ValueError(f"codepoint {value:X} is not a Unicode scalar value")
+    if len(values) > MAX_SEQUENCE_LENGTH:
+        raise ValueError(f"sequence of {len(values)} codepoints, at most {MAX_SEQUENCE_LENGTH} are supported")
+    return values[0] if len(values) == 1 else values
+
+
+def format_codepoint(codepoint):
+    """Manifest form of a codepoint or sequence tuple"""
+    if isinstance(codepoint, tuple):
+        return " ".join(f"{cp:04X}" for cp in codepoint)
+    return f"{codepoint:04X}"
+
+
+def read_category_enum(path=EMOJI_HEADER):
+    """EmojiCategory member names in enum order from Emoji.h, None if the header is missing"""
+    try:
+        with open(path) as f:
+            text = f.read()
+    except OSError:
+        return None
+    match = re.search(r"enum\s+class\s+EmojiCategory\b[^{]*\{(.*?)\}", text, re.S)
+    if not match:
+        return None
+    body = re.sub(r"//[^\n]*|/\*.*?\*/", "", match.group(1), flags=re.S)
+    names = [item.split("=")[0].strip() for item in body.split(",")]
+    return [name for name in names if name and name != "CATEGORY_COUNT"]
+
+
+def validate_rows(rows, where):
+    """Validate raw rows in one pass
+
+    rows yields dicts with codepoint, shortcode and category strings and
+    optional aliases (a list, or a space separated string from CSV); where(i)
+    names row i in messages. Returns (entries, aliases, errors, warnings).
+    """
+    entries = []
+    aliases = {}
+    errors = []
+    warnings = []
+    shortcodes = {}
+    codepoints = {}
+    last_category = -1
+
+    for i, row in enumerate(rows):
+        missing = [key for key in CSV_COLUMNS if not isinstance(row.get(key), str) or not row[key].strip()]
+        if missing:
+            errors.append(f"{where(i)}: missing {', '.join(missing)}")
+            continue
+        shortcode = row["shortcode"].strip()
+        category = row["category"].strip()
+        label = f"{where(i)} ({shortcode})"
+
+        try:
+            codepoint = parse_codepoint(row["codepoint"])
+        except ValueError as e:
+            errors.append(f"{label}: {e}")
+            codepoint = None
+
+        if len(shortcode) > SHORTCODE_MAX_LENGTH:
+            errors.append(f"{label}: shortcode is {len(shortcode)} characters, at most "
+                          f"{SHORTCODE_MAX_LENGTH} fit the firmware's :shortcode: buffer")
+        if not SHORTCODE_PATTERN.fullmatch(shortcode):
+            errors.append(f"{label}: shortcode may only contain a-z, 0-9 and _ "
+                          f"(it becomes EMOJI_BMP_{shortcode.upper()})")
+        if shortcode in shortcodes:
+            errors.append(f"{label}: duplicate shortcode, first used by {where(shortcodes[shortcode])}")
+        shortcodes.setdefault(shortcode, i)
+
+        names = row.get(CSV_ALIASES_COLUMN) or []
+        if isinstance(names, str):
+            names = names.split()
+        if not isinstance(names, list) or not all(isinstance(name, str) for name in names):
+            errors.append(f"{label}: aliases must be a list of shortcodes")
+            names = []
+        for name in names:
+            if len(name) > SHORTCODE_MAX_LENGTH or not SHORTCODE_PATTERN.fullmatch(name):
+                errors.append(f"{label}: invalid alias {name!r}, aliases follow the shortcode rules")
+            elif name in shortcodes:
+                errors.append(f"{label}: alias {name} is already used by {where(shortcodes[name])}")
+            else:
+                shortcodes[name] = i
+                aliases[name] = shortcode
+
+        if category not in CATEGORIES:
+            errors.append(f"{label}: unknown category {category!r}, expected one of {', '.join(CATEGORIES)}")
+        else:
+            order = CATEGORIES.index(category)
+            if order < last_category:
+                errors.append(f"{label}: category {category} after {CATEGORIES[last_category]}, categories "
+                              "must be contiguous and in EmojiCategory order")
+            last_category = max(last_category, order)
+
+        if codepoint is not None:
+            if codepoint in codepoints:
+                warnings.append(f"{label}: codepoint {format_codepoint(codepoint)} is also listed by "
+                                f"{where(codepoints[codepoint])}, lookups find the first")
+            codepoints.setdefault(codepoint, i)
+            entries.append((codepoint, shortcode, category))
+
+    if len(entries) > MAX_ENTRIES:
+        errors.append(f"{len(entries)} emoji, at most {MAX_ENTRIES} fit the 16-bit table indices")
+    return entries, aliases, errors, warnings
+
+
+def validate_profiles(profiles, shortcodes):
+    """Errors in a profiles object, shortcodes is the set of known shortcodes"""
+    errors = []
+    if not isinstance(profiles, dict):
+        return ["profiles must be an object of name -> definition"]
+    for name, definition in profiles.items():
+        if not isinstance(definition, dict):
+            errors.append(f"profile {name!r}: definition must be an object")
+            continue
+        for key in definition:
+            if key not in ("description", "categories", "include", "exclude"):
+                errors.append(f"profile {name!r}: unknown key {key!r}")
+        for key in ("categories", "include", "exclude"):
+            values = definition.get(key, [])
+            if not isinstance(values, list) or not all(isinstance(v, str) for v in values):
+                errors.append(f"profile {name!r}: {key} must be a list of strings")
+                continue
+            known = CATEGORIES if key == "categories" else shortcodes
+            unknown = [v for v in values if v not in known]
+            if unknown:
+                errors.append(f"profile {name!r}: unknown {'categories' if key == 'categories' else 'shortcodes'} "
+                              f"in {key}: {', '.join(unknown)}")
+    return errors
+
+
+def read_json(path):
+    """Raw rows and profiles of a JSON manifest"""
+    with open(path, encoding="utf-8") as f:
+        try:
+            data = json.load(f)
+        except json.JSONDecodeError as e:
+            raise ManifestError(path, [f"invalid JSON: {e}"]) from None
+    if not isinstance(data, dict) or not isinstance(data.get("emoji"), list):
+        raise ManifestError(path, ["expected an object with an \"emoji\" list"])
+    if data.get("version") != MANIFEST_VERSION:
+        raise ManifestError(path, [f"unsupported version {data.get('version')!r}, expected {MANIFEST_VERSION}"])
+    rows = [row if isinstance(row, dict) else {} for row in data["emoji"]]
+    return rows, data.get("profiles", {}), lambda i: f"emoji[{i}]"
+
+
+def read_csv(path):
+    """Raw rows of a CSV manifest, which has no profiles"""
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        if reader.fieldnames not in (CSV_COLUMNS, CSV_COLUMNS + [CSV_ALIASES_COLUMN]):
+            raise ManifestError(path, [f"expected the columns {','.join(CSV_COLUMNS)}[,{CSV_ALIASES_COLUMN}], got "
+                                       f"{','.join(reader.fieldnames or [])}"])
+        rows = list(reader)
+    # Line 1 is the column header
+    return rows, {}, lambda i: f"line {i + 2}"
+
+
+def load_manifest(path=DEFAULT_MANIFEST):
+    """Load and validate a JSON or CSV manifest, raises ManifestError listing every problem"""
+    reader = read_csv if path.lower().endswith(".csv") else read_json
+    rows, profiles, where = reader(path)
+    entries, aliases, errors, warnings = validate_rows(rows, where)
+    errors += validate_profiles(profiles, {sc for _, sc, _ in entries})
+
+    enum = read_category_enum()
+    if enum is not None and enum != CATEGORIES:
+        errors.append(f"category list {CATEGORIES} does not match EmojiCategory in {EMOJI_HEADER}: {enum}")
+
+    if errors:
+        raise ManifestError(path, errors)
+    return Manifest(path, entries, profiles, warnings, aliases)
+
+
+def aliases_by_shortcode(manifest):
+    """Aliases of each entry's shortcode, in manifest order"""
+    names = {}
+    for alias, shortcode in manifest.aliases.items():
+        names.setdefault(shortcode, []).append(alias)
+    return names
+
+
+def write_json(path, manifest):
+    """Write a manifest as JSON, one emoji per line"""
+    names = aliases_by_shortcode(manifest)
+    lines = [json.dumps({"codepoint": format_codepoint(cp), "shortcode": sc, "category": cat,
+                         **({"aliases": names[sc]} if sc in names else {})})
+             for cp, sc, cat in manifest.entries]
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(f'{{\n"version": {MANIFEST_VERSION},\n')
+        profiles = [f"{json.dumps(name)}: {json.dumps(definition)}" for name, definition in manifest.profiles.items()]
+        f.write('"profiles": {\n' + ",\n".join(profiles) + "\n},\n")
+        f.write('"emoji": [\n' + ",\n".join(lines) + "\n]\n}\n")
+
+
+def write_csv(path, manifest):
+    """Write a manifest's entries as CSV (profiles are not representable)"""
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f, lineterminator="\n")
+        names = aliases_by_shortcode(manifest)
+        writer.writerow(CSV_COLUMNS + ([CSV_ALIASES_COLUMN] if names else []))
+        for cp, sc, cat in manifest.entries:
+            writer.writerow([format_codepoint(cp), sc, cat] + ([" ".join(names.get(sc, []))] if names else []))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Validate or convert a MeshBerry emoji manifest")
+    parser.add_argument("manifest", nargs="?", default=DEFAULT_MANIFEST,
+                        help="JSON or CSV manifest (default: emoji_manifest.json)")
+    parser.add_argument("--profile", help="list the entries of a profile instead of the summary")
+    parser.add_argument("--csv", metavar="PATH", help="write the entries as CSV")
+    parser.add_argument("--json", metavar="PATH", help="write the manifest as JSON")
+    args = parser.parse_args()
+
+    try:
+        manifest = load_manifest(args.manifest)
+        entries = manifest.subset(args.profile) if args.profile else manifest.entries
+    except (OSError, ManifestError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    for warning in manifest.warnings:
+        print(f"Warning: {warning}", file=sys.stderr)
+
+    if args.csv:
+        write_csv(args.csv, manifest)
+    if args.json:
+        write_json(args.json, manifest)
+
+    if args.profile:
+        for cp, sc, cat in entries:
+            print(f"{format_codepoint(cp):<24} {sc:<24} {cat}")
+        return 0
+
+    counts = {cat: 0 for cat in CATEGORIES}
+    for _, _, cat in entries:
+        counts[cat] += 1
+    print(f"{args.manifest}: valid, {len(entries)} emoji, {len(manifest.aliases)} aliases")
+    print("  " + ", ".join(f"{cat} {n}" for cat, n in counts.items()))
+    for name, definition in sorted(manifest.profiles.items()):
+        print(f"  profile {name}: {len(manifest.subset(name))} emoji - {definition.get('description', '')}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+MeshBerry emoji pack images: build, validate and dump
+
+An emoji pack is a standalone flash data-partition image holding the emoji
+tables and bitmaps, so packs can be updated without re-flashing firmware.
+The firmware memory-maps the partition and reads it in place (EmojiPack.h).
+
+Layout (little-endian, every section 4-byte aligned, offsets from image start):
+  EmojiPackHeader                  48 bytes
+  category offsets                 uint16_t[categoryCount + 1]
+  entries                          EmojiPackEntry[count], table (category) order
+  codepoint index                  uint16_t[count], entry numbers sorted by codepoint
+  shortcodes                       NUL-terminated strings
+  bitmaps                          count * width * height RGB565, byte order per pixelFormat
+
+Usage: python3 emoji_pack.py validate emoji.pack
+       python3 emoji_pack.py dump emoji.pack [--bitmaps]
+
+Build packs with: python3 generate_emoji.py --pack emoji.pack
+"""
+
+import argparse
+import re
+import struct
+import sys
+import zlib
+
+PACK_MAGIC = 0x4D424550            # "MBEP" - MeshBerry Emoji Pack
+PACK_VERSION = 1
+PACK_FORMAT_RGB565 = 0             # Little-endian RGB565
+PACK_FORMAT_RGB565_BE = 1          # Big-endian (panel byte order) RGB565
+PACK_FORMATS = (PACK_FORMAT_RGB565, PACK_FORMAT_RGB565_BE)
+
+# EmojiPackHeader and EmojiPackEntry in src/ui/EmojiPack.h
+HEADER_FORMAT = "<IHHHBBBBHIIIIIIII"
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)    # 48
+ENTRY_FORMAT = "<IIHBB"
+ENTRY_SIZE = struct.calcsize(ENTRY_FORMAT)      # 12
+
+HEADER_FIELDS = [
+    "magic", "version", "header_size", "count", "width", "height", "pixel_format",
+    "category_count", "reserved0", "categories_offset", "entries_offset", "index_offset",
+    "strings_offset", "bitmaps_offset", "total_size", "crc32", "reserved1",
+]
+
+
+def _align(buf, alignment=4):
+    """Pad a bytearray with zeros to the alignment"""
+    buf.extend(b"\0" * (-len(buf) % alignment))
+
+
+def build_pack(entries, cp_index, category_offsets, width=12, height=12,
+               pixel_format=PACK_FORMAT_RGB565):
+    """Build a pack image
+
+    entries is a list of (codepoint, shortcode, category number, RGB565 pixels)
+    in table order, cp_index the entry numbers sorted by codepoint and
+    category_offsets the category start table (len = categories + 1). Pixel
+    values are stored as given, so big-endian data must already be swapped.
+    Returns the image bytes.
+    """
+    count = len(entries)
+    pixels = width * height
+    body = bytearray(HEADER_SIZE)
+
+    categories_offset = len(body)
+    body += struct.pack(f"<{len(category_offsets)}H", *category_offsets)
+    _align(body)
+
+    # Shortcode offsets are only known once the string section is placed
+    entries_offset = len(body)
+    body += bytes(ENTRY_SIZE * count)
+    _align(body)
+
+    index_offset = len(body)
+    body += struct.pack(f"<{count}H", *cp_index)
+    _align(body)
+
+    strings_offset = len(body)
+    shortcode_offsets = []
+    for _, shortcode, _, _ in entries:
+        shortcode_offsets.append(len(body))
+        body += shortcode.encode() + b"\0"
+    _align(body)
+
+    bitmaps_offset = len(body)
+    for _, _, _, data in entries:
+        body += struct.pack(f"<{pixels}H", *data)
+    _align(body)
+
+    for i, (codepoint, _, category, _) in enumerate(entries):
+        struct.pack_into(ENTRY_FORMAT, body, entries_offset + i * ENTRY_SIZE,
+                         codepoint, shortcode_offsets[i], i, category, 0)
+
+    total_size = len(body)
+    crc = zlib.crc32(bytes(body[HEADER_SIZE:]))
+    struct.pack_into(HEADER_FORMAT, body, 0,
+                     PACK_MAGIC, PACK_VERSION, HEADER_SIZE, count, width, height,
+                     pixel_format, len(category_offsets) - 1, 0,
+                     categories_offset, entries_offset, index_offset, strings_offset,
+                     bitmaps_offset, total_size, crc, 0)
+    return bytes(body)
+
+
+def parse_header(data):
+    """Unpack the pack header into a dict"""
+    if len(data) < HEADER_SIZE:
+        raise ValueError(f"image is {len(data)} bytes, smaller than the {HEADER_SIZE}-byte header")
+    return dict(zip(HEADER_FIELDS, struct.unpack_from(HEADER_FORMAT, data)))
+
+
+def read_string(data, offset):
+    """Read a NUL-terminated string at offset"""
+    end = data.index(b"\0", offset)
+    return data[offset:end].decode()
+
+
+def parse_entries(data, header):
+    """Unpack entries as a list of dicts"""
+    entries = []
+    for i in range(header["count"]):
+        codepoint, sc_offset, bitmap_index, category, _ = struct.unpack_from(
+            ENTRY_FORMAT, data, header["entries_offset"] + i * ENTRY_SIZE)
+        entries.append({"codepoint": codepoint, "shortcode_offset": sc_offset,
+                        "bitmap_index": bitmap_index, "category": category})
+    return entries
+
+
+def validate_pack(data):
+    """Check a pack image, returns a list of error strings (empty when valid)"""
+    try:
+        header = parse_header(data)
+    except ValueError as e:
+        return [str(e)]
+
+    errors = []
+    if header["magic"] != PACK_MAGIC:
+        return [f"bad magic 0x{header['magic']:08X}, expected 0x{PACK_MAGIC:08X}"]
+    if header["version"] != PACK_VERSION:
+        return [f"unsupported version {header['version']}, expected {PACK_VERSION}"]
+    if header["header_size"] != HEADER_SIZE:
+        errors.append(f"header size {header['header_size']}, expected {HEADER_SIZE}")
+    if header["total_size"] != len(data):
+        return errors + [f"total size {header['total_size']} does not match image size {len(data)}"]
+    if header["pixel_format"] not in PACK_FORMATS:
+        errors.append(f"unknown pixel format {header['pixel_format']}")
+    crc = zlib.crc32(data[HEADER_SIZE:header["total_size"]])
+    if crc != header["crc32"]:
+        errors.append(f"CRC-32 0x{crc:08X} does not match header 0x{header['crc32']:08X}")
+
+    count = header["count"]
+    ncat = header["category_count"]
+    pixels = header["width"] * header["height"]
+    sections = [
+        ("categories", header["categories_offset"], (ncat + 1) * 2),
+        ("entries", header["entries_offset"], count * ENTRY_SIZE),
+        ("index", header["index_offset"], count * 2),
+        ("strings", header["strings_offset"], 0),
+        ("bitmaps", header["bitmaps_offset"], count * pixels * 2),
+    ]
+    prev_end = HEADER_SIZE
+    for name, offset, size in sections:
+        if offset % 4:
+            errors.append(f"{name} section at {offset} is not 4-byte aligned")
+        if offset < prev_end or offset + size > len(data):
+            errors.append(f"{name} section [{offset}, {offset + size}) overlaps or is out of bounds")
+        prev_end = offset + size
+    if errors:
+        return errors
+
+    # Category table must partition the entries in order
+    offsets = struct.unpack_from(f"<{ncat + 1}H", data, header["categories_offset"])
+    if offsets[0] != 0 or offsets[-1] != count or list(offsets) != sorted(offsets):
+        errors.append(f"category offsets {list(offsets)} do not partition {count} entries")
+
+    entries = parse_entries(data, header)
+    shortcodes = {}
+    for i, entry in enumerate(entries):
+        sc_offset = entry["shortcode_offset"]
+        if not header["strings_offset"] <= sc_offset < header["bitmaps_offset"]:
+            errors.append(f"entry {i}: shortcode offset {sc_offset} outside the string section")
+            continue
+        try:
+            shortcode = read_string(data, sc_offset)
+        except (ValueError, UnicodeDecodeError):
+            errors.append(f"entry {i}: unterminated or invalid shortcode")
+            continue
+        if not re.fullmatch(r"[a-z0-9_+-]+", shortcode):
+            errors.append(f"entry {i}: invalid shortcode {shortcode!r}")
+        if shortcode in shortcodes:
+            errors.append(f"entry {i}: duplicate shortcode {shortcode!r} (also entry {shortcodes[shortcode]})")
+        shortcodes.setdefault(shortcode, i)
+
+        if entry["bitmap_index"] >= count:
+            errors.append(f"entry {i}: bitmap index {entry['bitmap_index']} out of range")
+        if entry["category"] >= ncat:
+            errors.append(f"entry {i}: category {entry['category']} out of range")
+        elif not offsets[entry["category"]] <= i < offsets[entry["category"] + 1]:
+            errors.append(f"entry {i}: category {entry['category']} does not match the category offsets")
+
+    # Codepoint index must be a stable sort of the entries
+    index = struct.unpack_from(f"<{count}H", data, header["index_offset"])
+    if sorted(index) != list(range(count)):
+        errors.append("codepoint index is not a permutation of the entries")
+    else:
+        for a, b in zip(index, index[1:]):
+            ca, cb = entries[a]["codepoint"], entries[b]["codepoint"]
+            if ca > cb or (ca == cb and a > b):
+                errors.append(f"codepoint index out of order at entries {a} / {b}")
+                break
+
+    return errors
+
+
+def dump_pack(data, bitmaps=False, out=sys.stdout):
+    """Print a human-readable listing of a pack image"""
+    header = parse_header(data)
+    for field in HEADER_FIELDS:
+        if not field.startswith("reserved"):
+            value = header[field]
+            out.write(f"{field:>18}: {f'0x{value:08X}' if field in ('magic', 'crc32') else value}\n")
+
+    ncat = header["category_count"]
+    offsets = struct.unpack_from(f"<{ncat + 1}H", data, header["categories_offset"])
+    out.write(f"{'categories':>18}: {list(offsets)}\n\n")
+
+    pixels = header["width"] * header["height"]
+    for i, entry in enumerate(parse_entries(data, header)):
+        shortcode = read_string(data, entry["shortcode_offset"])
+        out.write(f"{i:5} U+{entry['codepoint']:05X}  cat {entry['category']:2}  "
+                  f"bitmap {entry['bitmap_index']:5}  {shortcode}\n")
+        if bitmaps:
+            offset = header["bitmaps_offset"] + entry["bitmap_index"] * pixels * 2
+            values = struct.unpack_from(f"<{pixels}H", data, offset)
+            for row in range(0, pixels, header["width"]):
+                out.write("      " + " ".join(f"{v:04X}" for v in values[row:row + header["width"]]) + "\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Validate or dump a MeshBerry emoji pack image")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p_validate = sub.add_parser("validate", help="check structure, ordering and CRC")
+    p_validate.add_argument("image")
+    p_dump = sub.add_parser("dump", help="list header and entries")
+    p_dump.add_argument("image")
+    p_dump.add_argument("--bitmaps", action="store_true", help="also print pixel values")
+    args = parser.parse_args()
+
+    with open(args.image, "rb") as f:
+        data = f.read()
+
+    if args.command == "validate":
+        errors = validate_pack(data)
+        for error in errors:
+            print(f"Error: {error}", file=sys.stderr)
+        if errors:
+            return 1
+        header = parse_header(data)
+        print(f"{args.image}: valid, {header['count']} emoji, {header['total_size']} bytes")
+        return 0
+
+    errors = validate_pack(data)
+    if errors:
+        print(f"Warning: image is invalid ({errors[0]})", file=sys.stderr)
+    dump_pack(data, args.bitmaps)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Local Twemoji asset sources for generate_emoji.py (--source)
+
+Reads Twemoji assets from a release archive (.zip, .tar, .tar.gz, .tar.bz2,
+.tar.xz) or an unpacked directory such as a twemoji checkout, so builds need
+no network. Members are matched by file name anywhere in the tree
+(assets/72x72/1f600.png, assets/svg/1f600.svg, ...); a PNG is preferred and
+an SVG is rendered to a 72x72 PNG when it is the only form available. When
+several PNGs share a name (older releases also ship 16x16 and 36x36 icons),
+the one under a 72x72 directory wins, otherwise the largest.
+
+Archives are never extracted: zip members are read through the central
+directory and tar archives are streamed once, keeping only the requested
+members in memory.
+
+Usage: python3 emoji_sources.py twemoji-14.0.2.zip 1f600.png [NAME ...]
+
+Optional: pip install cairosvg (SVG-only sources)
+"""
+
+import argparse
+import os
+import struct
+import sys
+import tarfile
+import zipfile
+
+# Twemoji PNG assets are 72x72, SVGs are rendered to match
+SVG_RENDER_SIZE = 72
+# Directory holding the full-size PNGs in a Twemoji release
+PNG_ASSET_DIR = "72x72"
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+def render_svg(data, size=SVG_RENDER_SIZE):
+    """Render SVG bytes to a size x size PNG, returns PNG bytes"""
+    try:
+        import cairosvg
+    except ImportError:
+        raise ValueError("SVG assets need cairosvg: pip install cairosvg") from None
+    return cairosvg.svg2png(bytestring=data, output_width=size, output_height=size)
+
+
+def png_rank(member_name, data):
+    """Sort key for PNGs sharing a name: under 72x72/ first, then by width"""
+    in_asset_dir = PNG_ASSET_DIR in member_name.replace("\\", "/").split("/")[:-1]
+    # IHDR is the first chunk, its width follows the signature, length and type
+    width = struct.unpack(">I", data[16:20])[0] if data[:8] == PNG_SIGNATURE and len(data) >= 24 else 0
+    return in_asset_dir, width
+
+
+def asset_stem(member_name):
+    """Stem and extension of a member path if it is a PNG or SVG asset, else None"""
+    stem, ext = os.path.splitext(os.path.basename(member_name))
+    ext = ext.lower()
+    if ext in (".png", ".svg") and stem:
+        return stem, ext
+    return None
+
+
+class AssetSource:
+    """Base class: collects PNG/SVG members for the requested PNG file names"""
+
+    def __init__(self, path):
+        self.path = path
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """Release the underlying archive, if any"""
+
+    def members(self, stems):
+        """Yield (stem, ext, data, member name) for asset members whose stem is in stems"""
+        raise NotImplementedError
+
+    def read(self, filenames):
+        """Read assets for Twemoji PNG file names (e.g. "1f600.png")
+
+        Returns a dict of file name -> PNG bytes; names without a matching
+        member are left out. Of several PNGs with one name, the png_rank()
+        best is kept.
+        """
+        wanted = {os.path.splitext(name)[0]: name for name in filenames}
+        pngs = {}
+        svgs = {}
+        for stem, ext, data, name in self.members(wanted):
+            if ext == ".svg":
+                svgs.setdefault(stem, data)
+                continue
+            rank = png_rank(name, data)
+            if stem not in pngs or rank > pngs[stem][0]:
+                pngs[stem] = (rank, data)
+
+        results = {wanted[stem]: data for stem, (_, data) in pngs.items()}
+        for stem, data in svgs.items():
+            if stem not in pngs:
+                results[wanted[stem]] = render_svg(data)
+        return results
+
+
+class DirectorySource(AssetSource):
+    """Unpacked release or checkout, walked once to index file names"""
+
+    def members(self, stems):
+        for root, dirs, files in os.walk(self.path):
+            dirs.sort()
+            for name in sorted(files):
+                asset = asset_stem(name)
+                if asset and asset[0] in stems:
+                    path = os.path.join(root, name)
+                    with open(path, "rb") as f:
+                        yield asset[0], asset[1], f.read(), path
+
+
+class ZipSource(AssetSource):
+    """Zip archive, members are read by random access"""
+
+    def __init__(self, path):
+        super().__init__(path)
+        self.zip = zipfile.ZipFile(path)
+
+    def close(self):
+        self.zip.close()
+
+    def members(self, stems):
+        for info in self.zip.infolist():
+            asset = asset_stem(info.filename)
+            if asset and not info.is_dir() and asset[0] in stems:
+                yield asset[0], asset[1], self.zip.read(info), info.filename
+
+
+class TarSource(AssetSource):
+    """Tar archive (optionally compressed), streamed in a single pass"""
+
+    def __init__(self, path):
+        super().__init__(path)
+        self.tar = tarfile.open(path, "r|*")
+
+    def close(self):
+        self.tar.close()
+
+    def members(self, stems):
+        for member in self.tar:
+            asset = asset_stem(member.name)
+            if asset and member.isfile() and asset[0] in stems:
+                yield asset[0], asset[1], self.tar.extractfile(member).read(), member.name
+
+
+def open_source(path):
+    """Open a local asset source for a directory, zip or tar archive"""
+    if os.path.isdir(path):
+        return DirectorySource(path)
+    if not os.path.isfile(path):
+        raise ValueError(f"{path} is not a directory or archive")
+    if zipfile.is_zipfile(path):
+        return ZipSource(path)
+    if tarfile.is_tarfile(path):
+        return TarSource(path)
+    raise ValueError(f"{path} is not a zip or tar archive")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Look up Twemoji assets in a local source")
+    parser.add_argument("source", help="release archive (.zip/.tar[.gz|.bz2|.xz]) or directory")
+    parser.add_argument("names", nargs="+", help="Twemoji PNG file names, e.g. 1f600.png")
+    args = parser.parse_args()
+
+    try:
+        with open_source(args.source) as source:
+            found = source.read(args.names)
+    except (OSError, ValueError, tarfile.TarError, zipfile.BadZipFile) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    for name in args.names:
+        print(f"{name}: {len(found[name])} bytes" if name in found else f"{name}: missing")
+    return 0 if len(found) == len(set(args.names)) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Count emoji usage in MeshBerry message archives
+
+Streams the MessageArchive files pulled off SD cards (/channels/ch<N>.bin and
+/dms/dm_<ID>.bin, see src/settings/MessageArchive.h), decodes each message's
+UTF-8 text and counts the emoji of the manifest it contains. Sequences (ZWJ,
+keycap, flag) are matched longest first, with or without U+FE0F selectors,
+as Emoji::matchUTF8() does on the device.
+
+The result is a CSV frequency table, most used first:
+  codepoint,shortcode,category,count
+
+Feed it to the generator to put frequent emoji first on their picker page
+(--usage) or to rank emoji for a flash budget (--budget ... --weights):
+  python3 emoji_usage.py /media/sdcard /media/sdcard2 -o usage.csv
+  python3 generate_emoji.py --usage usage.csv --output ../src/ui/EmojiData.h
+
+Usage: python3 emoji_usage.py PATH [PATH ...] [-o usage.csv] [--outgoing]
+       PATH is an archive file or a directory searched for archive files
+"""
+
+import argparse
+import collections
+import csv
+import os
+import re
+import struct
+import sys
+
+import emoji_manifest
+
+# ArchiveHeader and ArchivedMessage in src/settings/MessageArchive.h
+ARCHIVE_MAGIC = 0x4D424D53          # "MBMS" - MeshBerry Message Store
+ARCHIVE_VERSION = 1
+HEADER_FORMAT = "<IIII"             # magic, version, messageCount, reserved
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)    # 16
+MESSAGE_FORMAT = "<I16s200sB3x"     # timestamp, sender, text, isOutgoing, reserved
+MESSAGE_SIZE = struct.calcsize(MESSAGE_FORMAT)  # 224
+
+# Records read per file read
+READ_BATCH = 64
+
+# Archive file names written by MessageArchive
+ARCHIVE_NAME = re.compile(r"ch\d+\.bin|dm_[0-9A-Fa-f]{8}\.bin")
+
+VARIATION_SELECTOR_16 = 0xFE0F
+# Codepoints that only modify or join the emoji before them (Emoji::isZeroWidth)
+ZERO_WIDTH = {0x200D, 0xFE0E, 0xFE0F, 0x20E3} | set(range(0x1F3FB, 0x1F400)) | set(range(0xE0020, 0xE0080))
+
+# Blocks where emoji live, unmatched codepoints in them are reported as missing
+# emoji (other text such as accents or CJK is not)
+EMOJI_BLOCKS = ((0x2000, 0x2BFF), (0x1F000, 0x1FAFF))
+
+# Unknown codepoints listed in the summary
+UNKNOWN_SHOWN = 10
+
+
+class EmojiMatcher:
+    """Longest-match lookup of manifest emoji in a codepoint list
+
+    Entries are manifest rows; a codepoint listed more than once matches its
+    first entry, like the firmware's codepoint index.
+    """
+
+    def __init__(self, entries):
+        self.singles = {}
+        self.sequences = {}
+        for i, (codepoint, _, _) in enumerate(entries):
+            if isinstance(codepoint, tuple):
+                self.sequences.setdefault(codepoint, i)
+                stripped = tuple(cp for cp in codepoint if cp != VARIATION_SELECTOR_16)
+                if len(stripped) > 1:
+                    self.sequences.setdefault(stripped, i)
+            else:
+                self.singles.setdefault(codepoint, i)
+        self.leads = {seq[0] for seq in self.sequences}
+        self.longest = max((len(seq) for seq in self.sequences), default=1)
+
+    def match(self, codepoints, pos):
+        """(entry index or None, codepoints consumed) at codepoints[pos]"""
+        if codepoints[pos] in self.leads:
+            for length in range(min(self.longest, len(codepoints) - pos), 1, -1):
+                entry = self.sequences.get(tuple(codepoints[pos:pos + length]))
+                if entry is not None:
+                    return entry, length
+        entry = self.singles.get(codepoints[pos])
+        if entry is None:
+            return None, 1
+        # A trailing emoji presentation selector belongs to the emoji
+        if pos + 1 < len(codepoints) and codepoints[pos + 1] == VARIATION_SELECTOR_16:
+            return entry, 2
+        return entry, 1
+
+
+def find_archives(paths):
+    """Archive files for files and directories, directories searched recursively in name order"""
+    for path in paths:
+        if not os.path.isdir(path):
+            yield path
+            continue
+        for root, dirs, files in os.walk(path):
+            dirs.sort()
+            for name in sorted(files):
+                if ARCHIVE_NAME.fullmatch(name):
+                    yield os.path.join(root, name)
+
+
+def read_messages(path):
+    """Yield (isOutgoing, text bytes) for each record of an archive file
+
+    Raises ValueError for a file that is not a message archive. A file cut
+    short (e.g. a card pulled mid-write) yields its complete records.
+    """
+    with open(path, "rb") as f:
+        header = f.read(HEADER_SIZE)
+        if len(header) < HEADER_SIZE:
+            raise ValueError("too short for an archive header")
+        magic, version, count, _ = struct.unpack(HEADER_FORMAT, header)
+        if magic != ARCHIVE_MAGIC or version != ARCHIVE_VERSION:
+            raise ValueError(f"not a message archive (magic 0x{magic:08X}, version {version})")
+
+        while count > 0:
+            batch = f.read(min(count, READ_BATCH) * MESSAGE_SIZE)
+            records = len(batch) // MESSAGE_SIZE
+            for _, _, text, outgoing in struct.iter_unpack(MESSAGE_FORMAT, batch[:records * MESSAGE_SIZE]):
+                yield outgoing, text.split(b"\0", 1)[0]
+            if records < min(count, READ_BATCH):
+                break
+            count -= records
+
+
+def count_usage(paths, entries, outgoing_only=False, log=sys.stderr):
+    """Count manifest emoji in archive files
+
+    Returns (counts by entry index, unknown codepoint Counter, totals dict).
+    """
+    matcher = EmojiMatcher(entries)
+    counts = collections.Counter()
+    unknown = collections.Counter()
+    totals = {"files": 0, "skipped": 0, "messages": 0, "invalid_utf8": 0, "emoji": 0}
+
+    for path in find_archives(paths):
+        try:
+            for outgoing, text in read_messages(path):
+                if outgoing_only and not outgoing:
+                    continue
+                totals["messages"] += 1
+                try:
+                    decoded = text.decode("utf-8")
+                except UnicodeDecodeError:
+                    # Text is cut at ARCHIVE_TEXT_LEN bytes, possibly mid-character
+                    totals["invalid_utf8"] += 1
+                    decoded = text.decode("utf-8", errors="ignore")
+
+                codepoints = [ord(c) for c in decoded]
+                pos = 0
+                while pos < len(codepoints):
+                    # ASCII is plain text unless it starts a keycap sequence
+                    if codepoints[pos] < 0x80 and codepoints[pos] not in matcher.leads:
+                        pos += 1
+                        continue
+                    entry, length = matcher.match(codepoints, pos)
+                    if entry is not None:
+                        counts[entry] += 1
+                        totals["emoji"] += 1
+                    elif codepoints[pos] not in ZERO_WIDTH and any(
+                            lo <= codepoints[pos] <= hi for lo, hi in EMOJI_BLOCKS):
+                        unknown[codepoints[pos]] += 1
+                    pos += length
+            totals["files"] += 1
+        except (OSError, ValueError) as e:
+            print(f"Skipping {path}: {e}", file=log)
+            totals["skipped"] += 1
+    return counts, unknown, totals
+
+
+def write_table(out, entries, counts):
+    """Write the CSV frequency table, most used first (ties in table order)"""
+    writer = csv.writer(out, lineterminator="\n")
+    writer.writerow(["codepoint", "shortcode", "category", "count"])
+    for i in sorted(counts, key=lambda i: (-counts[i], i)):
+        codepoint, shortcode, category = entries[i]
+        writer.writerow([emoji_manifest.format_codepoint(codepoint), shortcode, category, counts[i]])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Count emoji usage in MeshBerry message archives")
+    parser.add_argument("paths", nargs="+", metavar="PATH",
+                        help="archive file, or directory searched for ch<N>.bin / dm_<ID>.bin")
+    parser.add_argument("-o", "--output", metavar="PATH", help="write the table to PATH (default: stdout)")
+    parser.add_argument("--manifest", default=emoji_manifest.DEFAULT_MANIFEST,
+                        help="emoji manifest to count against (default: emoji_manifest.json)")
+    parser.add_argument("--outgoing", action="store_true",
+                        help="only count messages sent from the device")
+    args = parser.parse_args()
+
+    try:
+        entries = emoji_manifest.load_manifest(args.manifest).entries
+    except (OSError, emoji_manifest.ManifestError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    counts, unknown, totals = count_usage(args.paths, entries, args.outgoing)
+    if args.output:
+        with open(args.output, "w", newline="", encoding="utf-8") as f:
+            write_table(f, entries, counts)
+    else:
+        write_table(sys.stdout, entries, counts)
+
+    print(f"{totals['files']} archives ({totals['skipped']} skipped), {totals['messages']} messages, "
+          f"{totals['emoji']} emoji, {len(counts)} distinct", file=sys.stderr)
+    if totals["invalid_utf8"]:
+        print(f"  {totals['invalid_utf8']} messages had invalid or truncated UTF-8", file=sys.stderr)
+    if unknown:
+        print("  Not in the manifest: " + ", ".join(f"U+{cp:04X} x{n}" for cp, n in unknown.most_common(UNKNOWN_SHOWN)),
+              file=sys.stderr)
+    return 0 if totals["files"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,19 +3,55 @@
 Generate RGB565 emoji bitmaps for MeshBerry using Twemoji
 Downloads Twemoji PNG files and converts to 12x12 RGB565 bitmaps
 
-Usage: python3 generate_emoji.py > ../src/ui/EmojiData.h
+Usage: python3 generate_emoji.py --output ../src/ui/EmojiData.h
+       python3 generate_emoji.py --help    (storage modes, budgets, local sources, ...)
 
-Requires: pip install Pillow requests
+Library use: importing the module has no side effects, see generate()
+
+  import generate_emoji as ge
+  artifact = ge.generate(ge.make_options(atlas=True), ge.load_manifest(profile="compact"))
+  ge.HeaderFileWriter("EmojiData.h").write(artifact)
+
+Requires: pip install Pillow
+Optional: pip install numpy (vectorized RGB565 conversion)
+          pip install cairosvg (SVG assets with --source)
 """
 
 from PIL import Image
 import sys
 import os
 import io
-import urllib.request
-import urllib.error
+import http.client
+import urllib.parse
 import ssl
 import time
+import argparse
+import csv
+import threading
+import hashlib
+import itertools
+import json
+import logging
+import math
+import re
+import struct
+import cProfile
+import pstats
+import tarfile
+import zipfile
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+import emoji_manifest
+import emoji_pack
+import emoji_sources
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Progress and warnings of library calls; the CLI prints them to stderr
+log = logging.getLogger("generate_emoji")
 
 # Twemoji base URL (72x72 PNG files)
 TWEMOJI_BASE = "https://raw.githubusercontent.com/twitter/twemoji/master/assets/72x72"
@@ -23,1051 +59,93 @@ TWEMOJI_BASE = "https://raw.githubusercontent.com/twitter/twemoji/master/assets/
 # Cache directory for downloaded files
 CACHE_DIR = os.path.join(os.path.dirname(__file__), ".emoji_cache")
 
-# Full emoji set organized by category - comprehensive iPhone/Android compatible set
-EMOJI_DATA = {
-    "FACES": [
-        # Smileys
-        (0x1F600, "grin"),           # 😀
-        (0x1F603, "smiley"),         # 😃
-        (0x1F604, "smile"),          # 😄
-        (0x1F601, "grin_sweat"),     # 😁
-        (0x1F606, "laugh"),          # 😆
-        (0x1F605, "sweat_smile"),    # 😅
-        (0x1F923, "rofl"),           # 🤣
-        (0x1F602, "joy"),            # 😂
-        (0x1F642, "slight_smile"),   # 🙂
-        (0x1F643, "upside_down"),    # 🙃
-        (0x1F609, "wink"),           # 😉
-        (0x1F60A, "blush"),          # 😊
-        (0x1F607, "innocent"),       # 😇
-        (0x1F970, "smiling_hearts"), # 🥰
-        (0x1F60D, "heart_eyes"),     # 😍
-        (0x1F929, "star_struck"),    # 🤩
-        (0x1F618, "kiss"),           # 😘
-        (0x1F617, "kissing"),        # 😗
-        (0x263A, "relaxed"),         # ☺️
-        (0x1F61A, "kiss_closed"),    # 😚
-        (0x1F619, "kiss_smiling"),   # 😙
-        (0x1F972, "smiling_tear"),   # 🥲
-        (0x1F60B, "yum"),            # 😋
-        (0x1F61B, "tongue_out"),     # 😛
-        (0x1F61C, "wink_tongue"),    # 😜
-        (0x1F92A, "zany"),           # 🤪
-        (0x1F61D, "squint_tongue"),  # 😝
-        (0x1F911, "money_mouth"),    # 🤑
-        (0x1F917, "hugs"),           # 🤗
-        (0x1F92D, "hand_mouth"),     # 🤭
-        (0x1F92B, "shushing"),       # 🤫
-        (0x1F914, "thinking"),       # 🤔
-        (0x1F910, "zipper"),         # 🤐
-        (0x1F928, "raised_brow"),    # 🤨
-        (0x1F610, "neutral"),        # 😐
-        (0x1F611, "expressionless"), # 😑
-        (0x1F636, "no_mouth"),       # 😶
-        (0x1F60F, "smirk"),          # 😏
-        (0x1F612, "unamused"),       # 😒
-        (0x1F644, "eye_roll"),       # 🙄
-        (0x1F62C, "grimace"),        # 😬
-        (0x1F925, "lying"),          # 🤥
-        (0x1F60C, "relieved"),       # 😌
-        (0x1F614, "pensive"),        # 😔
-        (0x1F62A, "sleepy"),         # 😪
-        (0x1F924, "drooling"),       # 🤤
-        (0x1F634, "sleeping"),       # 😴
-        (0x1F637, "mask"),           # 😷
-        (0x1F912, "thermometer"),    # 🤒
-        (0x1F915, "bandage"),        # 🤕
-        (0x1F922, "nauseated"),      # 🤢
-        (0x1F92E, "vomiting"),       # 🤮
-        (0x1F927, "sneezing"),       # 🤧
-        (0x1F975, "hot"),            # 🥵
-        (0x1F976, "cold"),           # 🥶
-        (0x1F974, "woozy"),          # 🥴
-        (0x1F635, "dizzy_face"),     # 😵
-        (0x1F92F, "exploding"),      # 🤯
-        (0x1F920, "cowboy"),         # 🤠
-        (0x1F973, "party"),          # 🥳
-        (0x1F978, "disguised"),      # 🥸
-        (0x1F60E, "sunglasses"),     # 😎
-        (0x1F913, "nerd"),           # 🤓
-        (0x1F9D0, "monocle"),        # 🧐
-        (0x1F615, "confused"),       # 😕
-        (0x1F61F, "worried"),        # 😟
-        (0x1F641, "frown"),          # 🙁
-        (0x2639, "sad"),             # ☹️
-        (0x1F62E, "open_mouth"),     # 😮
-        (0x1F62F, "hushed"),         # 😯
-        (0x1F632, "astonished"),     # 😲
-        (0x1F633, "flushed"),        # 😳
-        (0x1F97A, "pleading"),       # 🥺
-        (0x1F626, "frowning"),       # 😦
-        (0x1F627, "anguished"),      # 😧
-        (0x1F628, "fearful"),        # 😨
-        (0x1F630, "anxious"),        # 😰
-        (0x1F625, "disappointed"),   # 😥
-        (0x1F622, "cry"),            # 😢
-        (0x1F62D, "sob"),            # 😭
-        (0x1F631, "scream"),         # 😱
-        (0x1F616, "confounded"),     # 😖
-        (0x1F623, "persevere"),      # 😣
-        (0x1F61E, "disappointed2"),  # 😞
-        (0x1F613, "sweat"),          # 😓
-        (0x1F629, "weary"),          # 😩
-        (0x1F62B, "tired"),          # 😫
-        (0x1F971, "yawning"),        # 🥱
-        (0x1F624, "triumph"),        # 😤
-        (0x1F621, "rage"),           # 😡
-        (0x1F620, "angry"),          # 😠
-        (0x1F92C, "cursing"),        # 🤬
-        (0x1F608, "smiling_imp"),    # 😈
-        (0x1F47F, "imp"),            # 👿
-        (0x1F480, "skull"),          # 💀
-        (0x2620, "skull_bones"),     # ☠️
-        (0x1F4A9, "poop"),           # 💩
-        (0x1F921, "clown"),          # 🤡
-        (0x1F479, "ogre"),           # 👹
-        (0x1F47A, "goblin"),         # 👺
-        (0x1F47B, "ghost"),          # 👻
-        (0x1F47D, "alien"),          # 👽
-        (0x1F47E, "space_invader"),  # 👾
-        (0x1F916, "robot"),          # 🤖
-        (0x1F63A, "smiley_cat"),     # 😺
-        (0x1F638, "smile_cat"),      # 😸
-        (0x1F639, "joy_cat"),        # 😹
-        (0x1F63B, "heart_eyes_cat"), # 😻
-        (0x1F63C, "smirk_cat"),      # 😼
-        (0x1F63D, "kiss_cat"),       # 😽
-        (0x1F640, "scream_cat"),     # 🙀
-        (0x1F63F, "cry_cat"),        # 😿
-        (0x1F63E, "angry_cat"),      # 😾
-    ],
-    "GESTURES": [
-        (0x1F44B, "wave"),           # 👋
-        (0x1F91A, "raised_back"),    # 🤚
-        (0x1F590, "raised_hand"),    # 🖐️
-        (0x270B, "hand"),            # ✋
-        (0x1F596, "vulcan"),         # 🖖
-        (0x1F44C, "ok_hand"),        # 👌
-        (0x1F90C, "pinched"),        # 🤌
-        (0x1F90F, "pinching"),       # 🤏
-        (0x270C, "v"),               # ✌️
-        (0x1F91E, "crossed_fingers"),  # 🤞
-        (0x1F91F, "love_you"),       # 🤟
-        (0x1F918, "horns"),          # 🤘
-        (0x1F919, "call_me"),        # 🤙
-        (0x1F448, "point_left"),     # 👈
-        (0x1F449, "point_right"),    # 👉
-        (0x1F446, "point_up2"),      # 👆
-        (0x1F595, "middle_finger"),  # 🖕
-        (0x1F447, "point_down"),     # 👇
-        (0x261D, "point_up"),        # ☝️
-        (0x1F44D, "thumbsup"),       # 👍
-        (0x1F44E, "thumbsdown"),     # 👎
-        (0x270A, "fist"),            # ✊
-        (0x1F44A, "punch"),          # 👊
-        (0x1F91B, "left_fist"),      # 🤛
-        (0x1F91C, "right_fist"),     # 🤜
-        (0x1F44F, "clap"),           # 👏
-        (0x1F64C, "raised_hands"),   # 🙌
-        (0x1F450, "open_hands"),     # 👐
-        (0x1F932, "palms_up"),       # 🤲
-        (0x1F91D, "handshake"),      # 🤝
-        (0x1F64F, "pray"),           # 🙏
-        (0x270D, "writing"),         # ✍️
-        (0x1F485, "nail_polish"),    # 💅
-        (0x1F933, "selfie"),         # 🤳
-        (0x1F4AA, "muscle"),         # 💪
-        (0x1F9BE, "mech_arm"),       # 🦾
-        (0x1F9BF, "mech_leg"),       # 🦿
-        (0x1F9B5, "leg"),            # 🦵
-        (0x1F9B6, "foot"),           # 🦶
-        (0x1F442, "ear"),            # 👂
-        (0x1F9BB, "ear_aid"),        # 🦻
-        (0x1F443, "nose"),           # 👃
-        (0x1F9E0, "brain"),          # 🧠
-        (0x1F9B7, "tooth"),          # 🦷
-        (0x1F9B4, "bone"),           # 🦴
-        (0x1F440, "eyes"),           # 👀
-        (0x1F441, "eye"),            # 👁️
-        (0x1F445, "tongue"),         # 👅
-        (0x1F444, "lips"),           # 👄
-    ],
-    "PEOPLE": [
-        (0x1F476, "baby"),           # 👶
-        (0x1F9D2, "child"),          # 🧒
-        (0x1F466, "boy"),            # 👦
-        (0x1F467, "girl"),           # 👧
-        (0x1F9D1, "person"),         # 🧑
-        (0x1F471, "blond"),          # 👱
-        (0x1F468, "man"),            # 👨
-        (0x1F9D4, "beard"),          # 🧔
-        (0x1F469, "woman"),          # 👩
-        (0x1F9D3, "older_person"),   # 🧓
-        (0x1F474, "old_man"),        # 👴
-        (0x1F475, "old_woman"),      # 👵
-        (0x1F64D, "person_frown"),   # 🙍
-        (0x1F64E, "person_pout"),    # 🙎
-        (0x1F645, "no_good"),        # 🙅
-        (0x1F646, "ok_person"),      # 🙆
-        (0x1F481, "tipping_hand"),   # 💁
-        (0x1F64B, "raising_hand"),   # 🙋
-        (0x1F9CF, "deaf_person"),    # 🧏
-        (0x1F647, "person_bow"),     # 🙇
-        (0x1F926, "facepalm"),       # 🤦
-        (0x1F937, "shrug"),          # 🤷
-        (0x1F46E, "cop"),            # 👮
-        (0x1F575, "detective"),      # 🕵️
-        (0x1F482, "guard"),          # 💂
-        (0x1F977, "ninja"),          # 🥷
-        (0x1F477, "construction_worker"),  # 👷
-        (0x1F934, "prince"),         # 🤴
-        (0x1F478, "princess"),       # 👸
-        (0x1F473, "turban"),         # 👳
-        (0x1F472, "man_cap"),        # 👲
-        (0x1F9D5, "headscarf"),      # 🧕
-        (0x1F935, "tuxedo"),         # 🤵
-        (0x1F470, "bride"),          # 👰
-        (0x1F930, "pregnant"),       # 🤰
-        (0x1F931, "breastfeeding"),  # 🤱
-        (0x1F47C, "angel"),          # 👼
-        (0x1F385, "santa"),          # 🎅
-        (0x1F936, "mrs_claus"),      # 🤶
-        (0x1F9B8, "superhero"),      # 🦸
-        (0x1F9B9, "supervillain"),   # 🦹
-        (0x1F9D9, "mage"),           # 🧙
-        (0x1F9DA, "fairy"),          # 🧚
-        (0x1F9DB, "vampire"),        # 🧛
-        (0x1F9DC, "merperson"),      # 🧜
-        (0x1F9DD, "elf"),            # 🧝
-        (0x1F9DE, "genie"),          # 🧞
-        (0x1F9DF, "zombie"),         # 🧟
-    ],
-    "HEARTS": [
-        (0x2764, "heart"),           # ❤️
-        (0x1F9E1, "orange_heart"),   # 🧡
-        (0x1F49B, "yellow_heart"),   # 💛
-        (0x1F49A, "green_heart"),    # 💚
-        (0x1F499, "blue_heart"),     # 💙
-        (0x1F49C, "purple_heart"),   # 💜
-        (0x1F90E, "brown_heart"),    # 🤎
-        (0x1F5A4, "black_heart"),    # 🖤
-        (0x1F90D, "white_heart"),    # 🤍
-        (0x1F494, "broken_heart"),   # 💔
-        (0x2763, "heart_excl"),      # ❣️
-        (0x1F495, "two_hearts"),     # 💕
-        (0x1F49E, "revolving"),      # 💞
-        (0x1F493, "heartbeat"),      # 💓
-        (0x1F497, "heartpulse"),     # 💗
-        (0x1F496, "sparkling"),      # 💖
-        (0x1F498, "cupid"),          # 💘
-        (0x1F49D, "gift_heart"),     # 💝
-        (0x1F49F, "heart_decor"),    # 💟
-        (0x2665, "hearts_suit"),     # ♥️
-        (0x1F48B, "kiss_mark"),      # 💋
-        (0x1F48C, "love_letter"),    # 💌
-        (0x1F48D, "ring"),           # 💍
-        (0x1F48E, "gem"),            # 💎
-        (0x1F490, "bouquet"),        # 💐
-        (0x1F339, "rose"),           # 🌹
-        (0x1F940, "wilted"),         # 🥀
-        (0x1F33A, "hibiscus"),       # 🌺
-        (0x1F337, "tulip"),          # 🌷
-        (0x1F338, "cherry_blossom"), # 🌸
-    ],
-    "ANIMALS": [
-        (0x1F436, "dog"),            # 🐶
-        (0x1F431, "cat"),            # 🐱
-        (0x1F42D, "mouse"),          # 🐭
-        (0x1F439, "hamster"),        # 🐹
-        (0x1F430, "rabbit"),         # 🐰
-        (0x1F98A, "fox"),            # 🦊
-        (0x1F43B, "bear"),           # 🐻
-        (0x1F43C, "panda"),          # 🐼
-        (0x1F428, "koala"),          # 🐨
-        (0x1F42F, "tiger"),          # 🐯
-        (0x1F981, "lion"),           # 🦁
-        (0x1F42E, "cow"),            # 🐮
-        (0x1F437, "pig"),            # 🐷
-        (0x1F438, "frog"),           # 🐸
-        (0x1F435, "monkey"),         # 🐵
-        (0x1F648, "see_no_evil"),    # 🙈
-        (0x1F649, "hear_no_evil"),   # 🙉
-        (0x1F64A, "speak_no_evil"),  # 🙊
-        (0x1F412, "monkey2"),        # 🐒
-        (0x1F414, "chicken"),        # 🐔
-        (0x1F427, "penguin"),        # 🐧
-        (0x1F426, "bird"),           # 🐦
-        (0x1F424, "chick"),          # 🐤
-        (0x1F986, "duck"),           # 🦆
-        (0x1F985, "eagle"),          # 🦅
-        (0x1F989, "owl"),            # 🦉
-        (0x1F987, "bat"),            # 🦇
-        (0x1F43A, "wolf"),           # 🐺
-        (0x1F417, "boar"),           # 🐗
-        (0x1F434, "horse"),          # 🐴
-        (0x1F984, "unicorn"),        # 🦄
-        (0x1F41D, "bee"),            # 🐝
-        (0x1F41B, "bug"),            # 🐛
-        (0x1F98B, "butterfly"),      # 🦋
-        (0x1F40C, "snail"),          # 🐌
-        (0x1F41E, "ladybug"),        # 🐞
-        (0x1F41C, "ant"),            # 🐜
-        (0x1F422, "turtle"),         # 🐢
-        (0x1F40D, "snake"),          # 🐍
-        (0x1F409, "dragon"),         # 🐉
-        (0x1F432, "dragon_face"),    # 🐲
-        (0x1F995, "sauropod"),       # 🦕
-        (0x1F996, "t_rex"),          # 🦖
-        (0x1F433, "whale"),          # 🐳
-        (0x1F42C, "dolphin"),        # 🐬
-        (0x1F41F, "fish"),           # 🐟
-        (0x1F420, "trop_fish"),      # 🐠
-        (0x1F421, "blowfish"),       # 🐡
-        (0x1F988, "shark"),          # 🦈
-        (0x1F419, "octopus"),        # 🐙
-        (0x1F41A, "shell"),          # 🐚
-        (0x1F40B, "whale2"),         # 🐋
-        (0x1F40A, "crocodile"),      # 🐊
-        (0x1F406, "leopard"),        # 🐆
-        (0x1F405, "tiger2"),         # 🐅
-        (0x1F403, "water_buffalo"),  # 🐃
-        (0x1F402, "ox"),             # 🐂
-        (0x1F404, "cow2"),           # 🐄
-        (0x1F98C, "deer"),           # 🦌
-        (0x1F42A, "camel"),          # 🐪
-        (0x1F42B, "camel2"),         # 🐫
-        (0x1F999, "llama"),          # 🦙
-        (0x1F992, "giraffe"),        # 🦒
-        (0x1F418, "elephant"),       # 🐘
-        (0x1F98F, "rhino"),          # 🦏
-        (0x1F99B, "hippo"),          # 🦛
-        (0x1F401, "mouse2"),         # 🐁
-        (0x1F400, "rat"),            # 🐀
-        (0x1F407, "rabbit2"),        # 🐇
-        (0x1F43F, "chipmunk"),       # 🐿️
-        (0x1F994, "hedgehog"),       # 🦔
-        (0x1F9A1, "badger"),         # 🦡
-        (0x1F43E, "paw_prints"),     # 🐾
-    ],
-    "FOOD": [
-        (0x1F34E, "apple"),          # 🍎
-        (0x1F34F, "green_apple"),    # 🍏
-        (0x1F350, "pear"),           # 🍐
-        (0x1F34A, "orange"),         # 🍊
-        (0x1F34B, "lemon"),          # 🍋
-        (0x1F34C, "banana"),         # 🍌
-        (0x1F349, "watermelon"),     # 🍉
-        (0x1F347, "grapes"),         # 🍇
-        (0x1F353, "strawberry"),     # 🍓
-        (0x1FAD0, "blueberries"),    # 🫐
-        (0x1F352, "cherries"),       # 🍒
-        (0x1F351, "peach"),          # 🍑
-        (0x1F96D, "mango"),          # 🥭
-        (0x1F34D, "pineapple"),      # 🍍
-        (0x1F965, "coconut"),        # 🥥
-        (0x1F95D, "kiwi"),           # 🥝
-        (0x1F345, "tomato"),         # 🍅
-        (0x1F346, "eggplant"),       # 🍆
-        (0x1F951, "avocado"),        # 🥑
-        (0x1F966, "broccoli"),       # 🥦
-        (0x1F96C, "leafy_green"),    # 🥬
-        (0x1F952, "cucumber"),       # 🥒
-        (0x1F336, "hot_pepper"),     # 🌶️
-        (0x1F33D, "corn"),           # 🌽
-        (0x1F955, "carrot"),         # 🥕
-        (0x1F9C4, "garlic"),         # 🧄
-        (0x1F9C5, "onion"),          # 🧅
-        (0x1F954, "potato"),         # 🥔
-        (0x1F360, "potato2"),        # 🍠
-        (0x1F950, "croissant"),      # 🥐
-        (0x1F35E, "bread"),          # 🍞
-        (0x1F956, "baguette"),       # 🥖
-        (0x1FAD3, "flatbread"),      # 🫓
-        (0x1F968, "pretzel"),        # 🥨
-        (0x1F96F, "bagel"),          # 🥯
-        (0x1F95E, "pancakes"),       # 🥞
-        (0x1F9C7, "waffle"),         # 🧇
-        (0x1F9C0, "cheese"),         # 🧀
-        (0x1F356, "meat"),           # 🍖
-        (0x1F357, "poultry"),        # 🍗
-        (0x1F969, "steak"),          # 🥩
-        (0x1F953, "bacon"),          # 🥓
-        (0x1F354, "hamburger"),      # 🍔
-        (0x1F35F, "fries"),          # 🍟
-        (0x1F355, "pizza"),          # 🍕
-        (0x1F32D, "hotdog"),         # 🌭
-        (0x1F96A, "sandwich"),       # 🥪
-        (0x1F32E, "taco"),           # 🌮
-        (0x1F32F, "burrito"),        # 🌯
-        (0x1FAD4, "tamale"),         # 🫔
-        (0x1F959, "falafel"),        # 🥙
-        (0x1F95A, "egg"),            # 🥚
-        (0x1F373, "cooking"),        # 🍳
-        (0x1F958, "paella"),         # 🥘
-        (0x1F372, "stew"),           # 🍲
-        (0x1FAD5, "fondue"),         # 🫕
-        (0x1F963, "bowl"),           # 🥣
-        (0x1F957, "salad"),          # 🥗
-        (0x1F37F, "popcorn"),        # 🍿
-        (0x1F9C8, "butter"),         # 🧈
-        (0x1F9C2, "salt"),           # 🧂
-        (0x1F35C, "ramen"),          # 🍜
-        (0x1F35D, "spaghetti"),      # 🍝
-        (0x1F35B, "curry"),          # 🍛
-        (0x1F35A, "rice"),           # 🍚
-        (0x1F359, "rice_ball"),      # 🍙
-        (0x1F358, "rice_cracker"),   # 🍘
-        (0x1F365, "fish_cake"),      # 🍥
-        (0x1F960, "fortune"),        # 🥠
-        (0x1F961, "takeout"),        # 🥡
-        (0x1F366, "icecream"),       # 🍦
-        (0x1F367, "shaved_ice"),     # 🍧
-        (0x1F368, "ice_cream"),      # 🍨
-        (0x1F369, "doughnut"),       # 🍩
-        (0x1F36A, "cookie"),         # 🍪
-        (0x1F382, "birthday"),       # 🎂
-        (0x1F370, "cake"),           # 🍰
-        (0x1F9C1, "cupcake"),        # 🧁
-        (0x1F967, "pie"),            # 🥧
-        (0x1F36B, "chocolate"),      # 🍫
-        (0x1F36C, "candy"),          # 🍬
-        (0x1F36D, "lollipop"),       # 🍭
-        (0x1F36E, "custard"),        # 🍮
-        (0x1F36F, "honey"),          # 🍯
-        (0x1F37C, "bottle"),         # 🍼
-        (0x1F95B, "milk"),           # 🥛
-        (0x2615, "coffee"),          # ☕
-        (0x1FAD6, "teapot"),         # 🫖
-        (0x1F375, "tea"),            # 🍵
-        (0x1F376, "sake"),           # 🍶
-        (0x1F37E, "champagne"),      # 🍾
-        (0x1F377, "wine"),           # 🍷
-        (0x1F378, "cocktail"),       # 🍸
-        (0x1F379, "tropical"),       # 🍹
-        (0x1F37A, "beer"),           # 🍺
-        (0x1F37B, "beers"),          # 🍻
-        (0x1F942, "clinking"),       # 🥂
-        (0x1F943, "tumbler"),        # 🥃
-        (0x1F964, "cup_straw"),      # 🥤
-        (0x1F9CB, "bubble_tea"),     # 🧋
-        (0x1F9C3, "juice"),          # 🧃
-        (0x1F9C9, "mate"),           # 🧉
-        (0x1F9CA, "ice"),            # 🧊
-    ],
-    "ACTIVITIES": [
-        (0x26BD, "soccer"),          # ⚽
-        (0x1F3C0, "basketball"),     # 🏀
-        (0x1F3C8, "football"),       # 🏈
-        (0x26BE, "baseball"),        # ⚾
-        (0x1F94E, "softball"),       # 🥎
-        (0x1F3BE, "tennis"),         # 🎾
-        (0x1F3D0, "volleyball"),     # 🏐
-        (0x1F3C9, "rugby"),          # 🏉
-        (0x1F94F, "flying_disc"),    # 🥏
-        (0x1F3B1, "billiards"),      # 🎱
-        (0x1F3D3, "ping_pong"),      # 🏓
-        (0x1F3F8, "badminton"),      # 🏸
-        (0x1F3D2, "hockey"),         # 🏒
-        (0x1F3D1, "field_hockey"),   # 🏑
-        (0x1F94D, "lacrosse"),       # 🥍
-        (0x1F3CF, "cricket"),        # 🏏
-        (0x1F945, "goal"),           # 🥅
-        (0x26F3, "golf"),            # ⛳
-        (0x1F3F9, "bow_arrow"),      # 🏹
-        (0x1F3A3, "fishing"),        # 🎣
-        (0x1F93F, "diving"),         # 🤿
-        (0x1F3BD, "running_shirt"),  # 🎽
-        (0x1F6F9, "skateboard"),     # 🛹
-        (0x1F6FC, "roller_skate"),   # 🛼
-        (0x1F94C, "curling"),        # 🥌
-        (0x26F7, "ski"),             # ⛷️
-        (0x1F3BF, "skis"),           # 🎿
-        (0x1F3C2, "snowboard"),      # 🏂
-        (0x1F3CB, "weight_lift"),    # 🏋️
-        (0x1F93C, "wrestling"),      # 🤼
-        (0x1F938, "cartwheeling"),   # 🤸
-        (0x1F93A, "fencing"),        # 🤺
-        (0x1F93E, "handball"),       # 🤾
-        (0x1F3CC, "golfing"),        # 🏌️
-        (0x1F3C7, "horse_racing"),   # 🏇
-        (0x1F9D8, "yoga"),           # 🧘
-        (0x1F3AF, "dart"),           # 🎯
-        (0x1FA80, "yoyo"),           # 🪀
-        (0x1FA81, "kite"),           # 🪁
-        (0x1F3B0, "slot"),           # 🎰
-        (0x1F3B2, "dice"),           # 🎲
-        (0x1F9E9, "puzzle"),         # 🧩
-        (0x1F9F8, "teddy"),          # 🧸
-        (0x1FA86, "nesting"),        # 🪆
-        (0x2660, "spades"),          # ♠️
-        (0x2665, "hearts"),          # ♥️
-        (0x2666, "diamonds"),        # ♦️
-        (0x2663, "clubs"),           # ♣️
-        (0x265F, "chess"),           # ♟️
-        (0x1F0CF, "joker"),          # 🃏
-        (0x1F004, "mahjong"),        # 🀄
-        (0x1F3AD, "masks"),          # 🎭
-        (0x1F3A8, "art"),            # 🎨
-        (0x1F3C6, "trophy"),         # 🏆
-        (0x1F3C5, "medal"),          # 🏅
-        (0x1F947, "first_place"),    # 🥇
-        (0x1F948, "second_place"),   # 🥈
-        (0x1F949, "third_place"),    # 🥉
-        (0x1F94A, "boxing"),         # 🥊
-        (0x1F94B, "martial_arts"),   # 🥋
-        (0x1F3AE, "video_game"),     # 🎮
-        (0x1F579, "joystick"),       # 🕹️
-        (0x1F3B9, "piano"),          # 🎹
-        (0x1F3B7, "saxophone"),      # 🎷
-        (0x1F3BA, "trumpet"),        # 🎺
-        (0x1F3B8, "guitar"),         # 🎸
-        (0x1FA95, "banjo"),          # 🪕
-        (0x1F3BB, "violin"),         # 🎻
-        (0x1FA98, "accordion"),      # 🪘
-        (0x1F941, "drum"),           # 🥁
-        (0x1FA97, "maracas"),        # 🪇
-        (0x1F3BC, "music_score"),    # 🎼
-        (0x1F3A4, "microphone"),     # 🎤
-        (0x1F3A7, "headphones"),     # 🎧
-        (0x1F4FB, "radio"),          # 📻
-    ],
-    "TRAVEL": [
-        (0x1F697, "car"),            # 🚗
-        (0x1F695, "taxi"),           # 🚕
-        (0x1F699, "suv"),            # 🚙
-        (0x1F68C, "bus"),            # 🚌
-        (0x1F68E, "trolley"),        # 🚎
-        (0x1F3CE, "race_car"),       # 🏎️
-        (0x1F693, "police_car"),     # 🚓
-        (0x1F691, "ambulance"),      # 🚑
-        (0x1F692, "fire_engine"),    # 🚒
-        (0x1F690, "minibus"),        # 🚐
-        (0x1F6FB, "pickup"),         # 🛻
-        (0x1F69A, "truck"),          # 🚚
-        (0x1F69B, "semi"),           # 🚛
-        (0x1F69C, "tractor"),        # 🚜
-        (0x1F3CD, "motorcycle"),     # 🏍️
-        (0x1F6F5, "scooter"),        # 🛵
-        (0x1F6B2, "bicycle"),        # 🚲
-        (0x1F6F4, "kick_scooter"),   # 🛴
-        (0x1F6FA, "auto_rick"),      # 🛺
-        (0x1F6A8, "police_light"),   # 🚨
-        (0x1F694, "police_car2"),    # 🚔
-        (0x1F68D, "bus2"),           # 🚍
-        (0x1F698, "car2"),           # 🚘
-        (0x1F696, "taxi2"),          # 🚖
-        (0x1F682, "train"),          # 🚂
-        (0x1F683, "railway"),        # 🚃
-        (0x1F684, "bullet"),         # 🚄
-        (0x1F685, "bullet2"),        # 🚅
-        (0x1F686, "train2"),         # 🚆
-        (0x1F687, "metro"),          # 🚇
-        (0x1F688, "light_rail"),     # 🚈
-        (0x1F689, "station"),        # 🚉
-        (0x1F68A, "tram"),           # 🚊
-        (0x1F69D, "monorail"),       # 🚝
-        (0x1F69E, "mountain_rail"),  # 🚞
-        (0x1F69F, "suspension"),     # 🚟
-        (0x1F6A0, "aerial"),         # 🚠
-        (0x1F6A1, "gondola"),        # 🚡
-        (0x1F681, "helicopter"),     # 🚁
-        (0x2708, "airplane"),        # ✈️
-        (0x1F6E9, "small_plane"),    # 🛩️
-        (0x1F6EB, "departure"),      # 🛫
-        (0x1F6EC, "arrival"),        # 🛬
-        (0x1FA82, "parachute"),      # 🪂
-        (0x1F4BA, "seat"),           # 💺
-        (0x1F680, "rocket"),         # 🚀
-        (0x1F6F8, "ufo"),            # 🛸
-        (0x1F6F0, "satellite"),      # 🛰️
-        (0x1F6A2, "ship"),           # 🚢
-        (0x26F5, "sailboat"),        # ⛵
-        (0x1F6F6, "canoe"),          # 🛶
-        (0x1F6A4, "speedboat"),      # 🚤
-        (0x1F6F3, "ferry"),          # 🛳️
-        (0x26F4, "ferry2"),          # ⛴️
-        (0x1F6A3, "rowing"),         # 🚣
-        (0x2693, "anchor"),          # ⚓
-        (0x26FD, "fuel"),            # ⛽
-        (0x1F6A7, "construction"),   # 🚧
-        (0x1F6A6, "traffic"),        # 🚦
-        (0x1F6A5, "traffic2"),       # 🚥
-        (0x1F68F, "bus_stop"),       # 🚏
-        (0x1F5FA, "world_map"),      # 🗺️
-        (0x1F5FF, "moyai"),          # 🗿
-        (0x1F5FD, "liberty"),        # 🗽
-        (0x1F5FC, "tokyo_tower"),    # 🗼
-        (0x1F3F0, "castle"),         # 🏰
-        (0x1F3EF, "japanese_castle"),# 🏯
-        (0x1F3E0, "house"),          # 🏠
-        (0x1F3E1, "house_garden"),   # 🏡
-        (0x1F3E2, "office"),         # 🏢
-        (0x1F3E3, "post_office"),    # 🏣
-        (0x1F3E4, "post_office2"),   # 🏤
-        (0x1F3E5, "hospital"),       # 🏥
-        (0x1F3E6, "bank"),           # 🏦
-        (0x1F3E8, "hotel"),          # 🏨
-        (0x1F3E9, "love_hotel"),     # 🏩
-        (0x1F3EA, "store"),          # 🏪
-        (0x1F3EB, "school"),         # 🏫
-        (0x1F3EC, "department"),     # 🏬
-        (0x1F3ED, "factory"),        # 🏭
-        (0x26EA, "church"),          # ⛪
-        (0x1F54C, "mosque"),         # 🕌
-        (0x1F54D, "synagogue"),      # 🕍
-        (0x26E9, "shinto"),          # ⛩️
-        (0x1F54B, "kaaba"),          # 🕋
-        (0x26F2, "fountain"),        # ⛲
-        (0x26FA, "tent"),            # ⛺
-        (0x1F30B, "volcano"),        # 🌋
-        (0x1F3D4, "mountain_snow"),  # 🏔️
-        (0x1F3D5, "camping"),        # 🏕️
-        (0x1F3D6, "beach"),          # 🏖️
-        (0x1F3DC, "desert"),         # 🏜️
-        (0x1F3DD, "island"),         # 🏝️
-        (0x1F3DE, "park"),           # 🏞️
-        (0x1F3DF, "stadium"),        # 🏟️
-        (0x1F3DB, "classical"),      # 🏛️
-        (0x1F3DA, "derelict"),       # 🏚️
-        (0x1F3D7, "construction2"),  # 🏗️
-        (0x1F3D8, "houses"),         # 🏘️
-        (0x1F3D9, "cityscape"),      # 🏙️
-    ],
-    "OBJECTS": [
-        (0x231A, "watch"),           # ⌚
-        (0x1F4F1, "phone"),          # 📱
-        (0x1F4F2, "calling"),        # 📲
-        (0x1F4BB, "laptop"),         # 💻
-        (0x2328, "keyboard"),        # ⌨️
-        (0x1F5A5, "computer"),       # 🖥️
-        (0x1F5A8, "printer"),        # 🖨️
-        (0x1F5B1, "computer_mouse"), # 🖱️
-        (0x1F5B2, "trackball"),      # 🖲️
-        (0x1F4BD, "minidisc"),       # 💽
-        (0x1F4BE, "floppy"),         # 💾
-        (0x1F4BF, "cd"),             # 💿
-        (0x1F4C0, "dvd"),            # 📀
-        (0x1F9EE, "abacus"),         # 🧮
-        (0x1F3A5, "film"),           # 🎥
-        (0x1F39E, "film_frames"),    # 🎞️
-        (0x1F4FD, "projector"),      # 📽️
-        (0x1F3AC, "clapper"),        # 🎬
-        (0x1F4F7, "camera"),         # 📷
-        (0x1F4F8, "camera_flash"),   # 📸
-        (0x1F4F9, "video_camera"),   # 📹
-        (0x1F4FC, "vhs"),            # 📼
-        (0x1F50D, "mag"),            # 🔍
-        (0x1F50E, "mag_right"),      # 🔎
-        (0x1F56F, "candle"),         # 🕯️
-        (0x1F4A1, "bulb"),           # 💡
-        (0x1F526, "flashlight"),     # 🔦
-        (0x1F3EE, "lantern"),        # 🏮
-        (0x1FA94, "lamp"),           # 🪔
-        (0x1F4D4, "notebook"),       # 📔
-        (0x1F4D5, "book_closed"),    # 📕
-        (0x1F4D6, "book_open"),      # 📖
-        (0x1F4D7, "green_book"),     # 📗
-        (0x1F4D8, "blue_book"),      # 📘
-        (0x1F4D9, "orange_book"),    # 📙
-        (0x1F4DA, "books"),          # 📚
-        (0x1F4D3, "notebook2"),      # 📓
-        (0x1F4D2, "ledger"),         # 📒
-        (0x1F4C3, "page_curl"),      # 📃
-        (0x1F4DC, "scroll"),         # 📜
-        (0x1F4C4, "page"),           # 📄
-        (0x1F4F0, "newspaper"),      # 📰
-        (0x1F5DE, "newspaper2"),     # 🗞️
-        (0x1F4D1, "bookmark_tabs"),  # 📑
-        (0x1F516, "bookmark"),       # 🔖
-        (0x1F3F7, "label"),          # 🏷️
-        (0x1F4B0, "money_bag"),      # 💰
-        (0x1FA99, "coin"),           # 🪙
-        (0x1F4B4, "yen"),            # 💴
-        (0x1F4B5, "dollar"),         # 💵
-        (0x1F4B6, "euro"),           # 💶
-        (0x1F4B7, "pound"),          # 💷
-        (0x1F4B8, "money_wings"),    # 💸
-        (0x1F4B3, "credit_card"),    # 💳
-        (0x1F9FE, "receipt"),        # 🧾
-        (0x1F4B9, "chart"),          # 💹
-        (0x2709, "envelope"),        # ✉️
-        (0x1F4E7, "email"),          # 📧
-        (0x1F4E8, "incoming"),       # 📨
-        (0x1F4E9, "outbox"),         # 📩
-        (0x1F4E4, "outbox2"),        # 📤
-        (0x1F4E5, "inbox"),          # 📥
-        (0x1F4E6, "package"),        # 📦
-        (0x1F4EB, "mailbox"),        # 📫
-        (0x1F4EA, "mailbox2"),       # 📪
-        (0x1F4EC, "mailbox3"),       # 📬
-        (0x1F4ED, "mailbox4"),       # 📭
-        (0x1F4EE, "postbox"),        # 📮
-        (0x1F5F3, "ballot"),         # 🗳️
-        (0x270F, "pencil"),          # ✏️
-        (0x2712, "nib"),             # ✒️
-        (0x1F58B, "pen"),            # 🖋️
-        (0x1F58A, "pen2"),           # 🖊️
-        (0x1F58C, "brush"),          # 🖌️
-        (0x1F58D, "crayon"),         # 🖍️
-        (0x1F4DD, "memo"),           # 📝
-        (0x1F4BC, "briefcase"),      # 💼
-        (0x1F4C1, "folder"),         # 📁
-        (0x1F4C2, "folder_open"),    # 📂
-        (0x1F5C2, "dividers"),       # 🗂️
-        (0x1F4C5, "calendar"),       # 📅
-        (0x1F4C6, "calendar2"),      # 📆
-        (0x1F5D2, "spiral_note"),    # 🗒️
-        (0x1F5D3, "spiral_cal"),     # 🗓️
-        (0x1F4C7, "rolodex"),        # 📇
-        (0x1F4C8, "chart_up"),       # 📈
-        (0x1F4C9, "chart_down"),     # 📉
-        (0x1F4CA, "bar_chart"),      # 📊
-        (0x1F4CB, "clipboard"),      # 📋
-        (0x1F4CC, "pushpin"),        # 📌
-        (0x1F4CD, "pin"),            # 📍
-        (0x1F4CE, "paperclip"),      # 📎
-        (0x1F587, "paperclips"),     # 🖇️
-        (0x1F4CF, "ruler"),          # 📏
-        (0x1F4D0, "ruler2"),         # 📐
-        (0x2702, "scissors"),        # ✂️
-        (0x1F5C3, "card_box"),       # 🗃️
-        (0x1F5C4, "cabinet"),        # 🗄️
-        (0x1F5D1, "wastebasket"),    # 🗑️
-        (0x1F512, "lock"),           # 🔒
-        (0x1F513, "unlock"),         # 🔓
-        (0x1F50F, "lock_pen"),       # 🔏
-        (0x1F510, "lock_key"),       # 🔐
-        (0x1F511, "key"),            # 🔑
-        (0x1F5DD, "old_key"),        # 🗝️
-        (0x1F528, "hammer"),         # 🔨
-        (0x1FA93, "axe"),            # 🪓
-        (0x26CF, "pick"),            # ⛏️
-        (0x2692, "hammer_pick"),     # ⚒️
-        (0x1F6E0, "tools"),          # 🛠️
-        (0x1F5E1, "dagger"),         # 🗡️
-        (0x2694, "swords"),          # ⚔️
-        (0x1F52B, "gun"),            # 🔫
-        (0x1FA83, "boomerang"),      # 🪃
-        (0x1F3F9, "bow2"),           # 🏹
-        (0x1F6E1, "shield"),         # 🛡️
-        (0x1FA9A, "carpentry"),      # 🪚
-        (0x1F527, "wrench"),         # 🔧
-        (0x1FA9B, "screwdriver"),    # 🪛
-        (0x1F529, "nut_bolt"),       # 🔩
-        (0x2699, "gear"),            # ⚙️
-        (0x1F5DC, "clamp"),          # 🗜️
-        (0x2696, "scales"),          # ⚖️
-        (0x1F9AF, "cane"),           # 🦯
-        (0x1F517, "link"),           # 🔗
-        (0x26D3, "chains"),          # ⛓️
-        (0x1FA9D, "hook"),           # 🪝
-        (0x1F9F0, "toolbox"),        # 🧰
-        (0x1F9F2, "magnet"),         # 🧲
-        (0x1FA9C, "ladder"),         # 🪜
-        (0x2697, "alembic"),         # ⚗️
-        (0x1F9EA, "test_tube"),      # 🧪
-        (0x1F9EB, "petri"),          # 🧫
-        (0x1F9EC, "dna"),            # 🧬
-        (0x1F52C, "microscope"),     # 🔬
-        (0x1F52D, "telescope"),      # 🔭
-        (0x1F4E1, "satellite2"),     # 📡
-        (0x1F489, "syringe"),        # 💉
-        (0x1FA78, "drop_blood"),     # 🩸
-        (0x1F48A, "pill"),           # 💊
-        (0x1FA79, "adhesive_bandage"),  # 🩹
-        (0x1FA7A, "stethoscope"),    # 🩺
-        (0x1F6AA, "door"),           # 🚪
-        (0x1F6D7, "elevator"),       # 🛗
-        (0x1FA9E, "mirror"),         # 🪞
-        (0x1FA9F, "window"),         # 🪟
-        (0x1F6CF, "bed"),            # 🛏️
-        (0x1F6CB, "couch"),          # 🛋️
-        (0x1FA91, "chair"),          # 🪑
-        (0x1F6BD, "toilet"),         # 🚽
-        (0x1FAA0, "plunger"),        # 🪠
-        (0x1F6BF, "shower"),         # 🚿
-        (0x1F6C1, "bathtub"),        # 🛁
-        (0x1FAA4, "mousetrap"),      # 🪤
-        (0x1FA92, "razor"),          # 🪒
-        (0x1F9F4, "lotion"),         # 🧴
-        (0x1F9F7, "safety_pin"),     # 🧷
-        (0x1F9F9, "broom"),          # 🧹
-        (0x1F9FA, "basket"),         # 🧺
-        (0x1F9FB, "roll"),           # 🧻
-        (0x1FAA3, "bucket"),         # 🪣
-        (0x1F9FC, "soap"),           # 🧼
-        (0x1FAE7, "bubbles"),        # 🫧
-        (0x1FAA5, "toothbrush"),     # 🪥
-        (0x1F9FD, "sponge"),         # 🧽
-        (0x1F9EF, "extinguisher"),   # 🧯
-        (0x1F6D2, "cart"),           # 🛒
-        (0x1F6AC, "cigarette"),      # 🚬
-        (0x26B0, "coffin"),          # ⚰️
-        (0x1FAA6, "headstone"),      # 🪦
-        (0x26B1, "urn"),             # ⚱️
-        (0x1F5FF, "moai"),           # 🗿
-        (0x1FAA7, "placard"),        # 🪧
-        (0x1FAA8, "rock"),           # 🪨
-    ],
-    "SYMBOLS": [
-        (0x2705, "check"),           # ✅
-        (0x274C, "cross"),           # ❌
-        (0x274E, "cross_neg"),       # ❎
-        (0x2795, "plus"),            # ➕
-        (0x2796, "minus"),           # ➖
-        (0x2797, "divide"),          # ➗
-        (0x27B0, "curly_loop"),      # ➰
-        (0x27BF, "double_loop"),     # ➿
-        (0x2B50, "star"),            # ⭐
-        (0x1F31F, "star2"),          # 🌟
-        (0x2728, "sparkles"),        # ✨
-        (0x1F4AB, "dizzy"),          # 💫
-        (0x1F4A5, "boom"),           # 💥
-        (0x1F4A2, "anger"),          # 💢
-        (0x1F4A6, "sweat_drops"),    # 💦
-        (0x1F4A8, "dash"),           # 💨
-        (0x1F573, "hole"),           # 🕳️
-        (0x1F4AC, "speech"),         # 💬
-        (0x1F5E8, "left_speech"),    # 🗨️
-        (0x1F5EF, "speech_right"),   # 🗯️
-        (0x1F4AD, "thought"),        # 💭
-        (0x1F4A4, "zzz"),            # 💤
-        (0x1F525, "fire"),           # 🔥
-        (0x1F4AF, "100"),            # 💯
-        (0x1F389, "tada"),           # 🎉
-        (0x1F38A, "confetti"),       # 🎊
-        (0x1F388, "balloon"),        # 🎈
-        (0x1F381, "gift"),           # 🎁
-        (0x1F380, "ribbon"),         # 🎀
-        (0x1F397, "reminder"),       # 🎗️
-        (0x1F39F, "tickets"),        # 🎟️
-        (0x1F3AB, "ticket"),         # 🎫
-        (0x1F396, "military"),       # 🎖️
-        (0x26A1, "zap"),             # ⚡
-        (0x1F300, "cyclone"),        # 🌀
-        (0x1F308, "rainbow"),        # 🌈
-        (0x2602, "umbrella2"),       # ☂️
-        (0x2614, "umbrella"),        # ☔
-        (0x2604, "comet"),           # ☄️
-        (0x1F4A7, "droplet"),        # 💧
-        (0x1F30A, "ocean"),          # 🌊
-        (0x1F514, "bell"),           # 🔔
-        (0x1F515, "no_bell"),        # 🔕
-        (0x1F3B5, "music"),          # 🎵
-        (0x1F3B6, "notes"),          # 🎶
-        (0x1F399, "studio_mic"),     # 🎙️
-        (0x1F39A, "level"),          # 🎚️
-        (0x1F39B, "knobs"),          # 🎛️
-        (0x1F4FA, "tv"),             # 📺
-        (0x1F507, "mute"),           # 🔇
-        (0x1F508, "quiet"),          # 🔈
-        (0x1F509, "sound"),          # 🔉
-        (0x1F50A, "loud"),           # 🔊
-        (0x1F4E3, "mega"),           # 📣
-        (0x1F4E2, "loudspeaker"),    # 📢
-        (0x1F50B, "battery"),        # 🔋
-        (0x1F50C, "plug"),           # 🔌
-        (0x2757, "exclamation"),     # ❗
-        (0x2753, "question"),        # ❓
-        (0x2754, "grey_question"),   # ❔
-        (0x2755, "grey_excl"),       # ❕
-        (0x2049, "interrobang"),     # ⁉️
-        (0x203C, "bangbang"),        # ‼️
-        (0x1F534, "red_circle"),     # 🔴
-        (0x1F7E0, "orange_circle"),  # 🟠
-        (0x1F7E1, "yellow_circle"),  # 🟡
-        (0x1F7E2, "green_circle"),   # 🟢
-        (0x1F535, "blue_circle"),    # 🔵
-        (0x1F7E3, "purple_circle"),  # 🟣
-        (0x1F7E4, "brown_circle"),   # 🟤
-        (0x26AB, "black_circle"),    # ⚫
-        (0x26AA, "white_circle"),    # ⚪
-        (0x1F7E5, "red_square"),     # 🟥
-        (0x1F7E7, "orange_square"),  # 🟧
-        (0x1F7E8, "yellow_square"),  # 🟨
-        (0x1F7E9, "green_square"),   # 🟩
-        (0x1F7E6, "blue_square"),    # 🟦
-        (0x1F7EA, "purple_square"),  # 🟪
-        (0x1F7EB, "brown_square"),   # 🟫
-        (0x2B1B, "black_square"),    # ⬛
-        (0x2B1C, "white_square"),    # ⬜
-        (0x25FC, "black_medium"),    # ◼️
-        (0x25FB, "white_medium"),    # ◻️
-        (0x25FE, "black_small"),     # ◾
-        (0x25FD, "white_small"),     # ◽
-        (0x25AA, "black_tiny"),      # ▪️
-        (0x25AB, "white_tiny"),      # ▫️
-        (0x1F536, "orange_diamond"), # 🔶
-        (0x1F537, "blue_diamond"),   # 🔷
-        (0x1F538, "small_orange"),   # 🔸
-        (0x1F539, "small_blue"),     # 🔹
-        (0x1F53A, "red_triangle"),   # 🔺
-        (0x1F53B, "red_triangle2"),  # 🔻
-        (0x1F4A0, "diamond_shape"),  # 💠
-        (0x1F518, "radio_button"),   # 🔘
-        (0x1F532, "black_button"),   # 🔲
-        (0x1F533, "white_button"),   # 🔳
-        (0x26D4, "no_entry"),        # ⛔
-        (0x1F6AB, "no_entry2"),      # 🚫
-        (0x1F6B3, "no_bikes"),       # 🚳
-        (0x1F6AD, "no_smoking"),     # 🚭
-        (0x1F6AF, "no_litter"),      # 🚯
-        (0x1F6B1, "no_water"),       # 🚱
-        (0x1F6B7, "no_pedestrians"), # 🚷
-        (0x1F4F5, "no_phones"),      # 📵
-        (0x1F51E, "underage"),       # 🔞
-        (0x2622, "radioactive"),     # ☢️
-        (0x2623, "biohazard"),       # ☣️
-        (0x2B06, "arrow_up"),        # ⬆️
-        (0x2197, "arrow_upper_right"),# ↗️
-        (0x27A1, "arrow_right"),     # ➡️
-        (0x2198, "arrow_lower_right"),# ↘️
-        (0x2B07, "arrow_down"),      # ⬇️
-        (0x2199, "arrow_lower_left"),# ↙️
-        (0x2B05, "arrow_left"),      # ⬅️
-        (0x2196, "arrow_upper_left"),# ↖️
-        (0x2195, "arrow_up_down"),   # ↕️
-        (0x2194, "arrow_left_right"),# ↔️
-        (0x21A9, "leftwards"),       # ↩️
-        (0x21AA, "rightwards"),      # ↪️
-        (0x2934, "arrow_heading_up"),# ⤴️
-        (0x2935, "arrow_heading_down"),# ⤵️
-        (0x1F503, "clockwise"),      # 🔃
-        (0x1F504, "counterclockwise"),# 🔄
-        (0x1F519, "back"),           # 🔙
-        (0x1F51A, "end"),            # 🔚
-        (0x1F51B, "on"),             # 🔛
-        (0x1F51C, "soon"),           # 🔜
-        (0x1F51D, "top"),            # 🔝
-        (0x1F6D0, "place_of_worship"),# 🛐
-        (0x269B, "atom"),            # ⚛️
-        (0x1F549, "om"),             # 🕉️
-        (0x2721, "star_of_david"),   # ✡️
-        (0x2638, "wheel"),           # ☸️
-        (0x262F, "yin_yang"),        # ☯️
-        (0x271D, "cross2"),          # ✝️
-        (0x2626, "orthodox"),        # ☦️
-        (0x262A, "star_crescent"),   # ☪️
-        (0x262E, "peace"),           # ☮️
-        (0x1F54E, "menorah"),        # 🕎
-        (0x1F52F, "six_star"),       # 🔯
-        (0x2648, "aries"),           # ♈
-        (0x2649, "taurus"),          # ♉
-        (0x264A, "gemini"),          # ♊
-        (0x264B, "cancer"),          # ♋
-        (0x264C, "leo"),             # ♌
-        (0x264D, "virgo"),           # ♍
-        (0x264E, "libra"),           # ♎
-        (0x264F, "scorpio"),         # ♏
-        (0x2650, "sagittarius"),     # ♐
-        (0x2651, "capricorn"),       # ♑
-        (0x2652, "aquarius"),        # ♒
-        (0x2653, "pisces"),          # ♓
-        (0x26CE, "ophiuchus"),       # ⛎
-        (0x1F500, "shuffle"),        # 🔀
-        (0x1F501, "repeat"),         # 🔁
-        (0x1F502, "repeat_one"),     # 🔂
-        (0x25B6, "play"),            # ▶️
-        (0x23E9, "fast_forward"),    # ⏩
-        (0x23ED, "next_track"),      # ⏭️
-        (0x23EF, "play_pause"),      # ⏯️
-        (0x25C0, "reverse"),         # ◀️
-        (0x23EA, "rewind"),          # ⏪
-        (0x23EE, "prev_track"),      # ⏮️
-        (0x1F53C, "up_button"),      # 🔼
-        (0x23EB, "fast_up"),         # ⏫
-        (0x1F53D, "down_button"),    # 🔽
-        (0x23EC, "fast_down"),       # ⏬
-        (0x23F8, "pause"),           # ⏸️
-        (0x23F9, "stop"),            # ⏹️
-        (0x23FA, "record"),          # ⏺️
-        (0x23CF, "eject"),           # ⏏️
-        (0x1F3A6, "cinema"),         # 🎦
-        (0x1F505, "low_bright"),     # 🔅
-        (0x1F506, "high_bright"),    # 🔆
-        (0x1F4F6, "signal"),         # 📶
-        (0x1F4F3, "vibration"),      # 📳
-        (0x1F4F4, "phone_off"),      # 📴
-        (0x2640, "female"),          # ♀️
-        (0x2642, "male"),            # ♂️
-        (0x26A7, "transgender"),     # ⚧️
-        (0x2716, "heavy_mult"),      # ✖️
-        (0x2795, "heavy_plus"),      # ➕
-        (0x2796, "heavy_minus"),     # ➖
-        (0x2797, "heavy_div"),       # ➗
-        (0x267E, "infinity"),        # ♾️
-        (0x1F4B2, "heavy_dollar"),   # 💲
-        (0x1F4B1, "currency"),       # 💱
-        (0x00A9, "copyright"),       # ©️
-        (0x00AE, "registered"),      # ®️
-        (0x2122, "tm"),              # ™️
-        (0x0030, "zero"),            # 0️⃣
-        (0x0031, "one"),             # 1️⃣
-        (0x0032, "two"),             # 2️⃣
-        (0x0033, "three"),           # 3️⃣
-        (0x0034, "four"),            # 4️⃣
-        (0x0035, "five"),            # 5️⃣
-        (0x0036, "six"),             # 6️⃣
-        (0x0037, "seven"),           # 7️⃣
-        (0x0038, "eight"),           # 8️⃣
-        (0x0039, "nine"),            # 9️⃣
-        (0x1F51F, "ten"),            # 🔟
-        (0x1F520, "abc_upper"),      # 🔠
-        (0x1F521, "abc_lower"),      # 🔡
-        (0x1F522, "numbers"),        # 🔢
-        (0x1F523, "symbols"),        # 🔣
-        (0x1F524, "abc"),            # 🔤
-        (0x1F170, "a_button"),       # 🅰️
-        (0x1F18E, "ab_button"),      # 🆎
-        (0x1F171, "b_button"),       # 🅱️
-        (0x1F191, "cl"),             # 🆑
-        (0x1F192, "cool"),           # 🆒
-        (0x1F193, "free"),           # 🆓
-        (0x2139, "info"),            # ℹ️
-        (0x1F194, "id"),             # 🆔
-        (0x24C2, "m"),               # Ⓜ️
-        (0x1F195, "new"),            # 🆕
-        (0x1F196, "ng"),             # 🆖
-        (0x1F17E, "o_button"),       # 🅾️
-        (0x1F197, "ok"),             # 🆗
-        (0x1F17F, "parking"),        # 🅿️
-        (0x1F198, "sos"),            # 🆘
-        (0x1F199, "up"),             # 🆙
-        (0x1F19A, "vs"),             # 🆚
-        (0x1F201, "koko"),           # 🈁
-        (0x1F202, "sa"),             # 🈂️
-        (0x1F237, "monthly"),        # 🈷️
-        (0x1F236, "u6709"),          # 🈶
-        (0x1F22F, "u6307"),          # 🈯
-        (0x1F250, "u5272"),          # 🉐
-        (0x1F239, "u5408"),          # 🈹
-        (0x1F21A, "u7121"),          # 🈚
-        (0x1F232, "u7981"),          # 🈲
-        (0x1F251, "u7a7a"),          # 🉑
-        (0x1F238, "u7533"),          # 🈸
-        (0x1F234, "u5408_2"),        # 🈴
-        (0x1F233, "u7a7a_2"),        # 🈳
-        (0x3297, "circled_ideograph"),# ㊗️
-        (0x3299, "circled_secret"),  # ㊙️
-        (0x1F23A, "u55b6"),          # 🈺
-        (0x1F235, "u6e80"),          # 🈵
-    ],
-    "FLAGS": [
-        (0x1F3C1, "checkered"),      # 🏁
-        (0x1F6A9, "triangular"),     # 🚩
-        (0x1F38C, "crossed_flags"),   # 🎌
-        (0x1F3F4, "black_flag"),     # 🏴
-        (0x1F3F3, "white_flag"),     # 🏳️
-        (0x1F3F3, "rainbow_flag"),   # 🏳️‍🌈 (note: this needs special handling)
-        (0x1F3F4, "pirate"),         # 🏴‍☠️
-        # Common country flags (two-letter codes convert to regional indicators)
-        # These use regional indicator symbols A-Z (0x1F1E6-0x1F1FF)
-    ],
-}
-
-# Total count
-total = sum(len(v) for v in EMOJI_DATA.values())
-print(f"// Total emoji: {total}", file=sys.stderr)
+# Download concurrency and rate limiting defaults
+DEFAULT_FETCH_WORKERS = 8
+DEFAULT_FETCH_RATE = 20.0   # requests per second
+DEFAULT_FETCH_BURST = 4
+DEFAULT_FETCH_RETRIES = 3
+DEFAULT_FETCH_BACKOFF = 0.5  # seconds before the first retry, doubled for each further one
+
+# Functions listed on stderr after a --profile run
+PROFILE_TOP_FUNCTIONS = 20
+
+# HTTP validators (ETag / Last-Modified) are stored beside each cached file
+CACHE_META_SUFFIX = ".meta"
+
+# Project root, embedded file symbols are named after paths relative to it
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Incremental build manifest (converted bitmaps keyed by source hash)
+BUILD_MANIFEST = os.path.join(CACHE_DIR, "build_manifest.json")
+
+# Size of the EmojiEntry bitmaps (EMOJI_WIDTH x EMOJI_HEIGHT in Emoji.h)
+EMOJI_SIZE = 12
+
+# Bump whenever process_twemoji_to_rgb565() or process_twemoji_to_rgba() output
+# changes to invalidate the manifest
+CONVERTER_VERSION = 1
+
+# Shortcode perfect hash (CHD) search parameters
+SHORTCODE_HASH_LAMBDA = 4          # average shortcodes per first-level bucket
+SHORTCODE_HASH_MAX_SEEDS = 64      # seeds to try before giving up
+SHORTCODE_HASH_MAX_TRIES = 1 << 20 # displacements to try per bucket
+
+# Codepoints that qualify or join a sequence; a sequence is also matched with
+# its U+FE0F selectors dropped, as many senders strip them
+VARIATION_SELECTOR_16 = 0xFE0F
+ZERO_WIDTH_JOINER = 0x200D
+
+# Category names in EmojiCategory enum order (src/ui/Emoji.h)
+CATEGORIES = emoji_manifest.CATEGORIES
+
+# Flash budget optimizer (--budget): candidate bitmap encodings, best fidelity first,
+# as (name, --palette mode, --palette-bits, bytes per bitmap, palette bytes per build)
+BUDGET_ENCODINGS = [
+    ("rgb565", None, None, 288, 0),
+    ("palette-shared-8", "shared", 8, 144, 256 * 2),
+    ("palette-local-4", "local", 4, 72 + 16 * 2, 0),
+    ("palette-shared-4", "shared", 4, 72, 16 * 2),
+]
+# Table bytes every build needs: category offsets plus the shortcode hash seeds and size
+BUDGET_FIXED_BYTES = (len(CATEGORIES) + 1) * 2 + 12
+# Priority of entries missing from --weights
+DEFAULT_PRIORITY_WEIGHT = 1.0
+# Knapsack resolution, costs are rounded up to budget / KNAPSACK_CELLS byte units
+KNAPSACK_CELLS = 1 << 15
+# Dropped entries named in the plan
+PLAN_DROPPED_SHOWN = 12
+
+
+class GeneratorError(Exception):
+    """A build cannot continue (bad data, unreachable sources, invalid options)"""
+
+
+def read_manifest(path):
+    """Validated emoji_manifest.Manifest, errors raised as GeneratorError"""
+    try:
+        return emoji_manifest.load_manifest(path)
+    except emoji_manifest.ManifestError as e:
+        raise GeneratorError(str(e)) from None
+    except OSError as e:
+        raise GeneratorError(f"cannot read emoji manifest: {e}") from None
+
+
+def load_manifest(path=emoji_manifest.DEFAULT_MANIFEST, profile=None):
+    """Emoji table rows in table order: (codepoint or sequence tuple, shortcode, category)
+
+    Rows come from a JSON or CSV emoji manifest (see emoji_manifest.py),
+    optionally narrowed to one of its device profiles.
+    """
+    manifest = read_manifest(path)
+    try:
+        return manifest.subset(profile) if profile else manifest.entries
+    except emoji_manifest.ManifestError as e:
+        raise GeneratorError(str(e)) from None
+
+
+def load_aliases(path=emoji_manifest.DEFAULT_MANIFEST):
+    """Other shortcodes listed by a manifest: {alias: shortcode of its entry}"""
+    return read_manifest(path).aliases
 
 
 def ensure_cache_dir():
@@ -1076,43 +154,371 @@ def ensure_cache_dir():
         os.makedirs(CACHE_DIR)
 
 
+def sequence_of(codepoint):
+    """Codepoints of a manifest codepoint (an int, or a tuple for sequences)"""
+    return codepoint if isinstance(codepoint, tuple) else (codepoint,)
+
+
+def codepoint_label(codepoint):
+    """Readable form of a manifest codepoint for messages, e.g. 0x1F3F3 0xFE0F"""
+    return " ".join(f"0x{cp:X}" for cp in sequence_of(codepoint))
+
+
 def codepoint_to_twemoji_filename(codepoint):
-    """Convert codepoint to Twemoji filename format"""
-    return f"{codepoint:x}.png"
+    """Convert codepoint (or sequence) to Twemoji filename format
 
+    Twemoji joins sequence codepoints with '-' and drops U+FE0F unless the
+    sequence contains a zero width joiner.
+    """
+    sequence = sequence_of(codepoint)
+    if ZERO_WIDTH_JOINER not in sequence:
+        sequence = [cp for cp in sequence if cp != VARIATION_SELECTOR_16]
+    return "-".join(f"{cp:x}" for cp in sequence) + ".png"
 
-def download_twemoji(codepoint):
-    """Download a Twemoji PNG file, returns image bytes or None"""
-    filename = codepoint_to_twemoji_filename(codepoint)
-    cache_path = os.path.join(CACHE_DIR, filename)
 
-    # Check cache first
+class TokenBucket:
+    """Thread-safe token bucket rate limiter"""
+
+    def __init__(self, rate, burst=1):
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.last = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available, then consume it"""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+                self.last = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+def read_cache(filename):
+    """Return cached source bytes for a Twemoji file name, or None"""
+    cache_path = os.path.join(CACHE_DIR, filename)
     if os.path.exists(cache_path):
         with open(cache_path, 'rb') as f:
             return f.read()
+    return None
+
+
+def write_cache(filename, data):
+    """Store source bytes in the cache (write then rename so parallel runs never see a partial PNG)"""
+    ensure_cache_dir()
+    cache_path = os.path.join(CACHE_DIR, filename)
+    tmp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, cache_path)
+
+
+class BuildStats:
+    """Wall-clock time per pipeline stage plus named counters for one run
+
+    Stages run one after another, so begin() closes the current stage and
+    starts the next; repeated stage names accumulate.
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.stages = {}
+        self.counters = {}
+        self.current = None
+        self.mark = self.started
+
+    def begin(self, name):
+        """End the current stage (if any) and start timing the next one"""
+        now = time.perf_counter()
+        if self.current:
+            self.stages[self.current] = self.stages.get(self.current, 0.0) + now - self.mark
+        self.current, self.mark = name, now
+
+    def finish(self):
+        """End the current stage"""
+        self.begin(None)
+
+    def count(self, name, value=1):
+        """Add to a counter"""
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    def as_dict(self):
+        """Stages and counters as a JSON-serialisable dict"""
+        return {
+            "total_seconds": round(time.perf_counter() - self.started, 6),
+            "stages": {name: round(seconds, 6) for name, seconds in self.stages.items()},
+            "counters": dict(self.counters),
+        }
 
-    # Download from Twemoji
-    url = f"{TWEMOJI_BASE}/{filename}"
+    def print_summary(self, out=sys.stderr):
+        """Print stage times and counters"""
+        total = time.perf_counter() - self.started
+        print("Stage timings:", file=out)
+        for name, seconds in self.stages.items():
+            print(f"  {name:<10} {seconds:8.3f}s {100 * seconds / total:5.1f}%", file=out)
+        print(f"  {'total':<10} {total:8.3f}s", file=out)
+        print("Counters: " + ", ".join(f"{name} {value}" for name, value in self.counters.items()), file=out)
 
+
+class FetchError(Exception):
+    """An asset could not be downloaded, even after retrying"""
+
+
+class HttpFetcher:
+    """Fetches Twemoji assets over persistent HTTP(S) connections
+
+    Each worker thread keeps one keep-alive connection to the asset host, so
+    a cold build pays for a handful of TLS handshakes instead of one per
+    file. Connection errors, 429 and 5xx responses are retried with
+    exponential backoff; other errors and exhausted retries raise FetchError.
+    """
+
+    def __init__(self, base_url=TWEMOJI_BASE, limiter=None, retries=DEFAULT_FETCH_RETRIES,
+                 backoff=DEFAULT_FETCH_BACKOFF, timeout=10):
+        parts = urllib.parse.urlsplit(base_url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise ValueError(f"unsupported asset URL {base_url!r}, expected http:// or https://")
+        self.https = parts.scheme == "https"
+        self.host = parts.hostname
+        self.port = parts.port
+        self.path = parts.path.rstrip("/")
+        self.limiter = limiter
+        self.retries = max(0, retries)
+        self.backoff = backoff
+        self.timeout = timeout
+        self.local = threading.local()
+        self.lock = threading.Lock()
+        self.connections = []
+        self.stats = {"requests": 0, "connections": 0, "not_modified": 0, "retries": 0, "bytes": 0}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """Close every pooled connection"""
+        with self.lock:
+            for conn in self.connections:
+                conn.close()
+            self.connections.clear()
+
+    def count(self, key, value=1):
+        """Add to a fetch counter (thread-safe)"""
+        with self.lock:
+            self.stats[key] += value
+
+    def _connection(self):
+        """This thread's connection, opened on first use"""
+        conn = getattr(self.local, "conn", None)
+        if conn is None:
+            if self.https:
+                # Certificates are not verified (for macOS Python installs without a CA bundle)
+                ctx = ssl.create_default_context()
+                ctx.check_hostname = False
+                ctx.verify_mode = ssl.CERT_NONE
+                conn = http.client.HTTPSConnection(self.host, self.port, timeout=self.timeout, context=ctx)
+            else:
+                conn = http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+            self.local.conn = conn
+            with self.lock:
+                self.connections.append(conn)
+        return conn
+
+    def _request(self, filename, headers):
+        """One GET on the pooled connection, returns (response, body)"""
+        conn = self._connection()
+        if conn.sock is None:
+            self.count("connections")
+        try:
+            conn.request("GET", f"{self.path}/{filename}", headers=headers)
+            response = conn.getresponse()
+            body = response.read()
+        except (OSError, http.client.HTTPException):
+            # Drop the broken socket, the next request reconnects
+            conn.close()
+            raise
+        if response.will_close:
+            conn.close()
+        self.count("requests")
+        return response, body
+
+    def fetch(self, filename, etag=None, last_modified=None):
+        """GET an asset, conditionally when validators are given
+
+        Returns (status, body, validators): status is 200 with the new body
+        and its {"etag", "last_modified"} validators, 304 when the cached copy
+        is still current, or 404 when the asset does not exist.
+        """
+        headers = {"User-Agent": "MeshBerry-emoji-generator"}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+        delay = self.backoff
+        for attempt in range(self.retries + 1):
+            if attempt:
+                self.count("retries")
+                time.sleep(delay)
+                delay *= 2
+            # Only network requests count against the rate limit, cache hits are free
+            if self.limiter:
+                self.limiter.acquire()
+
+            try:
+                response, body = self._request(filename, headers)
+            except (OSError, http.client.HTTPException) as e:
+                error = str(e) or type(e).__name__
+                continue
+
+            if response.status == 200:
+                self.count("bytes", len(body))
+                return 200, body, {"etag": response.getheader("ETag"),
+                                   "last_modified": response.getheader("Last-Modified")}
+            if response.status == 304:
+                self.count("not_modified")
+                return 304, None, None
+            if response.status == 404:
+                return 404, None, None
+
+            error = f"HTTP {response.status} {response.reason}"
+            if response.status != 429 and response.status < 500:
+                break
+            # Honour a Retry-After in seconds when the server asks for more than our backoff
+            retry_after = response.getheader("Retry-After", "")
+            if retry_after.isdigit():
+                delay = max(delay, int(retry_after))
+
+        raise FetchError(f"{error} (after {attempt + 1} attempts)")
+
+
+def read_cache_meta(filename):
+    """Return the stored HTTP validators for a cached file, {} if none"""
     try:
-        # Create SSL context that doesn't verify certificates (for macOS)
-        ctx = ssl.create_default_context()
-        ctx.check_hostname = False
-        ctx.verify_mode = ssl.CERT_NONE
-
-        req = urllib.request.Request(url, headers={'User-Agent': 'Mozilla/5.0'})
-        with urllib.request.urlopen(req, timeout=10, context=ctx) as response:
-            data = response.read()
-
-        # Cache the file
-        ensure_cache_dir()
-        with open(cache_path, 'wb') as f:
-            f.write(data)
+        with open(os.path.join(CACHE_DIR, filename + CACHE_META_SUFFIX)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def write_cache_meta(filename, validators):
+    """Store HTTP validators (ETag / Last-Modified) beside a cached file"""
+    meta = {k: v for k, v in (validators or {}).items() if v}
+    meta_path = os.path.join(CACHE_DIR, filename + CACHE_META_SUFFIX)
+    if not meta:
+        if os.path.exists(meta_path):
+            os.remove(meta_path)
+        return
+    write_cache(filename + CACHE_META_SUFFIX, json.dumps(meta, sort_keys=True).encode())
 
-        return data
-    except (urllib.error.URLError, urllib.error.HTTPError) as e:
-        print(f"  Failed to download {filename}: {e}", file=sys.stderr)
-        return None
+
+def download_twemoji(codepoint, fetcher, refresh=False):
+    """Download a Twemoji PNG file, returns image bytes or None if it does not exist
+
+    Cached files are used without touching the network unless refresh is
+    set, in which case they are re-validated with a conditional request.
+    Raises FetchError when the download fails and there is no cached copy.
+    """
+    filename = codepoint_to_twemoji_filename(codepoint)
+
+    # Check cache first
+    cached = read_cache(filename)
+    if cached and not refresh:
+        return cached
+
+    validators = read_cache_meta(filename) if cached else {}
+    try:
+        status, data, validators = fetcher.fetch(filename, validators.get("etag"),
+                                                 validators.get("last_modified"))
+    except FetchError as e:
+        if cached:
+            log.warning(f"  Could not re-validate {filename} ({e}), keeping the cached copy")
+            return cached
+        raise
+
+    if status == 304:
+        return cached
+    if status == 404:
+        if cached:
+            log.warning(f"  {filename} is no longer published, keeping the cached copy")
+        return cached
+
+    write_cache(filename, data)
+    write_cache_meta(filename, validators)
+    return data
+
+
+def fetch_all(codepoints, fetcher, workers=DEFAULT_FETCH_WORKERS, refresh=False):
+    """Download Twemoji PNGs concurrently, returns dict of codepoint -> bytes or None
+
+    Each distinct codepoint is fetched once. Results are keyed by codepoint so
+    callers can consume them in their own (deterministic) order. Assets that
+    do not exist map to None (and get a placeholder); any other failure
+    aborts the build instead of silently substituting placeholders.
+    """
+    unique = list(dict.fromkeys(codepoints))
+    failures = []
+
+    def fetch_one(cp):
+        try:
+            return download_twemoji(cp, fetcher, refresh)
+        except FetchError as e:
+            failures.append(f"{codepoint_to_twemoji_filename(cp)}: {e}")
+            return None
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        results = dict(zip(unique, pool.map(fetch_one, unique)))
+
+    for failure in sorted(failures):
+        log.warning(f"  Failed to download {failure}")
+    if failures:
+        raise GeneratorError(f"{len(failures)} downloads failed, retry later or build offline with --source")
+    return results
+
+
+def fetch_local(codepoints, path):
+    """Read Twemoji PNGs from a local archive or directory, returns dict of codepoint -> bytes or None
+
+    Shares the download cache: cached files are used as-is and the rest are
+    read from the source in one pass (SVG-only assets rendered to PNG) and
+    cached, so later runs and --incremental see the same bytes either way.
+    """
+    unique = list(dict.fromkeys(codepoints))
+    results = {}
+    missing = {}
+    for cp in unique:
+        filename = codepoint_to_twemoji_filename(cp)
+        results[cp] = read_cache(filename)
+        if not results[cp]:
+            missing.setdefault(filename, []).append(cp)
+
+    if not missing:
+        return results
+
+    log.info(f"  Reading {len(missing)} assets from {path}")
+    try:
+        with emoji_sources.open_source(path) as source:
+            assets = source.read(missing)
+    except (OSError, ValueError, tarfile.TarError, zipfile.BadZipFile) as e:
+        raise GeneratorError(f"cannot read Twemoji source {path}: {e}")
+
+    for filename, cps in missing.items():
+        data = assets.get(filename)
+        if data:
+            write_cache(filename, data)
+        else:
+            log.warning(f"  {filename} not found in {path}")
+        for cp in cps:
+            results[cp] = data
+    return results
 
 
 def rgb_to_rgb565(r, g, b):
@@ -1120,8 +526,25 @@ def rgb_to_rgb565(r, g, b):
     return ((r & 0xF8) << 8) | ((g & 0xFC) << 3) | (b >> 3)
 
 
-def process_twemoji_to_rgb565(png_data, size=12):
-    """Convert Twemoji PNG to 12x12 RGB565 array"""
+def rgb888_to_rgb565_array(pixels):
+    """Convert an HxWx3 uint8 NumPy array to a flat uint16 RGB565 array"""
+    p = pixels.astype(np.uint16)
+    return (((p[..., 0] & 0xF8) << 8) | ((p[..., 1] & 0xFC) << 3) | (p[..., 2] >> 3)).ravel()
+
+
+def image_to_rgb565(img):
+    """Convert an RGB image to a list of RGB565 values (vectorized when NumPy is available)"""
+    if np is not None:
+        return rgb888_to_rgb565_array(np.asarray(img, dtype=np.uint8)).tolist()
+    return [rgb_to_rgb565(r, g, b) for r, g, b in img.getdata()]
+
+
+def decode_twemoji(png_data, sizes=(12,), flatten=True):
+    """Decode a Twemoji PNG once and resample it to every size
+
+    Returns one pixel list per size: RGB565 flattened onto black when
+    flatten is set, otherwise flat RGBA bytes. None if the image fails.
+    """
     try:
         img = Image.open(io.BytesIO(png_data))
 
@@ -1129,35 +552,322 @@ def process_twemoji_to_rgb565(png_data, size=12):
         if img.mode != 'RGBA':
             img = img.convert('RGBA')
 
-        # Resize to target size with high-quality resampling
-        img = img.resize((size, size), Image.Resampling.LANCZOS)
+        # Resize to each target size with high-quality resampling
+        out = []
+        for size in sizes:
+            rgba = list(img.resize((size, size), Image.Resampling.LANCZOS).tobytes())
+            out.append(composite_rgba(rgba, (0, 0, 0), size) if flatten else rgba)
+        return out
+    except Exception as e:
+        log.warning(f"  Error processing image: {e}")
+        return None
+
+
+def composite_rgba(rgba, background=(0, 0, 0), size=12):
+    """Flatten RGBA pixels onto a solid RGB888 background, returns RGB565 values"""
+    img = Image.frombytes('RGBA', (size, size), bytes(rgba))
+    flat = Image.new('RGB', (size, size), background)
+
+    # Split alpha channel and use it as mask
+    r, g, b, a = img.split()
+    flat.paste(Image.merge('RGB', (r, g, b)), mask=a)
+    return image_to_rgb565(flat)
+
+
+def process_twemoji_to_rgba(png_data, size=12):
+    """Decode and resize a Twemoji PNG, returns flat RGBA bytes as a list (None on failure)"""
+    converted = decode_twemoji(png_data, (size,), flatten=False)
+    return converted[0] if converted else None
+
+
+def process_twemoji_to_rgb565(png_data, size=12):
+    """Convert Twemoji PNG to 12x12 RGB565 array, transparency flattened onto black"""
+    converted = decode_twemoji(png_data, (size,))
+    return converted[0] if converted else None
+
+
+def convert_all(png_list, sizes=(12,), jobs=1, flatten=True):
+    """Convert PNG byte strings at every size, optionally across processes
+
+    Each PNG is decoded once (see decode_twemoji). Returns a list in the same
+    order as png_list holding one pixel list per size, or None for images
+    that failed to convert, so output is identical regardless of the job count.
+    """
+    sizes = tuple(sizes)
+    if jobs <= 1 or len(png_list) <= 1:
+        return [decode_twemoji(png, sizes, flatten) for png in png_list]
+
+    chunksize = max(1, len(png_list) // (jobs * 4))
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        return list(pool.map(decode_twemoji, png_list, [sizes] * len(png_list),
+                             [flatten] * len(png_list), chunksize=chunksize))
+
+
+def build_cache_key(codepoint, size, flatten=True):
+    """Manifest key for a converted bitmap (RGBA conversions get their own keys)"""
+    name = "-".join(f"{cp:x}" for cp in sequence_of(codepoint))
+    if flatten:
+        return f"{name}@{size}"
+    return f"{name}@{size}/rgba"
+
+
+def load_build_manifest(path):
+    """Load incremental build manifest entries, returns {} if missing or unreadable"""
+    try:
+        with open(path) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return manifest.get("entries", {})
+
 
-        # Create black background for transparency
-        background = Image.new('RGB', (size, size), (0, 0, 0))
+def save_build_manifest(path, entries):
+    """Write incremental build manifest (atomically, so an interrupted run leaves the old one)"""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump({"converter": CONVERTER_VERSION, "entries": entries}, f, separators=(',', ':'))
+    os.replace(tmp_path, path)
 
-        # Composite emoji onto background
-        # Split alpha channel and use it as mask
-        if img.mode == 'RGBA':
-            r, g, b, a = img.split()
-            rgb_img = Image.merge('RGB', (r, g, b))
-            background.paste(rgb_img, mask=a)
+
+def convert_incremental(sources, manifest_path, sizes=(12,), jobs=1, flatten=True):
+    """Convert source PNGs, reusing manifest bitmaps whose inputs are unchanged
+
+    sources is a dict of codepoint -> PNG bytes. A manifest record is reused only
+    if its source PNG hash, target size and converter version all match; an
+    image missing any size is decoded once and converted at every size.
+    Returns ({size: {codepoint: pixel list or None}}, number of images reused).
+    """
+    old_entries = load_build_manifest(manifest_path)
+    new_entries = {}
+    bitmaps = {size: {} for size in sizes}
+    pending = []
+
+    for cp, png in sources.items():
+        digest = hashlib.sha256(png).hexdigest()
+        records = [old_entries.get(build_cache_key(cp, size, flatten)) for size in sizes]
+        if all(record and record.get("source") == digest and record.get("size") == size
+               and record.get("converter") == CONVERTER_VERSION
+               for record, size in zip(records, sizes)):
+            for record, size in zip(records, sizes):
+                bitmaps[size][cp] = record["pixels"]
+                new_entries[build_cache_key(cp, size, flatten)] = record
         else:
-            background.paste(img)
+            pending.append((cp, digest))
 
-        # Convert to RGB565
-        pixels = list(background.getdata())
-        rgb565_data = []
-        for r, g, b in pixels:
-            rgb565_data.append(rgb_to_rgb565(r, g, b))
+    converted = convert_all([sources[cp] for cp, _ in pending], sizes, jobs, flatten)
+    for (cp, digest), per_size in zip(pending, converted):
+        for i, size in enumerate(sizes):
+            data = per_size[i] if per_size else None
+            bitmaps[size][cp] = data
+            if data:
+                new_entries[build_cache_key(cp, size, flatten)] = {
+                    "source": digest, "size": size, "converter": CONVERTER_VERSION, "pixels": data}
+
+    # Only rewrite the manifest when something changed
+    if pending or new_entries.keys() != old_entries.keys():
+        save_build_manifest(manifest_path, new_entries)
+
+    return bitmaps, len(sources) - len(pending)
+
+
+def build_codepoint_index(entries, exclude=()):
+    """Return table indices sorted by codepoint, validated for binary search
+
+    The sort is stable, so duplicate codepoints keep table order and a
+    lower-bound search finds the same entry a linear scan would. Table
+    indices in exclude (sequences, matched through the sequence trie) are
+    left out so their first codepoint alone never matches them.
+    """
+    members = [i for i in range(len(entries)) if i not in exclude]
+    index = sorted(members, key=lambda i: entries[i][0])
+
+    if len(entries) > 0xFFFF:
+        raise GeneratorError(f"{len(entries)} emoji do not fit a 16-bit codepoint index")
+    if sorted(index) != members:
+        raise GeneratorError("codepoint index is not a permutation of the emoji table")
+    for a, b in zip(index, index[1:]):
+        if entries[a][0] > entries[b][0] or (entries[a][0] == entries[b][0] and a > b):
+            raise GeneratorError(f"codepoint index out of order at 0x{entries[a][0]:X} / 0x{entries[b][0]:X}")
+
+    return index
+
+
+def build_sequence_trie(sequences):
+    """Lay out a trie over multi-codepoint emoji for longest-match lookup
+
+    sequences maps table index -> codepoint tuple. Each sequence is also
+    inserted with its U+FE0F selectors dropped, which many senders do.
+    Returns nodes as (codepoint, first child, child count, table index or
+    None): node 0 is the root and every node's children are contiguous and
+    sorted by codepoint, so the firmware can binary search them while it
+    walks the text forward once.
+    """
+    root = ({}, [None])
+
+    def insert(sequence, entry):
+        children, terminal = root
+        for cp in sequence:
+            children, terminal = children.setdefault(cp, ({}, [None]))
+        if terminal[0] is None:
+            terminal[0] = entry
+
+    for entry, sequence in sorted(sequences.items()):
+        insert(sequence, entry)
+    for entry, sequence in sorted(sequences.items()):
+        bare = tuple(cp for cp in sequence if cp != VARIATION_SELECTOR_16)
+        if len(bare) > 1:
+            insert(bare, entry)
+
+    # Breadth-first layout keeps each node's children adjacent
+    order = [(0, root)]
+    nodes = []
+    for cp, (children, terminal) in order:
+        first = len(order) if children else 0
+        order.extend(sorted(children.items()))
+        if len(children) > 0xFF:
+            raise GeneratorError(f"{len(children)} sequences continue 0x{cp:X}, the trie allows 255")
+        nodes.append((cp, first, len(children), terminal[0]))
+
+    if len(nodes) > 0xFFFF:
+        raise GeneratorError(f"{len(nodes)} sequence trie nodes do not fit 16-bit links")
+    return nodes
+
+
+def emit_sequences(out, sequences, nodes):
+    """Print the sequence trie and the per-entry codepoint lists"""
+    print("// ============ SEQUENCES ============", file=out)
+    print(file=out)
+    print("// Multi-codepoint emoji (ZWJ, keycap and flag sequences), see Emoji::matchUTF8()", file=out)
+    print(f"#define EMOJI_SEQUENCE_COUNT {len(sequences)}", file=out)
+    print(f"#define EMOJI_SEQUENCE_NODE_COUNT {len(nodes)}", file=out)
+    print("#define EMOJI_SEQUENCE_NONE 0xFFFF", file=out)
+    print(file=out)
+    print("// Trie over the sequences, node 0 is the root; children are contiguous and sorted", file=out)
+    print("const EmojiSequenceNode EMOJI_SEQUENCE_NODES[EMOJI_SEQUENCE_NODE_COUNT] PROGMEM = {", file=out)
+    for cp, first, count, entry in nodes:
+        ref = "EMOJI_SEQUENCE_NONE" if entry is None else entry
+        print(f"    {{ 0x{cp:05X}, {first}, {count}, {ref} }},", file=out)
+    print("};", file=out)
+    print(file=out)
+
+    # Full codepoints of each sequence entry, so shortcodes can be encoded back to UTF-8
+    pool = []
+    print("// Sequence entries sorted by table index, codepoints in EMOJI_SEQUENCE_CODEPOINTS", file=out)
+    print("const EmojiSequence EMOJI_SEQUENCES[EMOJI_SEQUENCE_COUNT] PROGMEM = {", file=out)
+    for entry, sequence in sorted(sequences.items()):
+        print(f"    {{ {entry}, {len(pool)}, {len(sequence)} }},", file=out)
+        pool.extend(sequence)
+    print("};", file=out)
+    print(file=out)
+    print(f"const uint32_t EMOJI_SEQUENCE_CODEPOINTS[{len(pool)}] PROGMEM = {{", file=out)
+    for i in range(0, len(pool), 8):
+        print("    " + ", ".join(f"0x{v:05X}" for v in pool[i:i + 8]) + ",", file=out)
+    print("};", file=out)
+    print(file=out)
+
+    trie_bytes = len(nodes) * 12 + len(sequences) * 6 + len(pool) * 4
+    log.info(f"Sequences: {len(sequences)} entries, {len(nodes)} trie nodes, {trie_bytes} bytes")
+
+
+def emit_aliases(out, aliases):
+    """Print the EMOJI_ALIASES list, aliases maps each alias to its table index"""
+    print("// Other shortcodes of table entries, scanned by Emoji::findByShortcode() after the hash", file=out)
+    print(f"#define EMOJI_ALIAS_COUNT {len(aliases)}", file=out)
+    print(file=out)
+    print("const EmojiAlias EMOJI_ALIASES[EMOJI_ALIAS_COUNT] PROGMEM = {", file=out)
+    for alias, index in aliases.items():
+        print(f'    {{ "{alias}", {index} }},', file=out)
+    print("};", file=out)
+    print(file=out)
 
-        return rgb565_data
-    except Exception as e:
-        print(f"  Error processing image: {e}", file=sys.stderr)
-        return None
+
+def fnv1a_32(data, seed=0):
+    """32-bit FNV-1a with the seed folded into the offset basis (must match Emoji.cpp)"""
+    h = 0x811C9DC5 ^ seed
+    for b in data:
+        h = ((h ^ b) * 0x01000193) & 0xFFFFFFFF
+    return h
+
+
+def build_shortcode_hash(shortcodes):
+    """Build a minimal perfect hash (CHD) over the shortcodes
+
+    A key's bucket is fnv1a(key, bucket_seed) % len(displace). Its slot is
+    (f1 + d0 * f2 + d1) % n, where h = fnv1a(key, slot_seed), f1 = (h & 0xFFFF) % n,
+    f2 = (h >> 16) % n and displace[bucket] = (d0 << 16) | d1. slots[slot] is
+    the table index. Returns (bucket_seed, slot_seed, displace, slots).
+    """
+    n = len(shortcodes)
+    if len(set(shortcodes)) != n:
+        dups = sorted({sc for sc in shortcodes if shortcodes.count(sc) > 1})
+        raise GeneratorError(f"duplicate shortcodes, cannot build hash: {', '.join(dups)}")
+    if n == 0 or n > 0xFFFF:
+        raise GeneratorError(f"cannot build a shortcode hash over {n} entries")
+
+    keys = [sc.encode() for sc in shortcodes]
+    num_buckets = (n + SHORTCODE_HASH_LAMBDA - 1) // SHORTCODE_HASH_LAMBDA
+
+    for attempt in range(SHORTCODE_HASH_MAX_SEEDS):
+        bucket_seed = attempt
+        slot_seed = attempt ^ 0x5BD1E995
+
+        buckets = [[] for _ in range(num_buckets)]
+        for i, key in enumerate(keys):
+            h = fnv1a_32(key, slot_seed)
+            buckets[fnv1a_32(key, bucket_seed) % num_buckets].append((i, (h & 0xFFFF) % n, (h >> 16) % n))
+
+        displace = [0] * num_buckets
+        slots = [None] * n
+        ok = True
+
+        # Place the largest buckets first while the table is still sparse
+        for b in sorted(range(num_buckets), key=lambda b: -len(buckets[b])):
+            members = buckets[b]
+            if not members:
+                continue
+            for t in range(min(SHORTCODE_HASH_MAX_TRIES, n * n)):
+                d0, d1 = divmod(t, n)
+                placed = [(f1 + (d0 * f2) % n + d1) % n for _, f1, f2 in members]
+                if len(set(placed)) == len(placed) and all(slots[p] is None for p in placed):
+                    for (i, _, _), p in zip(members, placed):
+                        slots[p] = i
+                    displace[b] = (d0 << 16) | d1
+                    break
+            else:
+                ok = False
+                break
+
+        if ok:
+            return bucket_seed, slot_seed, displace, slots
+
+    raise GeneratorError(f"no shortcode perfect hash found after {SHORTCODE_HASH_MAX_SEEDS} seeds")
+
+
+def build_category_offsets(entries):
+    """Return CATEGORY_COUNT + 1 table offsets, validating that categories are contiguous
+
+    Category c occupies table indices offsets[c] .. offsets[c + 1] - 1, in
+    EmojiCategory enum order.
+    """
+    order = [CATEGORIES.index(category) if category in CATEGORIES else -1
+             for _, _, _, category in entries]
+    if -1 in order:
+        raise GeneratorError(f"unknown category {entries[order.index(-1)][3]}, expected one of {CATEGORIES}")
+    for i in range(1, len(order)):
+        if order[i] < order[i - 1]:
+            raise GeneratorError(f"category {entries[i][3]} is not contiguous or out of enum order "
+                     f"at table index {i} ({entries[i][1]})")
+
+    offsets = [0] * (len(CATEGORIES) + 1)
+    for cat in order:
+        offsets[cat + 1] += 1
+    for c in range(len(CATEGORIES)):
+        offsets[c + 1] += offsets[c]
+    return offsets
 
 
 def generate_placeholder(size=12):
-    """Generate a placeholder for missing emoji (question mark pattern)"""
+    """Generate a placeholder for missing emoji (question mark pattern, scaled to size)"""
     # Create a simple "?" pattern in yellow on black
     data = []
     pattern = [
@@ -1175,9 +885,16 @@ def generate_placeholder(size=12):
         "000001110000",
     ]
 
+    if size != len(pattern):
+        pattern = ["".join(pattern[y * 12 // size][x * 12 // size] for x in range(size)) for y in range(size)]
+
     yellow = rgb_to_rgb565(255, 215, 0)
     black = rgb_to_rgb565(0, 0, 0)
 
+    if np is not None:
+        mask = np.frombuffer("".join(pattern).encode(), dtype=np.uint8) == ord('1')
+        return np.where(mask, yellow, black).astype(np.uint16).tolist()
+
     for row in pattern:
         for c in row:
             data.append(yellow if c == '1' else black)
@@ -1185,88 +902,1338 @@ def generate_placeholder(size=12):
     return data
 
 
-def main():
-    print("Generating emoji data with Twemoji...", file=sys.stderr)
-    ensure_cache_dir()
+def swap_rgb565(data):
+    """Swap the two bytes of every RGB565 value (little-endian <-> big-endian)"""
+    return [((v & 0xFF) << 8) | (v >> 8) for v in data]
+
+
+def rgb565_to_rgb(value):
+    """Expand RGB565 to RGB888 (bit replication, so rgb_to_rgb565 round-trips)"""
+    r = (value >> 11) & 0x1F
+    g = (value >> 5) & 0x3F
+    b = value & 0x1F
+    return (r << 3) | (r >> 2), (g << 2) | (g >> 4), (b << 3) | (b >> 2)
+
+
+def rgb565_to_image(data, size=12):
+    """Build an RGB image from a list of RGB565 values"""
+    return Image.frombytes('RGB', (size, len(data) // size),
+                           bytes(c for v in data for c in rgb565_to_rgb(v)))
+
+
+def quantize_bitmap(data, colors, palette_image=None, size=12):
+    """Quantize an RGB565 bitmap to at most `colors` palette entries
+
+    Bitmaps that already fit are encoded losslessly. With palette_image (a
+    "P" mode image holding a shared palette) every pixel maps to its nearest
+    shared colour. Returns (palette as RGB565 list, indices list).
+    """
+    if palette_image is None:
+        unique = sorted(set(data))
+        if len(unique) <= colors:
+            lookup = {v: i for i, v in enumerate(unique)}
+            return unique, [lookup[v] for v in data]
+        quantized = rgb565_to_image(data, size).quantize(
+            colors=colors, method=Image.Quantize.MEDIANCUT, dither=Image.Dither.NONE)
+    else:
+        quantized = rgb565_to_image(data, size).quantize(palette=palette_image, dither=Image.Dither.NONE)
+
+    pal = quantized.getpalette()[:colors * 3]
+    palette = [rgb_to_rgb565(*pal[i:i + 3]) for i in range(0, len(pal), 3)]
+    return palette, list(quantized.tobytes())
+
+
+def build_shared_palette(bitmaps, colors, size=12):
+    """Quantize all bitmaps together, returns a "P" mode image holding the shared palette"""
+    unique = list(dict.fromkeys(tuple(d) for d in bitmaps))
+    mosaic = rgb565_to_image([v for d in unique for v in d], size)
+    return mosaic.quantize(colors=colors, method=Image.Quantize.MEDIANCUT, dither=Image.Dither.NONE)
+
+
+def bitmap_psnr(original, decoded):
+    """PSNR in dB of a decoded bitmap against the original RGB565 data (inf when identical)"""
+    err = 0
+    for a, b in zip(original, decoded):
+        if a != b:
+            err += sum((x - y) ** 2 for x, y in zip(rgb565_to_rgb(a), rgb565_to_rgb(b)))
+    if err == 0:
+        return float('inf')
+    mse = err / (len(original) * 3)
+    return 10 * math.log10(255 * 255 / mse)
+
+
+def pack_indices(indices, bits):
+    """Pack palette indices into bytes (4-bit: two per byte, high nibble first)"""
+    if bits == 8:
+        return list(indices)
+    return [(indices[i] << 4) | indices[i + 1] for i in range(0, len(indices), 2)]
+
+
+def parse_color(text):
+    """Parse a background colour given as RGB565 (0x0841) or RGB888 (#080808), returns RGB565"""
+    try:
+        if text.startswith("#") and len(text) == 7:
+            value = int(text[1:], 16)
+            return rgb_to_rgb565(value >> 16, (value >> 8) & 0xFF, value & 0xFF)
+        value = int(text, 16)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid colour {text!r}, expected 0xNNNN or #RRGGBB")
+    if not 0 <= value <= 0xFFFF:
+        raise argparse.ArgumentTypeError(f"colour {text!r} is not an RGB565 value")
+    return value
+
+
+def parse_size_list(text):
+    """Parse a comma-separated list of bitmap sizes"""
+    try:
+        sizes = [int(v) for v in text.split(",") if v.strip()]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid size list {text!r}")
+    if EMOJI_SIZE not in sizes or len(sizes) != len(set(sizes)) or not all(8 <= v <= 64 for v in sizes):
+        raise argparse.ArgumentTypeError(f"sizes must be distinct, between 8 and 64 and include {EMOJI_SIZE}")
+    return sizes
+
+
+def parse_color_list(text):
+    """Parse a comma-separated list of background colours"""
+    colors = [parse_color(c.strip()) for c in text.split(",") if c.strip()]
+    if not colors or len(colors) != len(set(colors)):
+        raise argparse.ArgumentTypeError("expected a list of distinct colours")
+    return colors
+
+
+def split_alpha(rgba, bits):
+    """Split RGBA pixels into straight RGB565 colour and alpha quantized to `bits`
+
+    Pixels that quantize to fully transparent get colour 0, which keeps
+    palette and blob data compact since those pixels are never drawn.
+    Returns (colours, alpha levels).
+    """
+    top = (1 << bits) - 1
+    colors = []
+    alpha = []
+    for i in range(0, len(rgba), 4):
+        r, g, b, a = rgba[i:i + 4]
+        level = (a * top + 127) // 255
+        alpha.append(level)
+        colors.append(rgb_to_rgb565(r, g, b) if level else 0)
+    return colors, alpha
+
+
+def pack_alpha(alpha, width=12):
+    """Pack 1-bit alpha levels into bytes
+
+    Planes use the Adafruit_GFX mask layout (rows padded to whole bytes, MSB
+    first), so the firmware can pass them straight to drawRGBBitmap().
+    """
+    packed = []
+    for y in range(0, len(alpha), width):
+        row = alpha[y:y + width]
+        for x in range(0, width, 8):
+            byte = 0
+            for bit, level in enumerate(row[x:x + 8]):
+                byte |= level << (7 - bit)
+            packed.append(byte)
+    return packed
 
-    # Header
-    print("/**")
-    print(" * MeshBerry Emoji Bitmap Data (Auto-Generated from Twemoji)")
-    print(" * ")
-    print(" * SPDX-License-Identifier: GPL-3.0-or-later")
-    print(" * Copyright (C) 2026 NodakMesh (nodakmesh.org)")
-    print(" * ")
-    print(" * Twemoji graphics licensed under CC-BY 4.0")
-    print(" * https://github.com/twitter/twemoji")
-    print(" * ")
-    print(f" * Total: {total} emoji as 12x12 RGB565 bitmaps")
-    print(" */")
-    print()
-    print("#ifndef MESHBERRY_EMOJI_DATA_H")
-    print("#define MESHBERRY_EMOJI_DATA_H")
-    print()
-    print("#include <Arduino.h>")
-    print("#include \"Emoji.h\"")
-    print()
-
-    # Generate bitmaps
-    all_entries = []
-    success_count = 0
-    fail_count = 0
-
-    for category, emojis in EMOJI_DATA.items():
-        print(f"// ============ {category} ({len(emojis)} emoji) ============")
-        print()
-
-        for codepoint, shortcode in emojis:
-            var_name = f"EMOJI_BMP_{shortcode.upper()}"
 
-            # Try to download and process Twemoji
-            print(f"  Processing {chr(codepoint) if codepoint < 0x10000 else ''} {shortcode}...", file=sys.stderr)
-
-            png_data = download_twemoji(codepoint)
-            if png_data:
-                data = process_twemoji_to_rgb565(png_data)
-                if data:
-                    success_count += 1
-                else:
-                    data = generate_placeholder()
-                    fail_count += 1
+def emit_alpha(out, entries, planes, bits):
+    """Print the EMOJI_ALPHA plane, one packed alpha bitmap per table entry"""
+    packed = [pack_alpha(p) for p in planes]
+    alpha_bytes = len(packed[0])
+    row_bytes = alpha_bytes // 12
+
+    print(f"// {bits}-bit alpha plane, entry i at EMOJI_ALPHA + i * EMOJI_ALPHA_BYTES "
+          "(mask rows padded to bytes, MSB first)", file=out)
+    print(f"#define EMOJI_ALPHA_BITS {bits}", file=out)
+    print(f"#define EMOJI_ALPHA_BYTES {alpha_bytes}", file=out)
+    print(file=out)
+    print(f"static const uint8_t EMOJI_ALPHA[{len(entries)} * EMOJI_ALPHA_BYTES] PROGMEM = {{", file=out)
+    for (_, shortcode, _, _), data in zip(entries, packed):
+        print(f"    // {shortcode}", file=out)
+        for i in range(0, alpha_bytes, row_bytes):
+            print("    " + ", ".join(f"0x{v:02X}" for v in data[i:i + row_bytes]) + ",", file=out)
+    print("};", file=out)
+    print(file=out)
+
+    log.info(f"Alpha plane: {len(entries) * alpha_bytes} bytes ({bits}-bit)")
+
+
+def emit_variant_backgrounds(out, backgrounds, stride):
+    """Print the background colour of each pre-composited bitmap variant"""
+    print("// Bitmaps are pre-composited once per background, variant v of bitmap slot s", file=out)
+    print("// is atlas slot v * EMOJI_VARIANT_STRIDE + s (see Emoji::setBackground)", file=out)
+    print(f"#define EMOJI_VARIANT_COUNT {len(backgrounds)}", file=out)
+    print(f"#define EMOJI_VARIANT_STRIDE {stride}", file=out)
+    print("static const uint16_t EMOJI_VARIANT_BG[EMOJI_VARIANT_COUNT] PROGMEM = {", file=out)
+    print("    " + ", ".join(f"0x{v:04X}" for v in backgrounds), file=out)
+    print("};", file=out)
+    print(file=out)
+
+
+def dedup_bitmaps(keys):
+    """Assign every entry a storage slot, sharing slots between identical bitmaps
+
+    keys holds one hashable bitmap value per table entry. Returns (unique,
+    slot_of): the table index stored in each slot, in first-use order, and
+    the slot of every table entry.
+    """
+    slots = {}
+    unique = []
+    slot_of = []
+    for i, key in enumerate(keys):
+        if key not in slots:
+            slots[key] = len(unique)
+            unique.append(i)
+        slot_of.append(slots[key])
+    return unique, slot_of
+
+
+def report_dedup(entries, slot_of, slot_bytes):
+    """Print which table entries share a bitmap and the bytes saved"""
+    groups = {}
+    for (_, shortcode, _, _), slot in zip(entries, slot_of):
+        groups.setdefault(slot, []).append(shortcode)
+    shared = [names for names in groups.values() if len(names) > 1]
+
+    saved = (len(entries) - len(groups)) * slot_bytes
+    log.info(f"Dedup: {len(entries)} bitmaps, {len(groups)} unique, {saved} bytes saved")
+    for names in shared:
+        log.info(f"  shared by {len(names)}: {', '.join(names)}")
+
+
+def report_duplicate_codepoints(entries, strict=False):
+    """Warn about codepoints listed more than once in the manifest
+
+    Lookups by codepoint always find the first entry, so later ones are only
+    reachable by shortcode. With strict, duplicates are data errors and abort
+    the build.
+    """
+    seen = {}
+    for codepoint, shortcode, category, _ in entries:
+        seen.setdefault(codepoint, []).append(f"{shortcode} ({category})")
+
+    duplicates = {cp: names for cp, names in seen.items() if len(names) > 1}
+    label, report = ("Data error", log.error) if strict else ("Warning", log.warning)
+    for cp, names in duplicates.items():
+        report(f"{label}: codepoint {codepoint_label(cp)} is listed {len(names)} times: {', '.join(names)}")
+    if duplicates and strict:
+        raise GeneratorError(f"{len(duplicates)} duplicate codepoints in the emoji manifest")
+
+
+def parse_byte_size(text):
+    """Parse a byte count such as 250000, 240K or 1.5M (binary units)"""
+    match = re.fullmatch(r"(\d+(?:\.\d+)?)([KkMm]?)", text.strip())
+    if not match:
+        raise argparse.ArgumentTypeError(f"invalid byte size {text!r}, e.g. 250000, 240K or 1M")
+    return int(float(match.group(1)) * {"": 1, "k": 1024, "m": 1024 * 1024}[match.group(2).lower()])
+
+
+def load_weights(path):
+    """Priority weight per shortcode
+
+    Reads a JSON object of shortcode -> weight, or a CSV with a shortcode
+    column and a weight or count column (such as a usage frequency table).
+    """
+    try:
+        with open(path, newline="", encoding="utf-8") as f:
+            if path.lower().endswith(".csv"):
+                reader = csv.DictReader(f)
+                column = next((c for c in ("weight", "count") if c in (reader.fieldnames or [])), None)
+                if "shortcode" not in (reader.fieldnames or []) or not column:
+                    raise GeneratorError(f"{path}: expected a shortcode column and a weight or count column")
+                weights = {row["shortcode"]: row[column] for row in reader}
             else:
-                data = generate_placeholder()
-                fail_count += 1
+                weights = json.load(f)
+    except (OSError, ValueError) as e:
+        raise GeneratorError(f"cannot read weights from {path}: {e}") from None
+
+    if not isinstance(weights, dict):
+        raise GeneratorError(f"{path}: expected an object of shortcode -> weight")
+    try:
+        weights = {sc: float(w) for sc, w in weights.items()}
+    except (TypeError, ValueError) as e:
+        raise GeneratorError(f"{path}: invalid weight: {e}") from None
+    if any(w < 0 for w in weights.values()):
+        raise GeneratorError(f"{path}: weights must not be negative")
+    return weights
+
+
+def entry_table_bytes(codepoint, shortcode_length, atlas=True):
+    """Estimated flash bytes of one table entry without its bitmap"""
+    # EmojiEntry on the 32-bit target: codepoint, shortcode pointer, bitmap pointer or
+    # 16-bit atlas slot, category; then the string and its shortcode hash slot
+    size = (12 if atlas else 16) + shortcode_length + 1 + 2 + 4 // SHORTCODE_HASH_LAMBDA
+    sequence = sequence_of(codepoint)
+    if len(sequence) == 1:
+        return size + 2  # EMOJI_CODEPOINT_INDEX
+    # EmojiSequence, its codepoints and trie nodes (a second path without U+FE0F)
+    paths = 2 if VARIATION_SELECTOR_16 in sequence else 1
+    return size + 6 + 4 * len(sequence) + 12 * len(sequence) * paths
+
+
+def fill_knapsack(costs, values, capacity, chosen=()):
+    """Add items to chosen by value per byte while they fit, returns sorted indices"""
+    chosen = set(chosen)
+    used = sum(costs[i] for i in chosen)
+    for i in sorted(range(len(costs)), key=lambda i: -values[i] / max(costs[i], 1)):
+        if i not in chosen and values[i] > 0 and used + costs[i] <= capacity:
+            chosen.add(i)
+            used += costs[i]
+    return sorted(chosen)
+
+
+def solve_knapsack(costs, values, capacity):
+    """Indices of the items maximising total value with total cost <= capacity (0/1 knapsack)
+
+    Dynamic programming over capacity / KNAPSACK_CELLS byte units with numpy,
+    rounding costs up so the pick always fits and topping up the bytes lost
+    to rounding; the greedy pick by value per byte is kept if it is better
+    (and is the only one without numpy).
+    """
+    if sum(costs) <= capacity:
+        return list(range(len(costs)))
+    if capacity <= 0:
+        return []
+
+    greedy = fill_knapsack(costs, values, capacity)
+    if np is None:
+        return greedy
+
+    unit = -(-capacity // KNAPSACK_CELLS)
+    cells = capacity // unit
+    units = [-(-cost // unit) for cost in costs]
+    best = np.zeros(cells + 1)
+    take = np.zeros((len(costs), cells + 1), dtype=bool)
+    for i, (cost, value) in enumerate(zip(units, values)):
+        if cost > cells or value <= 0:
+            continue
+        candidate = best[:cells + 1 - cost] + value
+        better = candidate > best[cost:]
+        take[i, cost:] = better
+        best[cost:] = np.where(better, candidate, best[cost:])
+
+    chosen = []
+    for i in range(len(costs) - 1, -1, -1):
+        if take[i, cells]:
+            chosen.append(i)
+            cells -= units[i]
+    chosen = fill_knapsack(costs, values, capacity, chosen)
+    return max(chosen, greedy, key=lambda picked: sum(values[i] for i in picked))
+
+
+class BudgetPlan:
+    """Entries and bitmap encoding chosen by plan_budget()
+
+    encoding is a BUDGET_ENCODINGS row and atlas tells whether the build
+    addresses bitmaps by atlas slot (and so needs -DEMOJI_USE_ATLAS=1).
+    entries are the chosen manifest rows in table order, dropped the rest.
+    candidates lists (encoding name, emoji, bytes, value) for every encoding
+    tried and categories maps each category to [emoji kept, emoji listed,
+    bytes, value kept, value listed].
+    """
+
+    def __init__(self, budget, encoding, atlas, entries, dropped, used, value, total_value, candidates, categories):
+        self.budget = budget
+        self.encoding = encoding
+        self.atlas = atlas
+        self.entries = entries
+        self.dropped = dropped
+        self.used = used
+        self.value = value
+        self.total_value = total_value
+        self.candidates = candidates
+        self.categories = categories
+
+    def apply(self, args):
+        """Copy of the options with the chosen encoding and the budget options cleared"""
+        options = argparse.Namespace(**vars(args))
+        _, options.palette, palette_bits, _, _ = self.encoding
+        options.palette_bits = palette_bits or options.palette_bits
+        options.budget = None
+        return options
+
+
+def plan_budget(manifest, weights, budget, encodings=BUDGET_ENCODINGS, atlas=True,
+                default_weight=DEFAULT_PRIORITY_WEIGHT):
+    """Choose the manifest entries and bitmap encoding that fit a flash budget
+
+    Every encoding whose fixed costs fit gets an optimal entry subset for
+    the bytes left; the plan keeping the most priority weight wins, ties
+    going to the higher fidelity encoding (earlier in encodings). Entries of
+    equal weight are kept in manifest order: shortcodes are costed at their
+    mean length, so a long name never costs an entry its place. The one
+    encoding applies to every entry, as the firmware decodes one per build.
+
+    atlas tells whether RGB565 bitmaps are addressed by atlas slot (--atlas,
+    --blob), as palette encodings always are. Sizes are estimates for the
+    32-bit target; shared (deduplicated) bitmaps make the real build
+    slightly smaller. Raises GeneratorError when the budget does not cover
+    the fixed tables or leaves room for no entry under any encoding.
+    """
+    fixed_min = BUDGET_FIXED_BYTES + min(encoding[4] for encoding in encodings)
+    if budget < fixed_min:
+        raise GeneratorError(f"budget of {budget} bytes is below the {fixed_min} bytes of fixed tables")
+    values = [weights.get(sc, default_weight) for _, sc, _ in manifest]
+    name_length = -(-sum(len(sc) for _, sc, _ in manifest) // max(len(manifest), 1))
+    best = None
+    candidates = []
+    for encoding in encodings:
+        name, palette, _, slot_bytes, fixed = encoding
+        if budget < BUDGET_FIXED_BYTES + fixed:
+            continue
+        addressed = atlas or palette is not None
+        costs = [entry_table_bytes(cp, len(sc), addressed) + slot_bytes for cp, sc, _ in manifest]
+        chosen = solve_knapsack([entry_table_bytes(cp, name_length, addressed) + slot_bytes for cp, _, _ in manifest],
+                                values, budget - BUDGET_FIXED_BYTES - fixed)
+        # Names longer than the mean can overshoot, drop the least valuable (latest on ties) until it fits
+        used = BUDGET_FIXED_BYTES + fixed + sum(costs[i] for i in chosen)
+        for i in sorted(chosen, key=lambda i: (values[i], -i)):
+            if used <= budget:
+                break
+            chosen.remove(i)
+            used -= costs[i]
+        value = sum(values[i] for i in chosen)
+        candidates.append((name, len(chosen), used, value))
+        if best is None or value > best[0]:
+            best = (value, encoding, chosen, costs, used)
+
+    value, encoding, chosen, costs, used = best
+    if not chosen:
+        raise GeneratorError(f"budget of {budget} bytes fits no emoji")
+    kept = set(chosen)
+    categories = {cat: [0, 0, 0, 0.0, 0.0] for cat in CATEGORIES}
+    for i, (_, _, cat) in enumerate(manifest):
+        row = categories[cat]
+        row[1] += 1
+        row[4] += values[i]
+        if i in kept:
+            row[0] += 1
+            row[2] += costs[i]
+            row[3] += values[i]
+    return BudgetPlan(budget, encoding, atlas or encoding[1] is not None, [manifest[i] for i in chosen],
+                      [manifest[i] for i in range(len(manifest)) if i not in kept],
+                      used, value, sum(values), candidates, categories)
+
+
+def order_by_usage(manifest, counts):
+    """Manifest rows with each category's most used emoji first
+
+    counts maps shortcodes to usage counts (an emoji_usage.py table); rows
+    stay grouped by category in enum order and ties keep manifest order.
+    """
+    return sorted(manifest, key=lambda row: (CATEGORIES.index(row[2]) if row[2] in CATEGORIES else len(CATEGORIES),
+                                             -counts.get(row[1], 0)))
+
+
+def table_order(args, manifest):
+    """Manifest rows in the table order of parsed options (order_by_usage() with --usage)"""
+    if args.usage:
+        return order_by_usage(manifest, load_weights(args.usage))
+    return manifest
+
+
+def plan_for(args, manifest):
+    """Run plan_budget() for parsed options (--budget, --weights or --usage, --default-weight)"""
+    weights_path = args.weights or args.usage
+    weights = load_weights(weights_path) if weights_path else {}
+    unknown = set(weights) - {sc for _, sc, _ in manifest}
+    if unknown:
+        log.warning(f"Weights: ignoring {len(unknown)} shortcodes that are not in the manifest")
+    # Blobs hold RGB565 bitmaps only
+    encodings = BUDGET_ENCODINGS[:1] if args.blob else BUDGET_ENCODINGS
+    return plan_budget(manifest, weights, args.budget, encodings, bool(args.atlas or args.blob),
+                       args.default_weight)
+
 
+def plan_lines(plan):
+    """Lines describing the encodings tried, the chosen one and the bytes per category"""
+    def share(part, whole):
+        return f"{100 * part / whole:5.1f}%" if whole else "    -"
+
+    yield f"Flash budget: {plan.budget} bytes"
+    for name, count, used, value in plan.candidates:
+        marker = "*" if name == plan.encoding[0] else " "
+        yield f"  {marker} {name:<18} {count:5} emoji {used:8} bytes  {share(value, plan.total_value)} of priority"
+
+    name, palette, palette_bits, _, _ = plan.encoding
+    flags = f"--palette {palette} --palette-bits {palette_bits}" if palette else "no palette"
+    yield (f"Plan: {name} ({flags}), {len(plan.entries)} of {len(plan.entries) + len(plan.dropped)} emoji, "
+           f"~{plan.used} bytes ({share(plan.used, plan.budget).strip()} of budget), "
+           f"{share(plan.value, plan.total_value).strip()} of priority")
+    if plan.atlas:
+        yield "  Firmware must be built with -DEMOJI_USE_ATLAS=1"
+    yield f"  {'category':<11} {'emoji':>9} {'bytes':>8} {'priority':>9}"
+    for category, (kept, listed, used, value, total) in plan.categories.items():
+        if listed:
+            yield f"  {category:<11} {kept:>4}/{listed:<4} {used:8} {share(value, total):>9}"
+    if plan.dropped:
+        names = ", ".join(sc for _, sc, _ in plan.dropped[:PLAN_DROPPED_SHOWN])
+        more = f" and {len(plan.dropped) - PLAN_DROPPED_SHOWN} more" if len(plan.dropped) > PLAN_DROPPED_SHOWN else ""
+        yield f"  Dropped: {names}{more}"
+
+
+def print_plan(plan, out=sys.stdout):
+    """Print plan_lines() to a stream"""
+    for line in plan_lines(plan):
+        print(line, file=out)
+
+
+def emit_sized_bitmaps(out, size, bitmaps):
+    """Print the RGB565 bitmaps of one extra size, returns the array name
+
+    bitmaps is in EMOJI_TABLE order, so the same table index (and codepoint
+    index) addresses every size.
+    """
+    name = f"EMOJI_BITMAPS_{size}"
+    pixels = size * size
+    print(f"// ============ {size}x{size} BITMAPS ============", file=out)
+    print(file=out)
+    print(f"// Bitmap of table entry i starts at {name} + i * {pixels}", file=out)
+    print(f"static const uint16_t {name}[{len(bitmaps)} * {pixels}] PROGMEM = {{", file=out)
+    for i, data in enumerate(bitmaps):
+        print(f"    // {i}", file=out)
+        for row in range(0, pixels, size):
+            print("    " + ", ".join(f"0x{v:04X}" for v in data[row:row + size]) + ",", file=out)
+    print("};", file=out)
+    print(file=out)
+
+    log.info(f"{size}x{size} bitmaps: {len(bitmaps) * pixels * 2} bytes")
+    return name
+
+
+def emit_size_tables(out, names):
+    """Print the EMOJI_SIZE_TABLES list of extra bitmap sizes (ascending)"""
+    print("// Extra bitmap sizes, see Emoji::getSizedBitmap()", file=out)
+    print(f"#define EMOJI_SIZE_COUNT {len(names)}", file=out)
+    print("static const EmojiSizeTable EMOJI_SIZE_TABLES[EMOJI_SIZE_COUNT] = {", file=out)
+    for size, name in sorted(names.items()):
+        print(f"    {{ {size}, {name} }},", file=out)
+    print("};", file=out)
+    print(file=out)
+
+
+def emit_bitmap_arrays(out, entries):
+    """Print one PROGMEM array per bitmap, returns the table bitmap references"""
+    refs = []
+    for category, group in itertools.groupby(entries, key=lambda e: e[2]):
+        group = list(group)
+        print(f"// ============ {category} ({len(group)} emoji) ============", file=out)
+        print(file=out)
+
+        for _, shortcode, _, data in group:
             # Output as PROGMEM array
-            print(f"static const uint16_t {var_name}[144] PROGMEM = {{")
+            var_name = f"EMOJI_BMP_{shortcode.upper()}"
+            print(f"static const uint16_t {var_name}[144] PROGMEM = {{", file=out)
             for i in range(0, 144, 12):
                 row = data[i:i + 12]
                 hex_row = ", ".join(f"0x{v:04X}" for v in row)
                 comma = "," if i + 12 < 144 else ""
-                print(f"    {hex_row}{comma}")
-            print("};")
-            print()
+                print(f"    {hex_row}{comma}", file=out)
+            print("};", file=out)
+            print(file=out)
+            refs.append(var_name)
+    return refs
+
+
+def emit_atlas(out, entries):
+    """Print all bitmaps as one EMOJI_ATLAS array, returns the table bitmap indices"""
+    print("// Bitmap i starts at EMOJI_ATLAS + i * EMOJI_PIXELS, categories are contiguous", file=out)
+    print(f"static const uint16_t EMOJI_ATLAS[{len(entries)} * EMOJI_PIXELS] PROGMEM = {{", file=out)
+
+    refs = []
+    for category, group in itertools.groupby(entries, key=lambda e: e[2]):
+        group = list(group)
+        print(f"    // ============ {category} ({len(group)} emoji) ============", file=out)
+        for _, shortcode, _, data in group:
+            # Output as the next atlas slot, referenced by index
+            print(f"    // {len(refs)}: {shortcode}", file=out)
+            for i in range(0, 144, 12):
+                hex_row = ", ".join(f"0x{v:04X}" for v in data[i:i + 12])
+                print(f"    {hex_row},", file=out)
+            refs.append(str(len(refs)))
+
+    print("};", file=out)
+    print(file=out)
+    return refs
+
+
+def emit_palette_bitmaps(out, entries, mode, bits, swap=False):
+    """Print palette-indexed bitmaps and their palette(s), returns the table bitmap indices
+
+    mode is "shared" (one global palette) or "local" (one palette per emoji).
+    With swap the palette colours are stored big-endian. Reports per-emoji
+    quality loss against the RGB565 bitmaps on stderr.
+    """
+    colors = 1 << bits
+    index_bytes = 144 * bits // 8
+    shared = build_shared_palette([d for _, _, _, d in entries], colors) if mode == "shared" else None
+
+    encoded = []
+    log.info(f"Palette encoding ({mode}, {bits}-bit), quality vs RGB565:")
+    for _, shortcode, _, data in entries:
+        palette, indices = quantize_bitmap(data, colors, shared)
+        palette = palette + [0] * (colors - len(palette))
+        psnr = bitmap_psnr(data, [palette[i] for i in indices])
+        quality = "lossless" if psnr == float('inf') else f"PSNR {psnr:5.1f} dB"
+        log.info(f"  {shortcode:<20} {len(set(data)):>3} colours  {quality}")
+        encoded.append((swap_rgb565(palette) if swap else palette, pack_indices(indices, bits)))
+
+    print(f"// Palette-indexed bitmaps: {bits}-bit indices"
+          f"{' (2 pixels per byte, high nibble first)' if bits == 4 else ''}, "
+          f"{'one shared palette' if shared else 'one palette per emoji'}", file=out)
+    print(f"#define EMOJI_PALETTE_BITS {bits}", file=out)
+    print(f"#define EMOJI_PALETTE_SHARED {1 if shared else 0}", file=out)
+    print(f"#define EMOJI_PALETTE_SIZE {colors}", file=out)
+    print(f"#define EMOJI_INDEX_BYTES {index_bytes}", file=out)
+    print(file=out)
+
+    if shared:
+        print("static const uint16_t EMOJI_PALETTE[EMOJI_PALETTE_SIZE] PROGMEM = {", file=out)
+        palette = encoded[0][0]
+        for i in range(0, colors, 16):
+            print("    " + ", ".join(f"0x{v:04X}" for v in palette[i:i + 16]) + ",", file=out)
+        print("};", file=out)
+    else:
+        print(f"static const uint16_t EMOJI_PALETTES[{len(entries)} * EMOJI_PALETTE_SIZE] PROGMEM = {{", file=out)
+        for (_, shortcode, _, _), (palette, _) in zip(entries, encoded):
+            print("    " + ", ".join(f"0x{v:04X}" for v in palette) + f",  // {shortcode}", file=out)
+        print("};", file=out)
+    print(file=out)
+
+    print("// Bitmap i starts at EMOJI_PALETTE_INDICES + i * EMOJI_INDEX_BYTES", file=out)
+    print(f"static const uint8_t EMOJI_PALETTE_INDICES[{len(entries)} * EMOJI_INDEX_BYTES] PROGMEM = {{", file=out)
+    refs = []
+    row_bytes = 12 * bits // 8
+    for category, group in itertools.groupby(zip(entries, encoded), key=lambda e: e[0][2]):
+        group = list(group)
+        print(f"    // ============ {category} ({len(group)} emoji) ============", file=out)
+        for (_, shortcode, _, _), (_, packed) in group:
+            print(f"    // {len(refs)}: {shortcode}", file=out)
+            for i in range(0, index_bytes, row_bytes):
+                print("    " + ", ".join(f"0x{v:02X}" for v in packed[i:i + row_bytes]) + ",", file=out)
+            refs.append(str(len(refs)))
+    print("};", file=out)
+    print(file=out)
+
+    raw_bytes = len(entries) * 288
+    palette_bytes = colors * 2 * (1 if shared else len(entries))
+    total_bytes = len(entries) * index_bytes + palette_bytes
+    log.info(f"Palette encoding: {total_bytes} bytes vs {raw_bytes} RGB565 "
+             f"({100 - total_bytes * 100 // raw_bytes}% smaller)")
+    return refs
+
+
+def blob_symbol_for(path):
+    """Linker symbol prefix PlatformIO/ESP-IDF gives an embedded file"""
+    rel = os.path.relpath(os.path.abspath(path), PROJECT_DIR)
+    return "_binary_" + re.sub(r"[^A-Za-z0-9]", "_", rel)
+
+
+def pack_blob(entries):
+    """Pack bitmaps as EMOJI_PIXELS little-endian RGB565 values per slot, in table order
+
+    Values are stored as given, so --swap-bytes data comes out big-endian.
+    """
+    return b"".join(struct.pack("<144H", *data) for _, _, _, data in entries)
+
+
+def emit_blob(out, count, blob_size, path, symbol):
+    """Print the declarations of a linked bitmap blob, returns the table bitmap indices"""
+    print(f"// Bitmaps live in {os.path.basename(path)}: {count} slots of EMOJI_PIXELS RGB565 "
+          "(byte order per EMOJI_BYTE_SWAPPED),", file=out)
+    print(f"// linked with board_build.embed_files = {os.path.relpath(os.path.abspath(path), PROJECT_DIR)}", file=out)
+    print(f"#define EMOJI_BLOB_SIZE {blob_size}", file=out)
+    print(f"extern const uint8_t EMOJI_BLOB_START[] asm(\"{symbol}_start\");", file=out)
+    print(f"extern const uint8_t EMOJI_BLOB_END[] asm(\"{symbol}_end\");", file=out)
+    print("#define EMOJI_ATLAS ((const uint16_t*)EMOJI_BLOB_START)", file=out)
+    print(file=out)
+    return [str(i) for i in range(count)]
+
+
+def build_pack_image(entries, cp_index, category_offsets, swapped=False):
+    """Build and self-check an emoji pack partition image, returns the image bytes"""
+    image = emoji_pack.build_pack(
+        [(cp, sc, CATEGORIES.index(cat), data) for cp, sc, cat, data in entries],
+        cp_index, category_offsets,
+        pixel_format=emoji_pack.PACK_FORMAT_RGB565_BE if swapped else emoji_pack.PACK_FORMAT_RGB565)
+
+    errors = emoji_pack.validate_pack(image)
+    if errors:
+        raise GeneratorError("emoji pack failed validation: " + "; ".join(errors))
+    return image
+
+
+def file_digest(path):
+    """SHA-256 of a file's contents, None if it cannot be read"""
+    try:
+        with open(path, 'rb') as f:
+            return hashlib.sha256(f.read()).digest()
+    except OSError:
+        return None
+
+
+def write_file(path, data):
+    """Replace path with data atomically (write then rename), so a failed run never leaves a torn file
+
+    Returns False without touching the file when it already holds data, so
+    its mtime is kept and build systems see no change.
+    """
+    if file_digest(path) == hashlib.sha256(data).digest():
+        return False
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return True
+
+
+class Artifact:
+    """In-memory result of one generator run, see generate()
+
+    header is the EmojiData.h text. blob and pack hold the bitmap blob and
+    emoji pack image when those were requested, otherwise None. entries lists
+    the table rows and tables the lookup tables (both plain data, as written
+    by JsonWriter); stats is the run's BuildStats.
+    """
 
-            all_entries.append((codepoint, shortcode, var_name, category))
+    def __init__(self, header, entries, tables, stats, blob=None, pack=None):
+        self.header = header
+        self.entries = entries
+        self.tables = tables
+        self.stats = stats
+        self.blob = blob
+        self.pack = pack
 
-            # Small delay to avoid hammering the server
-            time.sleep(0.05)
+    def as_dict(self):
+        """Entries, tables and stats as a JSON-serialisable dict"""
+        return {"entries": self.entries, "tables": self.tables, "stats": self.stats.as_dict()}
+
+
+class HeaderWriter:
+    """Writes the EmojiData.h text to a stream (stdout by default)"""
+
+    def __init__(self, stream=None):
+        self.stream = stream
+
+    def write(self, artifact):
+        (self.stream or sys.stdout).write(artifact.header)
+
+
+class FileWriter:
+    """Base for writers that atomically write one part of an artifact to a file"""
+
+    label = "Output"
+
+    def __init__(self, path):
+        self.path = path
+
+    def render(self, artifact):
+        """Bytes to write for this artifact"""
+        raise NotImplementedError
+
+    def write(self, artifact):
+        data = self.render(artifact)
+        if write_file(self.path, data):
+            log.info(f"{self.label}: {len(data)} bytes written to {self.path}")
+        else:
+            log.info(f"{self.label}: {self.path} is unchanged, not rewritten")
+
+
+class HeaderFileWriter(FileWriter):
+    """Writes the EmojiData.h text to a file (--output)"""
+
+    label = "Header"
+
+    def render(self, artifact):
+        return artifact.header.encode()
+
+
+class BlobWriter(FileWriter):
+    """Writes the packed bitmap blob of a blob build"""
+
+    label = "Blob"
+
+    def render(self, artifact):
+        if artifact.blob is None:
+            raise GeneratorError("this build has no bitmap blob, generate it with the blob option")
+        return artifact.blob
+
+
+class PackWriter(FileWriter):
+    """Writes the emoji pack partition image"""
+
+    label = "Emoji pack"
+
+    def render(self, artifact):
+        if artifact.pack is None:
+            raise GeneratorError("this build has no emoji pack, generate it with the pack option")
+        return artifact.pack
+
+
+class JsonWriter(FileWriter):
+    """Writes the emoji table, lookup tables and build stats as JSON"""
+
+    label = "JSON"
+
+    def render(self, artifact):
+        return (json.dumps(artifact.as_dict(), indent=1) + "\n").encode()
+
+
+def build_parser():
+    """Command line parser of the generator options"""
+    parser = argparse.ArgumentParser(description="Generate RGB565 emoji bitmaps for MeshBerry")
+    parser.add_argument("-o", "--output", metavar="PATH",
+                        help="write the header to PATH atomically, skipped when unchanged (default: stdout)")
+    parser.add_argument("--emoji-manifest", default=emoji_manifest.DEFAULT_MANIFEST, metavar="PATH",
+                        help="JSON or CSV emoji manifest (default: emoji_manifest.json)")
+    parser.add_argument("--subset", metavar="PROFILE",
+                        help="only build the emoji of a device profile defined in the manifest")
+    parser.add_argument("--usage", metavar="PATH",
+                        help="emoji_usage.py frequency table, most used emoji first on each picker page")
+    parser.add_argument("--budget", type=parse_byte_size, metavar="BYTES",
+                        help="choose the emoji and bitmap encoding that fit BYTES of flash (e.g. 200K)")
+    parser.add_argument("--weights", metavar="PATH",
+                        help="priority weight per shortcode for --budget, JSON or CSV (shortcode,weight|count)")
+    parser.add_argument("--default-weight", type=float, default=DEFAULT_PRIORITY_WEIGHT, metavar="W",
+                        help=f"weight of emoji missing from --weights (default: {DEFAULT_PRIORITY_WEIGHT:g})")
+    parser.add_argument("--plan-only", action="store_true",
+                        help="print the --budget plan and exit without fetching or writing anything")
+    parser.add_argument("--source", metavar="PATH",
+                        help="local Twemoji release archive or directory to read assets from (no network)")
+    parser.add_argument("--fetch-workers", type=int, default=DEFAULT_FETCH_WORKERS,
+                        help=f"concurrent downloads (default: {DEFAULT_FETCH_WORKERS})")
+    parser.add_argument("--fetch-rate", type=float, default=DEFAULT_FETCH_RATE,
+                        help=f"max download requests per second, 0 = unlimited (default: {DEFAULT_FETCH_RATE:g})")
+    parser.add_argument("--fetch-burst", type=int, default=DEFAULT_FETCH_BURST,
+                        help=f"requests allowed back-to-back before rate limiting (default: {DEFAULT_FETCH_BURST})")
+    parser.add_argument("--fetch-retries", type=int, default=DEFAULT_FETCH_RETRIES,
+                        help=f"retries for transient download errors (default: {DEFAULT_FETCH_RETRIES})")
+    parser.add_argument("--fetch-backoff", type=float, default=DEFAULT_FETCH_BACKOFF,
+                        help=f"seconds before the first retry, doubled each time (default: {DEFAULT_FETCH_BACKOFF:g})")
+    parser.add_argument("--fetch-url", default=TWEMOJI_BASE,
+                        help="Twemoji 72x72 asset base URL (default: the twemoji GitHub repo)")
+    parser.add_argument("--refresh", action="store_true",
+                        help="re-validate cached assets with conditional requests")
+    parser.add_argument("--stats-json", metavar="PATH",
+                        help="also write stage timings and counters as JSON to PATH")
+    parser.add_argument("--profile", metavar="PATH",
+                        help="run under cProfile and dump the stats to PATH (worker processes excluded)")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1,
+                        help="image conversion processes (default: CPU count)")
+    parser.add_argument("--incremental", action="store_true",
+                        help="reuse unchanged bitmaps from the build manifest")
+    parser.add_argument("--manifest", default=BUILD_MANIFEST,
+                        help="build manifest path (default: .emoji_cache/build_manifest.json)")
+    parser.add_argument("--atlas", action="store_true",
+                        help="pack bitmaps into one contiguous EMOJI_ATLAS array (needs -DEMOJI_USE_ATLAS=1)")
+    parser.add_argument("--palette", choices=["shared", "local"],
+                        help="emit palette-indexed bitmaps with one shared or one per-emoji palette "
+                             "(needs -DEMOJI_USE_ATLAS=1)")
+    parser.add_argument("--palette-bits", type=int, choices=[4, 8], default=4,
+                        help="bits per palette index (default: 4)")
+    parser.add_argument("--blob", metavar="PATH",
+                        help="write bitmaps to a packed binary blob, tables only on stdout (needs -DEMOJI_USE_ATLAS=1)")
+    parser.add_argument("--blob-symbol",
+                        help="linker symbol prefix of the embedded blob (default: derived from PATH)")
+    parser.add_argument("--pack", metavar="PATH",
+                        help="also write a standalone emoji pack partition image")
+    parser.add_argument("--json", metavar="PATH",
+                        help="also write the emoji table, lookup tables and build stats as JSON")
+    parser.add_argument("--swap-bytes", action="store_true",
+                        help="store RGB565 pixels big-endian for direct SPI push (needs -DEMOJI_SWAP_BYTES=1)")
+    parser.add_argument("--alpha-bits", type=int, choices=[1],
+                        help="emit straight colours plus a 1-bit alpha mask plane")
+    parser.add_argument("--strict", action="store_true",
+                        help="fail on data errors such as duplicate codepoints")
+    parser.add_argument("--sizes", type=parse_size_list, default=[EMOJI_SIZE], metavar="LIST",
+                        help=f"bitmap sizes to generate, must include {EMOJI_SIZE} (default: {EMOJI_SIZE})")
+    parser.add_argument("--backgrounds", type=parse_color_list, metavar="LIST",
+                        help="pre-composite one variant per background colour, e.g. 0x0841,0x1082 "
+                             "(needs -DEMOJI_USE_ATLAS=1)")
+    return parser
+
+
+def parse_args(argv=None):
+    """Parse and validate command line options, exits with a usage error on bad ones"""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    try:
+        validate_options(args)
+    except GeneratorError as e:
+        parser.error(str(e))
+    return args
+
+
+def validate_options(args):
+    """Reject option combinations the generator cannot build, raises GeneratorError"""
+    if args.budget is None and (args.weights or args.plan_only):
+        raise GeneratorError("--weights and --plan-only need a --budget")
+    if args.budget is not None and (args.palette or args.alpha_bits or args.backgrounds or len(args.sizes) > 1):
+        raise GeneratorError("--budget chooses the bitmap encoding, drop --palette/--alpha-bits/--backgrounds/--sizes")
+    if args.default_weight < 0:
+        raise GeneratorError("--default-weight must not be negative")
+
+    if args.alpha_bits and args.backgrounds:
+        raise GeneratorError("--alpha-bits and --backgrounds are alternative ways to handle transparency")
+    if args.backgrounds and args.palette:
+        raise GeneratorError("--backgrounds cannot be combined with --palette")
+    if len(args.sizes) > 1 and (args.alpha_bits or args.backgrounds):
+        raise GeneratorError("extra --sizes are plain RGB565, drop --alpha-bits/--backgrounds")
+    if args.pack and (args.alpha_bits or args.backgrounds):
+        raise GeneratorError("emoji packs hold a single opaque bitmap per emoji, drop --alpha-bits/--backgrounds")
+
+    if urllib.parse.urlsplit(args.fetch_url).scheme not in ("http", "https"):
+        raise GeneratorError(f"--fetch-url must be an http:// or https:// URL, got {args.fetch_url!r}")
+    if args.source and args.refresh:
+        raise GeneratorError("--refresh re-validates downloads, it cannot be combined with --source")
+
+    if args.blob and args.palette:
+        raise GeneratorError("--blob stores RGB565 bitmaps and cannot be combined with --palette")
+
+    # A 256-colour palette per 144-pixel emoji is larger than the RGB565 bitmap
+    if args.palette == "local" and args.palette_bits != 4:
+        raise GeneratorError("--palette local only supports --palette-bits 4")
+
+
+def make_options(**overrides):
+    """Options for generate() without a command line: the defaults plus overrides
+
+    Keyword names are the option names with underscores, e.g.
+    make_options(source="twemoji.zip", atlas=True, jobs=1). Raises
+    GeneratorError for unknown options or combinations validate_options()
+    rejects.
+    """
+    args = build_parser().parse_args([])
+    for name, value in overrides.items():
+        if not hasattr(args, name):
+            raise GeneratorError(f"unknown generator option {name!r}")
+        setattr(args, name, value)
+    validate_options(args)
+    return args
+
+
+class Layout:
+    """Table rows resolved to bitmaps and storage slots, see layout_table()
+
+    rows are (codepoint, shortcode, category, pixels) in table order with
+    placeholders substituted and placeholder flags the rows that got one.
+    alpha_planes (--alpha-bits) and variants (--backgrounds, one list of
+    rows per background) are empty in the other modes. unique lists the row
+    stored in each bitmap slot, slot_of the slot of every row, and sized the
+    converted bitmaps of every --sizes size by codepoint.
+    """
+
+    def __init__(self, rows, placeholder, alpha_planes, variants, unique, slot_of, sized):
+        self.rows = rows
+        self.placeholder = placeholder
+        self.alpha_planes = alpha_planes
+        self.variants = variants
+        self.unique = unique
+        self.slot_of = slot_of
+        self.sized = sized
+
+
+def fetch_sources(args, manifest, stats):
+    """Fetch stage: source PNG bytes (None when unpublished) by codepoint of the manifest rows"""
+    stats.begin("fetch")
+    ensure_cache_dir()
+    codepoints = [cp for cp, _, _ in manifest]
+    unique_sources = list(dict.fromkeys(codepoints))
+    cache_hits = sum(os.path.exists(os.path.join(CACHE_DIR, codepoint_to_twemoji_filename(cp)))
+                     for cp in unique_sources)
+    stats.count("sources", len(unique_sources))
+    stats.count("cache_hits", cache_hits)
+    stats.count("cache_misses", len(unique_sources) - cache_hits)
+    if args.source:
+        log.info(f"Loading {len(unique_sources)} Twemoji sources from {args.source}...")
+        return fetch_local(codepoints, args.source)
+
+    log.info(f"Fetching {len(unique_sources)} Twemoji sources ({args.fetch_workers} workers)...")
+    limiter = TokenBucket(args.fetch_rate, args.fetch_burst) if args.fetch_rate > 0 else None
+    with HttpFetcher(args.fetch_url, limiter, args.fetch_retries, args.fetch_backoff) as fetcher:
+        sources = fetch_all(codepoints, fetcher, args.fetch_workers, args.refresh)
+    fetch_stats = fetcher.stats
+    if fetch_stats["requests"]:
+        log.info(f"  {fetch_stats['requests']} requests on {fetch_stats['connections']} connections, "
+                 f"{fetch_stats['bytes']} bytes, {fetch_stats['not_modified']} not modified, "
+                 f"{fetch_stats['retries']} retries")
+    for key, value in fetch_stats.items():
+        stats.count("bytes_downloaded" if key == "bytes" else f"http_{key}", value)
+    return sources
+
+
+def convert_sources(args, sources, stats):
+    """Convert stage: {size: {codepoint: pixels or None}} for every fetched source and --sizes size
+
+    Every distinct source image is decoded once. Transparency modes
+    (--alpha-bits, --backgrounds) keep RGBA pixels, the rest are flattened.
+    """
+    stats.begin("convert")
+    fetched = [cp for cp, png in sources.items() if png]
+    log.info(f"Converting {len(fetched)} images ({args.jobs} jobs)...")
+    flatten = not (args.alpha_bits or args.backgrounds)
+    if args.incremental:
+        sized, reused = convert_incremental({cp: sources[cp] for cp in fetched},
+                                            args.manifest, args.sizes, args.jobs, flatten)
+        log.info(f"  Reused {reused} cached images, converted {len(fetched) - reused}")
+    else:
+        converted = convert_all([sources[cp] for cp in fetched], args.sizes, args.jobs, flatten)
+        sized = {size: {cp: per_size[i] if per_size else None for cp, per_size in zip(fetched, converted)}
+                 for i, size in enumerate(args.sizes)}
+        reused = 0
+    stats.count("images_converted", len(fetched) - reused)
+    stats.count("images_reused", reused)
+    stats.count("convert_failures", sum(1 for cp in fetched if not sized[EMOJI_SIZE].get(cp)))
+    return sized
+
+
+def layout_table(args, manifest, sized, stats):
+    """Layout stage: resolve the manifest rows to bitmaps and storage slots, returns a Layout
+
+    Rows without a bitmap get the placeholder. Identical bitmaps (repeated
+    codepoints, placeholders) share a slot; with background variants rows
+    only share when every variant matches.
+    """
+    stats.begin("resolve")
+    bitmaps = sized[EMOJI_SIZE]
+    flatten = not (args.alpha_bits or args.backgrounds)
+    rows = []
+    placeholder = []
+    alpha_planes = []
+    variants = [[] for _ in args.backgrounds or []]
+
+    for codepoint, shortcode, category in manifest:
+        data = bitmaps.get(codepoint)
+        placeholder.append(not data)
+
+        if flatten:
+            rows.append((codepoint, shortcode, category, data or generate_placeholder()))
+            continue
+
+        # Placeholders are opaque, so they look the same on every background
+        if args.alpha_bits:
+            colors, alpha = split_alpha(data, args.alpha_bits) if data else (generate_placeholder(), None)
+            alpha_planes.append(alpha or [(1 << args.alpha_bits) - 1] * 144)
+        else:
+            for bg, variant in zip(args.backgrounds, variants):
+                variant.append((codepoint, shortcode, category,
+                                composite_rgba(data, rgb565_to_rgb(bg)) if data else generate_placeholder()))
+            colors = variants[0][-1][3]
+        rows.append((codepoint, shortcode, category, colors))
+
+    report_duplicate_codepoints(rows, args.strict)
+    stats.count("entries", len(rows))
+    stats.count("placeholders", sum(placeholder))
+
+    stats.begin("dedup")
+    keys = [tuple(map(tuple, (v[i][3] for v in variants))) if variants else tuple(data)
+            for i, (_, _, _, data) in enumerate(rows)]
+    unique, slot_of = dedup_bitmaps(keys)
+    if args.palette:
+        slot_bytes = 144 * args.palette_bits // 8 + (2 << args.palette_bits if args.palette == "local" else 0)
+    else:
+        slot_bytes = 288 * max(1, len(variants))
+    report_dedup(rows, slot_of, slot_bytes)
+    return Layout(rows, placeholder, alpha_planes, variants, unique, slot_of, sized)
+
+
+def emit_preamble(out, args, count):
+    """Print the header comment, include guard and the build flag checks"""
+    print("/**", file=out)
+    print(" * MeshBerry Emoji Bitmap Data (Auto-Generated from Twemoji)", file=out)
+    print(" * ", file=out)
+    print(" * SPDX-License-Identifier: GPL-3.0-or-later", file=out)
+    print(" * Copyright (C) 2026 NodakMesh (nodakmesh.org)", file=out)
+    print(" * ", file=out)
+    print(" * Twemoji graphics licensed under CC-BY 4.0", file=out)
+    print(" * https://github.com/twitter/twemoji", file=out)
+    print(" * ", file=out)
+    if args.palette:
+        print(f" * Total: {count} emoji as 12x12 {args.palette_bits}-bit palette-indexed bitmaps "
+              f"({args.palette} palette)", file=out)
+    else:
+        storage = ' in a linked binary blob' if args.blob else ' in a single atlas' if args.atlas else ''
+        print(f" * Total: {count} emoji as 12x12 {'big-endian ' if args.swap_bytes else ''}RGB565 bitmaps{storage}", file=out)
+    if len(args.sizes) > 1:
+        print(" * Extra sizes: " + ", ".join(f"{v}x{v}" for v in sorted(args.sizes) if v != EMOJI_SIZE)
+              + " (EMOJI_SIZE_TABLES)", file=out)
+    if args.alpha_bits:
+        print(f" * Transparency kept as a {args.alpha_bits}-bit alpha plane", file=out)
+    elif args.backgrounds:
+        print(f" * Pre-composited onto {len(args.backgrounds)} backgrounds: "
+              + ", ".join(f"0x{v:04X}" for v in args.backgrounds), file=out)
+    print(" */", file=out)
+    print(file=out)
+    print("#ifndef MESHBERRY_EMOJI_DATA_H", file=out)
+    print("#define MESHBERRY_EMOJI_DATA_H", file=out)
+    print(file=out)
+    print("#include <Arduino.h>", file=out)
+    print("#include \"Emoji.h\"", file=out)
+    print(file=out)
+
+    # EmojiEntry layout depends on the bitmap storage, so the build flag must match
+    if args.atlas or args.palette or args.blob or args.backgrounds:
+        mode = ('--palette' if args.palette else '--blob' if args.blob else
+                '--atlas' if args.atlas else '--backgrounds')
+        print("#if !EMOJI_USE_ATLAS", file=out)
+        print(f"#error \"EmojiData.h was generated with {mode}, build with -DEMOJI_USE_ATLAS=1\"", file=out)
+    else:
+        print("#if EMOJI_USE_ATLAS", file=out)
+        print("#error \"EmojiData.h was generated without --atlas, regenerate it or drop -DEMOJI_USE_ATLAS\"", file=out)
+    print("#endif", file=out)
+    print(file=out)
+
+    # Pixel byte order, checked against -DEMOJI_SWAP_BYTES in Emoji.cpp
+    print("// RGB565 byte order: 1 = big-endian (panel order, --swap-bytes), 0 = little-endian", file=out)
+    print(f"#define EMOJI_BYTE_SWAPPED {1 if args.swap_bytes else 0}", file=out)
+    print(file=out)
+
+
+def write_header(args, layout, stats):
+    """Write stage: returns (EmojiData.h text, lookup tables as plain data, bitmap blob or None)"""
+    stats.begin("bitmaps")
+    out = io.StringIO()
+    resolved, unique, slot_of, variants = layout.rows, layout.unique, layout.slot_of, layout.variants
+    emit_preamble(out, args, len(resolved))
+
+    blob = None
+    # Bitmaps in output byte order (palette mode quantizes native values and swaps its palettes),
+    # background variants follow one another so variant v of slot s is v * stride + s
+    stored = [v[i] for v in variants for i in unique] if variants else [resolved[i] for i in unique]
+    if args.swap_bytes:
+        stored = [(cp, sc, cat, swap_rgb565(data)) for cp, sc, cat, data in stored]
+
+    if args.alpha_bits:
+        emit_alpha(out, resolved, layout.alpha_planes, args.alpha_bits)
+    elif args.backgrounds:
+        emit_variant_backgrounds(out, args.backgrounds, len(unique))
+
+    # Generate bitmaps, one per unique slot
+    if args.palette:
+        slot_refs = emit_palette_bitmaps(out, [resolved[i] for i in unique], args.palette, args.palette_bits,
+                                         args.swap_bytes)
+    elif args.blob:
+        blob = pack_blob(stored)
+        slot_refs = emit_blob(out, len(stored), len(blob), args.blob,
+                              args.blob_symbol or blob_symbol_for(args.blob))
+    elif args.atlas or args.backgrounds:
+        slot_refs = emit_atlas(out, stored)
+    else:
+        slot_refs = emit_bitmap_arrays(out, stored)
+    bitmap_refs = [slot_refs[slot] for slot in slot_of]
+    stats.count("bitmaps_emitted", len(unique) * max(1, len(variants)))
+
+    # Extra sizes share the table and codepoint index, so they are addressed by table index
+    extra_sizes = {}
+    for size in args.sizes:
+        if size != EMOJI_SIZE:
+            data = [layout.sized[size].get(cp) or generate_placeholder(size) for cp, _, _, _ in resolved]
+            if args.swap_bytes:
+                data = [swap_rgb565(d) for d in data]
+            extra_sizes[size] = emit_sized_bitmaps(out, size, data)
+            stats.count("bitmaps_emitted", len(data))
+    if extra_sizes:
+        emit_size_tables(out, extra_sizes)
+
+    stats.begin("tables")
+    # The table holds the first codepoint of a sequence, the rest live in EMOJI_SEQUENCES
+    all_entries = [(sequence_of(codepoint)[0], shortcode, bitmap_ref, category)
+                   for (codepoint, shortcode, category, _), bitmap_ref in zip(resolved, bitmap_refs)]
+    sequences = {i: codepoint for i, (codepoint, _, _, _) in enumerate(resolved) if isinstance(codepoint, tuple)}
 
     # Generate the emoji table
-    print("// ============ EMOJI TABLE ============")
-    print()
-    print(f"const int EMOJI_COUNT = {len(all_entries)};")
-    print()
-    print("const EmojiEntry EMOJI_TABLE[EMOJI_COUNT] PROGMEM = {")
+    print("// ============ EMOJI TABLE ============", file=out)
+    print(file=out)
+    print(f"const int EMOJI_COUNT = {len(all_entries)};", file=out)
+    print(file=out)
+    print("const EmojiEntry EMOJI_TABLE[EMOJI_COUNT] PROGMEM = {", file=out)
 
-    for codepoint, shortcode, var_name, category in all_entries:
+    for codepoint, shortcode, bitmap_ref, category in all_entries:
         cat_enum = f"EmojiCategory::{category}"
-        print(f'    {{ 0x{codepoint:05X}, "{shortcode}", {var_name}, {cat_enum} }},')
+        print(f'    {{ 0x{codepoint:05X}, "{shortcode}", {bitmap_ref}, {cat_enum} }},', file=out)
+
+    print("};", file=out)
+    print(file=out)
+
+    # Category offsets so the picker never scans the table
+    offsets = build_category_offsets(all_entries)
+    print("// First table index of each category (in EmojiCategory order), plus EMOJI_COUNT", file=out)
+    print("const uint16_t EMOJI_CATEGORY_OFFSETS[(int)EmojiCategory::CATEGORY_COUNT + 1] PROGMEM = {", file=out)
+    print("    " + ", ".join(f"{v}" for v in offsets), file=out)
+    print("};", file=out)
+    print(file=out)
+
+    # Codepoint-sorted index of the single-codepoint emoji for binary search lookup
+    cp_index = build_codepoint_index(all_entries, sequences)
+    print("// Single-codepoint table indices sorted by codepoint (ties keep table order) for binary search", file=out)
+    print(f"const int EMOJI_CODEPOINT_INDEX_COUNT = {len(cp_index)};", file=out)
+    print(file=out)
+    print("const uint16_t EMOJI_CODEPOINT_INDEX[EMOJI_CODEPOINT_INDEX_COUNT] PROGMEM = {", file=out)
+    for i in range(0, len(cp_index), 16):
+        print("    " + ", ".join(f"{v}" for v in cp_index[i:i + 16]) + ",", file=out)
+    print("};", file=out)
+    print(file=out)
+
+    if sequences:
+        nodes = build_sequence_trie(sequences)
+        emit_sequences(out, sequences, nodes)
+    else:
+        nodes = []
+
+    # Shortcode minimal perfect hash (see build_shortcode_hash for the lookup)
+    bucket_seed, slot_seed, displace, slots = build_shortcode_hash([sc for _, sc, _, _ in all_entries])
+    print("// Shortcode minimal perfect hash (CHD), see Emoji::findByShortcode()", file=out)
+    print(f"const uint32_t EMOJI_SHORTCODE_BUCKET_SEED = 0x{bucket_seed:08X};", file=out)
+    print(f"const uint32_t EMOJI_SHORTCODE_SLOT_SEED = 0x{slot_seed:08X};", file=out)
+    print(f"const int EMOJI_SHORTCODE_BUCKETS = {len(displace)};", file=out)
+    print(file=out)
+    print("const uint32_t EMOJI_SHORTCODE_DISPLACE[EMOJI_SHORTCODE_BUCKETS] PROGMEM = {", file=out)
+    for i in range(0, len(displace), 8):
+        print("    " + ", ".join(f"0x{v:08X}" for v in displace[i:i + 8]) + ",", file=out)
+    print("};", file=out)
+    print(file=out)
+    print("const uint16_t EMOJI_SHORTCODE_SLOTS[EMOJI_COUNT] PROGMEM = {", file=out)
+    for i in range(0, len(slots), 16):
+        print("    " + ", ".join(f"{v}" for v in slots[i:i + 16]) + ",", file=out)
+    print("};", file=out)
+    print(file=out)
+    hash_bytes = len(displace) * 4 + len(slots) * 2
+    log.info(f"Shortcode hash: seed {bucket_seed}, {len(displace)} buckets, {hash_bytes} bytes")
+
+    # Manifest aliases of the entries in this table (a table shortcode always wins)
+    index_of = {shortcode: i for i, (_, shortcode, _, _) in enumerate(all_entries)}
+    aliases = {alias: index_of[shortcode] for alias, shortcode in load_aliases(args.emoji_manifest).items()
+               if shortcode in index_of and alias not in index_of}
+    if aliases:
+        emit_aliases(out, aliases)
+    print("#endif // MESHBERRY_EMOJI_DATA_H", file=out)
+
+    stats.count("sequences", len(sequences))
+    tables = {
+        "category_offsets": offsets,
+        "codepoint_index": cp_index,
+        "sequence_nodes": [list(node) for node in nodes],
+        "shortcode_hash": {"bucket_seed": bucket_seed, "slot_seed": slot_seed,
+                           "displace": displace, "slots": slots},
+        "aliases": aliases,
+    }
+    return out.getvalue(), tables, blob
+
+
+def pack_layout(args, layout, stats):
+    """Emoji pack image (--pack) of a layout's single-codepoint rows
+
+    The pack format has no sequence section, so sequences are left out rather
+    than indexed under their first codepoint (which would shadow e.g. '0').
+    """
+    stats.begin("pack")
+    table_pixels = [(cp, sc, cat, swap_rgb565(data) if args.swap_bytes else data)
+                    for cp, sc, cat, data in layout.rows if not isinstance(cp, tuple)]
+    pack_entries = [(cp, sc, None, cat) for cp, sc, cat, _ in table_pixels]
+    pack = build_pack_image(table_pixels, build_codepoint_index(pack_entries),
+                            build_category_offsets(pack_entries), args.swap_bytes)
+    left_out = len(layout.rows) - len(table_pixels)
+    if left_out:
+        log.info(f"Emoji pack: {left_out} sequence emoji left out (no sequence section yet)")
+    return pack
+
+
+def generate(args, manifest=None, stats=None):
+    """Run the whole pipeline and return the result as an Artifact, nothing is written
+
+    args are parsed options (parse_args() or make_options()), manifest is a
+    list of (codepoint, shortcode, category) rows in table order (default:
+    the --emoji-manifest rows, narrowed to --subset) and stats a BuildStats
+    to record into. Aliases listed by --emoji-manifest are kept for the rows
+    in the table. With --usage, rows are reordered by order_by_usage(); with
+    a --budget, the rows and the bitmap encoding are chosen by plan_budget().
+
+    The stages run in turn: fetch_sources(), convert_sources(),
+    layout_table() and write_header(). Progress goes to the "generate_emoji"
+    logger. Raises GeneratorError when the build cannot be completed.
+    """
+    if manifest is None:
+        manifest = load_manifest(args.emoji_manifest, args.subset)
+    if stats is None:
+        stats = BuildStats()
+    manifest = table_order(args, manifest)
+
+    if args.budget is not None:
+        stats.begin("plan")
+        plan = plan_for(args, manifest)
+        for line in plan_lines(plan):
+            log.info(line)
+        manifest = plan.entries
+        args = plan.apply(args)
+
+    log.info("Generating emoji data with Twemoji...")
+    sources = fetch_sources(args, manifest, stats)
+    sized = convert_sources(args, sources, stats)
+    layout = layout_table(args, manifest, sized, stats)
+    header, tables, blob = write_header(args, layout, stats)
+    pack = pack_layout(args, layout, stats) if args.pack else None
+
+    stats.finish()
+    placeholders = sum(layout.placeholder)
+    log.info(f"\nDone! Success: {len(layout.rows) - placeholders}, Failed: {placeholders}")
+
+    entries = [{"index": i, "codepoints": list(sequence_of(codepoint)), "shortcode": shortcode,
+                "category": category, "bitmap": slot, "placeholder": placeholder}
+               for i, ((codepoint, shortcode, category, _), slot, placeholder)
+               in enumerate(zip(layout.rows, layout.slot_of, layout.placeholder))]
+    return Artifact(header, entries, tables, stats, blob, pack)
+
+
+def writers_for(args):
+    """Writers for the outputs requested by parsed options, the header first"""
+    writers = [HeaderFileWriter(args.output) if args.output else HeaderWriter()]
+    if args.blob:
+        writers.append(BlobWriter(args.blob))
+    if args.pack:
+        writers.append(PackWriter(args.pack))
+    if args.json:
+        writers.append(JsonWriter(args.json))
+    return writers
+
+
+def main():
+    args = parse_args()
+    stats = BuildStats()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    try:
+        if args.plan_only:
+            manifest = table_order(args, load_manifest(args.emoji_manifest, args.subset))
+            print_plan(plan_for(args, manifest), sys.stdout)
+            return
+
+        if args.profile:
+            # Worker processes are not profiled, use -j 1 to include image conversion
+            profiler = cProfile.Profile()
+            artifact = profiler.runcall(generate, args, stats=stats)
+            profiler.dump_stats(args.profile)
+            print(f"Profile written to {args.profile} (python3 -m pstats {args.profile}), "
+                  f"top functions by cumulative time:", file=sys.stderr)
+            pstats.Stats(profiler, stream=sys.stderr).sort_stats("cumulative").print_stats(PROFILE_TOP_FUNCTIONS)
+        else:
+            artifact = generate(args, stats=stats)
 
-    print("};")
-    print()
-    print("#endif // MESHBERRY_EMOJI_DATA_H")
+        for writer in writers_for(args):
+            writer.write(artifact)
+    except GeneratorError as e:
+        sys.exit(f"Error: {e}")
 
-    print(f"\nDone! Success: {success_count}, Failed: {fail_count}", file=sys.stderr)
+    stats.print_summary()
+    if args.stats_json:
+        with open(args.stats_json, "w") as f:
+            json.dump(stats.as_dict(), f, indent=2)
+            f.write("\n")
 
 
 if __name__ == "__main__":
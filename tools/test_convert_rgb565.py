@@ -0,0 +1,95 @@
+"""
+Round-trip tests for the RLE codec in convert_rgb565.py
+
+Run from tools/: python3 -m pytest -q test_convert_rgb565.py
+"""
+
+import os
+import re
+
+import pytest
+
+import convert_rgb565 as conv
+from convert_rgb565 import RLE_MAX_COUNT, rle_decode, rle_decode_rows, rle_encode
+
+UI_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src", "ui")
+
+
+def round_trip(pixels, width, height):
+    words = rle_encode(pixels, width, height)
+    rows = list(rle_decode_rows(words, width, height))
+    assert len(rows) == height
+    assert all(len(row) == width for row in rows)
+    assert [v for row in rows for v in row] == pixels
+    return words
+
+
+def test_all_zero_image():
+    words = round_trip([0] * (320 * 190), 320, 190)
+    # One run packet per row
+    assert words == [0x8000 | 320, 0] * 190
+
+
+def test_single_pixel_rows():
+    pixels = [0x1234, 0xFFFF, 0x0000, 0x1234]
+    words = round_trip(pixels, 1, len(pixels))
+    # A lone pixel is a one-word literal, rows never share a packet
+    assert words == [1, 0x1234, 1, 0xFFFF, 1, 0x0000, 1, 0x1234]
+
+
+def test_run_longer_than_count_limit():
+    width = 2 * RLE_MAX_COUNT + 5
+    words = round_trip([0xF800] * width, width, 1)
+    assert words == [0x8000 | RLE_MAX_COUNT, 0xF800, 0x8000 | RLE_MAX_COUNT, 0xF800, 0x8000 | 5, 0xF800]
+    assert all(w & 0x7FFF for w in words[::2])
+
+
+def test_alternating_literals():
+    width = 64
+    pixels = [0xFFFF if (x + y) & 1 else 0x0000 for y in range(3) for x in range(width)]
+    words = round_trip(pixels, width, 3)
+    assert words[0] == width and not words[0] & 0x8000
+
+
+def test_literal_longer_than_count_limit():
+    width = RLE_MAX_COUNT + 100
+    pixels = [x & 1 for x in range(width)]
+    words = round_trip(pixels, width, 1)
+    assert all(count <= RLE_MAX_COUNT for count in (w & 0x7FFF for w in words if w > 1))
+
+
+def test_mixed_runs_and_literals():
+    row = [1, 2, 3] + [7] * 10 + [4, 5] + [9] * 3 + [6, 6]
+    round_trip(row * 4, len(row), 4)
+
+
+@pytest.mark.parametrize("name", ["HomeBg.h", "BootLogo.h"])
+def test_committed_assets(name):
+    pixels, width, height = conv.load_header(os.path.join(UI_DIR, name))
+    assert len(pixels) == width * height
+    words = round_trip(pixels, width, height)
+    # The committed stream is exactly what the encoder produces
+    with open(os.path.join(UI_DIR, name)) as f:
+        text = f.read()
+    body = text[text.index("_RLE[] PROGMEM"):]
+    body = body[:body.index("};")]
+    committed = [int(v, 16) for v in re.findall(r"0x[0-9A-Fa-f]+", body)]
+    assert words == committed
+    assert rle_decode(committed, width, height) == pixels
+
+
+def test_truncated_stream_is_rejected():
+    words = rle_encode([5] * 20, 10, 2)
+    with pytest.raises(ValueError):
+        list(rle_decode_rows(words[:-2], 10, 2))
+
+
+def test_trailing_words_are_rejected():
+    words = rle_encode([5] * 10, 10, 1) + [0x8001, 0]
+    with pytest.raises(ValueError):
+        list(rle_decode_rows(words, 10, 1))
+
+
+def test_zero_length_packet_is_rejected():
+    with pytest.raises(ValueError):
+        list(rle_decode_rows([0x8000, 0], 1, 1))
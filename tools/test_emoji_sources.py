@@ -0,0 +1,102 @@
+"""
+Tests for the local Twemoji asset sources in emoji_sources.py
+
+Run from tools/: python3 -m pytest -q test_emoji_sources.py
+"""
+
+import io
+import os
+import tarfile
+import zipfile
+
+import pytest
+from PIL import Image
+
+import emoji_sources
+
+
+def png(size):
+    buf = io.BytesIO()
+    Image.new("RGBA", (size, size), (255, 0, 0, 255)).save(buf, "PNG")
+    return buf.getvalue()
+
+
+def png_size(data):
+    return Image.open(io.BytesIO(data)).size[0]
+
+
+def write_zip(path, members):
+    with zipfile.ZipFile(path, "w") as z:
+        for name, data in members.items():
+            z.writestr(name, data)
+
+
+def write_tar(path, members):
+    with tarfile.open(path, "w:gz") as t:
+        for name, data in members.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            t.addfile(info, io.BytesIO(data))
+
+
+def write_dir(path, members):
+    os.mkdir(path)
+    for name, data in members.items():
+        os.makedirs(os.path.join(path, os.path.dirname(name)), exist_ok=True)
+        with open(os.path.join(path, name), "wb") as f:
+            f.write(data)
+
+
+LAYOUTS = {"zip": ("tw.zip", write_zip), "tar": ("tw.tar.gz", write_tar), "dir": ("tw", write_dir)}
+
+
+@pytest.fixture(params=sorted(LAYOUTS))
+def make_source(request, tmp_path):
+    name, write = LAYOUTS[request.param]
+
+    def make(members):
+        path = str(tmp_path / name)
+        write(path, members)
+        return emoji_sources.open_source(path)
+    return make
+
+
+def test_mixed_sizes_prefer_72x72(make_source):
+    # A release lists assets/36x36/ before assets/72x72/
+    members = {
+        "twemoji-14.0.2/assets/36x36/1f600.png": png(36),
+        "twemoji-14.0.2/assets/72x72/1f600.png": png(72),
+        "twemoji-14.0.2/assets/16x16/1f600.png": png(16),
+        "twemoji-14.0.2/assets/36x36/1f603.png": png(36),
+    }
+    with make_source(members) as source:
+        found = source.read(["1f600.png", "1f603.png", "1f604.png"])
+    assert png_size(found["1f600.png"]) == 72
+    assert png_size(found["1f603.png"]) == 36
+    assert "1f604.png" not in found
+
+
+def test_largest_png_without_72x72_dir(make_source):
+    members = {
+        "a/1f600.png": png(36),
+        "b/1f600.png": png(48),
+        "c/1f600.png": png(16),
+    }
+    with make_source(members) as source:
+        found = source.read(["1f600.png"])
+    assert png_size(found["1f600.png"]) == 48
+
+
+def test_72x72_dir_beats_larger_png(make_source):
+    members = {
+        "assets/72x72/1f600.png": png(72),
+        "preview/1f600.png": png(128),
+    }
+    with make_source(members) as source:
+        found = source.read(["1f600.png"])
+    assert png_size(found["1f600.png"]) == 72
+
+
+def test_png_rank():
+    assert emoji_sources.png_rank("assets/72x72/1f600.png", png(36)) > emoji_sources.png_rank("x/1f600.png", png(72))
+    assert emoji_sources.png_rank("assets/72x72.png", b"not a png") == (False, 0)
@@ -0,0 +1,63 @@
+"""
+Library API tests for generate_emoji.py: options, stages and logging
+
+Run from tools/: python3 -m pytest -q test_generate_emoji.py
+"""
+
+import logging
+import os
+import shutil
+
+import pytest
+
+import generate_emoji as gen
+
+ROWS = [(0x1F600, "grin", "FACES"), (0x1F603, "smiley", "FACES"), (0x1F5FA, "japan_map", "TRAVEL")]
+
+
+@pytest.fixture
+def source(tmp_path, monkeypatch):
+    """Directory source holding the first two rows' PNGs, with an empty cache"""
+    assets = tmp_path / "assets" / "72x72"
+    assets.mkdir(parents=True)
+    for name in ("1f600.png", "1f603.png"):
+        shutil.copy(os.path.join(gen.CACHE_DIR, name), assets / name)
+    monkeypatch.setattr(gen, "CACHE_DIR", str(tmp_path / "cache"))
+    return str(tmp_path / "assets")
+
+
+def test_make_options_rejects_unknown_option():
+    with pytest.raises(gen.GeneratorError, match="unknown generator option"):
+        gen.make_options(no_such_option=True)
+
+
+def test_make_options_rejects_bad_combination():
+    with pytest.raises(gen.GeneratorError, match="--palette"):
+        gen.make_options(blob="emoji.bin", palette="shared")
+
+
+def test_stages_match_generate(source):
+    options = gen.make_options(source=source, jobs=1)
+    stats = gen.BuildStats()
+    sources = gen.fetch_sources(options, ROWS, stats)
+    assert sources[0x1F5FA] is None
+    sized = gen.convert_sources(options, sources, stats)
+    layout = gen.layout_table(options, ROWS, sized, stats)
+    assert layout.placeholder == [False, False, True]
+    header, tables, blob = gen.write_header(options, layout, stats)
+
+    artifact = gen.generate(options, ROWS)
+    assert header == artifact.header
+    assert tables == artifact.tables
+    assert blob is None
+    assert [e["placeholder"] for e in artifact.entries] == layout.placeholder
+
+
+def test_progress_goes_to_the_logger(source, caplog, capsys):
+    with caplog.at_level(logging.INFO, logger="generate_emoji"):
+        gen.generate(gen.make_options(source=source, jobs=1), ROWS)
+    messages = [record.getMessage() for record in caplog.records]
+    assert any(m.startswith("Dedup:") for m in messages)
+    assert any("Failed: 1" in m for m in messages)
+    assert any(r.levelno == logging.WARNING and "1f5fa.png" in r.getMessage() for r in caplog.records)
+    assert capsys.readouterr().err == ""
@@ -0,0 +1,44 @@
+"""
+Flash budget planner tests for generate_emoji.py (--budget)
+
+Run from tools/: python3 -m pytest -q test_generate_emoji_budget.py
+"""
+
+import pytest
+
+import generate_emoji as gen
+
+RGB565 = gen.BUDGET_ENCODINGS[:1]
+
+
+def rows(names):
+    return [(0x1F600 + i, name, "FACES") for i, name in enumerate(names)]
+
+
+def budget_for(count, manifest):
+    name_length = -(-sum(len(sc) for _, sc, _ in manifest) // len(manifest))
+    return gen.BUDGET_FIXED_BYTES + count * (gen.entry_table_bytes(0x1F600, name_length) + RGB565[0][3])
+
+
+def test_equal_weights_keep_manifest_order():
+    # Long names first, they must not lose their place to shorter ones
+    manifest = rows(["grinning_face_with_sweat", "slightly_smiling_face", "a", "b", "c", "d"])
+    plan = gen.plan_budget(manifest, {}, budget_for(3, manifest) + 40, RGB565)
+    assert [sc for _, sc, _ in plan.entries] == ["grinning_face_with_sweat", "slightly_smiling_face", "a"]
+    assert plan.used <= plan.budget
+
+
+def test_weights_beat_manifest_order():
+    manifest = rows(["a", "b", "c", "d"])
+    plan = gen.plan_budget(manifest, {"d": 5.0, "c": 2.0}, budget_for(2, manifest), RGB565)
+    assert [sc for _, sc, _ in plan.entries] == ["c", "d"]
+
+
+def test_budget_below_fixed_tables():
+    with pytest.raises(gen.GeneratorError, match="fixed tables"):
+        gen.plan_budget(rows(["a"]), {}, gen.BUDGET_FIXED_BYTES - 1)
+
+
+def test_budget_fitting_nothing():
+    with pytest.raises(gen.GeneratorError, match="fits no emoji"):
+        gen.plan_budget(rows(["a"]), {}, gen.BUDGET_FIXED_BYTES + 10, RGB565)
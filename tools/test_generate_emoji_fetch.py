@@ -0,0 +1,167 @@
+"""
+HttpFetcher and download tests against a local stand-in for the Twemoji host
+
+Run from tools/: python3 -m pytest -q test_generate_emoji_fetch.py
+"""
+
+import hashlib
+import http.server
+import os
+import threading
+
+import pytest
+
+import generate_emoji as gen
+
+CACHE_DIR = gen.CACHE_DIR
+
+GRIN = 0x1F600
+MISSING = 0x1F5FA
+
+
+class StandInHandler(http.server.BaseHTTPRequestHandler):
+    """Serves server.assets with ETags, keep-alive and scripted failures"""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        server = self.server
+        name = os.path.basename(self.path)
+        with server.lock:
+            server.log.append((name, self.headers.get("If-None-Match")))
+            fail = server.failures.get(name, 0)
+            if fail:
+                server.failures[name] = fail - 1
+            drop = server.drop_after > 0
+            server.drop_after -= 1
+
+        if fail:
+            self.reply(503, b"busy")
+        elif name not in server.assets:
+            self.reply(404, b"not found")
+        else:
+            body = server.assets[name]
+            etag = '"%s"' % hashlib.sha1(body).hexdigest()
+            if self.headers.get("If-None-Match") == etag:
+                self.reply(304, b"", etag)
+            else:
+                self.reply(200, body, etag)
+
+        # Close the socket without announcing it, like an idle keep-alive timeout
+        if drop:
+            self.close_connection = True
+
+    def reply(self, status, body, etag=None):
+        self.send_response(status)
+        if etag:
+            self.send_header("ETag", etag)
+        if status != 304:
+            self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if status != 304:
+            self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = http.server.ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    httpd.daemon_threads = True
+    httpd.lock = threading.Lock()
+    httpd.log = []
+    httpd.failures = {}
+    httpd.drop_after = 0
+    with open(os.path.join(CACHE_DIR, "1f600.png"), "rb") as f:
+        httpd.assets = {"1f600.png": f.read()}
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    httpd.url = f"http://127.0.0.1:{httpd.server_address[1]}/assets/72x72"
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(gen, "CACHE_DIR", str(tmp_path))
+    return tmp_path
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    delays = []
+    monkeypatch.setattr(gen.time, "sleep", delays.append)
+    return delays
+
+
+def test_download_writes_cache_and_meta(server, cache):
+    with gen.HttpFetcher(server.url, retries=0) as fetcher:
+        data = gen.download_twemoji(GRIN, fetcher)
+
+    assert data == server.assets["1f600.png"]
+    assert (cache / "1f600.png").read_bytes() == data
+    assert gen.read_cache_meta("1f600.png")["etag"] == '"%s"' % hashlib.sha1(data).hexdigest()
+    assert fetcher.stats["requests"] == 1 and fetcher.stats["bytes"] == len(data)
+
+
+def test_cached_asset_is_not_requested(server, cache):
+    with gen.HttpFetcher(server.url, retries=0) as fetcher:
+        gen.download_twemoji(GRIN, fetcher)
+        gen.download_twemoji(GRIN, fetcher)
+    assert len(server.log) == 1
+
+
+def test_refresh_sends_conditional_request(server, cache):
+    with gen.HttpFetcher(server.url, retries=0) as fetcher:
+        first = gen.download_twemoji(GRIN, fetcher)
+        again = gen.download_twemoji(GRIN, fetcher, refresh=True)
+
+    assert again == first
+    assert server.log[1] == ("1f600.png", gen.read_cache_meta("1f600.png")["etag"])
+    assert fetcher.stats["not_modified"] == 1
+    # Both requests shared one keep-alive connection
+    assert fetcher.stats["connections"] == 1
+
+
+def test_missing_asset_becomes_placeholder(server, cache):
+    with gen.HttpFetcher(server.url, retries=0) as fetcher:
+        sources = gen.fetch_all([GRIN, MISSING], fetcher, workers=2)
+    assert sources[GRIN] == server.assets["1f600.png"]
+    assert sources[MISSING] is None
+    assert not (cache / "1f5fa.png").exists()
+
+    options = gen.make_options(fetch_url=server.url, fetch_rate=0, jobs=1)
+    artifact = gen.generate(options, [(GRIN, "grin", "FACES"), (MISSING, "japan_map", "TRAVEL")])
+    assert artifact.stats.counters["placeholders"] == 1
+    assert [e["placeholder"] for e in artifact.entries] == [False, True]
+
+
+def test_transient_5xx_is_retried_with_backoff(server, cache, sleeps):
+    server.failures["1f600.png"] = 2
+    with gen.HttpFetcher(server.url, retries=3, backoff=0.5) as fetcher:
+        data = gen.download_twemoji(GRIN, fetcher)
+    assert data == server.assets["1f600.png"]
+    assert sleeps == [0.5, 1.0]
+    assert fetcher.stats["retries"] == 2
+
+
+def test_persistent_5xx_aborts_the_build(server, cache, sleeps):
+    server.failures["1f600.png"] = 100
+    with gen.HttpFetcher(server.url, retries=2, backoff=0.25) as fetcher:
+        with pytest.raises(gen.GeneratorError, match="1 downloads failed"):
+            gen.fetch_all([GRIN], fetcher)
+    assert len(server.log) == 3
+    assert sleeps == [0.25, 0.5]
+    assert not (cache / "1f600.png").exists()
+
+
+def test_dropped_keepalive_reconnects(server, cache, sleeps):
+    server.assets["1f603.png"] = server.assets["1f600.png"] + b"\0"
+    server.drop_after = 1
+    with gen.HttpFetcher(server.url, retries=1, backoff=0.1) as fetcher:
+        assert gen.download_twemoji(GRIN, fetcher) == server.assets["1f600.png"]
+        assert gen.download_twemoji(0x1F603, fetcher) == server.assets["1f603.png"]
+    assert fetcher.stats["connections"] == 2
+    assert fetcher.stats["requests"] == 2